@@ -1,1277 +1,83 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session, send_from_directory
-from flask_sqlalchemy import SQLAlchemy
+from flask import Flask, current_app, render_template, request, redirect, url_for, flash, jsonify, session, send_from_directory
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
-from functools import wraps
+from werkzeug.security import check_password_hash
 from datetime import datetime, date, timedelta
-from calendar import monthrange
 import os
 import uuid
-import qrcode
 import re
 import base64
-import requests
-import unicodedata
-import threading
-from bs4 import BeautifulSoup
-from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib import colors
-from reportlab.lib.units import cm, mm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
-
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'aadvita-secret-key-2024')
-# Configurar banco de dados - usar variável de ambiente se disponível, senão usar SQLite local
-database_url = os.environ.get('DATABASE_URL')
-if database_url:
-    # Render usa PostgreSQL, mas se for SQLite, ajustar o formato
-    if database_url.startswith('postgres://'):
-        database_url = database_url.replace('postgres://', 'postgresql+psycopg://', 1)
-    elif database_url.startswith('postgresql://') and '+psycopg' not in database_url:
-        # Garantir que usa psycopg (versão 3) ao invés de psycopg2
-        database_url = database_url.replace('postgresql://', 'postgresql+psycopg://', 1)
-    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
-    print(f"✅ Usando PostgreSQL: {database_url[:50]}...")  # Log parcial da URL por segurança
-else:
-    # SQLite local - usar caminho absoluto para persistência no Render
-    # AVISO: SQLite não persiste no Render! Use PostgreSQL em produção.
-    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'aadvita.db')
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
-    print("⚠️ AVISO: Usando SQLite local - dados NÃO persistirão no Render!")
-    print("⚠️ Configure DATABASE_URL no Render para usar PostgreSQL!")
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['LANGUAGES'] = {
-    'pt': 'Português',
-    'es': 'Español',
-    'en': 'English'
-}
-app.config['UPLOAD_FOLDER'] = 'static/images/uploads'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-app.config['ALLOWED_DOCUMENT_EXTENSIONS'] = {'pdf', 'doc', 'docx', 'xls', 'xlsx', 'txt', 'odt', 'ods'}
-
-db = SQLAlchemy(app)
-
-# Safety-net startup migration: ensure certain Postgres columns exist even when
-# the process is started directly with `gunicorn app:app` (some hosts ignore
-# the Procfile start wrapper). This tries to run the existing migration module
-# and — as a fallback — issues an `ALTER TABLE ... IF NOT EXISTS` using the
-# SQLAlchemy engine. It runs here before model classes are defined.
-def _ensure_associado_foto_base64():
-    try:
-        # Only attempt for Postgres-like DBs
-        uri = app.config.get('SQLALCHEMY_DATABASE_URI', '') or ''
-        if uri.startswith('sqlite') or uri == '':
-            return
-
-        # First, try to reuse the existing migration script if available
-        try:
-            import migrate_postgres_associado as _mig_ass
-            try:
-                print('Startup: running migrate_postgres_associado.migrate()')
-                _mig_ass.migrate()
-            except Exception as e:
-                print('Startup: migrate_postgres_associado.migrate() failed:', e)
-        except Exception:
-            # migration module not present or import failed — fall back
-            pass
-
-        # Reflect columns and add the column if it is missing
-        from sqlalchemy import inspect, text
-        inspector = inspect(db.engine)
-        tables = inspector.get_table_names()
-        if 'associado' in tables:
-            cols = [c['name'] for c in inspector.get_columns('associado')]
-            if 'foto_base64' not in cols:
-                print('Startup: foto_base64 column missing — issuing ALTER TABLE')
-                with db.engine.connect() as conn:
-                    conn.execute(text('ALTER TABLE associado ADD COLUMN IF NOT EXISTS foto_base64 TEXT'))
-                    # commit if using transactional DDL
-                    try:
-                        conn.commit()
-                    except Exception:
-                        pass
-                print('Startup: foto_base64 column ensured')
-    except Exception as e:
-        print('Startup: error while ensuring associado.foto_base64:', e)
-
-
-def _ensure_associado_tipo_associado():
-    try:
-        # Only attempt for Postgres-like DBs
-        uri = app.config.get('SQLALCHEMY_DATABASE_URI', '') or ''
-        if uri.startswith('sqlite') or uri == '':
-            return
-
-        # Reflect columns and add the column if it is missing
-        from sqlalchemy import inspect, text
-        inspector = inspect(db.engine)
-        tables = inspector.get_table_names()
-        if 'associado' in tables:
-            cols = [c['name'] for c in inspector.get_columns('associado')]
-            if 'tipo_associado' not in cols:
-                print('Startup: tipo_associado column missing — issuing ALTER TABLE')
-                with db.engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE associado ADD COLUMN IF NOT EXISTS tipo_associado VARCHAR(20) DEFAULT 'contribuinte'"))
-                    # commit if using transactional DDL
-                    try:
-                        conn.commit()
-                    except Exception:
-                        pass
-                print('Startup: tipo_associado column ensured')
-    except Exception as e:
-        print('Startup: error while ensuring associado.tipo_associado:', e)
+import zlib
 
-
-def _ensure_descricao_imagem_columns():
-    """Garante que a coluna descricao_imagem existe em todas as tabelas que têm imagens"""
-    try:
-        # Only attempt for Postgres-like DBs
-        uri = app.config.get('SQLALCHEMY_DATABASE_URI', '') or ''
-        if uri.startswith('sqlite') or uri == '':
-            return
-
-        from sqlalchemy import inspect, text
-        inspector = inspect(db.engine)
-        tables = inspector.get_table_names()
-        
-        # Tabelas que precisam da coluna descricao_imagem
-        tables_with_images = [
-            'slider_image',
-            'acao',
-            'evento',
-            'projeto',
-            'informativo',
-            'radio_programa',
-            'banner',
-            'banner_conteudo',
-            'apoiador',
-            'acao_foto',
-            'evento_foto',
-            'album_foto'
-        ]
-        
-        for table_name in tables_with_images:
-            if table_name in tables:
-                cols = [c['name'] for c in inspector.get_columns(table_name)]
-                if 'descricao_imagem' not in cols:
-                    print(f'Startup: descricao_imagem column missing in {table_name} — issuing ALTER TABLE')
-                    with db.engine.connect() as conn:
-                        conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS descricao_imagem TEXT'))
-                        try:
-                            conn.commit()
-                        except Exception:
-                            pass
-                    print(f'Startup: descricao_imagem column ensured in {table_name}')
-    except Exception as e:
-        print('Startup: error while ensuring descricao_imagem columns:', e)
-
-
-# Run safety-net migration now (before model classes are declared)
-try:
-    with app.app_context():
-        _ensure_associado_foto_base64()
-        _ensure_associado_tipo_associado()
-        _ensure_descricao_imagem_columns()
-except Exception as _:
-    # Swallow errors to avoid preventing app import — errors logged above
-    pass
-
-# Dicionário de traduções
-TRANSLATIONS = {
-    'pt': {
-        'Início': 'Início',
-        'Agendas': 'Agendas',
-        'Agenda Presencial': 'Agenda Presencial',
-        'Agenda Virtual': 'Agenda Virtual',
-        'Projetos': 'Projetos',
-        'Ações': 'Ações',
-        'Apoiadores': 'Apoiadores',
-        'Selecionar idioma': 'Selecionar idioma',
-        'Idioma atual': 'Idioma atual',
-        'Bem-vindo à AADVITA': 'Bem-vindo à AADVITA',
-        'Associação de Deficientes Visuais promovendo inclusão e acessibilidade': 'Associação de Deficientes Visuais promovendo inclusão e acessibilidade',
-        'Conheça nossos projetos': 'Conheça nossos projetos',
-        'Destaques': 'Destaques',
-        'Próximas Reuniões Presenciais': 'Próximas Reuniões Presenciais',
-        'Próximas Reuniões Virtuais': 'Próximas Reuniões Virtuais',
-        'Projetos em Destaque': 'Projetos em Destaque',
-        'Ações Recentes': 'Ações Recentes',
-        'Ver todas as reuniões presenciais': 'Ver todas as reuniões presenciais',
-        'Ver todas as reuniões virtuais': 'Ver todas as reuniões virtuais',
-        'Ver todos os projetos': 'Ver todos os projetos',
-        'Ver todas as ações': 'Ver todas as ações',
-        'Agenda de Reuniões Presenciais': 'Agenda de Reuniões Presenciais',
-        'Confira nossas próximas reuniões presenciais e eventos': 'Confira nossas próximas reuniões presenciais e eventos',
-        'Agenda de Reuniões Virtuais': 'Agenda de Reuniões Virtuais',
-        'Participe das nossas reuniões e eventos online': 'Participe das nossas reuniões e eventos online',
-        'Nossos Projetos': 'Nossos Projetos',
-        'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade': 'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade',
-        'Nossas Ações': 'Nossas Ações',
-        'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA': 'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA',
-        'Nossos Apoiadores': 'Nossos Apoiadores',
-        'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis': 'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis',
-        'Informativo': 'Informativo',
-        'Fique por dentro das notícias e podcasts da AADVITA': 'Fique por dentro das notícias e podcasts da AADVITA',
-        'Todos': 'Todos',
-        'Notícias': 'Notícias',
-        'Podcast': 'Podcast',
-        'Notícia': 'Notícia',
-        'Publicado em': 'Publicado em',
-        'Não há notícias cadastradas no momento.': 'Não há notícias cadastradas no momento.',
-        'Não há podcasts cadastrados no momento.': 'Não há podcasts cadastrados no momento.',
-        'Não há informativos cadastrados no momento.': 'Não há informativos cadastrados no momento.',
-        'Ler Notícia': 'Ler Notícia',
-        'Escutar Podcast': 'Escutar Podcast',
-        'Voltar para Informativo': 'Voltar para Informativo',
-        'Abrir no SoundCloud': 'Abrir no SoundCloud',
-        'Clique no botão abaixo para escutar o podcast completo': 'Clique no botão abaixo para escutar o podcast completo',
-        'Compartilhar': 'Compartilhar',
-        'Compartilhar no Facebook': 'Compartilhar no Facebook',
-        'Compartilhar no Twitter': 'Compartilhar no Twitter',
-        'Compartilhar no WhatsApp': 'Compartilhar no WhatsApp',
-        'Compartilhar no LinkedIn': 'Compartilhar no LinkedIn',
-        'Copiar Link': 'Copiar Link',
-        'Link Copiado!': 'Link Copiado!',
-        'Copiar link': 'Copiar link',
-        'Não foi possível copiar o link. Por favor, copie manualmente:': 'Não foi possível copiar o link. Por favor, copie manualmente:',
-        'Rádio AADVITA': 'Rádio AADVITA',
-        'Ouça nossos programas de rádio e acompanhe nossa programação': 'Ouça nossos programas de rádio e acompanhe nossa programação',
-        'Apresentador': 'Apresentador',
-        'Horário': 'Horário',
-        'Ao Vivo': 'Ao Vivo',
-        'Clique em play para ouvir ao vivo': 'Clique em play para ouvir ao vivo',
-        'Episódio': 'Episódio',
-        'Ouça o episódio completo': 'Ouça o episódio completo',
-        'Seu navegador não suporta o elemento de áudio.': 'Seu navegador não suporta o elemento de áudio.',
-        'Não há programas de rádio cadastrados no momento.': 'Não há programas de rádio cadastrados no momento.',
-        'Rádio AADVITA - Ao Vivo': 'Rádio AADVITA - Ao Vivo',
-        'Transmitindo ao vivo': 'Transmitindo ao vivo',
-        'Nossos Programas': 'Nossos Programas',
-        'Campanhas': 'Campanhas',
-        'Conheça nossas campanhas e participe': 'Conheça nossas campanhas e participe',
-        'Apoie-nos': 'Apoie-nos',
-        'Apoie nossa causa e faça a diferença': 'Apoie nossa causa e faça a diferença',
-        'Editais': 'Editais',
-        'Confira nossos editais e oportunidades': 'Confira nossos editais e oportunidades',
-        'Acesso Rápido': 'Acesso Rápido',
-        'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.': 'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.',
-        'Como Apoiar': 'Como Apoiar',
-        'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.': 'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.',
-        'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.': 'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.',
-        'Em breve, informações sobre nossos editais estarão disponíveis aqui.': 'Em breve, informações sobre nossos editais estarão disponíveis aqui.',
-        'Sobre': 'Sobre',
-        'Sobre a AADVITA': 'Sobre a AADVITA',
-        'Transparência': 'Transparência',
-        'Acompanhe nossa gestão, relatórios e informações financeiras': 'Acompanhe nossa gestão, relatórios e informações financeiras',
-        'Nossa Compromisso com a Transparência': 'Nossa Compromisso com a Transparência',
-        'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.': 'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.',
-        'Relatórios Financeiros': 'Relatórios Financeiros',
-        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.': 'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.',
-        'Estatuto e Documentos': 'Estatuto e Documentos',
-        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.': 'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.',
-        'Prestação de Contas': 'Prestação de Contas',
-        'Confira como utilizamos os recursos recebidos e os resultados alcançados.': 'Confira como utilizamos os recursos recebidos e os resultados alcançados.',
-        'Relatório de Atividades': 'Relatório de Atividades',
-        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Acompanhe as atividades realizadas pela associação e os resultados alcançados.',
-        'Nenhum relatório de atividades cadastrado no momento.': 'Nenhum relatório de atividades cadastrado no momento.',
-        'Atividades Realizadas:': 'Atividades Realizadas:',
-        'Projetos e Ações': 'Projetos e Ações',
-        'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.': 'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.',
-        'Doações e Recursos': 'Doações e Recursos',
-        'Informações sobre doações recebidas e como contribuir com nossa causa.': 'Informações sobre doações recebidas e como contribuir com nossa causa.',
-        'Diretoria e Conselho': 'Diretoria e Conselho',
-        'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.': 'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.',
-        'Em breve': 'Em breve',
-        'Ver Projetos': 'Ver Projetos',
-        'Ver Detalhes': 'Ver Detalhes',
-        'Voltar para Projetos': 'Voltar para Projetos',
-        'Término:': 'Término:',
-        'Identificação do Projeto': 'Identificação do Projeto',
-        'Contexto e Justificativa': 'Contexto e Justificativa',
-        'Objetivos': 'Objetivos',
-        'Público-Alvo': 'Público-Alvo',
-        'Metodologia': 'Metodologia',
-        'Recursos Necessários': 'Recursos Necessários',
-        'Parcerias': 'Parcerias',
-        'Resultados Esperados': 'Resultados Esperados',
-        'Monitoramento e Avaliação': 'Monitoramento e Avaliação',
-        'Cronograma de Execução': 'Cronograma de Execução',
-        'Orçamento': 'Orçamento',
-        'Exemplo Resumido': 'Exemplo Resumido',
-        'Considerações Finais': 'Considerações Finais',
-        'Descrição': 'Descrição',
-        'Ver Diretoria': 'Ver Diretoria',
-        'Ver Relatórios': 'Ver Relatórios',
-        'Acompanhe nossas doações e gastos de forma transparente': 'Acompanhe nossas doações e gastos de forma transparente',
-        'Doações Recebidas': 'Doações Recebidas',
-        'Gastos Realizados': 'Gastos Realizados',
-        'Tipo': 'Tipo',
-        'Descrição': 'Descrição',
-        'Doador': 'Doador',
-        'País': 'País',
-        'Valor/Quantidade': 'Valor/Quantidade',
-        'Data': 'Data',
-        'Observações': 'Observações',
-        'Categoria': 'Categoria',
-        'Fornecedor': 'Fornecedor',
-        'Valor': 'Valor',
-        'Financeira': 'Financeira',
-        'Material': 'Material',
-        'Serviço': 'Serviço',
-        'itens': 'itens',
-        'unidades': 'unidades',
-        'Total de Doações Financeiras': 'Total de Doações Financeiras',
-        'Total de Doações em Material': 'Total de Doações em Material',
-        'Total de Doações em Serviços': 'Total de Doações em Serviços',
-        'Total de Gastos': 'Total de Gastos',
-        'Nenhuma doação cadastrada no momento.': 'Nenhuma doação cadastrada no momento.',
-        'Nenhum gasto cadastrado no momento.': 'Nenhum gasto cadastrado no momento.',
-        'Voltar para Transparência': 'Voltar para Transparência',
-        'Baixar Documento': 'Baixar Documento',
-        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente': 'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente',
-        'Nenhum relatório financeiro cadastrado no momento.': 'Nenhum relatório financeiro cadastrado no momento.',
-        'Relatório': 'Relatório',
-        'Demonstrativo': 'Demonstrativo',
-        'Balanço': 'Balanço',
-        'Ver Relatórios': 'Ver Relatórios',
-        'Ver Documentos': 'Ver Documentos',
-        'Ver Prestação de Contas': 'Ver Prestação de Contas',
-        'Ver Informações': 'Ver Informações',
-        'Estatuto': 'Estatuto',
-        'Ata': 'Ata',
-        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais': 'Acesse nosso estatuto social, atas de reuniões e documentos oficiais',
-        'Confira como utilizamos os recursos recebidos e os resultados alcançados': 'Confira como utilizamos os recursos recebidos e os resultados alcançados',
-        'Informações sobre doações recebidas e como contribuir com nossa causa': 'Informações sobre doações recebidas e como contribuir com nossa causa',
-        'Nenhum documento cadastrado no momento.': 'Nenhum documento cadastrado no momento.',
-        'Nenhuma prestação de contas cadastrada no momento.': 'Nenhuma prestação de contas cadastrada no momento.',
-        'Nenhuma informação de doação cadastrada no momento.': 'Nenhuma informação de doação cadastrada no momento.',
-        'Nenhum relatório de atividades cadastrado no momento.': 'Nenhum relatório de atividades cadastrado no momento.',
-        'Período:': 'Período:',
-        'A partir de': 'A partir de',
-        'Recursos Recebidos:': 'Recursos Recebidos:',
-        'Resultados Alcançados:': 'Resultados Alcançados:',
-        'Como Contribuir:': 'Como Contribuir:',
-        'Informações de Contato': 'Informações de Contato',
-        'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.': 'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.',
-        'E-mail:': 'E-mail:',
-        'Telefone:': 'Telefone:',
-        'Entre em contato através do formulário': 'Entre em contato através do formulário',
-        'Conheça nossa história, missão e valores': 'Conheça nossa história, missão e valores',
-        'Quem Somos': 'Quem Somos',
-        'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.': 'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.',
-        'Nossa Missão': 'Nossa Missão',
-        'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.': 'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.',
-        'Nossos Valores': 'Nossos Valores',
-        'Inclusão:': 'Inclusão:',
-        'Acreditamos que todos têm o direito de participar plenamente da sociedade': 'Acreditamos que todos têm o direito de participar plenamente da sociedade',
-        'Respeito:': 'Respeito:',
-        'Valorizamos a diversidade e a dignidade de cada pessoa': 'Valorizamos a diversidade e a dignidade de cada pessoa',
-        'Compromisso:': 'Compromisso:',
-        'Trabalhamos com dedicação para alcançar nossos objetivos': 'Trabalhamos com dedicação para alcançar nossos objetivos',
-        'Solidariedade:': 'Solidariedade:',
-        'Apoiamos uns aos outros em nossa jornada coletiva': 'Apoiamos uns aos outros em nossa jornada coletiva',
-        'Transparência:': 'Transparência:',
-        'Mantemos práticas éticas e transparentes em todas as nossas ações': 'Mantemos práticas éticas e transparentes em todas as nossas ações',
-        'Diretoria': 'Diretoria',
-        'Diretor de Comunicação': 'Diretor de Comunicação',
-        'Presidente': 'Presidente',
-        'Vice Presidente': 'Vice Presidente',
-        'Primeiro(a) Secretário(a)': 'Primeiro(a) Secretário(a)',
-        'Segundo(a) Secretário(a)': 'Segundo(a) Secretário(a)',
-        'Tesoureiro(a)': 'Tesoureiro(a)',
-        'Nome do Presidente': 'Nome do Presidente',
-        'Nome do Vice Presidente': 'Nome do Vice-Presidente',
-        'Vice-Presidente': 'Vice-Presidente',
-        'Vice Presidente': 'Vice-Presidente',
-        'Nome do Primeiro Secretário': 'Nome do Primeiro Secretário',
-        'Nome do Segundo Secretário': 'Nome do Segundo Secretário',
-        'Nome do Tesoureiro': 'Nome do Tesoureiro',
-        'Primeiro Secretário(a)': 'Primeiro Secretário(a)',
-        'Segundo Secretário(a)': 'Segundo Secretário(a)',
-        'Primeiro Tesoureiro(a)': 'Primeiro Tesoureiro(a)',
-        'Conselho Fiscal': 'Conselho Fiscal',
-        'Conselheiro': 'Conselheiro(a)',
-        'Conselheiro(a)': 'Conselheiro(a)',
-        'Coordenação Social': 'Coordenação Social',
-        'Coordenador(a)': 'Coordenador(a)',
-        'Membro da Coordenação Social': 'Coordenador(a)',
-        'Nenhum coordenador(a) cadastrado(a).': 'Nenhum coordenador(a) cadastrado(a).',
-        'Nome do Conselheiro 1': 'Nome do Conselheiro 1',
-        'Nome do Conselheiro 2': 'Nome do Conselheiro 2',
-        'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.': 'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.',
-        'Contato': 'Contato',
-        'Links Rápidos': 'Links Rápidos',
-        'Não há reuniões presenciais programadas no momento.': 'Não há reuniões presenciais programadas no momento.',
-        'Não há reuniões virtuais programadas no momento.': 'Não há reuniões virtuais programadas no momento.',
-        'Não há projetos cadastrados no momento.': 'Não há projetos cadastrados no momento.',
-        'Não há ações cadastradas no momento.': 'Não há ações cadastradas no momento.',
-        'Não há reuniões presenciais cadastradas no momento.': 'Não há reuniões presenciais cadastradas no momento.',
-        'Não há reuniões virtuais cadastradas no momento.': 'Não há reuniões virtuais cadastradas no momento.',
-        'Volte em breve para conferir nossa agenda atualizada.': 'Volte em breve para conferir nossa agenda atualizada.',
-        'Acessar reunião': 'Acessar reunião',
-        'Acessar evento': 'Acessar evento',
-        'Local:': 'Local:',
-        'Endereço:': 'Endereço:',
-        'Plataforma:': 'Plataforma:',
-        'Data:': 'Data:',
-        'Hora:': 'Hora:',
-        'Visitar site': 'Visitar site',
-        'Não há apoiadores cadastrados no momento.': 'Não há apoiadores cadastrados no momento.',
-        'Galeria': 'Galeria',
-        'Galeria de Imagens': 'Galeria de Imagens',
-        'Fotos de Eventos': 'Fotos de Eventos',
-        'Fotos de Ações': 'Fotos de Ações',
-        'Galeria Geral': 'Galeria Geral',
-        'Confira nossa galeria completa de álbuns': 'Confira nossa galeria completa de álbuns',
-        'Ver Álbum': 'Ver Álbum',
-        'Voltar para Galeria': 'Voltar para Galeria',
-        'foto(s)': 'foto(s)',
-        'Este álbum ainda não possui fotos.': 'Este álbum ainda não possui fotos.',
-        'Nenhum álbum cadastrado no momento.': 'Nenhum álbum cadastrado no momento.',
-        'Álbuns:': 'Álbuns:',
-        'Enviar Imagem': 'Enviar Imagem',
-        'Título (opcional)': 'Título (opcional)',
-        'Descrição (opcional)': 'Descrição (opcional)',
-        'Selecionar arquivo': 'Selecionar arquivo',
-        'Nenhuma imagem cadastrada no momento.': 'Nenhuma imagem cadastrada no momento.',
-        'Imagem ampliada': 'Imagem ampliada',
-        'Fechar': 'Fechar',
-        'Anterior': 'Anterior',
-        'Próxima': 'Próxima',
-        'Vídeos': 'Vídeos',
-        'Nossos Vídeos': 'Nossos Vídeos',
-        'Confira nossos vídeos e conteúdos em vídeo': 'Confira nossos vídeos e conteúdos em vídeo',
-        'Vídeos em Destaque': 'Vídeos em Destaque',
-        'Ver todos os vídeos': 'Ver todos os vídeos',
-        'Nenhum vídeo cadastrado no momento.': 'Nenhum vídeo cadastrado no momento.',
-        'Assistir vídeo': 'Assistir vídeo',
-        'Associe-se': 'Associe-se',
-        'Eventos': 'Eventos',
-        'Próximos Eventos': 'Próximos Eventos',
-        'Ver todos os eventos': 'Ver todos os eventos',
-        'Não há eventos cadastrados no momento.': 'Não há eventos cadastrados no momento.',
-        'Tipo:': 'Tipo:',
-        'Ir para conteúdo principal': 'Ir para conteúdo principal',
-        'Abrir menu': 'Abrir menu',
-        'Menu': 'Menu',
-        'Navegação principal': 'Navegação principal',
-        'AADVITA - Página inicial': 'AADVITA - Página inicial',
-        'Português': 'Português',
-        'Español': 'Español',
-        'English': 'English',
-        'Fechar mensagem': 'Fechar mensagem',
-        'Email:': 'Email:',
-        'Telefone:': 'Telefone:',
-        'WhatsApp:': 'WhatsApp:',
-        'Doações': 'Doações',
-        'QR Code para doação': 'QR Code para doação',
-        'Todos os direitos reservados.': 'Todos os direitos reservados.',
-        'Desenvolvido por:': 'Desenvolvido por:',
-        'AADVITA - Associação de Deficientes Visuais': 'AADVITA - Associação de Deficientes Visuais',
-        '(abre em nova aba)': '(abre em nova aba)',
-        'Entrar': 'Entrar',
-        'Acesse sua conta ou área administrativa': 'Acesse sua conta ou área administrativa',
-        'Associado': 'Associado',
-        'Administrador': 'Administrador',
-        'Digite seu CPF cadastrado': 'Digite seu CPF cadastrado',
-        'Senha': 'Senha',
-        'Digite sua senha': 'Digite sua senha',
-        'Opções de idioma': 'Opções de idioma',
-        'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade': 'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade',
-        'AADVITA - Associação dos Deficientes Visuais Tapuienses': 'AADVITA - Associação dos Deficientes Visuais Tapuienses',
-    },
-    'es': {
-        'Início': 'Inicio',
-        'Agendas': 'Agendas',
-        'Agenda Presencial': 'Agenda Presencial',
-        'Agenda Virtual': 'Agenda Virtual',
-        'Projetos': 'Proyectos',
-        'Ações': 'Acciones',
-        'Apoiadores': 'Apoiadores',
-        'Selecionar idioma': 'Seleccionar idioma',
-        'Idioma atual': 'Idioma actual',
-        'Bem-vindo à AADVITA': 'Bienvenido a AADVITA',
-        'Associação de Deficientes Visuais promovendo inclusão e acessibilidade': 'Asociación de Deficientes Visuales promoviendo inclusión y accesibilidad',
-        'Conheça nossos projetos': 'Conoce nuestros proyectos',
-        'Destaques': 'Destacados',
-        'Próximas Reuniões Presenciais': 'Próximas Reuniones Presenciales',
-        'Próximas Reuniões Virtuais': 'Próximas Reuniones Virtuales',
-        'Projetos em Destaque': 'Proyectos Destacados',
-        'Ações Recentes': 'Acciones Recientes',
-        'Ver todas as reuniões presenciais': 'Ver todas las reuniones presenciales',
-        'Ver todas as reuniões virtuais': 'Ver todas las reuniones virtuales',
-        'Ver todos os projetos': 'Ver todos los proyectos',
-        'Ver todas as ações': 'Ver todas las acciones',
-        'Agenda de Reuniões Presenciais': 'Agenda de Reuniones Presenciales',
-        'Confira nossas próximas reuniões presenciais e eventos': 'Consulta nuestras próximas reuniones presenciales y eventos',
-        'Agenda de Reuniões Virtuais': 'Agenda de Reuniones Virtuales',
-        'Participe das nossas reuniões e eventos online': 'Participa en nuestras reuniones y eventos en línea',
-        'Nossos Projetos': 'Nuestros Proyectos',
-        'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade': 'Conoce los proyectos que desarrollamos para promover inclusión y accesibilidad',
-        'Nossas Ações': 'Nuestras Acciones',
-        'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA': 'Acompaña las acciones e iniciativas desarrolladas por AADVITA',
-        'Nossos Apoiadores': 'Nuestros Apoiadores',
-        'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis': 'Agradecemos a todos los que apoyan nuestra causa y hacen posibles nuestros proyectos',
-        'Informativo': 'Informativo',
-        'Fique por dentro das notícias e podcasts da AADVITA': 'Mantente al tanto de las noticias y podcasts de AADVITA',
-        'Todos': 'Todos',
-        'Notícias': 'Noticias',
-        'Podcast': 'Podcast',
-        'Notícia': 'Noticia',
-        'Publicado em': 'Publicado el',
-        'Não há notícias cadastradas no momento.': 'No hay noticias registradas en este momento.',
-        'Não há podcasts cadastrados no momento.': 'No hay podcasts registrados en este momento.',
-        'Não há informativos cadastrados no momento.': 'No hay informativos registrados en este momento.',
-        'Ler Notícia': 'Leer Noticia',
-        'Escutar Podcast': 'Escuchar Podcast',
-        'Voltar para Informativo': 'Volver a Informativo',
-        'Abrir no SoundCloud': 'Abrir en SoundCloud',
-        'Clique no botão abaixo para escutar o podcast completo': 'Haga clic en el botón a continuación para escuchar el podcast completo',
-        'Compartilhar': 'Compartir',
-        'Compartilhar no Facebook': 'Compartir en Facebook',
-        'Compartilhar no Twitter': 'Compartir en Twitter',
-        'Compartilhar no WhatsApp': 'Compartir en WhatsApp',
-        'Compartilhar no LinkedIn': 'Compartir en LinkedIn',
-        'Copiar Link': 'Copiar Enlace',
-        'Link Copiado!': '¡Enlace Copiado!',
-        'Copiar link': 'Copiar enlace',
-        'Não foi possível copiar o link. Por favor, copie manualmente:': 'No se pudo copiar el enlace. Por favor, copie manualmente:',
-        'Rádio AADVITA': 'Radio AADVITA',
-        'Ouça nossos programas de rádio e acompanhe nossa programação': 'Escucha nuestros programas de radio y sigue nuestra programación',
-        'Apresentador': 'Presentador',
-        'Horário': 'Horario',
-        'Ao Vivo': 'En Vivo',
-        'Clique em play para ouvir ao vivo': 'Haz clic en play para escuchar en vivo',
-        'Episódio': 'Episodio',
-        'Ouça o episódio completo': 'Escucha el episodio completo',
-        'Seu navegador não suporta o elemento de áudio.': 'Su navegador no soporta el elemento de audio.',
-        'Não há programas de rádio cadastrados no momento.': 'No hay programas de radio registrados en este momento.',
-        'Rádio AADVITA - Ao Vivo': 'Radio AADVITA - En Vivo',
-        'Transmitindo ao vivo': 'Transmitiendo en vivo',
-        'Nossos Programas': 'Nuestros Programas',
-        'Campanhas': 'Campañas',
-        'Conheça nossas campanhas e participe': 'Conoce nuestras campañas y participa',
-        'Apoie-nos': 'Apóyanos',
-        'Apoie nossa causa e faça a diferença': 'Apoya nuestra causa y marca la diferencia',
-        'Editais': 'Editales',
-        'Confira nossos editais e oportunidades': 'Consulta nuestros editales y oportunidades',
-        'Acesso Rápido': 'Acceso Rápido',
-        'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.': 'Pronto, la información sobre nuestras campañas estará disponible aquí.',
-        'Como Apoiar': 'Cómo Apoyar',
-        'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.': 'Su contribución es fundamental para continuar promoviendo la inclusión y accesibilidad.',
-        'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.': 'Pronto, más información sobre cómo apoyar estará disponible aquí.',
-        'Em breve, informações sobre nossos editais estarão disponíveis aqui.': 'Pronto, la información sobre nuestros editales estará disponible aquí.',
-        'Sobre': 'Sobre',
-        'Sobre a AADVITA': 'Sobre AADVITA',
-        'Conheça nossa história, missão e valores': 'Conoce nuestra historia, misión y valores',
-        'Transparência': 'Transparencia',
-        'Acompanhe nossa gestão, relatórios e informações financeiras': 'Consulta nuestra gestión, informes e información financiera',
-        'Nossa Compromisso com a Transparência': 'Nuestro Compromiso con la Transparencia',
-        'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.': 'AADVITA cree que la transparencia es fundamental para construir confianza y fortalecer nuestra relación con la comunidad. Por eso, proporcionamos información sobre nuestra gestión, actividades y recursos financieros.',
-        'Relatórios Financeiros': 'Informes Financieros',
-        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.': 'Consulta nuestros informes financieros, estados financieros y balances.',
-        'Estatuto e Documentos': 'Estatuto y Documentos',
-        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.': 'Accede a nuestro estatuto social, actas de reuniones y documentos oficiales.',
-        'Prestação de Contas': 'Rendición de Cuentas',
-        'Confira como utilizamos os recursos recebidos e os resultados alcançados.': 'Consulta cómo utilizamos los recursos recibidos y los resultados alcanzados.',
-        'Relatório de Atividades': 'Informe de Actividades',
-        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Consulta las actividades realizadas por la asociación y los resultados alcanzados.',
-        'Nenhum relatório de atividades cadastrado no momento.': 'No hay informes de actividades registrados en este momento.',
-        'Atividades Realizadas:': 'Actividades Realizadas:',
-        'Projetos e Ações': 'Proyectos y Acciones',
-        'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.': 'Consulta los proyectos desarrollados y acciones realizadas en beneficio de la comunidad.',
-        'Doações e Recursos': 'Donaciones y Recursos',
-        'Informações sobre doações recebidas e como contribuir com nossa causa.': 'Información sobre donaciones recibidas y cómo contribuir con nuestra causa.',
-        'Diretoria e Conselho': 'Directiva y Consejo',
-        'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.': 'Conoce los miembros de la directiva y consejo fiscal responsables de la gestión.',
-        'Em breve': 'Próximamente',
-        'Ver Projetos': 'Ver Proyectos',
-        'Ver Detalhes': 'Ver Detalles',
-        'Voltar para Projetos': 'Volver a Proyectos',
-        'Término:': 'Término:',
-        'Identificação do Projeto': 'Identificación del Proyecto',
-        'Contexto e Justificativa': 'Contexto y Justificación',
-        'Objetivos': 'Objetivos',
-        'Público-Alvo': 'Público Objetivo',
-        'Metodologia': 'Metodología',
-        'Recursos Necessários': 'Recursos Necesarios',
-        'Parcerias': 'Alianzas',
-        'Resultados Esperados': 'Resultados Esperados',
-        'Monitoramento e Avaliação': 'Monitoreo y Evaluación',
-        'Cronograma de Execução': 'Cronograma de Ejecución',
-        'Orçamento': 'Presupuesto',
-        'Exemplo Resumido': 'Ejemplo Resumido',
-        'Considerações Finais': 'Consideraciones Finales',
-        'Descrição': 'Descripción',
-        'Ver Diretoria': 'Ver Directiva',
-        'Ver Relatórios': 'Ver Informes',
-        'Acompanhe nossas doações e gastos de forma transparente': 'Consulta nuestras donaciones y gastos de forma transparente',
-        'Doações Recebidas': 'Donaciones Recibidas',
-        'Gastos Realizados': 'Gastos Realizados',
-        'Tipo': 'Tipo',
-        'Descrição': 'Descripción',
-        'Doador': 'Donante',
-        'País': 'País',
-        'Valor/Quantidade': 'Valor/Cantidad',
-        'Data': 'Fecha',
-        'Observações': 'Observaciones',
-        'Categoria': 'Categoría',
-        'Fornecedor': 'Proveedor',
-        'Valor': 'Valor',
-        'Financeira': 'Financiera',
-        'Material': 'Material',
-        'Serviço': 'Servicio',
-        'itens': 'artículos',
-        'unidades': 'unidades',
-        'Total de Doações Financeiras': 'Total de Donaciones Financieras',
-        'Total de Doações em Material': 'Total de Donaciones en Material',
-        'Total de Doações em Serviços': 'Total de Donaciones en Servicios',
-        'Total de Gastos': 'Total de Gastos',
-        'Nenhuma doação cadastrada no momento.': 'No hay donaciones registradas en este momento.',
-        'Nenhum gasto cadastrado no momento.': 'No hay gastos registrados en este momento.',
-        'Voltar para Transparência': 'Volver a Transparencia',
-        'Baixar Documento': 'Descargar Documento',
-        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente': 'Consulta nuestros informes financieros, estados financieros y balances de forma transparente',
-        'Nenhum relatório financeiro cadastrado no momento.': 'No hay informes financieros registrados en este momento.',
-        'Relatório': 'Informe',
-        'Demonstrativo': 'Estado Financiero',
-        'Balanço': 'Balance',
-        'Ver Relatórios': 'Ver Informes',
-        'Ver Documentos': 'Ver Documentos',
-        'Ver Prestação de Contas': 'Ver Rendición de Cuentas',
-        'Ver Informações': 'Ver Información',
-        'Estatuto': 'Estatuto',
-        'Ata': 'Acta',
-        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais': 'Accede a nuestro estatuto social, actas de reuniones y documentos oficiales',
-        'Confira como utilizamos os recursos recebidos e os resultados alcançados': 'Consulta cómo utilizamos los recursos recibidos y los resultados alcanzados',
-        'Informações sobre doações recebidas e como contribuir com nossa causa': 'Información sobre donaciones recibidas y cómo contribuir con nuestra causa',
-        'Nenhum documento cadastrado no momento.': 'No hay documentos registrados en este momento.',
-        'Nenhuma prestação de contas cadastrada no momento.': 'No hay rendiciones de cuentas registradas en este momento.',
-        'Nenhuma informação de doação cadastrada no momento.': 'No hay información de donaciones registrada en este momento.',
-        'Nenhum relatório de atividades cadastrado no momento.': 'No hay informes de actividades registrados en este momento.',
-        'Período:': 'Período:',
-        'A partir de': 'A partir de',
-        'Recursos Recebidos:': 'Recursos Recibidos:',
-        'Resultados Alcançados:': 'Resultados Alcanzados:',
-        'Atividades Realizadas:': 'Actividades Realizadas:',
-        'Relatório de Atividades': 'Informe de Actividades',
-        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Consulta las actividades realizadas por la asociación y los resultados alcanzados.',
-        'Como Contribuir:': 'Cómo Contribuir:',
-        'Informações de Contato': 'Información de Contacto',
-        'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.': 'Para más información sobre transparencia, contáctanos a través de los canales oficiales.',
-        'E-mail:': 'Correo:',
-        'Telefone:': 'Teléfono:',
-        'Entre em contato através do formulário': 'Contáctanos a través del formulario',
-        'Quem Somos': 'Quiénes Somos',
-        'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.': 'AADVITA - Asociación de Deficientes Visuales Tapuienses es una organización sin fines de lucro dedicada a promover la inclusión, accesibilidad y calidad de vida para personas con discapacidad visual en nuestra comunidad.',
-        'Nossa Missão': 'Nuestra Misión',
-        'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.': 'Promover la inclusión social, educativa y profesional de personas con discapacidad visual, ofreciendo apoyo, capacitación y recursos necesarios para que puedan desarrollar todo su potencial y participar plenamente en la sociedad.',
-        'Nossos Valores': 'Nuestros Valores',
-        'Inclusão:': 'Inclusión:',
-        'Acreditamos que todos têm o direito de participar plenamente da sociedade': 'Creemos que todos tienen derecho a participar plenamente en la sociedad',
-        'Respeito:': 'Respeto:',
-        'Valorizamos a diversidade e a dignidade de cada pessoa': 'Valoramos la diversidad y la dignidad de cada persona',
-        'Compromisso:': 'Compromiso:',
-        'Trabalhamos com dedicação para alcançar nossos objetivos': 'Trabajamos con dedicación para alcanzar nuestros objetivos',
-        'Solidariedade:': 'Solidaridad:',
-        'Apoiamos uns aos outros em nossa jornada coletiva': 'Nos apoyamos mutuamente en nuestro viaje colectivo',
-        'Transparência:': 'Transparencia:',
-        'Mantemos práticas éticas e transparentes em todas as nossas ações': 'Mantenemos prácticas éticas y transparentes en todas nuestras acciones',
-        'Diretoria': 'Directiva',
-        'Diretor de Comunicação': 'Director de Comunicación',
-        'Presidente': 'Presidente',
-        'Vice Presidente': 'Vicepresidente',
-        'Primeiro(a) Secretário(a)': 'Primer(a) Secretario(a)',
-        'Segundo(a) Secretário(a)': 'Segundo(a) Secretario(a)',
-        'Tesoureiro(a)': 'Tesorero(a)',
-        'Nome do Presidente': 'Nombre del Presidente',
-        'Nome do Vice Presidente': 'Nombre del Vicepresidente',
-        'Vice-Presidente': 'Vicepresidente',
-        'Vice Presidente': 'Vicepresidente',
-        'Nome do Primeiro Secretário': 'Nombre del Primer Secretario',
-        'Nome do Segundo Secretário': 'Nombre del Segundo Secretario',
-        'Nome do Tesoureiro': 'Nombre del Tesorero',
-        'Primeiro Secretário(a)': 'Primer Secretario(a)',
-        'Segundo Secretário(a)': 'Segundo Secretario(a)',
-        'Primeiro Tesoureiro(a)': 'Primer Tesorero(a)',
-        'Conselho Fiscal': 'Consejo Fiscal',
-        'Conselheiro': 'Consejero(a)',
-        'Conselheiro(a)': 'Consejero(a)',
-        'Coordenação Social': 'Coordinación Social',
-        'Coordenador(a)': 'Coordinador(a)',
-        'Membro da Coordenação Social': 'Coordinador(a)',
-        'Nenhum coordenador(a) cadastrado(a).': 'Ningún coordinador(a) registrado(a).',
-        'Nome do Conselheiro 1': 'Nombre del Consejero 1',
-        'Nome do Conselheiro 2': 'Nombre del Consejero 2',
-        'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.': 'Asociación dedicada a promover la inclusión y accesibilidad para personas con discapacidad visual.',
-        'Contato': 'Contacto',
-        'Links Rápidos': 'Enlaces Rápidos',
-        'Não há reuniões presenciais programadas no momento.': 'No hay reuniones presenciales programadas en este momento.',
-        'Não há reuniões virtuais programadas no momento.': 'No hay reuniones virtuales programadas en este momento.',
-        'Não há projetos cadastrados no momento.': 'No hay proyectos registrados en este momento.',
-        'Não há ações cadastradas no momento.': 'No hay acciones registradas en este momento.',
-        'Não há reuniões presenciais cadastradas no momento.': 'No hay reuniones presenciales registradas en este momento.',
-        'Não há reuniões virtuais cadastradas no momento.': 'No hay reuniones virtuales registradas en este momento.',
-        'Volte em breve para conferir nossa agenda atualizada.': 'Vuelve pronto para consultar nuestra agenda actualizada.',
-        'Acessar reunião': 'Acceder a reunión',
-        'Acessar evento': 'Acceder a evento',
-        'Local:': 'Local:',
-        'Endereço:': 'Dirección:',
-        'Plataforma:': 'Plataforma:',
-        'Data:': 'Fecha:',
-        'Hora:': 'Hora:',
-        'Visitar site': 'Visitar sitio',
-        'Não há apoiadores cadastrados no momento.': 'No hay apoyadores registrados en este momento.',
-        'Galeria': 'Galería',
-        'Galeria de Imagens': 'Galería de Imágenes',
-        'Fotos de Eventos': 'Fotos de Eventos',
-        'Fotos de Ações': 'Fotos de Acciones',
-        'Galeria Geral': 'Galería General',
-        'Confira nossa galeria completa de álbuns': 'Consulte nuestra galería completa de álbumes',
-        'Ver Álbum': 'Ver Álbum',
-        'Voltar para Galeria': 'Volver a Galería',
-        'foto(s)': 'foto(s)',
-        'Este álbum ainda não possui fotos.': 'Este álbum aún no tiene fotos.',
-        'Nenhum álbum cadastrado no momento.': 'No hay álbumes registrados en este momento.',
-        'Álbuns:': 'Álbumes:',
-        'Enviar Imagem': 'Enviar Imagen',
-        'Título (opcional)': 'Título (opcional)',
-        'Descrição (opcional)': 'Descripción (opcional)',
-        'Selecionar arquivo': 'Seleccionar archivo',
-        'Nenhuma imagem cadastrada no momento.': 'No hay imágenes registradas en este momento.',
-        'Imagem ampliada': 'Imagen ampliada',
-        'Fechar': 'Cerrar',
-        'Anterior': 'Anterior',
-        'Próxima': 'Siguiente',
-        'Vídeos': 'Videos',
-        'Nossos Vídeos': 'Nuestros Videos',
-        'Confira nossos vídeos e conteúdos em vídeo': 'Consulta nuestros videos y contenidos en video',
-        'Vídeos em Destaque': 'Videos Destacados',
-        'Ver todos os vídeos': 'Ver todos los videos',
-        'Nenhum vídeo cadastrado no momento.': 'No hay videos registrados en este momento.',
-        'Assistir vídeo': 'Ver video',
-        'Associe-se': 'Asóciate',
-        'Eventos': 'Eventos',
-        'Próximos Eventos': 'Próximos Eventos',
-        'Ver todos os eventos': 'Ver todos los eventos',
-        'Não há eventos cadastrados no momento.': 'No hay eventos registrados en este momento.',
-        'Tipo:': 'Tipo:',
-        'Ir para conteúdo principal': 'Ir al contenido principal',
-        'Abrir menu': 'Abrir menú',
-        'Menu': 'Menú',
-        'Navegação principal': 'Navegación principal',
-        'AADVITA - Página inicial': 'AADVITA - Página de inicio',
-        'Português': 'Portugués',
-        'Español': 'Español',
-        'English': 'Inglés',
-        'Fechar mensagem': 'Cerrar mensaje',
-        'Email:': 'Correo:',
-        'Telefone:': 'Teléfono:',
-        'WhatsApp:': 'WhatsApp:',
-        'Doações': 'Donaciones',
-        'QR Code para doação': 'Código QR para donación',
-        'Todos os direitos reservados.': 'Todos los derechos reservados.',
-        'Desenvolvido por:': 'Desarrollado por:',
-        'AADVITA - Associação de Deficientes Visuais': 'AADVITA - Asociación de Deficientes Visuales',
-        '(abre em nova aba)': '(se abre en nueva pestaña)',
-        'Entrar': 'Iniciar sesión',
-        'Acesse sua conta ou área administrativa': 'Accede a tu cuenta o área administrativa',
-        'Associado': 'Asociado',
-        'Administrador': 'Administrador',
-        'Digite seu CPF cadastrado': 'Ingresa tu CPF registrado',
-        'Senha': 'Contraseña',
-        'Digite sua senha': 'Ingresa tu contraseña',
-        'Opções de idioma': 'Opciones de idioma',
-        'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade': 'Asociación de Deficientes Visuales Tapuienses AADVITA - Promoviendo inclusión y accesibilidad',
-        'AADVITA - Associação dos Deficientes Visuais Tapuienses': 'AADVITA - Asociación de Deficientes Visuales Tapuienses',
-        'Radar de Acessibilidade': 'Radar de Accesibilidad',
-        'Validar Certificados': 'Validar Certificados',
-        'Reciclagem': 'Reciclaje',
-        'O que fazemos': 'Lo que hacemos',
-        'Associação dos Deficientes Visuais Tapuienses': 'Asociación de Deficientes Visuales Tapuienses',
-        'Conheça nossas campanhas e participe.': 'Conoce nuestras campañas y participa.',
-        'Sua contribuição transforma vidas!': '¡Tu contribución transforma vidas!',
-        'Confira nossos editais e oportunidades.': 'Consulta nuestros editales y oportunidades.',
-        'Seja Voluntário': 'Sé Voluntario',
-        'Ações principais': 'Acciones principales',
-        'Imagem anterior': 'Imagen anterior',
-        'Próxima imagem': 'Siguiente imagen',
-        'Ir para imagem': 'Ir a imagen',
-        'Solicitar Coleta de Reciclagem': 'Solicitar Recolección de Reciclaje',
-        'Preencha o formulário abaixo para solicitar a coleta de materiais recicláveis. Nossa equipe entrará em contato em breve.': 'Complete el formulario a continuación para solicitar la recolección de materiales reciclables. Nuestro equipo se pondrá en contacto pronto.',
-        'Tipo de Material': 'Tipo de Material',
-        'Selecione o tipo de material': 'Seleccione el tipo de material',
-        'Ferro': 'Hierro',
-        'Alumínio': 'Aluminio',
-        'Cobre': 'Cobre',
-        'Plástico': 'Plástico',
-        'Papel': 'Papel',
-        'Papelão': 'Cartón',
-        'Nome Completo': 'Nombre Completo',
-        'Digite seu nome completo': 'Ingrese su nombre completo',
-        'Telefone/WhatsApp': 'Teléfono/WhatsApp',
-        'Endereço de Retirada do Material': 'Dirección de Recolección del Material',
-        'Digite o endereço completo onde o material deve ser coletado': 'Ingrese la dirección completa donde se debe recolectar el material',
-        'Observações': 'Observaciones',
-        'Informações adicionais sobre o material ou horários preferenciais para coleta': 'Información adicional sobre el material u horarios preferenciales para la recolección',
-        'Enviar Solicitação': 'Enviar Solicitud',
-        'Validar Certificado': 'Validar Certificado',
-        'Informe o número do certificado (ex: <strong>CERT-7B062C2604</strong>) para verificar a autenticidade.': 'Ingrese el número del certificado (ej: <strong>CERT-7B062C2604</strong>) para verificar la autenticidad.',
-        'Número do Certificado': 'Número del Certificado',
-        'Validar': 'Validar',
-        'Voltar': 'Volver',
-        'Certificado válido': 'Certificado válido',
-        'O certificado': 'El certificado',
-        'é autêntico': 'es auténtico',
-        'Beneficiário:': 'Beneficiario:',
-        'Curso/Atividade:': 'Curso/Actividad:',
-        'Descrição:': 'Descripción:',
-        'Data de emissão:': 'Fecha de emisión:',
-        'Validade:': 'Validez:',
-        'Vitalício': 'Vitalicio',
-        'Certificado inválido': 'Certificado inválido',
-        'Não encontramos um certificado válido para o código informado.': 'No encontramos un certificado válido para el código proporcionado.',
-        'Validar outro certificado': 'Validar otro certificado',
-        'Registrar Problema de Acessibilidade': 'Registrar Problema de Accesibilidad',
-        'Ajude-nos a mapear os problemas de acessibilidade na cidade. Sua denúncia é importante para cobrarmos melhorias dos órgãos públicos.': 'Ayúdanos a mapear los problemas de accesibilidad en la ciudad. Tu denuncia es importante para exigir mejoras a los órganos públicos.',
-        'Tipo de Problema': 'Tipo de Problema',
-        'Selecione o tipo de problema': 'Seleccione el tipo de problema',
-        'Acessibilidade Urbana': 'Accesibilidad Urbana',
-        'Calçada': 'Acera',
-        'Faixa de Pedestre': 'Cruce de Peatones',
-        'Sinal Sonoro': 'Señal Sonora',
-        'Rampa de Acesso': 'Rampa de Acceso',
-        'Piso Tátil': 'Piso Táctil',
-        'Transporte Público': 'Transporte Público',
-        'Estabelecimento Comercial': 'Establecimiento Comercial',
-        'Outro': 'Otro',
-        'Localização (Endereço)': 'Ubicación (Dirección)',
-        'Descrição do Problema': 'Descripción del Problema',
-        'Descreva detalhadamente o problema encontrado...': 'Describe detalladamente el problema encontrado...',
-        'Seu Nome Completo': 'Tu Nombre Completo',
-        'Nome completo': 'Nombre completo',
-        'Email (opcional)': 'Correo (opcional)',
-        'Anexos (Fotos, documentos) - opcional': 'Anexos (Fotos, documentos) - opcional',
-        'Envie fotos ou documentos que ajudem a ilustrar o problema. Tamanho máximo por arquivo: 16MB.': 'Envía fotos o documentos que ayuden a ilustrar el problema. Tamaño máximo por archivo: 16MB.',
-        'Enviar Denúncia': 'Enviar Denuncia',
-        'Cancelar': 'Cancelar',
-        'Fique por dentro das novidades da AADVITA.': 'Mantente al tanto de las novedades de AADVITA.',
-        'Ouça nossos podcasts e conteúdos em áudio.': 'Escucha nuestros podcasts y contenidos en audio.',
-        'Nenhum serviço cadastrado no momento.': 'Ningún servicio registrado en este momento.',
-        'Acessibilidade': 'Accesibilidad',
-        'Opções de acessibilidade': 'Opciones de accesibilidad',
-        'Tamanho da Fonte': 'Tamaño de la Fuente',
-        'Diminuir fonte': 'Disminuir fuente',
-        'Aumentar fonte': 'Aumentar fuente',
-        'Diminuir': 'Disminuir',
-        'Aumentar': 'Aumentar',
-        'Contraste': 'Contraste',
-        'Alternar contraste': 'Alternar contraste',
-        'Alto Contraste': 'Alto Contraste',
-        'Alto Contraste Ativo': 'Alto Contraste Activo',
-        'Áudio Descrição': 'Descripción de Audio',
-        'Áudio Descrição Ativa': 'Descripción de Audio Activa',
-        'Alternar áudio descrição': 'Alternar descripción de audio',
-        'Redefinir': 'Restablecer',
-    },
-    'en': {
-        'Início': 'Home',
-        'Agendas': 'Schedules',
-        'Agenda Presencial': 'In-Person Schedule',
-        'Agenda Virtual': 'Virtual Schedule',
-        'Projetos': 'Projects',
-        'Ações': 'Actions',
-        'Apoiadores': 'Supporters',
-        'Selecionar idioma': 'Select language',
-        'Idioma atual': 'Current language',
-        'Bem-vindo à AADVITA': 'Welcome to AADVITA',
-        'Associação de Deficientes Visuais promovendo inclusão e acessibilidade': 'Association of Visually Impaired promoting inclusion and accessibility',
-        'Conheça nossos projetos': 'Learn about our projects',
-        'Destaques': 'Highlights',
-        'Próximas Reuniões Presenciais': 'Upcoming In-Person Meetings',
-        'Próximas Reuniões Virtuais': 'Upcoming Virtual Meetings',
-        'Projetos em Destaque': 'Featured Projects',
-        'Ações Recentes': 'Recent Actions',
-        'Ver todas as reuniões presenciais': 'View all in-person meetings',
-        'Ver todas as reuniões virtuais': 'View all virtual meetings',
-        'Ver todos os projetos': 'View all projects',
-        'Ver todas as ações': 'View all actions',
-        'Agenda de Reuniões Presenciais': 'In-Person Meeting Schedule',
-        'Confira nossas próximas reuniões presenciais e eventos': 'Check out our upcoming in-person meetings and events',
-        'Agenda de Reuniões Virtuais': 'Virtual Meeting Schedule',
-        'Participe das nossas reuniões e eventos online': 'Join our online meetings and events',
-        'Nossos Projetos': 'Our Projects',
-        'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade': 'Learn about the projects we develop to promote inclusion and accessibility',
-        'Nossas Ações': 'Our Actions',
-        'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA': 'Follow the actions and initiatives developed by AADVITA',
-        'Nossos Apoiadores': 'Our Supporters',
-        'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis': 'We thank everyone who supports our cause and makes our projects possible',
-        'Informativo': 'News & Podcasts',
-        'Fique por dentro das notícias e podcasts da AADVITA': 'Stay up to date with AADVITA news and podcasts',
-        'Todos': 'All',
-        'Notícias': 'News',
-        'Podcast': 'Podcast',
-        'Notícia': 'News',
-        'Publicado em': 'Published on',
-        'Não há notícias cadastradas no momento.': 'No news registered at this time.',
-        'Não há podcasts cadastrados no momento.': 'No podcasts registered at this time.',
-        'Não há informativos cadastrados no momento.': 'No news or podcasts registered at this time.',
-        'Ler Notícia': 'Read News',
-        'Escutar Podcast': 'Listen to Podcast',
-        'Voltar para Informativo': 'Back to News & Podcasts',
-        'Abrir no SoundCloud': 'Open in SoundCloud',
-        'Clique no botão abaixo para escutar o podcast completo': 'Click the button below to listen to the full podcast',
-        'Compartilhar': 'Share',
-        'Compartilhar no Facebook': 'Share on Facebook',
-        'Compartilhar no Twitter': 'Share on Twitter',
-        'Compartilhar no WhatsApp': 'Share on WhatsApp',
-        'Compartilhar no LinkedIn': 'Share on LinkedIn',
-        'Copiar Link': 'Copy Link',
-        'Link Copiado!': 'Link Copied!',
-        'Copiar link': 'Copy link',
-        'Não foi possível copiar o link. Por favor, copie manualmente:': 'Could not copy link. Please copy manually:',
-        'Rádio AADVITA': 'AADVITA Radio',
-        'Ouça nossos programas de rádio e acompanhe nossa programação': 'Listen to our radio programs and follow our schedule',
-        'Apresentador': 'Host',
-        'Horário': 'Schedule',
-        'Ao Vivo': 'Live',
-        'Clique em play para ouvir ao vivo': 'Click play to listen live',
-        'Episódio': 'Episode',
-        'Ouça o episódio completo': 'Listen to the full episode',
-        'Seu navegador não suporta o elemento de áudio.': 'Your browser does not support the audio element.',
-        'Não há programas de rádio cadastrados no momento.': 'No radio programs registered at this time.',
-        'Rádio AADVITA - Ao Vivo': 'AADVITA Radio - Live',
-        'Transmitindo ao vivo': 'Live Broadcasting',
-        'Nossos Programas': 'Our Programs',
-        'Campanhas': 'Campaigns',
-        'Conheça nossas campanhas e participe': 'Learn about our campaigns and participate',
-        'Apoie-nos': 'Support Us',
-        'Apoie nossa causa e faça a diferença': 'Support our cause and make a difference',
-        'Editais': 'Public Notices',
-        'Confira nossos editais e oportunidades': 'Check our public notices and opportunities',
-        'Acesso Rápido': 'Quick Access',
-        'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.': 'Soon, information about our campaigns will be available here.',
-        'Como Apoiar': 'How to Support',
-        'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.': 'Your contribution is essential for us to continue promoting inclusion and accessibility.',
-        'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.': 'Soon, more information on how to support will be available here.',
-        'Em breve, informações sobre nossos editais estarão disponíveis aqui.': 'Soon, information about our public notices will be available here.',
-        'Sobre': 'About',
-        'Sobre a AADVITA': 'About AADVITA',
-        'Conheça nossa história, missão e valores': 'Learn about our history, mission and values',
-        'Transparência': 'Transparency',
-        'Acompanhe nossa gestão, relatórios e informações financeiras': 'Follow our management, reports and financial information',
-        'Nossa Compromisso com a Transparência': 'Our Commitment to Transparency',
-        'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.': 'AADVITA believes that transparency is fundamental to building trust and strengthening our relationship with the community. Therefore, we provide information about our management, activities and financial resources.',
-        'Relatórios Financeiros': 'Financial Reports',
-        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.': 'Follow our financial reports, statements and balances.',
-        'Estatuto e Documentos': 'Statute and Documents',
-        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.': 'Access our bylaws, meeting minutes and official documents.',
-        'Prestação de Contas': 'Accountability',
-        'Confira como utilizamos os recursos recebidos e os resultados alcançados.': 'See how we use the resources received and the results achieved.',
-        'Projetos e Ações': 'Projects and Actions',
-        'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.': 'See the projects developed and actions carried out for the benefit of the community.',
-        'Doações e Recursos': 'Donations and Resources',
-        'Informações sobre doações recebidas e como contribuir com nossa causa.': 'Information about donations received and how to contribute to our cause.',
-        'Diretoria e Conselho': 'Board and Council',
-        'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.': 'Meet the members of the board and fiscal council responsible for management.',
-        'Em breve': 'Coming soon',
-        'Ver Projetos': 'View Projects',
-        'Ver Detalhes': 'View Details',
-        'Voltar para Projetos': 'Back to Projects',
-        'Término:': 'End:',
-        'Identificação do Projeto': 'Project Identification',
-        'Contexto e Justificativa': 'Context and Justification',
-        'Objetivos': 'Objectives',
-        'Público-Alvo': 'Target Audience',
-        'Metodologia': 'Methodology',
-        'Recursos Necessários': 'Necessary Resources',
-        'Parcerias': 'Partnerships',
-        'Resultados Esperados': 'Expected Results',
-        'Monitoramento e Avaliação': 'Monitoring and Evaluation',
-        'Cronograma de Execução': 'Execution Schedule',
-        'Orçamento': 'Budget',
-        'Exemplo Resumido': 'Summary Example',
-        'Considerações Finais': 'Final Considerations',
-        'Descrição': 'Description',
-        'Ver Diretoria': 'View Board',
-        'Ver Relatórios': 'View Reports',
-        'Acompanhe nossas doações e gastos de forma transparente': 'Follow our donations and expenses transparently',
-        'Doações Recebidas': 'Donations Received',
-        'Gastos Realizados': 'Expenses Made',
-        'Tipo': 'Type',
-        'Descrição': 'Description',
-        'Doador': 'Donor',
-        'País': 'Country',
-        'Valor/Quantidade': 'Value/Quantity',
-        'Data': 'Date',
-        'Observações': 'Observations',
-        'Categoria': 'Category',
-        'Fornecedor': 'Supplier',
-        'Valor': 'Value',
-        'Financeira': 'Financial',
-        'Material': 'Material',
-        'Serviço': 'Service',
-        'itens': 'items',
-        'unidades': 'units',
-        'Total de Doações Financeiras': 'Total Financial Donations',
-        'Total de Doações em Material': 'Total Material Donations',
-        'Total de Doações em Serviços': 'Total Service Donations',
-        'Total de Gastos': 'Total Expenses',
-        'Nenhuma doação cadastrada no momento.': 'No donations registered at this time.',
-        'Nenhum gasto cadastrado no momento.': 'No expenses registered at this time.',
-        'Voltar para Transparência': 'Back to Transparency',
-        'Baixar Documento': 'Download Document',
-        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente': 'Follow our financial reports, statements and balances transparently',
-        'Nenhum relatório financeiro cadastrado no momento.': 'No financial reports registered at this time.',
-        'Relatório': 'Report',
-        'Demonstrativo': 'Statement',
-        'Balanço': 'Balance',
-        'Ver Relatórios': 'View Reports',
-        'Ver Documentos': 'View Documents',
-        'Ver Prestação de Contas': 'View Accountability',
-        'Ver Informações': 'View Information',
-        'Estatuto': 'Statute',
-        'Ata': 'Minutes',
-        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais': 'Access our bylaws, meeting minutes and official documents',
-        'Confira como utilizamos os recursos recebidos e os resultados alcançados': 'See how we use the resources received and the results achieved',
-        'Informações sobre doações recebidas e como contribuir com nossa causa': 'Information about donations received and how to contribute to our cause',
-        'Nenhum documento cadastrado no momento.': 'No documents registered at this time.',
-        'Nenhuma prestação de contas cadastrada no momento.': 'No accountability reports registered at this time.',
-        'Nenhuma informação de doação cadastrada no momento.': 'No donation information registered at this time.',
-        'Nenhum relatório de atividades cadastrado no momento.': 'No activity reports registered at this time.',
-        'Período:': 'Period:',
-        'A partir de': 'From',
-        'Recursos Recebidos:': 'Resources Received:',
-        'Resultados Alcançados:': 'Results Achieved:',
-        'Atividades Realizadas:': 'Activities Carried Out:',
-        'Relatório de Atividades': 'Activity Report',
-        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Follow the activities carried out by the association and the results achieved.',
-        'Como Contribuir:': 'How to Contribute:',
-        'Informações de Contato': 'Contact Information',
-        'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.': 'For more information about transparency, contact us through official channels.',
-        'E-mail:': 'Email:',
-        'Telefone:': 'Phone:',
-        'Entre em contato através do formulário': 'Contact us through the form',
-        'Quem Somos': 'Who We Are',
-        'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.': 'AADVITA - Association of Visually Impaired Tapuienses is a non-profit organization dedicated to promoting inclusion, accessibility and quality of life for visually impaired people in our community.',
-        'Nossa Missão': 'Our Mission',
-        'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.': 'Promote social, educational and professional inclusion of visually impaired people, offering support, training and necessary resources so they can develop their full potential and fully participate in society.',
-        'Nossos Valores': 'Our Values',
-        'Inclusão:': 'Inclusion:',
-        'Acreditamos que todos têm o direito de participar plenamente da sociedade': 'We believe everyone has the right to fully participate in society',
-        'Respeito:': 'Respect:',
-        'Valorizamos a diversidade e a dignidade de cada pessoa': 'We value diversity and the dignity of each person',
-        'Compromisso:': 'Commitment:',
-        'Trabalhamos com dedicação para alcançar nossos objetivos': 'We work with dedication to achieve our goals',
-        'Solidariedade:': 'Solidarity:',
-        'Apoiamos uns aos outros em nossa jornada coletiva': 'We support each other on our collective journey',
-        'Transparência:': 'Transparency:',
-        'Mantemos práticas éticas e transparentes em todas as nossas ações': 'We maintain ethical and transparent practices in all our actions',
-        'Diretoria': 'Board of Directors',
-        'Diretor de Comunicação': 'Director of Communications',
-        'Presidente': 'President',
-        'Vice Presidente': 'Vice-President',
-        'Vice-Presidente': 'Vice-President',
-        'Primeiro(a) Secretário(a)': 'First Secretary',
-        'Segundo(a) Secretário(a)': 'Second Secretary',
-        'Tesoureiro(a)': 'Treasurer',
-        'Nome do Presidente': 'President Name',
-        'Nome do Vice Presidente': 'Vice President Name',
-        'Nome do Primeiro Secretário': 'First Secretary Name',
-        'Nome do Segundo Secretário': 'Second Secretary Name',
-        'Nome do Tesoureiro': 'Treasurer Name',
-        'Primeiro Secretário(a)': 'First Secretary',
-        'Segundo Secretário(a)': 'Second Secretary',
-        'Primeiro Tesoureiro(a)': 'First Treasurer',
-        'Conselho Fiscal': 'Fiscal Council',
-        'Conselheiro': 'Councilor',
-        'Conselheiro(a)': 'Councilor',
-        'Coordenação Social': 'Social Coordination',
-        'Coordenador(a)': 'Coordinator',
-        'Membro da Coordenação Social': 'Coordinator',
-        'Nenhum coordenador(a) cadastrado(a).': 'No coordinator(s) registered.',
-        'Conselheiro': 'Councilor',
-        'Nome do Conselheiro 1': 'Councilor 1 Name',
-        'Nome do Conselheiro 2': 'Councilor 2 Name',
-        'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.': 'Association dedicated to promoting inclusion and accessibility for visually impaired people.',
-        'Contato': 'Contact',
-        'Links Rápidos': 'Quick Links',
-        'Não há reuniões presenciais programadas no momento.': 'No in-person meetings scheduled at this time.',
-        'Não há reuniões virtuais programadas no momento.': 'No virtual meetings scheduled at this time.',
-        'Não há projetos cadastrados no momento.': 'No projects registered at this time.',
-        'Não há ações cadastradas no momento.': 'No actions registered at this time.',
-        'Não há reuniões presenciais cadastradas no momento.': 'No in-person meetings registered at this time.',
-        'Não há reuniões virtuais cadastradas no momento.': 'No virtual meetings registered at this time.',
-        'Volte em breve para conferir nossa agenda atualizada.': 'Come back soon to check our updated schedule.',
-        'Acessar reunião': 'Join meeting',
-        'Acessar evento': 'Join event',
-        'Local:': 'Location:',
-        'Endereço:': 'Address:',
-        'Plataforma:': 'Platform:',
-        'Data:': 'Date:',
-        'Hora:': 'Time:',
-        'Visitar site': 'Visit website',
-        'Não há apoiadores cadastrados no momento.': 'No supporters registered at this time.',
-        'Galeria': 'Gallery',
-        'Galeria de Imagens': 'Image Gallery',
-        'Fotos de Eventos': 'Event Photos',
-        'Fotos de Ações': 'Action Photos',
-        'Galeria Geral': 'General Gallery',
-        'Confira nossa galeria completa de álbuns': 'Check out our complete album gallery',
-        'Ver Álbum': 'View Album',
-        'Voltar para Galeria': 'Back to Gallery',
-        'foto(s)': 'photo(s)',
-        'Este álbum ainda não possui fotos.': 'This album does not have photos yet.',
-        'Nenhum álbum cadastrado no momento.': 'No albums registered at this time.',
-        'Álbuns:': 'Albums:',
-        'Enviar Imagem': 'Upload Image',
-        'Título (opcional)': 'Title (optional)',
-        'Descrição (opcional)': 'Description (optional)',
-        'Selecionar arquivo': 'Select file',
-        'Nenhuma imagem cadastrada no momento.': 'No images registered at this time.',
-        'Imagem ampliada': 'Enlarged image',
-        'Fechar': 'Close',
-        'Anterior': 'Previous',
-        'Próxima': 'Next',
-        'Vídeos': 'Videos',
-        'Nossos Vídeos': 'Our Videos',
-        'Confira nossos vídeos e conteúdos em vídeo': 'Check out our videos and video content',
-        'Vídeos em Destaque': 'Featured Videos',
-        'Ver todos os vídeos': 'View all videos',
-        'Nenhum vídeo cadastrado no momento.': 'No videos registered at this time.',
-        'Assistir vídeo': 'Watch video',
-        'Associe-se': 'Join Us',
-        'Eventos': 'Events',
-        'Próximos Eventos': 'Upcoming Events',
-        'Ver todos os eventos': 'View all events',
-        'Não há eventos cadastrados no momento.': 'No events registered at this time.',
-        'Tipo:': 'Type:',
-        'Ir para conteúdo principal': 'Skip to main content',
-        'Abrir menu': 'Open menu',
-        'Menu': 'Menu',
-        'Navegação principal': 'Main navigation',
-        'AADVITA - Página inicial': 'AADVITA - Home page',
-        'Português': 'Portuguese',
-        'Español': 'Spanish',
-        'English': 'English',
-        'Fechar mensagem': 'Close message',
-        'Email:': 'Email:',
-        'Telefone:': 'Phone:',
-        'WhatsApp:': 'WhatsApp:',
-        'Doações': 'Donations',
-        'QR Code para doação': 'QR Code for donation',
-        'Todos os direitos reservados.': 'All rights reserved.',
-        'Desenvolvido por:': 'Developed by:',
-        'AADVITA - Associação de Deficientes Visuais': 'AADVITA - Association of Visually Impaired',
-        '(abre em nova aba)': '(opens in new tab)',
-        'Entrar': 'Login',
-        'Acesse sua conta ou área administrativa': 'Access your account or administrative area',
-        'Associado': 'Member',
-        'Administrador': 'Administrator',
-        'Digite seu CPF cadastrado': 'Enter your registered CPF',
-        'Senha': 'Password',
-        'Digite sua senha': 'Enter your password',
-        'Opções de idioma': 'Language options',
-        'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade': 'Association of Visually Impaired Tapuienses AADVITA - Promoting inclusion and accessibility',
-        'AADVITA - Associação dos Deficientes Visuais Tapuienses': 'AADVITA - Association of Visually Impaired Tapuienses',
-        'Radar de Acessibilidade': 'Accessibility Radar',
-        'Validar Certificados': 'Validate Certificates',
-        'Reciclagem': 'Recycling',
-        'O que fazemos': 'What We Do',
-        'Associação dos Deficientes Visuais Tapuienses': 'Association of Visually Impaired Tapuienses',
-        'Conheça nossas campanhas e participe.': 'Learn about our campaigns and participate.',
-        'Sua contribuição transforma vidas!': 'Your contribution transforms lives!',
-        'Confira nossos editais e oportunidades.': 'Check our public notices and opportunities.',
-        'Seja Voluntário': 'Be a Volunteer',
-        'Ações principais': 'Main actions',
-        'Imagem anterior': 'Previous image',
-        'Próxima imagem': 'Next image',
-        'Ir para imagem': 'Go to image',
-        'Solicitar Coleta de Reciclagem': 'Request Recycling Collection',
-        'Preencha o formulário abaixo para solicitar a coleta de materiais recicláveis. Nossa equipe entrará em contato em breve.': 'Fill out the form below to request collection of recyclable materials. Our team will contact you soon.',
-        'Tipo de Material': 'Material Type',
-        'Selecione o tipo de material': 'Select the material type',
-        'Ferro': 'Iron',
-        'Alumínio': 'Aluminum',
-        'Cobre': 'Copper',
-        'Plástico': 'Plastic',
-        'Papel': 'Paper',
-        'Papelão': 'Cardboard',
-        'Nome Completo': 'Full Name',
-        'Digite seu nome completo': 'Enter your full name',
-        'Telefone/WhatsApp': 'Phone/WhatsApp',
-        'Endereço de Retirada do Material': 'Material Pickup Address',
-        'Digite o endereço completo onde o material deve ser coletado': 'Enter the complete address where the material should be collected',
-        'Observações': 'Observations',
-        'Informações adicionais sobre o material ou horários preferenciais para coleta': 'Additional information about the material or preferred collection times',
-        'Enviar Solicitação': 'Submit Request',
-        'Validar Certificado': 'Validate Certificate',
-        'Informe o número do certificado (ex: <strong>CERT-7B062C2604</strong>) para verificar a autenticidade.': 'Enter the certificate number (e.g., <strong>CERT-7B062C2604</strong>) to verify authenticity.',
-        'Número do Certificado': 'Certificate Number',
-        'Validar': 'Validate',
-        'Voltar': 'Back',
-        'Certificado válido': 'Valid certificate',
-        'O certificado': 'The certificate',
-        'é autêntico': 'is authentic',
-        'Beneficiário:': 'Beneficiary:',
-        'Curso/Atividade:': 'Course/Activity:',
-        'Descrição:': 'Description:',
-        'Data de emissão:': 'Issue date:',
-        'Validade:': 'Validity:',
-        'Vitalício': 'Lifetime',
-        'Certificado inválido': 'Invalid certificate',
-        'Não encontramos um certificado válido para o código informado.': 'We did not find a valid certificate for the code provided.',
-        'Validar outro certificado': 'Validate another certificate',
-        'Registrar Problema de Acessibilidade': 'Register Accessibility Problem',
-        'Ajude-nos a mapear os problemas de acessibilidade na cidade. Sua denúncia é importante para cobrarmos melhorias dos órgãos públicos.': 'Help us map accessibility problems in the city. Your report is important to demand improvements from public agencies.',
-        'Tipo de Problema': 'Problem Type',
-        'Selecione o tipo de problema': 'Select the problem type',
-        'Acessibilidade Urbana': 'Urban Accessibility',
-        'Calçada': 'Sidewalk',
-        'Faixa de Pedestre': 'Crosswalk',
-        'Sinal Sonoro': 'Audio Signal',
-        'Rampa de Acesso': 'Access Ramp',
-        'Piso Tátil': 'Tactile Floor',
-        'Transporte Público': 'Public Transportation',
-        'Estabelecimento Comercial': 'Commercial Establishment',
-        'Outro': 'Other',
-        'Localização (Endereço)': 'Location (Address)',
-        'Descrição do Problema': 'Problem Description',
-        'Descreva detalhadamente o problema encontrado...': 'Describe in detail the problem found...',
-        'Seu Nome Completo': 'Your Full Name',
-        'Nome completo': 'Full name',
-        'Email (opcional)': 'Email (optional)',
-        'Anexos (Fotos, documentos) - opcional': 'Attachments (Photos, documents) - optional',
-        'Envie fotos ou documentos que ajudem a ilustrar o problema. Tamanho máximo por arquivo: 16MB.': 'Send photos or documents that help illustrate the problem. Maximum file size: 16MB.',
-        'Enviar Denúncia': 'Submit Report',
-        'Cancelar': 'Cancel',
-        'Fique por dentro das novidades da AADVITA.': 'Stay up to date with AADVITA news.',
-        'Ouça nossos podcasts e conteúdos em áudio.': 'Listen to our podcasts and audio content.',
-        'Nenhum serviço cadastrado no momento.': 'No services registered at this time.',
-        'Acessibilidade': 'Accessibility',
-        'Opções de acessibilidade': 'Accessibility options',
-        'Tamanho da Fonte': 'Font Size',
-        'Diminuir fonte': 'Decrease font',
-        'Aumentar fonte': 'Increase font',
-        'Diminuir': 'Decrease',
-        'Aumentar': 'Increase',
-        'Contraste': 'Contrast',
-        'Alternar contraste': 'Toggle contrast',
-        'Alto Contraste': 'High Contrast',
-        'Alto Contraste Ativo': 'High Contrast Active',
-        'Áudio Descrição': 'Audio Description',
-        'Áudio Descrição Ativa': 'Audio Description Active',
-        'Alternar áudio descrição': 'Toggle audio description',
-        'Redefinir': 'Reset',
-    }
-}
+from arquivos import arquivo_url, eh_blob, ingerir_upload, resposta_blob
+from auth import admin_required, associado_required, voluntario_required
+from billing import (
+    cancelar_em_lote, excluir_em_lote, gerar_mensalidades_automaticas, gerar_primeira_mensalidade,
+    ids_validos, marcar_pagas_em_lote, nova_mensalidade,
+)
+from calendario import (
+    cronograma_mensal, data_base_associado, proximo_vencimento, somar_meses, vencimento_no_mes,
+)
+from comandos import TarefaEmExecucao, init_comandos, trava_execucao
+from config import configure_app
+from conteudo import renderizar_campos
+from database import init_database
+from extensions import db
+from models import (
+    Permissao, Usuario, Configuracao, ReunionPresencial, ReunionVirtual,
+    Projeto, Acao, AcaoFoto, Apoiador, Imagem, SliderImage, Album,
+    AlbumFoto, Evento, EventoFoto, Video, Associado, Mensalidade,
+    Reciclagem, Doacao, Gasto, SobreConteudo, MembroDiretoria,
+    MembroConselhoFiscal, MembroCoordenacaoSocial, DadosAssociacao,
+    OQueFazemosServico, InstagramPost, RelatorioFinanceiro,
+    EstatutoDocumento, PrestacaoConta, RelatorioAtividade, InformacaoDoacao,
+    Informativo, RadioPrograma, RadioConfig, Voluntario, OfertaHoras,
+    AgendamentoVoluntario, ProblemaAcessibilidade, Certificado, Banner,
+    BannerConteudo, ModeloDocumento, acao_album, evento_album,
+)
+from saldos import associados_atrasados, atualizar_atrasos, resumo_associado, resumo_geral
+from paises import CONFIG_PAISES_JS, PAISES, VERSAO as PAISES_VERSAO, nome_pais, normalizar_documento, normalizar_pais
+from qrcodes import FORMATOS as QR_FORMATOS, codigo_valido, etag_qr, renderizar_qr
+from snapshot import init_snapshot
+from compilacao import init_bytecode_cache
+from condicional import detalhe_condicional
+from fragmentos import configuracoes_site, init_fragmentos, invalidar_fragmentos
+from identidade import associado_por_cpf, resolver, voluntario_por_cpf
+from limitador import init_limitador
+from perfilador import init_perfilador
+from rotas import Rotas
+from slugs import buscar_por_slug_ou_404, gerar_slug_unico, redirecionar_para_slug
+from startup import run_startup_tasks
+from translations import TRANSLATIONS
+
+
+def create_app():
+    """Cria e configura a instância Flask.
+
+    Não executa nenhuma tarefa de banco: migrações, criação de tabelas e
+    dados iniciais ficam em ``startup.run_startup_tasks``, executado uma
+    vez antes do fork dos workers (ver start.py e gunicorn.conf.py). As páginas
+    declaradas neste módulo com ``@rotas.route`` são registradas aqui (ver rotas.py).
+    """
+    app = Flask(__name__)
+    configure_app(app)
+    db.init_app(app)
+    # Primeiro before_request (e último after_request): o perfil cobre a requisição inteira
+    init_perfilador(app)
+    init_limitador(app)
+    init_database(app, db)
+    init_snapshot(app)
+    init_fragmentos(app)
+    init_bytecode_cache(app)
+    init_comandos(app)
+
+    from blueprints import register_blueprints
+    register_blueprints(app)
+    rotas.registrar(app)
+    return app
+
+
+# Páginas, filtros e context processor deste módulo, aplicados em create_app
+rotas = Rotas()
 
 def get_locale():
     """Retorna o idioma atual da sessão"""
@@ -1283,29 +89,14 @@ def _(text):
     return TRANSLATIONS.get(lang, TRANSLATIONS['pt']).get(text, text)
 
 # Filtro para converter quebras de linha em <br>
-@app.template_filter('nl2br')
+@rotas.template_filter('nl2br')
 def nl2br_filter(text):
     if text:
         return text.replace('\n', '<br>')
     return text
 
-# Filtro para limpar tags <br> e converter para quebras de linha, depois aplicar nl2br
-@app.template_filter('limpar_br_nl2br')
-def limpar_br_nl2br_filter(text):
-    """Remove tags <br> e converte para quebras de linha, depois aplica nl2br"""
-    from markupsafe import Markup
-    if not text:
-        return Markup('')
-    # Converter todas as variações de <br> para quebras de linha
-    import re
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-    # Remover outras tags HTML que possam ter sido inseridas
-    text = re.sub(r'<[^>]+>', '', text)
-    # Aplicar nl2br e marcar como seguro para renderização HTML
-    return Markup(text.replace('\n', '<br>'))
-
 # Filtro para converter HTML de volta para texto simples (para edição)
-@app.template_filter('html_para_texto')
+@rotas.template_filter('html_para_texto')
 def html_para_texto_filter(html):
     """Converte HTML de volta para texto simples para edição em textarea"""
     if not html:
@@ -1321,816 +112,11 @@ def html_para_texto_filter(html):
     linhas = [p.strip() for p in texto.split('\n\n') if p.strip()]
     return '\n\n'.join(linhas)
 
-# Modelos de Base de Datos
-# Tabela de associação para Usuario e Permissao
-usuario_permissao = db.Table('usuario_permissao',
-    db.Column('usuario_id', db.Integer, db.ForeignKey('usuario.id'), primary_key=True),
-    db.Column('permissao_id', db.Integer, db.ForeignKey('permissao.id'), primary_key=True)
-)
-
-class Permissao(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    codigo = db.Column(db.String(50), unique=True, nullable=False)
-    nome = db.Column(db.String(100), nullable=False)
-    descricao = db.Column(db.String(255))
-    categoria = db.Column(db.String(50))  # Para agrupar permissões
-    
-    def __repr__(self):
-        return f'<Permissao {self.codigo}>'
-
-class Usuario(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    password_hash = db.Column(db.String(255), nullable=False)
-    nome = db.Column(db.String(200), nullable=False)
-    is_super_admin = db.Column(db.Boolean, default=False)  # Super admin tem acesso a tudo
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-    
-    # Relacionamento many-to-many com permissões
-    permissoes = db.relationship('Permissao', secondary=usuario_permissao, lazy='subquery', backref=db.backref('usuarios', lazy=True))
-    
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-    
-    def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
-    
-    def tem_permissao(self, codigo_permissao):
-        """Verifica se o usuário tem uma permissão específica"""
-        if self.is_super_admin:
-            return True
-        return any(p.codigo == codigo_permissao for p in self.permissoes)
-
-class Configuracao(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    chave = db.Column(db.String(100), unique=True, nullable=False)
-    valor = db.Column(db.Text)
-    tipo = db.Column(db.String(50))  # texto, numero, imagem, etc
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class ReunionPresencial(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
-    descripcion = db.Column(db.Text)
-    fecha = db.Column(db.DateTime, nullable=False)
-    hora = db.Column(db.String(10), nullable=False)
-    lugar = db.Column(db.String(300), nullable=False)
-    direccion = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-class ReunionVirtual(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
-    descripcion = db.Column(db.Text)
-    fecha = db.Column(db.DateTime, nullable=False)
-    hora = db.Column(db.String(10), nullable=False)
-    plataforma = db.Column(db.String(100), nullable=False)
-    link = db.Column(db.String(500))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-class Projeto(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
-    descripcion = db.Column(db.Text, nullable=False)
-    identificacao = db.Column(db.Text)
-    contexto_justificativa = db.Column(db.Text)
-    objetivos = db.Column(db.Text)
-    publico_alvo = db.Column(db.Text)
-    metodologia = db.Column(db.Text)
-    recursos_necessarios = db.Column(db.Text)
-    parcerias = db.Column(db.Text)
-    resultados_esperados = db.Column(db.Text)
-    monitoramento_avaliacao = db.Column(db.Text)
-    cronograma_execucao = db.Column(db.Text)
-    orcamento = db.Column(db.Text)
-    consideracoes_finais = db.Column(db.Text)
-    imagen = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagen_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    arquivo_pdf = db.Column(db.String(300))  # Caminho do arquivo PDF ou 'base64:application/pdf'
-    arquivo_pdf_base64 = db.Column(db.Text, nullable=True)  # PDF em base64 para persistência no Render (opcional)
-    estado = db.Column(db.String(50), default='Ativo')
-    data_inicio = db.Column(db.Date)
-    data_fim = db.Column(db.Date)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-# Tabelas de associação (definidas antes das classes que as usam)
-evento_album = db.Table('evento_album',
-    db.Column('evento_id', db.Integer, db.ForeignKey('evento.id'), primary_key=True),
-    db.Column('album_id', db.Integer, db.ForeignKey('album.id'), primary_key=True)
-)
-
-acao_album = db.Table('acao_album',
-    db.Column('acao_id', db.Integer, db.ForeignKey('acao.id'), primary_key=True),
-    db.Column('album_id', db.Integer, db.ForeignKey('album.id'), primary_key=True)
-)
-
-class Acao(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
-    descricao = db.Column(db.Text, nullable=False)
-    data = db.Column(db.Date, nullable=False)
-    categoria = db.Column(db.String(100))
-    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    # Relacionamento com fotos
-    fotos = db.relationship('AcaoFoto', backref='acao', lazy=True, cascade='all, delete-orphan')
-    
-    # Relacionamento many-to-many com álbuns
-    albuns = db.relationship('Album', secondary=acao_album, lazy='subquery', backref=db.backref('acoes', lazy=True))
-
-class AcaoFoto(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    acao_id = db.Column(db.Integer, db.ForeignKey('acao.id'), nullable=False)
-    caminho = db.Column(db.String(300), nullable=False)
-    titulo = db.Column(db.String(200))
-    descricao = db.Column(db.Text)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-class Apoiador(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(200), nullable=False)
-    tipo = db.Column(db.String(100))  # Empresa, Individual, Instituição
-    logo = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    logo_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem (logo) para acessibilidade
-    website = db.Column(db.String(500))
-    descricao = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-
-class Imagem(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200))
-    descricao = db.Column(db.Text)
-    filename = db.Column(db.String(300), nullable=False)
-    caminho = db.Column(db.String(500), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-class SliderImage(db.Model):
-    __tablename__ = 'slider_image'
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200))
-    imagem = db.Column(db.String(300), nullable=False)  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    link = db.Column(db.String(500))  # Link clicável (opcional)
-    ordem = db.Column(db.Integer, default=0)  # Ordem de exibição
-    ativo = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    __mapper_args__ = {
-        'confirm_deleted_rows': False
-    }
-    
-    def get_imagem_url(self):
-        """Retorna a URL da imagem, seja base64 ou arquivo"""
-        try:
-            from flask import url_for
-            # Verificar se tem imagem_base64 usando getattr (seguro se coluna não existir)
-            imagem_base64 = getattr(self, 'imagem_base64', None)
-            if imagem_base64:
-                return f"/slider/{self.id}/imagem"
-            elif self.imagem and 'base64:' in str(self.imagem):
-                return f"/slider/{self.id}/imagem"
-            elif self.imagem:
-                return url_for('static', filename=self.imagem)
-            return None
-        except Exception as e:
-            print(f"Erro em get_imagem_url: {e}")
-            try:
-                if self.imagem:
-                    from flask import url_for
-                    return url_for('static', filename=self.imagem)
-            except:
-                pass
-            return None
-    
-    def __repr__(self):
-        return f'<SliderImage {self.id}>'
-
-class Album(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo_pt = db.Column(db.String(200), nullable=False)
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    capa = db.Column(db.String(300))  # Caminho da foto de capa
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    # Relacionamento com fotos
-    fotos = db.relationship('AlbumFoto', backref='album', lazy=True, cascade='all, delete-orphan')
-
-class AlbumFoto(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    album_id = db.Column(db.Integer, db.ForeignKey('album.id'), nullable=False)
-    caminho = db.Column(db.String(300), nullable=False)
-    titulo_pt = db.Column(db.String(200))
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-class Evento(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
-    descricao = db.Column(db.Text)
-    data = db.Column(db.DateTime, nullable=False)
-    hora = db.Column(db.String(10))
-    local = db.Column(db.String(300))
-    endereco = db.Column(db.Text)
-    tipo = db.Column(db.String(100))  # Presencial, Virtual, Híbrido
-    link = db.Column(db.String(500))
-    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    # Relacionamento com fotos
-    fotos = db.relationship('EventoFoto', backref='evento', lazy=True, cascade='all, delete-orphan')
-    
-    # Relacionamento many-to-many com álbuns
-    albuns = db.relationship('Album', secondary=evento_album, lazy='subquery', backref=db.backref('eventos', lazy=True))
-
-class EventoFoto(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    evento_id = db.Column(db.Integer, db.ForeignKey('evento.id'), nullable=False)
-    caminho = db.Column(db.String(300), nullable=False)
-    titulo = db.Column(db.String(200))
-    descricao = db.Column(db.Text)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-class Video(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    descricao = db.Column(db.Text)
-    url_youtube = db.Column(db.String(500), nullable=False)
-    thumbnail = db.Column(db.String(500))
-    categoria = db.Column(db.String(100))
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    def get_youtube_id(self):
-        """Extrai o ID do vídeo do YouTube da URL"""
-        import re
-        # Suporta diferentes formatos de URL do YouTube
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.url_youtube)
-            if match:
-                return match.group(1)
-        return None
-    
-    def get_embed_url(self):
-        """Retorna a URL para embed do vídeo"""
-        video_id = self.get_youtube_id()
-        if video_id:
-            return f"https://www.youtube.com/embed/{video_id}"
-        return None
-    
-    def get_thumbnail_url(self):
-        """Retorna a URL da thumbnail do YouTube"""
-        video_id = self.get_youtube_id()
-        if video_id:
-            return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-        return None
-
-class Associado(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome_completo = db.Column(db.String(200), nullable=False)
-    cpf = db.Column(db.String(14), nullable=False, unique=True)
-    data_nascimento = db.Column(db.Date, nullable=False)
-    endereco = db.Column(db.Text, nullable=False)
-    telefone = db.Column(db.String(20), nullable=False)
-    password_hash = db.Column(db.String(255), nullable=False)
-    status = db.Column(db.String(20), nullable=False, default='pendente')  # pendente, aprovado, negado
-    tipo_associado = db.Column(db.String(20), nullable=False, default='contribuinte')  # 'regular' ou 'contribuinte'
-    # Campos para mensalidade
-    valor_mensalidade = db.Column(db.Numeric(10, 2), default=0.00)
-    desconto_tipo = db.Column(db.String(10), default=None)  # 'real' ou 'porcentagem'
-    desconto_valor = db.Column(db.Numeric(10, 2), default=0.00)
-    ativo = db.Column(db.Boolean, default=True)  # Controla se gera mensalidades automaticamente
-    carteira_pdf = db.Column(db.String(300))  # Caminho do PDF da carteira de associado
-    carteira_pdf_base64 = db.Column(db.Text, nullable=True)  # PDF da carteira em base64 para persistência no Render
-    foto = db.Column(db.String(300))  # Caminho da foto do associado
-    foto_base64 = db.Column(db.Text, nullable=True)  # salvar imagem em base64 para persistência no Render
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-    
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-    
-    def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
-    
-    def calcular_valor_final(self):
-        """Calcula o valor final da mensalidade com desconto"""
-        valor_base = float(self.valor_mensalidade) if self.valor_mensalidade else 0.0
-        desconto = float(self.desconto_valor) if self.desconto_valor else 0.0
-        
-        if self.desconto_tipo == 'porcentagem':
-            valor_final = valor_base * (1 - desconto / 100)
-        elif self.desconto_tipo == 'real':
-            valor_final = valor_base - desconto
-        else:
-            valor_final = valor_base
-        
-        return max(0.0, valor_final)  # Não permite valor negativo
-
-class Mensalidade(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    associado_id = db.Column(db.Integer, db.ForeignKey('associado.id'), nullable=False)
-    valor_base = db.Column(db.Numeric(10, 2), nullable=False)
-    desconto_tipo = db.Column(db.String(10))  # 'real' ou 'porcentagem'
-    desconto_valor = db.Column(db.Numeric(10, 2), default=0.00)
-    valor_final = db.Column(db.Numeric(10, 2), nullable=False)
-    mes_referencia = db.Column(db.Integer, nullable=False)  # 1-12
-    ano_referencia = db.Column(db.Integer, nullable=False)
-    data_vencimento = db.Column(db.Date, nullable=False)
-    status = db.Column(db.String(20), default='pendente')  # pendente, paga, cancelada
-    data_pagamento = db.Column(db.Date)
-    observacoes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-    
-    # Relacionamento
-    associado = db.relationship('Associado', backref='mensalidades')
-
-class Reciclagem(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    tipo_material = db.Column(db.String(50), nullable=False)  # Ferro, Aluminio, Cobre, Plastico, Papel, Papelao
-    nome_completo = db.Column(db.String(200), nullable=False)
-    telefone = db.Column(db.String(20), nullable=False)
-    endereco_retirada = db.Column(db.Text, nullable=False)
-    observacoes = db.Column(db.Text)
-    status = db.Column(db.String(20), default='pendente')  # pendente, em_andamento, coletado, cancelado
-    observacoes_admin = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(), onupdate=lambda: datetime.now())
-
-class Doacao(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    tipo = db.Column(db.String(50), nullable=False)  # 'financeira', 'material', 'servico'
-    descricao = db.Column(db.Text, nullable=False)
-    valor = db.Column(db.Numeric(10, 2))  # Valor em dinheiro (para financeira e servico)
-    quantidade = db.Column(db.Integer)  # Quantidade (para material)
-    unidade = db.Column(db.String(50))  # Unidade (ex: 'kg', 'litros', 'unidades')
-    doador = db.Column(db.String(200))  # Nome do doador
-    pais = db.Column(db.String(100))  # País do doador
-    telefone = db.Column(db.String(50))  # Telefone do doador
-    tipo_documento = db.Column(db.String(20))  # 'cpf', 'cnpj', 'passaporte', 'dni', etc.
-    documento = db.Column(db.String(30))  # Documento (sem formatação)
-    data_doacao = db.Column(db.Date, nullable=False)
-    observacoes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-
-class Gasto(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    descricao = db.Column(db.Text, nullable=False)
-    valor = db.Column(db.Numeric(10, 2), nullable=False)
-    categoria = db.Column(db.String(100))  # Ex: 'Aluguel', 'Material', 'Serviços', 'Salários', etc.
-    data_gasto = db.Column(db.Date, nullable=False)
-    fornecedor = db.Column(db.String(200))  # Nome do fornecedor
-    observacoes = db.Column(db.Text)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
-
-class SobreConteudo(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    chave = db.Column(db.String(50), unique=True, nullable=False)  # 'quem_somos', 'missao', 'valores'
-    conteudo_pt = db.Column(db.Text)
-    conteudo_es = db.Column(db.Text)
-    conteudo_en = db.Column(db.Text)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class MembroDiretoria(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    cargo = db.Column(db.String(100), nullable=False)  # 'Presidente', 'Vice-Presidente', etc.
-    nome_pt = db.Column(db.String(200), nullable=False)
-    nome_es = db.Column(db.String(200))
-    nome_en = db.Column(db.String(200))
-    foto = db.Column(db.String(500))
-    foto_base64 = db.Column(db.Text, nullable=True)  # salvar imagem em base64 para persistência no Render
-    ordem = db.Column(db.Integer, default=0)  # Para ordenar os cargos
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class MembroConselhoFiscal(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome_pt = db.Column(db.String(200), nullable=False)
-    nome_es = db.Column(db.String(200))
-    nome_en = db.Column(db.String(200))
-    foto = db.Column(db.String(500))
-    foto_base64 = db.Column(db.Text, nullable=True)  # salvar imagem em base64 para persistência no Render
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class MembroCoordenacaoSocial(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    cargo = db.Column(db.String(100), nullable=False)  # 'Membro da Coordenação Social', etc.
-    nome_pt = db.Column(db.String(200), nullable=False)
-    nome_es = db.Column(db.String(200))
-    nome_en = db.Column(db.String(200))
-    foto = db.Column(db.String(500))
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class DadosAssociacao(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(200), nullable=False)
-    cnpj = db.Column(db.String(18), nullable=False)
-    endereco = db.Column(db.Text, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    @staticmethod
-    def get_dados():
-        """Retorna os dados da associação, criando um registro padrão se não existir"""
-        dados = DadosAssociacao.query.first()
-        if not dados:
-            dados = DadosAssociacao(
-                nome='Associação AADVITA',
-                cnpj='00.000.000/0001-00',
-                endereco='Endereço não informado'
-            )
-            db.session.add(dados)
-            db.session.commit()
-        return dados
-
-class OQueFazemosServico(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo = db.Column(db.String(200), nullable=False)
-    descricao = db.Column(db.Text, nullable=False)
-    cor_icone = db.Column(db.String(7), nullable=False, default='#3b82f6')  # Cor em hexadecimal
-    icone_svg = db.Column(db.Text)  # SVG do ícone
-    ordem = db.Column(db.Integer, default=0)
-    coluna = db.Column(db.Integer, nullable=False, default=1)  # 1, 2 ou 3
-    ativo = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    def __repr__(self):
-        return f'<OQueFazemosServico {self.titulo}>'
-
-class InstagramPost(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    url_instagram = db.Column(db.String(500))  # URL do post no Instagram
-    imagem_url = db.Column(db.String(500), nullable=False)  # URL da imagem
-    legenda = db.Column(db.Text)  # Legenda do post
-    data_post = db.Column(db.DateTime, nullable=False)  # Data de publicação no Instagram
-    ordem = db.Column(db.Integer, default=0)  # Ordem de exibição
-    ativo = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    def __repr__(self):
-        return f'<InstagramPost {self.id}>'
-
-class RelatorioFinanceiro(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo_pt = db.Column(db.String(200), nullable=False)
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    arquivo = db.Column(db.String(500))  # Caminho do arquivo PDF/documento
-    data_relatorio = db.Column(db.Date)
-    tipo = db.Column(db.String(50))  # 'relatorio', 'demonstrativo', 'balanco'
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class EstatutoDocumento(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo_pt = db.Column(db.String(200), nullable=False)
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    arquivo = db.Column(db.String(500))  # Caminho do arquivo PDF/documento
-    tipo = db.Column(db.String(50))  # 'estatuto', 'ata', 'documento'
-    data_documento = db.Column(db.Date)
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class PrestacaoConta(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo_pt = db.Column(db.String(200), nullable=False)
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    recursos_recebidos_pt = db.Column(db.Text)
-    recursos_recebidos_es = db.Column(db.Text)
-    recursos_recebidos_en = db.Column(db.Text)
-    resultados_pt = db.Column(db.Text)
-    resultados_es = db.Column(db.Text)
-    resultados_en = db.Column(db.Text)
-    periodo_inicio = db.Column(db.Date)
-    periodo_fim = db.Column(db.Date)
-    arquivo = db.Column(db.String(500))
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class RelatorioAtividade(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo_pt = db.Column(db.String(200), nullable=False)
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    atividades_realizadas_pt = db.Column(db.Text)
-    atividades_realizadas_es = db.Column(db.Text)
-    atividades_realizadas_en = db.Column(db.Text)
-    resultados_pt = db.Column(db.Text)
-    resultados_es = db.Column(db.Text)
-    resultados_en = db.Column(db.Text)
-    periodo_inicio = db.Column(db.Date)
-    periodo_fim = db.Column(db.Date)
-    arquivo = db.Column(db.String(500))  # Caminho do arquivo PDF/documento ou 'base64:application/pdf'
-    arquivo_base64 = db.Column(db.Text, nullable=True)  # Arquivo em base64 para persistência no Render
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class InformacaoDoacao(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    titulo_pt = db.Column(db.String(200), nullable=False)
-    titulo_es = db.Column(db.String(200))
-    titulo_en = db.Column(db.String(200))
-    descricao_pt = db.Column(db.Text)
-    descricao_es = db.Column(db.Text)
-    descricao_en = db.Column(db.Text)
-    como_contribuir_pt = db.Column(db.Text)
-    como_contribuir_es = db.Column(db.Text)
-    como_contribuir_en = db.Column(db.Text)
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class Informativo(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    tipo = db.Column(db.String(50), nullable=False)  # 'Noticia' ou 'Podcast'
-    titulo = db.Column(db.String(200), nullable=False)
-    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
-    subtitulo = db.Column(db.String(300))  # Subtítulo opcional
-    conteudo = db.Column(db.Text)  # Texto para notícias
-    url_soundcloud = db.Column(db.String(500))  # URL do SoundCloud para podcasts
-    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    data_publicacao = db.Column(db.Date, nullable=False, default=date.today)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class RadioPrograma(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(200), nullable=False)
-    descricao = db.Column(db.Text)
-    apresentador = db.Column(db.String(200))  # Nome do apresentador
-    horario = db.Column(db.String(100))  # Ex: "Segunda a Sexta, 14h às 16h"
-    url_streaming = db.Column(db.String(500))  # URL para streaming ao vivo
-    url_arquivo = db.Column(db.String(500))  # URL para arquivo de áudio (episódio)
-    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    ativo = db.Column(db.Boolean, default=True)
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class RadioConfig(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    url_streaming_principal = db.Column(db.String(500))  # URL principal de streaming da rádio
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class Voluntario(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome_completo = db.Column(db.String(200), nullable=False)
-    email = db.Column(db.String(200), nullable=False)
-    telefone = db.Column(db.String(50))
-    cpf = db.Column(db.String(20))
-    password_hash = db.Column(db.String(255), nullable=True)
-    endereco = db.Column(db.Text)
-    cidade = db.Column(db.String(100))
-    estado = db.Column(db.String(50))
-    cep = db.Column(db.String(20))
-    data_nascimento = db.Column(db.Date)
-    profissao = db.Column(db.String(200))
-    habilidades = db.Column(db.Text)  # Habilidades e competências do voluntário
-    disponibilidade = db.Column(db.Text)  # Dias e horários disponíveis
-    area_interesse = db.Column(db.String(200))  # Área de interesse para voluntariado
-    observacoes = db.Column(db.Text)
-    status = db.Column(db.String(50), default='pendente')  # pendente, aprovado, inativo
-    ativo = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    # Relacionamentos
-    ofertas_horas = db.relationship('OfertaHoras', backref='voluntario', lazy=True, cascade='all, delete-orphan')
-    agendamentos = db.relationship('AgendamentoVoluntario', backref='voluntario', lazy=True, cascade='all, delete-orphan')
-
-    def set_password(self, password):
-        try:
-            self.password_hash = generate_password_hash(password)
-        except Exception:
-            # If DB column doesn't exist, set attribute anyway; commit will fail and should be handled by caller
-            self.password_hash = generate_password_hash(password)
-
-    def check_password(self, password):
-        if not getattr(self, 'password_hash', None):
-            return False
-        return check_password_hash(self.password_hash, password)
-
-class OfertaHoras(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    voluntario_id = db.Column(db.Integer, db.ForeignKey('voluntario.id'), nullable=False)
-    data_inicio = db.Column(db.Date, nullable=False)
-    data_fim = db.Column(db.Date)  # Opcional, se for um período
-    hora_inicio = db.Column(db.String(10))  # Ex: "08:00"
-    hora_fim = db.Column(db.String(10))  # Ex: "12:00"
-    dias_semana = db.Column(db.String(100))  # Ex: "Segunda, Quarta, Sexta" ou "Todos os dias"
-    horas_totais = db.Column(db.Float)  # Total de horas oferecidas
-    descricao = db.Column(db.Text)  # Descrição da oferta
-    area_atividade = db.Column(db.String(200))  # Área de atividade oferecida
-    status = db.Column(db.String(50), default='disponivel')  # disponivel, agendada, concluida, cancelada
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    # Relacionamento com agendamentos
-    agendamentos = db.relationship('AgendamentoVoluntario', backref='oferta_horas', lazy=True, cascade='all, delete-orphan')
-
-class AgendamentoVoluntario(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    voluntario_id = db.Column(db.Integer, db.ForeignKey('voluntario.id'), nullable=False)
-    oferta_horas_id = db.Column(db.Integer, db.ForeignKey('oferta_horas.id'), nullable=True)  # Opcional, pode agendar sem oferta específica
-    data_agendamento = db.Column(db.Date, nullable=False)
-    hora_inicio = db.Column(db.String(10), nullable=False)
-    hora_fim = db.Column(db.String(10), nullable=False)
-    atividade = db.Column(db.String(200), nullable=False)  # Tipo de atividade/ajuda
-    descricao = db.Column(db.Text)  # Descrição detalhada do que será feito
-    responsavel = db.Column(db.String(200))  # Nome da pessoa que está agendando
-    contato_responsavel = db.Column(db.String(100))  # Telefone/email do responsável
-    local = db.Column(db.String(300))  # Local onde será a atividade
-    observacoes = db.Column(db.Text)
-    status = db.Column(db.String(50), default='agendado')  # agendado, confirmado, em_andamento, concluido, cancelado
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-
-class ProblemaAcessibilidade(db.Model):
-    __tablename__ = 'problema_acessibilidade'
-    id = db.Column(db.Integer, primary_key=True)
-    tipo_problema = db.Column(db.String(100), nullable=False)  # Ex: "acessibilidade urbana", "calçada", "faixa de pedestre", "sinal sonoro"
-    descricao = db.Column(db.Text, nullable=False)
-    localizacao = db.Column(db.String(500), nullable=False)  # Endereço ou localização
-    nome_denunciante = db.Column(db.String(200), nullable=False)
-    telefone = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(200))
-    anexos = db.Column(db.Text)  # caminhos separados por vírgula
-    status = db.Column(db.String(50), default='novo')  # novo, em_analise, encaminhado, resolvido
-    observacoes_admin = db.Column(db.Text)  # Observações internas da associação
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class Certificado(db.Model):
-    __tablename__ = 'certificado'
-    id = db.Column(db.Integer, primary_key=True)
-    numero_validacao = db.Column(db.String(50), unique=True, nullable=False)
-    nome_pessoa = db.Column(db.String(200), nullable=False)
-    documento = db.Column(db.String(100), nullable=True)
-    descricao = db.Column(db.Text, nullable=True)
-    curso = db.Column(db.String(200), nullable=True)
-    data_emissao = db.Column(db.DateTime, default=datetime.utcnow)
-    data_validade = db.Column(db.DateTime, nullable=True)
-    status = db.Column(db.String(50), default='valido')  # valido, revogado, expirado
-    qr_code_path = db.Column(db.String(300), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class Banner(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    tipo = db.Column(db.String(50), nullable=False, unique=True)  # 'Campanhas', 'Apoie-nos', 'Editais'
-    titulo = db.Column(db.String(200), nullable=False)
-    descricao = db.Column(db.String(300))
-    url = db.Column(db.String(500))  # URL de destino
-    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    cor_gradiente_inicio = db.Column(db.String(7), default='#667eea')  # Cor inicial do gradiente
-    cor_gradiente_fim = db.Column(db.String(7), default='#764ba2')  # Cor final do gradiente
-    ativo = db.Column(db.Boolean, default=True)
-    ordem = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    # Relacionamento com conteúdos
-    conteudos = db.relationship('BannerConteudo', backref='banner', lazy=True, cascade='all, delete-orphan', order_by='BannerConteudo.ordem')
-
-class BannerConteudo(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    banner_id = db.Column(db.Integer, db.ForeignKey('banner.id'), nullable=False)
-    titulo = db.Column(db.String(200), nullable=False)
-    conteudo = db.Column(db.Text)  # Conteúdo HTML/texto
-    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
-    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
-    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
-    arquivo_pdf = db.Column(db.String(300))  # Arquivo PDF opcional
-    ordem = db.Column(db.Integer, default=0)
-    ativo = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class ModeloDocumento(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(200), nullable=False)
-    descricao = db.Column(db.Text)
-    arquivo = db.Column(db.String(500), nullable=False)  # Caminho do arquivo Word
-    nome_arquivo_original = db.Column(db.String(300))  # Nome original do arquivo
-    tamanho_arquivo = db.Column(db.Integer)  # Tamanho em bytes
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-# Decorador para proteger rotas administrativas
-def admin_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not session.get('admin_logged_in'):
-            flash('Você precisa fazer login para acessar esta página', 'error')
-            return redirect(url_for('admin_login'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-def permissao_required(codigo_permissao):
-    """Decorador para verificar se o usuário tem uma permissão específica"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if not session.get('admin_logged_in'):
-                flash('Você precisa fazer login para acessar esta página', 'error')
-                return redirect(url_for('admin_login'))
-            
-            usuario_id = session.get('admin_user_id')
-            if usuario_id:
-                usuario = Usuario.query.get(usuario_id)
-                if usuario and usuario.tem_permissao(codigo_permissao):
-                    return f(*args, **kwargs)
-            
-            flash('Você não tem permissão para acessar esta funcionalidade', 'error')
-            return redirect(url_for('admin_dashboard'))
-        return decorated_function
-    return decorator
-
-# Decorador para proteger rotas de associados
-def associado_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not session.get('associado_logged_in'):
-            flash('Você precisa fazer login para acessar esta página', 'error')
-            return redirect(url_for('login'))
-        return f(*args, **kwargs)
-    return decorated_function
-
-
-def voluntario_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not session.get('voluntario_logged_in'):
-            flash('Você precisa fazer login como voluntário para acessar esta página', 'error')
-            return redirect(url_for('login'))
-        return f(*args, **kwargs)
-    return decorated_function
-
 # ============================================
 # ROTAS ADMINISTRATIVAS
 # ============================================
 
-@app.route('/admin/login', methods=['GET', 'POST'])
+@rotas.route('/admin/login', methods=['GET', 'POST'])
 def admin_login():
     if request.method == 'POST':
         username = request.form.get('username')
@@ -2151,41 +137,31 @@ def admin_login():
     
     return render_template('admin/login.html')
 
-@app.route('/admin/logout')
+@rotas.route('/admin/logout')
 def admin_logout():
     session.clear()
     flash('Logout realizado com sucesso!', 'success')
     return redirect(url_for('admin_login'))
 
-@app.route('/admin')
+@rotas.route('/admin')
 @admin_required
 def admin_dashboard():
-    stats = {
-        'reuniones_presenciales': ReunionPresencial.query.count(),
-        'reuniones_virtuales': ReunionVirtual.query.count(),
-        'projetos': Projeto.query.count(),
-        'eventos': Evento.query.count(),
-        'acoes': Acao.query.count(),
-        'informativos': Informativo.query.count(),
-        'radio_programas': RadioPrograma.query.filter_by(ativo=True).count(),
-        'imagens': Imagem.query.count(),
-        'videos': Video.query.count(),
-        'problemas_acessibilidade_novos': ProblemaAcessibilidade.query.filter_by(status='novo').count(),
-        'problemas_acessibilidade_total': ProblemaAcessibilidade.query.count(),
-        'certificados_total': Certificado.query.count(),
-        'associados': Associado.query.count(),
-        'associados_pendentes': Associado.query.filter_by(status='pendente').count(),
-        'voluntarios': Voluntario.query.count(),
-        'voluntarios_pendentes': Voluntario.query.filter_by(status='pendente').count(),
-        'ofertas_horas': OfertaHoras.query.count(),
-        'agendamentos': AgendamentoVoluntario.query.count(),
-        'reciclagem_pendentes': Reciclagem.query.filter_by(status='pendente').count(),
-        'reciclagem_total': Reciclagem.query.count(),
-    }
+    from painel import estatisticas
+    stats = estatisticas()
     return render_template('admin/dashboard.html', stats=stats)
 
 
-@app.route('/problema-acessibilidade/registrar', methods=['GET', 'POST'])
+@rotas.route('/admin/dashboard/pendencias')
+@admin_required
+def admin_dashboard_pendencias():
+    """Contadores dos avisos pendentes (consultado periodicamente pela barra lateral)"""
+    from painel import pendencias
+    resposta = jsonify(pendencias())
+    resposta.headers['Cache-Control'] = 'private, no-cache'
+    return resposta
+
+
+@rotas.route('/problema-acessibilidade/registrar', methods=['GET', 'POST'])
 def problema_acessibilidade_registrar():
     """Formulário público para registro de problemas de acessibilidade"""
     if request.method == 'POST':
@@ -2210,14 +186,8 @@ def problema_acessibilidade_registrar():
                     if not allowed_document_file(file.filename):
                         flash('Tipo de arquivo não permitido. Use PDF/DOC/IMG etc.', 'error')
                         return redirect(url_for('problema_acessibilidade_registrar'))
-                    upload_dir = os.path.join('static', 'documents', 'problemas_acessibilidade')
-                    os.makedirs(upload_dir, exist_ok=True)
-                    filename = secure_filename(file.filename)
-                    unique_name = f"{uuid.uuid4()}_{filename}"
-                    filepath = os.path.join(upload_dir, unique_name)
                     try:
-                        file.save(filepath)
-                        anexos_list.append(f"documents/problemas_acessibilidade/{unique_name}")
+                        anexos_list.append(ingerir_upload(file).referencia)
                     except Exception as e:
                         print('Erro ao salvar anexo:', e)
                         flash('Erro ao salvar arquivo enviado.', 'error')
@@ -2226,63 +196,6 @@ def problema_acessibilidade_registrar():
         anexos_txt = ','.join(anexos_list) if anexos_list else None
 
         try:
-            # Garantir que a tabela existe antes de inserir
-            try:
-                db.create_all()
-                # Verificar se a tabela existe
-                from sqlalchemy import inspect
-                inspector = inspect(db.engine)
-                if 'problema_acessibilidade' not in inspector.get_table_names():
-                    print('[PROBLEMA_ACESSIBILIDADE] Tabela não existe, executando migração...')
-                    try:
-                        import migrate_postgres_problema_acessibilidade as mig_problema
-                        mig_problema.migrate()
-                        print('[PROBLEMA_ACESSIBILIDADE] Migração executada')
-                    except Exception as mig_error:
-                        print(f'[PROBLEMA_ACESSIBILIDADE] Erro na migração: {mig_error}')
-                        # Tentar criar manualmente
-                        from sqlalchemy import text
-                        is_sqlite = db.engine.url.drivername == 'sqlite'
-                        with db.engine.connect() as conn:
-                            if is_sqlite:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS problema_acessibilidade (
-                                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                        tipo_problema VARCHAR(100) NOT NULL,
-                                        descricao TEXT NOT NULL,
-                                        localizacao VARCHAR(500) NOT NULL,
-                                        nome_denunciante VARCHAR(200) NOT NULL,
-                                        telefone VARCHAR(100) NOT NULL,
-                                        email VARCHAR(200),
-                                        anexos TEXT,
-                                        status VARCHAR(50) DEFAULT 'novo',
-                                        observacoes_admin TEXT,
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            else:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS problema_acessibilidade (
-                                        id SERIAL PRIMARY KEY,
-                                        tipo_problema VARCHAR(100) NOT NULL,
-                                        descricao TEXT NOT NULL,
-                                        localizacao VARCHAR(500) NOT NULL,
-                                        nome_denunciante VARCHAR(200) NOT NULL,
-                                        telefone VARCHAR(100) NOT NULL,
-                                        email VARCHAR(200),
-                                        anexos TEXT,
-                                        status VARCHAR(50) DEFAULT 'novo',
-                                        observacoes_admin TEXT,
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            conn.commit()
-                        print('[PROBLEMA_ACESSIBILIDADE] Tabela criada manualmente')
-            except Exception as create_error:
-                print(f'[PROBLEMA_ACESSIBILIDADE] Aviso ao verificar/criar tabela: {create_error}')
-
             problema = ProblemaAcessibilidade(
                 tipo_problema=tipo_problema,
                 descricao=descricao,
@@ -2306,7 +219,7 @@ def problema_acessibilidade_registrar():
     return render_template('problema_acessibilidade/registrar.html')
 
 
-@app.route('/admin/problemas-acessibilidade')
+@rotas.route('/admin/problemas-acessibilidade')
 @admin_required
 def admin_problemas_acessibilidade():
     """Listagem de problemas de acessibilidade para admin"""
@@ -2314,7 +227,7 @@ def admin_problemas_acessibilidade():
     return render_template('admin/problemas_acessibilidade.html', problemas=problemas)
 
 
-@app.route('/admin/problemas-acessibilidade/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/problemas-acessibilidade/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_problemas_acessibilidade_editar(id):
     """Editar problema de acessibilidade"""
@@ -2335,7 +248,23 @@ def admin_problemas_acessibilidade_editar(id):
     return render_template('admin/problema_acessibilidade_form.html', problema=problema)
 
 
-@app.route('/admin/problemas-acessibilidade/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/problemas-acessibilidade/<int:id>/anexos/<int:indice>')
+@admin_required
+def admin_problemas_acessibilidade_anexo(id, indice):
+    """Anexo enviado com o problema (fotos e documentos de visitantes: fora da rota pública /arquivos)"""
+    from flask import abort
+    problema = ProblemaAcessibilidade.query.get_or_404(id)
+    anexos = (problema.anexos or '').split(',')
+    anexo = anexos[indice].strip() if indice < len(anexos) else ''
+    if not anexo:
+        abort(404)
+    if not eh_blob(anexo):
+        # Anexos antigos, gravados em static/
+        return redirect(arquivo_url(anexo))
+    return resposta_blob(anexo, as_attachment=False, privado=True)
+
+
+@rotas.route('/admin/problemas-acessibilidade/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_problemas_acessibilidade_excluir(id):
     """Excluir problema de acessibilidade"""
@@ -2350,14 +279,14 @@ def admin_problemas_acessibilidade_excluir(id):
     return redirect(url_for('admin_problemas_acessibilidade'))
 
 
-@app.route('/admin/certificados')
+@rotas.route('/admin/certificados')
 @admin_required
 def admin_certificados():
     certificados = Certificado.query.order_by(Certificado.created_at.desc()).all()
     return render_template('admin/certificados.html', certificados=certificados)
 
 
-@app.route('/admin/certificados/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/certificados/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_certificados_novo():
     if request.method == 'POST':
@@ -2398,9 +327,6 @@ def admin_certificados_novo():
             db.session.add(certificado)
             db.session.commit()
 
-            certificado.qr_code_path = salvar_qr_certificado(certificado.numero_validacao)
-            db.session.commit()
-
             flash('Certificado criado com sucesso.', 'success')
             return redirect(url_for('admin_certificados'))
         except Exception as e:
@@ -2412,7 +338,7 @@ def admin_certificados_novo():
     return render_template('admin/certificado_form.html', certificado=None)
 
 
-@app.route('/admin/certificados/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/certificados/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_certificados_editar(id):
     certificado = Certificado.query.get_or_404(id)
@@ -2446,21 +372,25 @@ def admin_certificados_editar(id):
     return render_template('admin/certificado_form.html', certificado=certificado)
 
 
-@app.route('/admin/certificados/<int:id>/regenerar-qr', methods=['POST'])
+@rotas.route('/admin/certificados/<int:id>/regenerar-qr', methods=['POST'])
 @admin_required
 def admin_certificados_regenerar_qr(id):
     certificado = Certificado.query.get_or_404(id)
-    try:
-        certificado.qr_code_path = salvar_qr_certificado(certificado.numero_validacao)
-        db.session.commit()
-        flash('QR Code regenerado com sucesso.', 'success')
-    except Exception as e:
-        db.session.rollback()
-        flash(f'Erro ao regenerar QR Code: {e}', 'error')
+    # O QR é gerado em memória a partir do código de validação e do SITE_URL: não há
+    # imagem a refazer, apenas o caminho legado em disco a descartar
+    if certificado.qr_code_path:
+        try:
+            certificado.qr_code_path = None
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            flash(f'Erro ao regenerar QR Code: {e}', 'error')
+            return redirect(url_for('admin_certificados'))
+    flash('QR Code regenerado com sucesso.', 'success')
     return redirect(url_for('admin_certificados'))
 
 
-@app.route('/certificados/validar/<codigo>')
+@rotas.route('/certificados/validar/<codigo>')
 def certificado_validar(codigo):
     codigo = codigo.upper()
     certificado = Certificado.query.filter_by(numero_validacao=codigo).first()
@@ -2468,7 +398,56 @@ def certificado_validar(codigo):
     return render_template('certificados/validar.html', certificado=certificado, valido=valido)
 
 
-@app.route('/certificados/validar', methods=['GET', 'POST'])
+@rotas.route('/certificados/qr/<codigo>.<formato>')
+def certificado_qr(codigo, formato):
+    """QR Code da página de validação, gerado em memória
+
+    A URL de validação usa o SITE_URL configurado; sem ele, depende do Host da
+    requisição, e a resposta não pode ir para caches compartilhados.
+    """
+    from flask import Response, abort
+    codigo = codigo.upper()
+    if formato not in QR_FORMATOS or not codigo_valido(codigo):
+        abort(404)
+    # Só códigos emitidos: entradas arbitrárias não ocupam o LRU de imagens
+    if db.session.query(Certificado.id).filter_by(numero_validacao=codigo).first() is None:
+        abort(404)
+
+    site_url = current_app.config.get('SITE_URL')
+    if site_url:
+        validation_url = site_url + url_for('certificado_validar', codigo=codigo)
+    else:
+        validation_url = url_for('certificado_validar', codigo=codigo, _external=True)
+    etag = etag_qr(validation_url, formato)
+    if request.if_none_match.contains(etag):
+        resposta = Response(status=304)
+    else:
+        resposta = Response(renderizar_qr(validation_url, formato), mimetype=QR_FORMATOS[formato])
+    resposta.set_etag(etag)
+    if site_url:
+        resposta.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    else:
+        resposta.headers['Cache-Control'] = 'private, max-age=86400'
+    return resposta
+
+
+@rotas.route('/dados/paises.<versao>.js')
+def paises_js(versao):
+    """Configuração de países do formulário de doação (URL versionada pelo conteúdo)"""
+    from flask import Response
+    if versao != PAISES_VERSAO:
+        # Página antiga em cache: aponta para a versão atual sem cachear o redirecionamento
+        return redirect(url_for('paises_js', versao=PAISES_VERSAO))
+    if request.if_none_match.contains(PAISES_VERSAO):
+        resposta = Response(status=304)
+    else:
+        resposta = Response(CONFIG_PAISES_JS, mimetype='application/javascript')
+    resposta.set_etag(PAISES_VERSAO)
+    resposta.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return resposta
+
+
+@rotas.route('/certificados/validar', methods=['GET', 'POST'])
 def certificado_validar_form():
     if request.method == 'POST':
         codigo = request.form.get('codigo', '').strip().upper()
@@ -2477,7 +456,7 @@ def certificado_validar_form():
         flash('Informe o número do certificado para validar.', 'error')
     return render_template('certificados/validar_form.html')
 
-@app.route('/reciclagem', methods=['GET', 'POST'])
+@rotas.route('/reciclagem', methods=['GET', 'POST'])
 def reciclagem_form():
     """Formulário público para coleta de reciclagem"""
     if request.method == 'POST':
@@ -2533,13 +512,13 @@ def reciclagem_form():
 # CRUD - REUNIÕES PRESENCIAIS
 # ============================================
 
-@app.route('/admin/reuniones-presenciales')
+@rotas.route('/admin/reuniones-presenciales')
 @admin_required
 def admin_reuniones_presenciales():
     reuniones = ReunionPresencial.query.order_by(ReunionPresencial.fecha.desc()).all()
     return render_template('admin/reuniones_presenciales.html', reuniones=reuniones)
 
-@app.route('/admin/reuniones-presenciales/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/reuniones-presenciales/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_reuniones_presenciales_novo():
     if request.method == 'POST':
@@ -2570,7 +549,7 @@ def admin_reuniones_presenciales_novo():
     
     return render_template('admin/reuniones_presenciales_form.html')
 
-@app.route('/admin/reuniones-presenciales/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/reuniones-presenciales/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_reuniones_presenciales_editar(id):
     reunion = ReunionPresencial.query.get_or_404(id)
@@ -2602,7 +581,7 @@ def admin_reuniones_presenciales_editar(id):
     
     return render_template('admin/reuniones_presenciales_form.html', reunion=reunion)
 
-@app.route('/admin/reuniones-presenciales/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/reuniones-presenciales/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_reuniones_presenciales_excluir(id):
     reunion = ReunionPresencial.query.get_or_404(id)
@@ -2622,13 +601,13 @@ def admin_reuniones_presenciales_excluir(id):
 # CRUD - REUNIÕES VIRTUAIS
 # ============================================
 
-@app.route('/admin/reuniones-virtuales')
+@rotas.route('/admin/reuniones-virtuales')
 @admin_required
 def admin_reuniones_virtuales():
     reuniones = ReunionVirtual.query.order_by(ReunionVirtual.fecha.desc()).all()
     return render_template('admin/reuniones_virtuales.html', reuniones=reuniones)
 
-@app.route('/admin/reuniones-virtuales/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/reuniones-virtuales/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_reuniones_virtuales_novo():
     if request.method == 'POST':
@@ -2659,7 +638,7 @@ def admin_reuniones_virtuales_novo():
     
     return render_template('admin/reuniones_virtuales_form.html')
 
-@app.route('/admin/reuniones-virtuales/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/reuniones-virtuales/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_reuniones_virtuales_editar(id):
     reunion = ReunionVirtual.query.get_or_404(id)
@@ -2691,7 +670,7 @@ def admin_reuniones_virtuales_editar(id):
     
     return render_template('admin/reuniones_virtuales_form.html', reunion=reunion)
 
-@app.route('/admin/reuniones-virtuales/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/reuniones-virtuales/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_reuniones_virtuales_excluir(id):
     reunion = ReunionVirtual.query.get_or_404(id)
@@ -2711,13 +690,13 @@ def admin_reuniones_virtuales_excluir(id):
 # CRUD - PROJETOS
 # ============================================
 
-@app.route('/admin/projetos')
+@rotas.route('/admin/projetos')
 @admin_required
 def admin_projetos():
     projetos = Projeto.query.order_by(Projeto.created_at.desc()).all()
     return render_template('admin/projetos.html', projetos=projetos)
 
-@app.route('/admin/projetos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/projetos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_projetos_novo():
     if request.method == 'POST':
@@ -2751,7 +730,7 @@ def admin_projetos_novo():
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -2766,32 +745,13 @@ def admin_projetos_novo():
                     flash('Tipo de arquivo não permitido. Use: PNG, JPG, JPEG, GIF ou WEBP', 'error')
                     return redirect(url_for('admin_projetos_novo'))
             
-            # Processar upload do PDF - salvar como base64 no banco para persistência no Render
+            # Processar upload do PDF - gravar no banco para persistência no Render
             pdf_path = None
-            pdf_base64_data = None
             if 'arquivo_pdf' in request.files:
                 file = request.files['arquivo_pdf']
                 if file and file.filename != '' and allowed_pdf_file(file.filename):
-                    # Ler o arquivo e converter para base64
-                    file_data = file.read()
-                    
-                    # Converter para base64
-                    pdf_base64_data = base64.b64encode(file_data).decode('utf-8')
-                    pdf_path = "base64:application/pdf"
-                    
-                    # Também salvar localmente para desenvolvimento local (opcional)
-                    try:
-                        upload_folder_pdf = os.path.join('static', 'documents', 'projetos')
-                        os.makedirs(upload_folder_pdf, exist_ok=True)
-                        
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        filepath = os.path.join(upload_folder_pdf, unique_filename)
-                        file.seek(0)  # Reset file pointer after reading for base64
-                        file.save(filepath)
-                        pdf_path = f"documents/projetos/{unique_filename}"
-                    except Exception as e:
-                        print(f"[AVISO] Não foi possível salvar PDF localmente: {e}")
+                    # Gravar no banco em streaming (persistência no Render sem cópia base64 em memória)
+                    pdf_path = ingerir_upload(file, mime_type='application/pdf').referencia
                 elif file and file.filename != '':
                     flash('Tipo de arquivo não permitido para PDF. Use apenas arquivos .pdf', 'error')
                     return redirect(url_for('admin_projetos_novo'))
@@ -2821,8 +781,7 @@ def admin_projetos_novo():
                 imagen=imagen_path,
                 imagen_base64=imagen_base64_data,
                 descricao_imagem=request.form.get('descricao_imagem', '').strip() or None,
-                arquivo_pdf=pdf_path,
-                arquivo_pdf_base64=pdf_base64_data
+                arquivo_pdf=pdf_path
             )
             db.session.add(projeto)
             db.session.commit()
@@ -2834,7 +793,7 @@ def admin_projetos_novo():
     
     return render_template('admin/projetos_form.html')
 
-@app.route('/admin/projetos/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/projetos/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_projetos_editar(id):
     projeto = Projeto.query.get_or_404(id)
@@ -2878,7 +837,7 @@ def admin_projetos_editar(id):
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -2893,7 +852,7 @@ def admin_projetos_editar(id):
                     flash('Tipo de arquivo não permitido. Use: PNG, JPG, JPEG, GIF ou WEBP', 'error')
                     return redirect(url_for('admin_projetos_editar', id=id))
             
-            # Processar upload do PDF - salvar como base64 no banco para persistência no Render
+            # Processar upload do PDF - gravar no banco para persistência no Render
             if 'arquivo_pdf' in request.files:
                 file = request.files['arquivo_pdf']
                 if file and file.filename != '' and allowed_pdf_file(file.filename):
@@ -2906,27 +865,9 @@ def admin_projetos_editar(id):
                             except:
                                 pass
                     
-                    # Ler o arquivo e converter para base64
-                    file_data = file.read()
-                    
-                    # Converter para base64
-                    pdf_base64_data = base64.b64encode(file_data).decode('utf-8')
-                    projeto.arquivo_pdf_base64 = pdf_base64_data
-                    projeto.arquivo_pdf = "base64:application/pdf"
-                    
-                    # Também salvar localmente para desenvolvimento local (opcional)
-                    try:
-                        upload_folder_pdf = os.path.join('static', 'documents', 'projetos')
-                        os.makedirs(upload_folder_pdf, exist_ok=True)
-                        
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        filepath = os.path.join(upload_folder_pdf, unique_filename)
-                        file.seek(0)  # Reset file pointer after reading for base64
-                        file.save(filepath)
-                        projeto.arquivo_pdf = f"documents/projetos/{unique_filename}"
-                    except Exception as e:
-                        print(f"[AVISO] Não foi possível salvar PDF localmente: {e}")
+                    # Gravar no banco em streaming (persistência no Render sem cópia base64 em memória)
+                    projeto.arquivo_pdf = ingerir_upload(file, mime_type='application/pdf').referencia
+                    projeto.arquivo_pdf_base64 = None
                 elif file and file.filename != '':
                     flash('Tipo de arquivo não permitido para PDF. Use apenas arquivos .pdf', 'error')
                     return redirect(url_for('admin_projetos_editar', id=id))
@@ -2976,7 +917,7 @@ def admin_projetos_editar(id):
     
     return render_template('admin/projetos_form.html', projeto=projeto)
 
-@app.route('/admin/projetos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/projetos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_projetos_excluir(id):
     projeto = Projeto.query.get_or_404(id)
@@ -3005,13 +946,13 @@ def admin_projetos_excluir(id):
 # CRUD - EVENTOS
 # ============================================
 
-@app.route('/admin/eventos')
+@rotas.route('/admin/eventos')
 @admin_required
 def admin_eventos():
     eventos = Evento.query.order_by(Evento.data.desc()).all()
     return render_template('admin/eventos.html', eventos=eventos)
 
-@app.route('/admin/eventos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/eventos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_eventos_novo():
     if request.method == 'POST':
@@ -3025,7 +966,7 @@ def admin_eventos_novo():
             if 'imagem' in request.files:
                 file = request.files['imagem']
                 if file and file.filename != '' and allowed_file(file.filename):
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     
                     filename = secure_filename(file.filename)
@@ -3073,7 +1014,7 @@ def admin_eventos_novo():
     albuns = Album.query.order_by(Album.titulo_pt.asc()).all()
     return render_template('admin/eventos_form.html', albuns=albuns)
 
-@app.route('/admin/eventos/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/eventos/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_eventos_editar(id):
     evento = Evento.query.get_or_404(id)
@@ -3097,7 +1038,7 @@ def admin_eventos_editar(id):
                             except:
                                 pass
                     
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     
                     filename = secure_filename(file.filename)
@@ -3140,7 +1081,7 @@ def admin_eventos_editar(id):
     albuns = Album.query.order_by(Album.titulo_pt.asc()).all()
     return render_template('admin/eventos_form.html', evento=evento, albuns=albuns)
 
-@app.route('/admin/eventos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/eventos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_eventos_excluir(id):
     evento = Evento.query.get_or_404(id)
@@ -3169,14 +1110,14 @@ def admin_eventos_excluir(id):
 # GERENCIAR FOTOS DE EVENTOS
 # ============================================
 
-@app.route('/admin/eventos/<int:id>/fotos')
+@rotas.route('/admin/eventos/<int:id>/fotos')
 @admin_required
 def admin_eventos_fotos(id):
     evento = Evento.query.get_or_404(id)
     fotos = EventoFoto.query.filter_by(evento_id=id).order_by(EventoFoto.ordem.asc(), EventoFoto.created_at.desc()).all()
     return render_template('admin/eventos_fotos.html', evento=evento, fotos=fotos)
 
-@app.route('/admin/eventos/<int:id>/fotos/adicionar', methods=['POST'])
+@rotas.route('/admin/eventos/<int:id>/fotos/adicionar', methods=['POST'])
 @admin_required
 def admin_eventos_fotos_adicionar(id):
     evento = Evento.query.get_or_404(id)
@@ -3192,7 +1133,7 @@ def admin_eventos_fotos_adicionar(id):
     
     if file and allowed_file(file.filename):
         try:
-            upload_folder = app.config['UPLOAD_FOLDER']
+            upload_folder = current_app.config['UPLOAD_FOLDER']
             os.makedirs(upload_folder, exist_ok=True)
             
             filename = secure_filename(file.filename)
@@ -3219,7 +1160,7 @@ def admin_eventos_fotos_adicionar(id):
     
     return redirect(url_for('admin_eventos_fotos', id=id))
 
-@app.route('/admin/eventos/fotos/<int:foto_id>/excluir', methods=['POST'])
+@rotas.route('/admin/eventos/fotos/<int:foto_id>/excluir', methods=['POST'])
 @admin_required
 def admin_eventos_fotos_excluir(foto_id):
     foto = EventoFoto.query.get_or_404(foto_id)
@@ -3248,13 +1189,13 @@ def admin_eventos_fotos_excluir(foto_id):
 # CRUD - AÇÕES
 # ============================================
 
-@app.route('/admin/acoes')
+@rotas.route('/admin/acoes')
 @admin_required
 def admin_acoes():
     acoes = Acao.query.order_by(Acao.data.desc()).all()
     return render_template('admin/acoes.html', acoes=acoes)
 
-@app.route('/admin/acoes/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/acoes/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_acoes_novo():
     if request.method == 'POST':
@@ -3287,7 +1228,7 @@ def admin_acoes_novo():
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -3326,7 +1267,7 @@ def admin_acoes_novo():
     albuns = Album.query.order_by(Album.titulo_pt.asc()).all()
     return render_template('admin/acoes_form.html', albuns=albuns)
 
-@app.route('/admin/acoes/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/acoes/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_acoes_editar(id):
     acao = Acao.query.get_or_404(id)
@@ -3369,7 +1310,7 @@ def admin_acoes_editar(id):
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -3410,7 +1351,7 @@ def admin_acoes_editar(id):
     albuns = Album.query.order_by(Album.titulo_pt.asc()).all()
     return render_template('admin/acoes_form.html', acao=acao, albuns=albuns)
 
-@app.route('/admin/acoes/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/acoes/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_acoes_excluir(id):
     acao = Acao.query.get_or_404(id)
@@ -3439,14 +1380,14 @@ def admin_acoes_excluir(id):
 # GERENCIAR FOTOS DE AÇÕES
 # ============================================
 
-@app.route('/admin/acoes/<int:id>/fotos')
+@rotas.route('/admin/acoes/<int:id>/fotos')
 @admin_required
 def admin_acoes_fotos(id):
     acao = Acao.query.get_or_404(id)
     fotos = AcaoFoto.query.filter_by(acao_id=id).order_by(AcaoFoto.ordem.asc(), AcaoFoto.created_at.desc()).all()
     return render_template('admin/acoes_fotos.html', acao=acao, fotos=fotos)
 
-@app.route('/admin/acoes/<int:id>/fotos/adicionar', methods=['POST'])
+@rotas.route('/admin/acoes/<int:id>/fotos/adicionar', methods=['POST'])
 @admin_required
 def admin_acoes_fotos_adicionar(id):
     acao = Acao.query.get_or_404(id)
@@ -3462,7 +1403,7 @@ def admin_acoes_fotos_adicionar(id):
     
     if file and allowed_file(file.filename):
         try:
-            upload_folder = app.config['UPLOAD_FOLDER']
+            upload_folder = current_app.config['UPLOAD_FOLDER']
             os.makedirs(upload_folder, exist_ok=True)
             
             filename = secure_filename(file.filename)
@@ -3489,7 +1430,7 @@ def admin_acoes_fotos_adicionar(id):
     
     return redirect(url_for('admin_acoes_fotos', id=id))
 
-@app.route('/admin/acoes/fotos/<int:foto_id>/excluir', methods=['POST'])
+@rotas.route('/admin/acoes/fotos/<int:foto_id>/excluir', methods=['POST'])
 @admin_required
 def admin_acoes_fotos_excluir(foto_id):
     foto = AcaoFoto.query.get_or_404(foto_id)
@@ -3518,13 +1459,13 @@ def admin_acoes_fotos_excluir(foto_id):
 # CRUD - ÁLBUNS
 # ============================================
 
-@app.route('/admin/albuns')
+@rotas.route('/admin/albuns')
 @admin_required
 def admin_albuns():
     albuns = Album.query.order_by(Album.ordem.asc(), Album.created_at.desc()).all()
     return render_template('admin/albuns.html', albuns=albuns)
 
-@app.route('/admin/albuns/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/albuns/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_albuns_novo():
     if request.method == 'POST':
@@ -3534,7 +1475,7 @@ def admin_albuns_novo():
             if 'capa' in request.files:
                 file = request.files['capa']
                 if file and file.filename != '' and allowed_file(file.filename):
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     
                     filename = secure_filename(file.filename)
@@ -3568,7 +1509,7 @@ def admin_albuns_novo():
     
     return render_template('admin/albuns_form.html')
 
-@app.route('/admin/albuns/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/albuns/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_albuns_editar(id):
     album = Album.query.get_or_404(id)
@@ -3588,7 +1529,7 @@ def admin_albuns_editar(id):
                             except:
                                 pass
                     
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     
                     filename = secure_filename(file.filename)
@@ -3619,7 +1560,7 @@ def admin_albuns_editar(id):
     
     return render_template('admin/albuns_form.html', album=album)
 
-@app.route('/admin/albuns/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/albuns/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_albuns_excluir(id):
     album = Album.query.get_or_404(id)
@@ -3648,14 +1589,14 @@ def admin_albuns_excluir(id):
 # GERENCIAR FOTOS DE ÁLBUNS
 # ============================================
 
-@app.route('/admin/albuns/<int:id>/fotos')
+@rotas.route('/admin/albuns/<int:id>/fotos')
 @admin_required
 def admin_albuns_fotos(id):
     album = Album.query.get_or_404(id)
     fotos = AlbumFoto.query.filter_by(album_id=id).order_by(AlbumFoto.ordem.asc(), AlbumFoto.created_at.desc()).all()
     return render_template('admin/albuns_fotos.html', album=album, fotos=fotos)
 
-@app.route('/admin/albuns/<int:id>/fotos/adicionar', methods=['POST'])
+@rotas.route('/admin/albuns/<int:id>/fotos/adicionar', methods=['POST'])
 @admin_required
 def admin_albuns_fotos_adicionar(id):
     album = Album.query.get_or_404(id)
@@ -3674,7 +1615,7 @@ def admin_albuns_fotos_adicionar(id):
         flash('Nenhum arquivo selecionado', 'error')
         return redirect(url_for('admin_albuns_fotos', id=id))
     
-    upload_folder = app.config['UPLOAD_FOLDER']
+    upload_folder = current_app.config['UPLOAD_FOLDER']
     os.makedirs(upload_folder, exist_ok=True)
     
     ordem_inicial = int(request.form.get('ordem_inicial', 0) or 0)
@@ -3724,7 +1665,7 @@ def admin_albuns_fotos_adicionar(id):
     
     return redirect(url_for('admin_albuns_fotos', id=id))
 
-@app.route('/admin/albuns/fotos/<int:foto_id>/excluir', methods=['POST'])
+@rotas.route('/admin/albuns/fotos/<int:foto_id>/excluir', methods=['POST'])
 @admin_required
 def admin_albuns_fotos_excluir(foto_id):
     foto = AlbumFoto.query.get_or_404(foto_id)
@@ -3753,13 +1694,13 @@ def admin_albuns_fotos_excluir(foto_id):
 # CRUD - IMAGENS
 # ============================================
 
-@app.route('/admin/imagens')
+@rotas.route('/admin/imagens')
 @admin_required
 def admin_imagens():
     imagens = Imagem.query.order_by(Imagem.created_at.desc()).all()
     return render_template('admin/imagens.html', imagens=imagens)
 
-@app.route('/admin/imagens/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/imagens/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_imagens_novo():
     if request.method == 'POST':
@@ -3774,7 +1715,7 @@ def admin_imagens_novo():
                 return redirect(url_for('admin_imagens_novo'))
             
             if file and allowed_file(file.filename):
-                upload_folder = app.config['UPLOAD_FOLDER']
+                upload_folder = current_app.config['UPLOAD_FOLDER']
                 os.makedirs(upload_folder, exist_ok=True)
                 
                 filename = secure_filename(file.filename)
@@ -3800,7 +1741,7 @@ def admin_imagens_novo():
     
     return render_template('admin/imagens_form.html')
 
-@app.route('/admin/imagens/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/imagens/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_imagens_editar(id):
     imagem = Imagem.query.get_or_404(id)
@@ -3819,7 +1760,7 @@ def admin_imagens_editar(id):
     
     return render_template('admin/imagens_form.html', imagem=imagem)
 
-@app.route('/admin/imagens/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/imagens/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_imagens_excluir(id):
     imagem = Imagem.query.get_or_404(id)
@@ -3848,13 +1789,13 @@ def admin_imagens_excluir(id):
 # CRUD - VÍDEOS
 # ============================================
 
-@app.route('/admin/videos')
+@rotas.route('/admin/videos')
 @admin_required
 def admin_videos():
     videos = Video.query.order_by(Video.ordem.desc(), Video.created_at.desc()).all()
     return render_template('admin/videos.html', videos=videos)
 
-@app.route('/admin/videos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/videos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_videos_novo():
     if request.method == 'POST':
@@ -3877,7 +1818,7 @@ def admin_videos_novo():
     
     return render_template('admin/videos_form.html')
 
-@app.route('/admin/videos/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/videos/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_videos_editar(id):
     video = Video.query.get_or_404(id)
@@ -3900,7 +1841,7 @@ def admin_videos_editar(id):
     
     return render_template('admin/videos_form.html', video=video)
 
-@app.route('/admin/videos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/videos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_videos_excluir(id):
     video = Video.query.get_or_404(id)
@@ -3920,7 +1861,7 @@ def admin_videos_excluir(id):
 # GERENCIAMENTO DO RODAPÉ
 # ============================================
 
-@app.route('/admin/rodape', methods=['GET', 'POST'])
+@rotas.route('/admin/rodape', methods=['GET', 'POST'])
 @admin_required
 def admin_rodape():
     if request.method == 'POST':
@@ -3997,6 +1938,7 @@ def admin_rodape():
                             print(f"[AVISO] Não foi possível salvar arquivo localmente: {e}")
             
             db.session.commit()
+            invalidar_fragmentos()
             flash('Configurações do rodapé atualizadas com sucesso!', 'success')
             return redirect(url_for('admin_rodape'))
         except Exception as e:
@@ -4014,7 +1956,7 @@ def admin_rodape():
 # GERENCIAMENTO DOS DADOS DA ASSOCIAÇÃO
 # ============================================
 
-@app.route('/admin/dados-associacao', methods=['GET', 'POST'])
+@rotas.route('/admin/dados-associacao', methods=['GET', 'POST'])
 @admin_required
 def admin_dados_associacao():
     """Gerencia os dados da associação (Nome, CNPJ, Endereço)"""
@@ -4028,6 +1970,7 @@ def admin_dados_associacao():
             dados.updated_at = datetime.utcnow()
             
             db.session.commit()
+            invalidar_fragmentos()
             flash('Dados da associação atualizados com sucesso!', 'success')
             return redirect(url_for('admin_dados_associacao'))
         except Exception as e:
@@ -4040,14 +1983,14 @@ def admin_dados_associacao():
 # GERENCIAMENTO "O QUE FAZEMOS"
 # ============================================
 
-@app.route('/admin/dados-associacao/o-que-fazemos')
+@rotas.route('/admin/dados-associacao/o-que-fazemos')
 @admin_required
 def admin_o_que_fazemos():
     """Lista todos os serviços do módulo 'O que fazemos'"""
     servicos = OQueFazemosServico.query.order_by(OQueFazemosServico.coluna.asc(), OQueFazemosServico.ordem.asc()).all()
     return render_template('admin/o_que_fazemos.html', servicos=servicos)
 
-@app.route('/admin/dados-associacao/o-que-fazemos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/dados-associacao/o-que-fazemos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_o_que_fazemos_novo():
     """Cria um novo serviço"""
@@ -4102,7 +2045,7 @@ def admin_o_que_fazemos_novo():
     
     return render_template('admin/o_que_fazemos_form.html', servico=None)
 
-@app.route('/admin/dados-associacao/o-que-fazemos/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/dados-associacao/o-que-fazemos/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_o_que_fazemos_editar(id):
     """Edita um serviço existente"""
@@ -4139,7 +2082,7 @@ def admin_o_que_fazemos_editar(id):
     
     return render_template('admin/o_que_fazemos_form.html', servico=servico)
 
-@app.route('/admin/dados-associacao/o-que-fazemos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/dados-associacao/o-que-fazemos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_o_que_fazemos_excluir(id):
     """Exclui um serviço"""
@@ -4162,14 +2105,14 @@ def admin_o_que_fazemos_excluir(id):
 # GERENCIAMENTO INSTAGRAM
 # ============================================
 
-@app.route('/admin/instagram')
+@rotas.route('/admin/instagram')
 @admin_required
 def admin_instagram():
     """Lista todos os posts do Instagram"""
     posts = InstagramPost.query.order_by(InstagramPost.data_post.desc(), InstagramPost.ordem.asc()).all()
     return render_template('admin/instagram.html', posts=posts)
 
-@app.route('/admin/instagram/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/instagram/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_instagram_novo():
     """Cria um novo post do Instagram"""
@@ -4212,7 +2155,7 @@ def admin_instagram_novo():
     
     return render_template('admin/instagram_form.html', post=None)
 
-@app.route('/admin/instagram/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/instagram/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_instagram_editar(id):
     """Edita um post do Instagram existente"""
@@ -4247,7 +2190,7 @@ def admin_instagram_editar(id):
     
     return render_template('admin/instagram_form.html', post=post)
 
-@app.route('/admin/instagram/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/instagram/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_instagram_excluir(id):
     """Exclui um post do Instagram"""
@@ -4263,7 +2206,7 @@ def admin_instagram_excluir(id):
     
     return redirect(url_for('admin_instagram'))
 
-@app.route('/admin/instagram/sincronizar', methods=['POST'])
+@rotas.route('/admin/instagram/sincronizar', methods=['POST'])
 @admin_required
 def admin_instagram_sincronizar():
     """Sincroniza as últimas fotos do Instagram"""
@@ -4311,12 +2254,13 @@ def admin_instagram_sincronizar():
 
 def baixar_e_salvar_imagem_instagram(url_imagem, shortcode):
     """Baixa uma imagem do Instagram e salva localmente"""
+    import requests
     try:
         if not shortcode or not url_imagem:
             return url_imagem
         
         # Criar diretório para imagens do Instagram se não existir
-        instagram_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'instagram')
+        instagram_dir = os.path.join(current_app.config['UPLOAD_FOLDER'], 'instagram')
         os.makedirs(instagram_dir, exist_ok=True)
         
         # Nome do arquivo usando o shortcode do post
@@ -4371,6 +2315,8 @@ def baixar_e_salvar_imagem_instagram(url_imagem, shortcode):
 
 def buscar_posts_instagram(username, instagram_url_base):
     """Busca as últimas fotos do Instagram e atualiza o banco de dados"""
+    import requests
+    from bs4 import BeautifulSoup
     posts_data = []
     error_messages = []
     
@@ -4788,7 +2734,7 @@ def start_instagram_updater(username, instagram_url):
 # GERENCIAMENTO DA PÁGINA SOBRE
 # ============================================
 
-@app.route('/admin/sobre')
+@rotas.route('/admin/sobre')
 @admin_required
 def admin_sobre():
     # Buscar conteúdos
@@ -4807,7 +2753,7 @@ def admin_sobre():
                          membros_diretoria=membros_diretoria,
                          membros_conselho=membros_conselho)
 
-@app.route('/admin/sobre/conteudo', methods=['POST'])
+@rotas.route('/admin/sobre/conteudo', methods=['POST'])
 @admin_required
 def admin_sobre_conteudo():
     chave = request.form.get('chave')
@@ -4843,7 +2789,7 @@ def admin_sobre_conteudo():
     
     return redirect(url_for('admin_sobre'))
 
-@app.route('/admin/sobre/diretoria/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/sobre/diretoria/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_sobre_diretoria_novo():
     if request.method == 'POST':
@@ -4901,7 +2847,7 @@ def admin_sobre_diretoria_novo():
     
     return render_template('admin/sobre_diretoria_form.html')
 
-@app.route('/admin/sobre/diretoria/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/sobre/diretoria/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_sobre_diretoria_editar(id):
     membro = MembroDiretoria.query.get_or_404(id)
@@ -4945,7 +2891,7 @@ def admin_sobre_diretoria_editar(id):
     
     return render_template('admin/sobre_diretoria_form.html', membro=membro)
 
-@app.route('/admin/sobre/diretoria/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/sobre/diretoria/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_sobre_diretoria_excluir(id):
     membro = MembroDiretoria.query.get_or_404(id)
@@ -4958,7 +2904,7 @@ def admin_sobre_diretoria_excluir(id):
         flash(f'Erro ao excluir membro: {str(e)}', 'error')
     return redirect(url_for('admin_sobre'))
 
-@app.route('/admin/sobre/conselho/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/sobre/conselho/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_sobre_conselho_novo():
     if request.method == 'POST':
@@ -5014,7 +2960,7 @@ def admin_sobre_conselho_novo():
     
     return render_template('admin/sobre_conselho_form.html')
 
-@app.route('/admin/sobre/conselho/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/sobre/conselho/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_sobre_conselho_editar(id):
     membro = MembroConselhoFiscal.query.get_or_404(id)
@@ -5057,7 +3003,7 @@ def admin_sobre_conselho_editar(id):
     
     return render_template('admin/sobre_conselho_form.html', membro=membro)
 
-@app.route('/admin/sobre/conselho/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/sobre/conselho/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_sobre_conselho_excluir(id):
     membro = MembroConselhoFiscal.query.get_or_404(id)
@@ -5074,7 +3020,7 @@ def admin_sobre_conselho_excluir(id):
 # GERENCIAMENTO DA COORDENAÇÃO SOCIAL
 # ============================================
 
-@app.route('/admin/sobre/coordenacao/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/sobre/coordenacao/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_sobre_coordenacao_novo():
     if request.method == 'POST':
@@ -5126,7 +3072,7 @@ def admin_sobre_coordenacao_novo():
     
     return render_template('admin/sobre_coordenacao_form.html')
 
-@app.route('/admin/sobre/coordenacao/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/sobre/coordenacao/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_sobre_coordenacao_editar(id):
     membro = MembroCoordenacaoSocial.query.get_or_404(id)
@@ -5167,7 +3113,7 @@ def admin_sobre_coordenacao_editar(id):
     
     return render_template('admin/sobre_coordenacao_form.html', membro=membro)
 
-@app.route('/admin/sobre/coordenacao/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/sobre/coordenacao/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_sobre_coordenacao_excluir(id):
     membro = MembroCoordenacaoSocial.query.get_or_404(id)
@@ -5184,7 +3130,7 @@ def admin_sobre_coordenacao_excluir(id):
 # GERENCIAMENTO DA PÁGINA TRANSPARÊNCIA
 # ============================================
 
-@app.route('/admin/transparencia')
+@rotas.route('/admin/transparencia')
 @admin_required
 def admin_transparencia():
     # Buscar todos os itens
@@ -5205,7 +3151,7 @@ def admin_transparencia():
 # CRUD - RELATÓRIOS FINANCEIROS
 # ============================================
 
-@app.route('/admin/transparencia/relatorio/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/relatorio/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_relatorio_novo():
     if request.method == 'POST':
@@ -5262,7 +3208,7 @@ def admin_relatorio_novo():
     
     return render_template('admin/relatorio_form.html')
 
-@app.route('/admin/transparencia/relatorio/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/relatorio/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_relatorio_editar(id):
     relatorio = RelatorioFinanceiro.query.get_or_404(id)
@@ -5304,7 +3250,7 @@ def admin_relatorio_editar(id):
     
     return render_template('admin/relatorio_form.html', relatorio=relatorio)
 
-@app.route('/admin/transparencia/relatorio/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/transparencia/relatorio/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_relatorio_excluir(id):
     relatorio = RelatorioFinanceiro.query.get_or_404(id)
@@ -5321,7 +3267,7 @@ def admin_relatorio_excluir(id):
 # CRUD - ESTATUTO E DOCUMENTOS
 # ============================================
 
-@app.route('/admin/transparencia/documento/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/documento/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_documento_novo():
     if request.method == 'POST':
@@ -5378,7 +3324,7 @@ def admin_documento_novo():
     
     return render_template('admin/documento_form.html')
 
-@app.route('/admin/transparencia/documento/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/documento/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_documento_editar(id):
     documento = EstatutoDocumento.query.get_or_404(id)
@@ -5420,7 +3366,7 @@ def admin_documento_editar(id):
     
     return render_template('admin/documento_form.html', documento=documento)
 
-@app.route('/admin/transparencia/documento/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/transparencia/documento/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_documento_excluir(id):
     documento = EstatutoDocumento.query.get_or_404(id)
@@ -5437,7 +3383,7 @@ def admin_documento_excluir(id):
 # CRUD - PRESTAÇÃO DE CONTAS
 # ============================================
 
-@app.route('/admin/transparencia/prestacao/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/prestacao/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_prestacao_novo():
     if request.method == 'POST':
@@ -5470,14 +3416,7 @@ def admin_prestacao_novo():
                 file = request.files['arquivo']
                 if file.filename != '':
                     if file and allowed_document_file(file.filename):
-                        upload_folder = 'static/documents/transparencia'
-                        os.makedirs(upload_folder, exist_ok=True)
-                        
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        filepath = os.path.join(upload_folder, unique_filename)
-                        file.save(filepath)
-                        arquivo_path = f"documents/transparencia/{unique_filename}"
+                        arquivo_path = ingerir_upload(file).referencia
             
             prestacao = PrestacaoConta(
                 titulo_pt=titulo_pt,
@@ -5497,6 +3436,7 @@ def admin_prestacao_novo():
                 periodo_fim=periodo_fim,
                 arquivo=arquivo_path
             )
+            renderizar_campos(prestacao)
             db.session.add(prestacao)
             db.session.commit()
             flash('Prestação de contas cadastrada com sucesso!', 'success')
@@ -5507,7 +3447,7 @@ def admin_prestacao_novo():
     
     return render_template('admin/prestacao_form.html')
 
-@app.route('/admin/transparencia/prestacao/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/prestacao/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_prestacao_editar(id):
     prestacao = PrestacaoConta.query.get_or_404(id)
@@ -5537,16 +3477,10 @@ def admin_prestacao_editar(id):
                 file = request.files['arquivo']
                 if file.filename != '':
                     if file and allowed_file(file.filename):
-                        upload_folder = 'static/documents/transparencia'
-                        os.makedirs(upload_folder, exist_ok=True)
-                        
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        filepath = os.path.join(upload_folder, unique_filename)
-                        file.save(filepath)
-                        prestacao.arquivo = f"documents/transparencia/{unique_filename}"
+                        prestacao.arquivo = ingerir_upload(file).referencia
             
             prestacao.updated_at = datetime.utcnow()
+            renderizar_campos(prestacao)
             db.session.commit()
             flash('Prestação de contas atualizada com sucesso!', 'success')
             return redirect(url_for('admin_transparencia'))
@@ -5556,7 +3490,7 @@ def admin_prestacao_editar(id):
     
     return render_template('admin/prestacao_form.html', prestacao=prestacao)
 
-@app.route('/admin/transparencia/prestacao/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/transparencia/prestacao/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_prestacao_excluir(id):
     prestacao = PrestacaoConta.query.get_or_404(id)
@@ -5573,17 +3507,6 @@ def admin_prestacao_excluir(id):
 # CRUD - RELATÓRIOS DE ATIVIDADES
 # ============================================
 
-def processar_texto_relatorio(texto):
-    """Processa texto de relatório: converte tags <br> para quebras de linha e limpa dados antigos"""
-    if not texto:
-        return ''
-    # Converter <br>, <br/>, <br /> para quebras de linha
-    texto = texto.replace('<br>', '\n').replace('<br/>', '\n').replace('<br />', '\n')
-    # Remover tags HTML restantes que possam ter sido inseridas
-    import re
-    texto = re.sub(r'<[^>]+>', '', texto)  # Remove qualquer tag HTML restante
-    return texto
-
 def processar_texto_paragrafos(texto):
     """Converte quebras de linha em parágrafos HTML"""
     if not texto:
@@ -5622,7 +3545,7 @@ def html_para_texto(html):
     texto = '\n\n'.join([p.strip() for p in texto.split('\n\n') if p.strip()])
     return texto
 
-@app.route('/admin/transparencia/relatorio-atividade/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/relatorio-atividade/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_relatorio_atividade_novo():
     if request.method == 'POST':
@@ -5649,39 +3572,13 @@ def admin_relatorio_atividade_novo():
                 flash('Título em português é obrigatório!', 'error')
                 return redirect(url_for('admin_relatorio_atividade_novo'))
             
-            # Processar texto: converter tags <br> para quebras de linha
-            descricao_pt = processar_texto_relatorio(descricao_pt)
-            descricao_es = processar_texto_relatorio(descricao_es)
-            descricao_en = processar_texto_relatorio(descricao_en)
-            atividades_realizadas_pt = processar_texto_relatorio(atividades_realizadas_pt)
-            atividades_realizadas_es = processar_texto_relatorio(atividades_realizadas_es)
-            atividades_realizadas_en = processar_texto_relatorio(atividades_realizadas_en)
-            resultados_pt = processar_texto_relatorio(resultados_pt)
-            resultados_es = processar_texto_relatorio(resultados_es)
-            resultados_en = processar_texto_relatorio(resultados_en)
-            
-            # Upload do arquivo - salvar como base64 no banco para persistência no Render
+            # Upload do arquivo - gravar no banco para persistência no Render
             arquivo_path = None
-            arquivo_base64_data = None
             if 'arquivo' in request.files:
                 file = request.files['arquivo']
                 if file.filename != '':
                     if file and allowed_document_file(file.filename):
-                        # Salvar também como arquivo local (compatibilidade)
-                        upload_folder = 'static/documents/transparencia'
-                        os.makedirs(upload_folder, exist_ok=True)
-                        
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        filepath = os.path.join(upload_folder, unique_filename)
-                        file.save(filepath)
-                        
-                        # Salvar em base64 para persistência no Render
-                        file.seek(0)  # Voltar ao início do arquivo
-                        file_data = file.read()
-                        mime_type = file.content_type or 'application/pdf'
-                        arquivo_base64_data = base64.b64encode(file_data).decode('utf-8')
-                        arquivo_path = f"base64:{mime_type}"
+                        arquivo_path = ingerir_upload(file).referencia
             
             relatorio = RelatorioAtividade(
                 titulo_pt=titulo_pt,
@@ -5699,9 +3596,9 @@ def admin_relatorio_atividade_novo():
                 periodo_inicio=periodo_inicio,
                 periodo_fim=periodo_fim,
                 arquivo=arquivo_path,
-                arquivo_base64=arquivo_base64_data,
                 ordem=ordem
             )
+            renderizar_campos(relatorio)
             db.session.add(relatorio)
             db.session.commit()
             flash('Relatório de atividades cadastrado com sucesso!', 'success')
@@ -5712,47 +3609,26 @@ def admin_relatorio_atividade_novo():
     
     return render_template('admin/relatorio_atividade_form.html')
 
-@app.route('/admin/transparencia/relatorio-atividade/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/relatorio-atividade/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_relatorio_atividade_editar(id):
     relatorio = RelatorioAtividade.query.get_or_404(id)
     
-    # Limpar dados existentes que têm tags <br> ao carregar para edição
-    if request.method == 'GET':
-        campos_texto = [
-            'descricao_pt', 'descricao_es', 'descricao_en',
-            'atividades_realizadas_pt', 'atividades_realizadas_es', 'atividades_realizadas_en',
-            'resultados_pt', 'resultados_es', 'resultados_en'
-        ]
-        precisa_salvar = False
-        for campo in campos_texto:
-            valor = getattr(relatorio, campo, None)
-            if valor and ('<br>' in valor or '<br/>' in valor or '<br />' in valor):
-                valor_limpo = processar_texto_relatorio(valor)
-                setattr(relatorio, campo, valor_limpo)
-                precisa_salvar = True
-        
-        if precisa_salvar:
-            try:
-                db.session.commit()
-            except:
-                db.session.rollback()
-    
     if request.method == 'POST':
         try:
             relatorio.titulo_pt = request.form.get('titulo_pt')
             relatorio.titulo_es = request.form.get('titulo_es', '')
             relatorio.titulo_en = request.form.get('titulo_en', '')
             
-            relatorio.descricao_pt = processar_texto_relatorio(request.form.get('descricao_pt', ''))
-            relatorio.descricao_es = processar_texto_relatorio(request.form.get('descricao_es', ''))
-            relatorio.descricao_en = processar_texto_relatorio(request.form.get('descricao_en', ''))
-            relatorio.atividades_realizadas_pt = processar_texto_relatorio(request.form.get('atividades_realizadas_pt', ''))
-            relatorio.atividades_realizadas_es = processar_texto_relatorio(request.form.get('atividades_realizadas_es', ''))
-            relatorio.atividades_realizadas_en = processar_texto_relatorio(request.form.get('atividades_realizadas_en', ''))
-            relatorio.resultados_pt = processar_texto_relatorio(request.form.get('resultados_pt', ''))
-            relatorio.resultados_es = processar_texto_relatorio(request.form.get('resultados_es', ''))
-            relatorio.resultados_en = processar_texto_relatorio(request.form.get('resultados_en', ''))
+            relatorio.descricao_pt = request.form.get('descricao_pt', '')
+            relatorio.descricao_es = request.form.get('descricao_es', '')
+            relatorio.descricao_en = request.form.get('descricao_en', '')
+            relatorio.atividades_realizadas_pt = request.form.get('atividades_realizadas_pt', '')
+            relatorio.atividades_realizadas_es = request.form.get('atividades_realizadas_es', '')
+            relatorio.atividades_realizadas_en = request.form.get('atividades_realizadas_en', '')
+            relatorio.resultados_pt = request.form.get('resultados_pt', '')
+            relatorio.resultados_es = request.form.get('resultados_es', '')
+            relatorio.resultados_en = request.form.get('resultados_en', '')
             relatorio.ordem = int(request.form.get('ordem', 0))
             periodo_inicio_str = request.form.get('periodo_inicio')
             periodo_fim_str = request.form.get('periodo_fim')
@@ -5764,22 +3640,12 @@ def admin_relatorio_atividade_editar(id):
                 file = request.files['arquivo']
                 if file.filename != '':
                     if file and allowed_document_file(file.filename):
-                        upload_folder = 'static/documents/transparencia'
-                        os.makedirs(upload_folder, exist_ok=True)
-                        
-                        filename = secure_filename(file.filename)
-                        unique_filename = f"{uuid.uuid4()}_{filename}"
-                        filepath = os.path.join(upload_folder, unique_filename)
-                        file.save(filepath)
-                        
-                        # Salvar em base64 para persistência no Render
-                        file.seek(0)  # Voltar ao início do arquivo
-                        file_data = file.read()
-                        mime_type = file.content_type or 'application/pdf'
-                        relatorio.arquivo_base64 = base64.b64encode(file_data).decode('utf-8')
-                        relatorio.arquivo = f"base64:{mime_type}"
+                        # Gravar no banco em streaming (persistência no Render)
+                        relatorio.arquivo = ingerir_upload(file).referencia
+                        relatorio.arquivo_base64 = None
             
             relatorio.updated_at = datetime.utcnow()
+            renderizar_campos(relatorio)
             db.session.commit()
             flash('Relatório de atividades atualizado com sucesso!', 'success')
             return redirect(url_for('admin_transparencia'))
@@ -5789,7 +3655,7 @@ def admin_relatorio_atividade_editar(id):
     
     return render_template('admin/relatorio_atividade_form.html', relatorio=relatorio)
 
-@app.route('/admin/transparencia/relatorio-atividade/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/transparencia/relatorio-atividade/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_relatorio_atividade_excluir(id):
     relatorio = RelatorioAtividade.query.get_or_404(id)
@@ -5802,12 +3668,15 @@ def admin_relatorio_atividade_excluir(id):
         flash(f'Erro ao excluir relatório de atividades: {str(e)}', 'error')
     return redirect(url_for('admin_transparencia'))
 
-@app.route('/relatorio-atividade/<int:id>/arquivo')
+@rotas.route('/relatorio-atividade/<int:id>/arquivo')
 def relatorio_atividade_arquivo(id):
-    """Rota para servir arquivos de relatórios de atividades do banco de dados (base64)"""
+    """Rota para servir arquivos de relatórios de atividades do banco de dados (blob ou base64)"""
     try:
         relatorio = RelatorioAtividade.query.get_or_404(id)
         
+        if eh_blob(relatorio.arquivo):
+            return resposta_blob(relatorio.arquivo, download_name=f'relatorio_atividade_{relatorio.id}.pdf')
+        
         # Verificar se tem arquivo em base64 (prioridade para persistência no Render)
         arquivo_base64 = getattr(relatorio, 'arquivo_base64', None)
         
@@ -5870,7 +3739,7 @@ def relatorio_atividade_arquivo(id):
 # CRUD - INFORMAÇÕES DE DOAÇÕES
 # ============================================
 
-@app.route('/admin/transparencia/doacao-info/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/doacao-info/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_doacao_info_novo():
     if request.method == 'POST':
@@ -5912,7 +3781,7 @@ def admin_doacao_info_novo():
     
     return render_template('admin/doacao_info_form.html')
 
-@app.route('/admin/transparencia/doacao-info/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/transparencia/doacao-info/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_doacao_info_editar(id):
     info = InformacaoDoacao.query.get_or_404(id)
@@ -5940,7 +3809,7 @@ def admin_doacao_info_editar(id):
     
     return render_template('admin/doacao_info_form.html', info=info)
 
-@app.route('/admin/transparencia/doacao-info/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/transparencia/doacao-info/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_doacao_info_excluir(id):
     info = InformacaoDoacao.query.get_or_404(id)
@@ -5957,13 +3826,13 @@ def admin_doacao_info_excluir(id):
 # CRUD - MODELOS DE DOCUMENTOS AADVITA
 # ============================================
 
-@app.route('/admin/modelos-documentos')
+@rotas.route('/admin/modelos-documentos')
 @admin_required
 def admin_modelos_documentos():
     documentos = ModeloDocumento.query.order_by(ModeloDocumento.created_at.desc()).all()
     return render_template('admin/modelos_documentos.html', documentos=documentos)
 
-@app.route('/admin/modelos-documentos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/modelos-documentos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_modelos_documentos_novo():
     if request.method == 'POST':
@@ -5991,26 +3860,16 @@ def admin_modelos_documentos_novo():
                 flash('Apenas arquivos Word (.doc ou .docx) são permitidos!', 'error')
                 return redirect(url_for('admin_modelos_documentos_novo'))
             
-            # Criar diretório se não existir
-            upload_folder = 'static/documents/modelos'
-            os.makedirs(upload_folder, exist_ok=True)
-            
-            # Salvar arquivo
-            filename = secure_filename(file.filename)
-            unique_filename = f"{uuid.uuid4()}_{filename}"
-            filepath = os.path.join(upload_folder, unique_filename)
-            file.save(filepath)
-            
-            # Obter tamanho do arquivo
-            tamanho_arquivo = os.path.getsize(filepath)
+            # Salvar arquivo (tamanho calculado durante a gravação)
+            ingerido = ingerir_upload(file)
             
             # Criar registro no banco
             documento = ModeloDocumento(
                 nome=nome,
                 descricao=descricao,
-                arquivo=f"documents/modelos/{unique_filename}",
-                nome_arquivo_original=filename,
-                tamanho_arquivo=tamanho_arquivo
+                arquivo=ingerido.referencia,
+                nome_arquivo_original=ingerido.nome,
+                tamanho_arquivo=ingerido.tamanho
             )
             db.session.add(documento)
             db.session.commit()
@@ -6024,13 +3883,13 @@ def admin_modelos_documentos_novo():
     
     return render_template('admin/modelos_documentos_form.html')
 
-@app.route('/admin/modelos-documentos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/modelos-documentos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_modelos_documentos_excluir(id):
     documento = ModeloDocumento.query.get_or_404(id)
     try:
-        # Excluir arquivo físico se existir
-        if documento.arquivo:
+        # Excluir arquivo físico se existir (blobs órfãos são limpos por remover_orfaos)
+        if documento.arquivo and not eh_blob(documento.arquivo):
             filepath = os.path.join('static', documento.arquivo)
             if os.path.exists(filepath):
                 os.remove(filepath)
@@ -6046,10 +3905,12 @@ def admin_modelos_documentos_excluir(id):
         traceback.print_exc()
     return redirect(url_for('admin_modelos_documentos'))
 
-@app.route('/admin/modelos-documentos/<int:id>/download')
+@rotas.route('/admin/modelos-documentos/<int:id>/download')
 @admin_required
 def admin_modelos_documentos_download(id):
     documento = ModeloDocumento.query.get_or_404(id)
+    if eh_blob(documento.arquivo):
+        return resposta_blob(documento.arquivo, download_name=documento.nome_arquivo_original)
     if documento.arquivo:
         filepath = os.path.join('static', documento.arquivo)
         if os.path.exists(filepath):
@@ -6063,7 +3924,7 @@ def admin_modelos_documentos_download(id):
 # CRUD - ASSOCIADOS
 # ============================================
 
-@app.route('/admin/associados')
+@rotas.route('/admin/associados')
 @admin_required
 def admin_associados():
     status_filter = request.args.get('status', 'todos')
@@ -6089,7 +3950,7 @@ def admin_associados():
                          aprovados_count=aprovados_count,
                          negados_count=negados_count)
 
-@app.route('/admin/associados/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/associados/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_associados_novo():
     if request.method == 'POST':
@@ -6102,6 +3963,10 @@ def admin_associados_novo():
                 flash('A senha deve ter no mínimo 6 caracteres', 'error')
                 return redirect(url_for('admin_associados_novo'))
             
+            if associado_por_cpf(request.form.get('cpf')):
+                flash('Já existe um associado com este CPF.', 'error')
+                return redirect(url_for('admin_associados_novo'))
+            
             # Upload da foto se fornecida
             foto_path = None
             if 'foto' in request.files:
@@ -6182,7 +4047,7 @@ def admin_associados_novo():
     
     return render_template('admin/associados_form.html')
 
-@app.route('/admin/associados/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/associados/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_associados_editar(id):
     associado = Associado.query.get_or_404(id)
@@ -6326,7 +4191,7 @@ def admin_associados_editar(id):
     
     return render_template('admin/associados_form.html', associado=associado)
 
-@app.route('/admin/associados/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/associados/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_associados_excluir(id):
     associado = Associado.query.get_or_404(id)
@@ -6371,422 +4236,55 @@ def admin_associados_excluir(id):
 # CRUD - CARTEIRAS DE ASSOCIADOS
 # ============================================
 
-def draw_rg_border(canvas, doc, border_color, is_front):
-    """Desenha a borda azul do RG com design melhorado"""
-    # Desenhar borda azul mais espessa
-    canvas.setStrokeColor(border_color)
-    canvas.setLineWidth(3)
-    
-    # Retângulo externo com borda azul
-    canvas.rect(3*mm, 3*mm, doc.width - 6*mm, doc.height - 6*mm, stroke=1, fill=0)
+@rotas.route('/admin/carteiras')
+@admin_required
+def admin_carteiras():
+    """Lista todos os associados para gerenciar carteiras"""
+    status_filter = request.args.get('status', 'todos')
     
-    # Linha horizontal superior decorativa (como no RG)
-    canvas.setLineWidth(1.5)
-    canvas.line(3*mm, doc.height - 12*mm, doc.width - 3*mm, doc.height - 12*mm)
+    if status_filter == 'pendentes':
+        associados = Associado.query.filter_by(status='pendente').order_by(Associado.created_at.desc()).all()
+    elif status_filter == 'aprovados':
+        associados = Associado.query.filter_by(status='aprovado').order_by(Associado.nome_completo.asc()).all()
+    elif status_filter == 'negados':
+        associados = Associado.query.filter_by(status='negado').order_by(Associado.created_at.desc()).all()
+    else:
+        associados = Associado.query.order_by(Associado.created_at.desc()).all()
     
-    # Linha horizontal inferior decorativa
-    canvas.line(3*mm, 8*mm, doc.width - 3*mm, 8*mm)
+    # Contar por status
+    pendentes_count = Associado.query.filter_by(status='pendente').count()
+    aprovados_count = Associado.query.filter_by(status='aprovado').count()
+    negados_count = Associado.query.filter_by(status='negado').count()
     
-    # Se for a frente, adicionar texto "BRASIL" no topo com melhor estilo
-    if is_front:
-        canvas.setFillColor(border_color)
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.drawCentredString(doc.width / 2, doc.height - 9*mm, "BRASIL")
+    return render_template('admin/carteiras.html', 
+                         associados=associados, 
+                         status_filter=status_filter,
+                         pendentes_count=pendentes_count,
+                         aprovados_count=aprovados_count,
+                         negados_count=negados_count)
 
-def gerar_carteira_pdf(associado):
-    """Gera o PDF da carteira de associado no formato RG brasileiro (azul) - UMA PÁGINA com frente e verso"""
+@rotas.route('/admin/carteiras/<int:id>/gerar', methods=['POST'])
+@admin_required
+def admin_carteira_gerar(id):
+    """Gera a carteira PDF para um associado"""
+    associado = Associado.query.get_or_404(id)
+    
+    if associado.status != 'aprovado':
+        flash('Apenas associados aprovados podem ter carteiras geradas.', 'error')
+        return redirect(url_for('admin_carteiras'))
+    
     try:
-        # Criar diretório se não existir
-        upload_folder = 'static/documents/carteiras'
-        os.makedirs(upload_folder, exist_ok=True)
+        # Recarregar associado do banco para garantir que tem foto_base64 atualizado
+        db.session.refresh(associado)
         
-        # Nome do arquivo
-        filename = f"carteira_{associado.cpf.replace('.', '').replace('-', '')}.pdf"
-        filepath = os.path.join(upload_folder, filename)
-        
-        # Tamanho do RG brasileiro (10.5cm x 6.5cm)
-        card_width = 10.5 * cm
-        card_height = 6.5 * cm
-        
-        # Buscar dados da associação
-        dados_associacao = DadosAssociacao.get_dados()
-        
-        # Criar PDF usando canvas diretamente
-        from reportlab.lib.pagesizes import A4, landscape
-        from reportlab.pdfgen import canvas as pdfcanvas
-        
-        page_width, page_height = landscape(A4)
-        gap = 10*mm
-        total_width = card_width * 2 + gap
-        
-        # Posições centralizadas
-        frente_x = (page_width - total_width) / 2
-        frente_y = (page_height - card_height) / 2
-        verso_x = frente_x + card_width + gap
-        verso_y = frente_y
-        
-        # Criar canvas
-        c = pdfcanvas.Canvas(filepath, pagesize=landscape(A4))
-        border_color = colors.HexColor('#1e40af')
-        
-        # Variável para armazenar caminho do arquivo temporário (será deletado no final)
-        foto_temp_path = None
-        
-        # Logo
-        logo_path = os.path.join('static', 'images', 'logo.png')
-        if not os.path.exists(logo_path):
-            logo_path = os.path.join('static', 'images', 'logorodape.png')
-        
-        def draw_card_front(x, y, width, height):
-            """Desenha a frente da carteira"""
-            # Borda azul
-            c.setStrokeColor(border_color)
-            c.setLineWidth(3)
-            c.rect(x, y, width, height, stroke=1, fill=0)
-            
-            # Linhas decorativas
-            c.setLineWidth(1.5)
-            c.line(x, y + height - 12*mm, x + width, y + height - 12*mm)
-            c.line(x, y + 8*mm, x + width, y + 8*mm)
-            
-            # BRASIL no topo
-            c.setFillColor(border_color)
-            c.setFont("Helvetica-Bold", 9)
-            c.drawCentredString(x + width/2, y + height - 9*mm, "BRASIL")
-            
-            # Área interna com margem de 4mm
-            inner_x = x + 4*mm
-            inner_y = y + 4*mm
-            inner_w = width - 8*mm
-            inner_h = height - 8*mm
-            
-            # Logo (centro superior)
-            if os.path.exists(logo_path):
-                try:
-                    from PIL import Image as PILImage
-                    img = PILImage.open(logo_path)
-                    img_w, img_h = img.size
-                    aspect = img_w / img_h
-                    logo_h = 9*mm
-                    logo_w = logo_h * aspect
-                    if logo_w > inner_w - 2*mm:
-                        logo_w = inner_w - 2*mm
-                        logo_h = logo_w / aspect
-                    logo_x = x + (width - logo_w) / 2
-                    logo_y = y + height - 20*mm
-                    c.drawImage(logo_path, logo_x, logo_y, width=logo_w, height=logo_h, preserveAspectRatio=True)
-                except:
-                    pass
-            
-            # Título
-            c.setFillColor(border_color)
-            c.setFont("Helvetica-Bold", 7.5)
-            c.drawCentredString(x + width/2, y + height - 32*mm, "CARTEIRA DE ASSOCIADO")
-            
-            # Foto (esquerda, abaixo do título)
-            foto_x = inner_x
-            foto_y = y + 20*mm
-            foto_w_max = 22*mm
-            foto_h_max = 28*mm
-            
-            # Usar a variável do escopo externo
-            nonlocal foto_temp_path
-            
-            print(f"[Carteira] Verificando foto do associado {associado.id} ({associado.nome_completo})")
-            print(f"[Carteira] associado.foto = {associado.foto}")
-            print(f"[Carteira] associado.foto_base64 existe? {bool(getattr(associado, 'foto_base64', None))}")
-            
-            if associado.foto:
-                foto_path = None
-                
-                # Verificar se a foto está em base64 (Render)
-                if associado.foto.startswith('base64:'):
-                    foto_base64 = getattr(associado, 'foto_base64', None)
-                    if foto_base64:
-                        try:
-                            import tempfile
-                            from PIL import Image as PILImage
-                            from io import BytesIO
-                            
-                            # Extrair o tipo MIME
-                            mime_type = associado.foto.replace('base64:', '')
-                            print(f"[Carteira] Tipo MIME da foto: {mime_type}")
-                            print(f"[Carteira] Tamanho do base64: {len(foto_base64)} caracteres")
-                            
-                            # Decodificar base64
-                            image_data = base64.b64decode(foto_base64)
-                            print(f"[Carteira] Foto base64 decodificada, tamanho: {len(image_data)} bytes")
-                            
-                            # Criar imagem PIL a partir dos bytes
-                            img = PILImage.open(BytesIO(image_data))
-                            print(f"[Carteira] Imagem PIL criada: {img.size} pixels, formato: {img.format}")
-                            
-                            # Converter para RGB se necessário (para JPEG)
-                            if img.mode != 'RGB':
-                                print(f"[Carteira] Convertendo imagem de {img.mode} para RGB")
-                                img = img.convert('RGB')
-                            
-                            # Criar arquivo temporário
-                            foto_temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
-                            foto_temp_path = foto_temp_file.name
-                            foto_temp_file.close()
-                            
-                            # Salvar imagem no arquivo temporário
-                            img.save(foto_temp_path, 'JPEG', quality=95)
-                            print(f"[Carteira] Foto temporária salva em: {foto_temp_path}")
-                            print(f"[Carteira] Arquivo existe? {os.path.exists(foto_temp_path)}")
-                            
-                            foto_path = foto_temp_path
-                        except Exception as e:
-                            print(f"[Carteira] Erro ao processar foto base64: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            foto_path = None
-                    else:
-                        print(f"[Carteira] Foto marcada como base64 mas foto_base64 está vazio")
-                else:
-                    # Tentar usar o caminho do arquivo
-                    foto_path = os.path.join('static', associado.foto)
-                    print(f"[Carteira] Tentando usar arquivo local: {foto_path}")
-                    if not os.path.exists(foto_path):
-                        print(f"[Carteira] Arquivo não encontrado: {foto_path}")
-                        foto_path = None
-                
-                if foto_path and os.path.exists(foto_path):
-                    try:
-                        from PIL import Image as PILImage
-                        img = PILImage.open(foto_path)
-                        img_w, img_h = img.size
-                        aspect = img_w / img_h
-                        foto_h = min(foto_h_max, inner_h - 40*mm)
-                        foto_w = foto_h * aspect
-                        if foto_w > foto_w_max:
-                            foto_w = foto_w_max
-                            foto_h = foto_w / aspect
-                        print(f"[Carteira] Desenhando foto: {foto_path}, tamanho: {foto_w}x{foto_h}, posição: ({foto_x}, {foto_y})")
-                        c.drawImage(foto_path, foto_x, foto_y, width=foto_w, height=foto_h, preserveAspectRatio=True)
-                        print(f"[Carteira] Foto desenhada com sucesso!")
-                    except Exception as e:
-                        print(f"[Carteira] Erro ao desenhar foto na carteira: {e}")
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    print(f"[Carteira] Foto não encontrada ou inválida: {foto_path}")
-            else:
-                print(f"[Carteira] Associado não possui foto cadastrada")
-            
-            # Nome e CPF (direita da foto)
-            text_x = inner_x + 24*mm
-            text_y = y + height - 42*mm
-            
-            nome = associado.nome_completo.upper()
-            c.setFillColor(colors.HexColor('#1f2937'))
-            c.setFont("Helvetica-Bold", 7.5)
-            
-            # Quebrar nome se necessário
-            max_chars = 22
-            if len(nome) > max_chars:
-                palavras = nome.split()
-                meio = len(palavras) // 2
-                linha1 = ' '.join(palavras[:meio])
-                linha2 = ' '.join(palavras[meio:])
-                c.drawString(text_x, text_y, linha1[:max_chars])
-                c.drawString(text_x, text_y - 6*mm, linha2[:max_chars])
-                cpf_y = text_y - 12*mm
-            else:
-                c.drawString(text_x, text_y, nome[:max_chars])
-                cpf_y = text_y - 7*mm
-            
-            c.setFont("Helvetica", 6)
-            c.drawString(text_x, cpf_y, f"CPF: {associado.cpf}")
-        
-        def draw_card_back(x, y, width, height):
-            """Desenha o verso da carteira"""
-            # Borda azul
-            c.setStrokeColor(border_color)
-            c.setLineWidth(3)
-            c.rect(x, y, width, height, stroke=1, fill=0)
-            
-            # Linhas decorativas
-            c.setLineWidth(1.5)
-            c.line(x, y + height - 12*mm, x + width, y + height - 12*mm)
-            c.line(x, y + 8*mm, x + width, y + 8*mm)
-            
-            # Área interna com margem de 4mm
-            inner_x = x + 4*mm
-            inner_y = y + 4*mm
-            inner_w = width - 8*mm
-            inner_h = height - 8*mm
-            
-            # Título (centro superior, dentro da borda)
-            c.setFillColor(border_color)
-            c.setFont("Helvetica-Bold", 7.5)
-            titulo_y = y + height - 25*mm
-            c.drawCentredString(x + width/2, titulo_y, "DADOS DA ASSOCIAÇÃO")
-            
-            # Dados (abaixo do título, dentro da borda)
-            dados_start_y = y + height - 38*mm
-            label_x = inner_x
-            value_x = inner_x + 14*mm
-            line_h = 6*mm
-            
-            # Layout em duas colunas: esquerda (Nome, CNPJ) e direita (Endereço)
-            col_left_x = inner_x
-            col_right_x = inner_x + inner_w / 2
-            col_width = inner_w / 2 - 2*mm
-            
-            c.setFillColor(colors.HexColor('#1f2937'))
-            
-            # Nome (coluna esquerda)
-            c.setFont("Helvetica-Bold", 5.5)
-            c.drawString(col_left_x, dados_start_y, "Nome:")
-            c.setFont("Helvetica", 5.5)
-            nome_assoc = dados_associacao.nome
-            max_chars = 25
-            nome_value_x = col_left_x + 12*mm
-            if len(nome_assoc) > max_chars:
-                palavras = nome_assoc.split()
-                meio = len(palavras) // 2
-                linha1 = ' '.join(palavras[:meio])
-                linha2 = ' '.join(palavras[meio:])
-                c.drawString(nome_value_x, dados_start_y, linha1[:max_chars])
-                c.drawString(nome_value_x, dados_start_y - line_h, linha2[:max_chars])
-                cnpj_y = dados_start_y - (line_h * 2)
-            else:
-                c.drawString(nome_value_x, dados_start_y, nome_assoc[:max_chars])
-                cnpj_y = dados_start_y - line_h
-            
-            # Endereço (coluna direita, alinhado verticalmente com Nome)
-            end_y = dados_start_y
-            c.setFont("Helvetica-Bold", 5.5)
-            c.drawString(col_right_x, end_y, "Endereço:")
-            c.setFont("Helvetica", 5.5)
-            endereco = dados_associacao.endereco
-            max_chars_line = 20
-            endereco_x = col_right_x + 16*mm
-            
-            # Quebrar endereço em múltiplas linhas se necessário
-            if len(endereco) > max_chars_line:
-                partes = endereco.split(', ')
-                current = partes[0]
-                offset = 0
-                for parte in partes[1:]:
-                    if len(current + ', ' + parte) <= max_chars_line:
-                        current += ', ' + parte
-                    else:
-                        c.drawString(endereco_x, end_y - offset, current[:max_chars_line])
-                        offset += line_h
-                        current = parte
-                if current:
-                    c.drawString(endereco_x, end_y - offset, current[:max_chars_line])
-            else:
-                c.drawString(endereco_x, end_y, endereco[:max_chars_line])
-            
-            # CNPJ (coluna esquerda, abaixo do Nome)
-            c.setFont("Helvetica-Bold", 5.5)
-            c.drawString(col_left_x, cnpj_y, "CNPJ:")
-            c.setFont("Helvetica", 5.5)
-            c.drawString(col_left_x + 12*mm, cnpj_y, dados_associacao.cnpj)
-        
-        # Desenhar frente e verso
-        draw_card_front(frente_x, frente_y, card_width, card_height)
-        draw_card_back(verso_x, verso_y, card_width, card_height)
-        
-        # Salvar
-        c.showPage()
-        c.save()
-        
-        # Ler o PDF gerado e converter para base64
-        pdf_base64 = None
-        try:
-            with open(filepath, 'rb') as pdf_file:
-                pdf_bytes = pdf_file.read()
-                pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
-                print(f"[Carteira] PDF convertido para base64, tamanho: {len(pdf_base64)} caracteres")
-        except Exception as e:
-            print(f"[Carteira] Erro ao converter PDF para base64: {e}")
-        
-        # Salvar base64 no banco de dados (sem commit - será feito pela função chamadora)
-        if pdf_base64:
-            try:
-                associado.carteira_pdf_base64 = pdf_base64
-                associado.carteira_pdf = f"base64:application/pdf"  # Marcar como base64
-                # Não fazer commit aqui - será feito pela função que chama
-                print(f"[Carteira] PDF preparado para salvar em base64 no banco de dados")
-            except Exception as e:
-                print(f"[Carteira] Erro ao preparar PDF base64: {e}")
-        
-        # Limpar arquivo temporário se foi criado (após salvar o PDF)
-        if foto_temp_path and os.path.exists(foto_temp_path):
-            try:
-                os.unlink(foto_temp_path)
-                print(f"[Carteira] Arquivo temporário removido: {foto_temp_path}")
-            except Exception as e:
-                print(f"[Carteira] Erro ao remover arquivo temporário: {e}")
-        
-        return f"documents/carteiras/{filename}"
-        
-    except Exception as e:
-        print(f"Erro ao gerar carteira PDF: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        # Limpar arquivo temporário em caso de erro
-        if 'foto_temp_path' in locals() and foto_temp_path and os.path.exists(foto_temp_path):
-            try:
-                os.unlink(foto_temp_path)
-            except:
-                pass
-        raise
-
-@app.route('/admin/carteiras')
-@admin_required
-def admin_carteiras():
-    """Lista todos os associados para gerenciar carteiras"""
-    status_filter = request.args.get('status', 'todos')
-    
-    if status_filter == 'pendentes':
-        associados = Associado.query.filter_by(status='pendente').order_by(Associado.created_at.desc()).all()
-    elif status_filter == 'aprovados':
-        associados = Associado.query.filter_by(status='aprovado').order_by(Associado.nome_completo.asc()).all()
-    elif status_filter == 'negados':
-        associados = Associado.query.filter_by(status='negado').order_by(Associado.created_at.desc()).all()
-    else:
-        associados = Associado.query.order_by(Associado.created_at.desc()).all()
-    
-    # Contar por status
-    pendentes_count = Associado.query.filter_by(status='pendente').count()
-    aprovados_count = Associado.query.filter_by(status='aprovado').count()
-    negados_count = Associado.query.filter_by(status='negado').count()
-    
-    return render_template('admin/carteiras.html', 
-                         associados=associados, 
-                         status_filter=status_filter,
-                         pendentes_count=pendentes_count,
-                         aprovados_count=aprovados_count,
-                         negados_count=negados_count)
-
-@app.route('/admin/carteiras/<int:id>/gerar', methods=['POST'])
-@admin_required
-def admin_carteira_gerar(id):
-    """Gera a carteira PDF para um associado"""
-    associado = Associado.query.get_or_404(id)
-    
-    if associado.status != 'aprovado':
-        flash('Apenas associados aprovados podem ter carteiras geradas.', 'error')
-        return redirect(url_for('admin_carteiras'))
-    
-    try:
-        # Recarregar associado do banco para garantir que tem foto_base64 atualizado
-        db.session.refresh(associado)
-        
-        print(f"[Admin Carteira] Gerando carteira para associado {associado.id} - {associado.nome_completo}")
-        print(f"[Admin Carteira] Foto: {associado.foto}")
-        print(f"[Admin Carteira] Foto base64 existe? {bool(associado.foto_base64)}")
-        
-        # Deletar carteira antiga se existir (apenas se for arquivo, não base64)
-        if associado.carteira_pdf and not associado.carteira_pdf.startswith('base64:'):
-            old_filepath = os.path.join('static', associado.carteira_pdf)
-            if os.path.exists(old_filepath):
+        print(f"[Admin Carteira] Gerando carteira para associado {associado.id} - {associado.nome_completo}")
+        print(f"[Admin Carteira] Foto: {associado.foto}")
+        print(f"[Admin Carteira] Foto base64 existe? {bool(associado.foto_base64)}")
+        
+        # Deletar carteira antiga se existir (apenas se for arquivo, não base64)
+        if associado.carteira_pdf and not associado.carteira_pdf.startswith('base64:'):
+            old_filepath = os.path.join('static', associado.carteira_pdf)
+            if os.path.exists(old_filepath):
                 try:
                     os.remove(old_filepath)
                 except Exception as e:
@@ -6796,6 +4294,7 @@ def admin_carteira_gerar(id):
         associado.carteira_pdf_base64 = None
         
         # Gerar nova carteira (a função já salva em base64 automaticamente)
+        from carteira import gerar_carteira_pdf
         carteira_path = gerar_carteira_pdf(associado)
         
         # Atualizar no banco de dados (a função já atualizou carteira_pdf e carteira_pdf_base64)
@@ -6809,7 +4308,7 @@ def admin_carteira_gerar(id):
     
     return redirect(url_for('admin_carteiras'))
 
-@app.route('/admin/carteiras/<int:id>/pdf')
+@rotas.route('/admin/carteiras/<int:id>/pdf')
 @admin_required
 def admin_carteira_pdf(id):
     """Rota para servir o PDF da carteira do associado"""
@@ -6838,7 +4337,7 @@ def admin_carteira_pdf(id):
     
     return send_from_directory('static', associado.carteira_pdf, as_attachment=False)
 
-@app.route('/admin/carteiras/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/carteiras/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_carteira_excluir(id):
     """Exclui a carteira PDF de um associado"""
@@ -6865,7 +4364,7 @@ def admin_carteira_excluir(id):
     
     return redirect(url_for('admin_carteiras'))
 
-@app.route('/admin/associados/<int:id>/aprovar', methods=['POST'])
+@rotas.route('/admin/associados/<int:id>/aprovar', methods=['POST'])
 @admin_required
 def admin_associados_aprovar(id):
     associado = Associado.query.get_or_404(id)
@@ -6886,7 +4385,7 @@ def admin_associados_aprovar(id):
         flash(f'Erro ao aprovar associado: {str(e)}', 'error')
     return redirect(url_for('admin_associados', status='pendentes'))
 
-@app.route('/admin/associados/<int:id>/negar', methods=['POST'])
+@rotas.route('/admin/associados/<int:id>/negar', methods=['POST'])
 @admin_required
 def admin_associados_negar(id):
     associado = Associado.query.get_or_404(id)
@@ -6900,199 +4399,11 @@ def admin_associados_negar(id):
         flash(f'Erro ao negar cadastro: {str(e)}', 'error')
     return redirect(url_for('admin_associados', status='pendentes'))
 
-# ============================================
-# SISTEMA FINANCEIRO - MENSALIDADES
-# ============================================
-
-def calcular_dias_uteis(data_inicial, dias):
-    """
-    Calcula uma data X dias úteis à frente, excluindo sábados e domingos
-    """
-    data_atual = data_inicial
-    dias_adicionados = 0
-    
-    while dias_adicionados < dias:
-        data_atual += timedelta(days=1)
-        # Segunda = 0, Domingo = 6
-        if data_atual.weekday() < 5:  # Segunda a Sexta (0-4)
-            dias_adicionados += 1
-    
-    return data_atual
-
-def gerar_primeira_mensalidade(associado):
-    """
-    Gera mensalidades para 1 ano (12 meses) para um associado recém-cadastrado ou aprovado
-    - Primeira mensalidade: vencimento em 3 dias úteis após cadastro/aprovação
-    - Próximas 11 mensalidades: vencimento fixo no mesmo dia do mês do cadastro/aprovação
-    """
-    # Verificar se é Associado Regular (não paga mensalidade)
-    if associado.tipo_associado == 'regular':
-        return  # Associados Regulares não pagam mensalidade
-    
-    # Verificar se já existe alguma mensalidade para este associado
-    mensalidade_existente = Mensalidade.query.filter_by(associado_id=associado.id).first()
-    if mensalidade_existente:
-        return  # Já existe mensalidade, não gerar
-    
-    # Verificar se o associado tem valor de mensalidade configurado
-    if not associado.valor_mensalidade or associado.valor_mensalidade <= 0:
-        return  # Não tem valor configurado, não gerar
-    
-    # Calcular valor final
-    valor_final = associado.calcular_valor_final()
-    
-    # Data base: data de criação do associado
-    data_base = associado.created_at.date() if isinstance(associado.created_at, datetime) else associado.created_at
-    
-    # Dia do cadastro/aprovação (será usado para as próximas mensalidades)
-    dia_cadastro = data_base.day
-    
-    # PRIMEIRA MENSALIDADE: 3 dias úteis após cadastro/aprovação
-    data_vencimento_primeira = calcular_dias_uteis(data_base, 3)
-    mes_referencia_primeira = data_vencimento_primeira.month
-    ano_referencia_primeira = data_vencimento_primeira.year
-    
-    mensalidade_primeira = Mensalidade(
-        associado_id=associado.id,
-        valor_base=float(associado.valor_mensalidade),
-        desconto_tipo=associado.desconto_tipo,
-        desconto_valor=float(associado.desconto_valor) if associado.desconto_valor else 0.0,
-        valor_final=valor_final,
-        mes_referencia=mes_referencia_primeira,
-        ano_referencia=ano_referencia_primeira,
-        data_vencimento=data_vencimento_primeira,
-        status='pendente'
-    )
-    db.session.add(mensalidade_primeira)
-    
-    # PRÓXIMAS 11 MENSALIDADES: vencimento fixo no dia do cadastro
-    # Começar do mês seguinte ao vencimento da primeira mensalidade
-    mes_atual = data_vencimento_primeira.month
-    ano_atual = data_vencimento_primeira.year
-    
-    # Se a primeira mensalidade vence no mesmo mês do cadastro, começar do próximo mês
-    if mes_referencia_primeira == data_base.month:
-        # Próximo mês
-        if mes_atual == 12:
-            mes_proximo = 1
-            ano_proximo = ano_atual + 1
-        else:
-            mes_proximo = mes_atual + 1
-            ano_proximo = ano_atual
-    else:
-        # A primeira mensalidade já está no próximo mês, começar do mês seguinte
-        if mes_atual == 12:
-            mes_proximo = 1
-            ano_proximo = ano_atual + 1
-        else:
-            mes_proximo = mes_atual + 1
-            ano_proximo = ano_atual
-    
-    # Gerar as próximas 11 mensalidades
-    for i in range(11):
-        # Calcular mês e ano
-        mes = mes_proximo + i
-        ano = ano_proximo
-        
-        # Ajustar se passar de dezembro
-        while mes > 12:
-            mes -= 12
-            ano += 1
-        
-        # Verificar se o dia existe no mês (ex: 31/02 não existe)
-        ultimo_dia_mes = monthrange(ano, mes)[1]
-        dia_vencimento = min(dia_cadastro, ultimo_dia_mes)
-        
-        # Data de vencimento
-        data_vencimento = date(ano, mes, dia_vencimento)
-        
-        # Criar mensalidade
-        mensalidade = Mensalidade(
-            associado_id=associado.id,
-            valor_base=float(associado.valor_mensalidade),
-            desconto_tipo=associado.desconto_tipo,
-            desconto_valor=float(associado.desconto_valor) if associado.desconto_valor else 0.0,
-            valor_final=valor_final,
-            mes_referencia=mes,
-            ano_referencia=ano,
-            data_vencimento=data_vencimento,
-            status='pendente'
-        )
-        db.session.add(mensalidade)
-    
-    db.session.commit()
-
-def gerar_mensalidades_automaticas():
-    """Gera mensalidades automaticamente para todos os associados ativos"""
-    hoje = date.today()
-    mes_atual = hoje.month
-    ano_atual = hoje.year
-    
-    # Buscar todos os associados aprovados, ativos, Contribuintes (não Regulares) com valor de mensalidade definido
-    associados = Associado.query.filter_by(
-        status='aprovado',
-        ativo=True,
-        tipo_associado='contribuinte'
-    ).filter(Associado.valor_mensalidade > 0).all()
-    
-    mensalidades_geradas = 0
-    
-    for associado in associados:
-        # Verificar se já existe mensalidade para este mês/ano
-        mensalidade_existente = Mensalidade.query.filter_by(
-            associado_id=associado.id,
-            mes_referencia=mes_atual,
-            ano_referencia=ano_atual
-        ).first()
-        
-        if not mensalidade_existente:
-            # Calcular valor final
-            valor_final = associado.calcular_valor_final()
-            
-            # Calcular data de vencimento (dia 10 do mês atual)
-            dia_vencimento = 10
-            data_vencimento = date(ano_atual, mes_atual, dia_vencimento)
-            
-            # Se o dia 10 já passou, usar o próximo mês
-            if hoje > data_vencimento:
-                # Próximo mês
-                if mes_atual == 12:
-                    mes_vencimento = 1
-                    ano_vencimento = ano_atual + 1
-                else:
-                    mes_vencimento = mes_atual + 1
-                    ano_vencimento = ano_atual
-                
-                # Verificar se o dia existe no mês
-                ultimo_dia = monthrange(ano_vencimento, mes_vencimento)[1]
-                dia_vencimento = min(dia_vencimento, ultimo_dia)
-                data_vencimento = date(ano_vencimento, mes_vencimento, dia_vencimento)
-            
-            # Criar mensalidade
-            mensalidade = Mensalidade(
-                associado_id=associado.id,
-                valor_base=float(associado.valor_mensalidade),
-                desconto_tipo=associado.desconto_tipo,
-                desconto_valor=float(associado.desconto_valor) if associado.desconto_valor else 0.0,
-                valor_final=valor_final,
-                mes_referencia=mes_atual,
-                ano_referencia=ano_atual,
-                data_vencimento=data_vencimento,
-                status='pendente'
-            )
-            db.session.add(mensalidade)
-            mensalidades_geradas += 1
-    
-    if mensalidades_geradas > 0:
-        db.session.commit()
-    
-    return mensalidades_geradas
-
 # ============================================
 # SISTEMA DE CONTAS - DOAÇÕES E GASTOS
 # ============================================
 
-@app.route('/admin/contas')
+@rotas.route('/admin/contas')
 @admin_required
 def admin_contas():
     # Buscar doações e gastos
@@ -7120,7 +4431,7 @@ def admin_contas():
                          total_doacoes_servico_por_unidade=total_doacoes_servico_por_unidade,
                          total_gastos=float(total_gastos))
 
-@app.route('/admin/contas/doacao/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/contas/doacao/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_doacao_novo():
     if request.method == 'POST':
@@ -7131,11 +4442,11 @@ def admin_doacao_novo():
             quantidade = request.form.get('quantidade', '0')
             unidade = request.form.get('unidade', '')
             doador = request.form.get('doador', '')
-            pais = request.form.get('pais', '')
-            # País agora vem diretamente do select (todos os países estão na lista)
+            # País e documento validados contra a lista de países (ValueError vira mensagem de erro)
+            pais = normalizar_pais(request.form.get('pais'))
             telefone = request.form.get('telefone', '').strip()
-            tipo_documento = request.form.get('tipo_documento', '')
-            documento = request.form.get('documento', '').replace('.', '').replace('-', '').replace('/', '').replace(' ', '').upper()
+            tipo_documento, documento = normalizar_documento(
+                pais, request.form.get('tipo_documento'), request.form.get('documento'))
             data_doacao_str = request.form.get('data_doacao')
             observacoes = request.form.get('observacoes', '')
             
@@ -7146,10 +4457,10 @@ def admin_doacao_novo():
                 quantidade=int(quantidade) if quantidade and tipo in ['material', 'servico'] else None,
                 unidade=unidade if tipo in ['material', 'servico'] else None,
                 doador=doador,
-                pais=pais if pais else None,
+                pais=pais,
                 telefone=telefone if telefone else None,
-                tipo_documento=tipo_documento if tipo_documento else None,
-                documento=documento if documento else None,
+                tipo_documento=tipo_documento,
+                documento=documento,
                 data_doacao=datetime.strptime(data_doacao_str, "%Y-%m-%d").date(),
                 observacoes=observacoes
             )
@@ -7161,9 +4472,9 @@ def admin_doacao_novo():
             db.session.rollback()
             flash(f'Erro ao cadastrar doação: {str(e)}', 'error')
     
-    return render_template('admin/doacao_form.html')
+    return render_template('admin/doacao_form.html', paises=PAISES, paises_versao=PAISES_VERSAO)
 
-@app.route('/admin/contas/doacao/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/contas/doacao/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_doacao_editar(id):
     doacao = Doacao.query.get_or_404(id)
@@ -7176,21 +4487,21 @@ def admin_doacao_editar(id):
             quantidade = request.form.get('quantidade', '0')
             unidade = request.form.get('unidade', '')
             doacao.doador = request.form.get('doador', '')
-            pais = request.form.get('pais', '')
-            # País agora vem diretamente do select (todos os países estão na lista)
+            # País e documento validados contra a lista de países (ValueError vira mensagem de erro)
+            pais = normalizar_pais(request.form.get('pais'))
             telefone = request.form.get('telefone', '').strip()
-            tipo_documento = request.form.get('tipo_documento', '')
-            documento = request.form.get('documento', '').replace('.', '').replace('-', '').replace('/', '').replace(' ', '').upper()
+            tipo_documento, documento = normalizar_documento(
+                pais, request.form.get('tipo_documento'), request.form.get('documento'))
             data_doacao_str = request.form.get('data_doacao')
             doacao.observacoes = request.form.get('observacoes', '')
             
             doacao.valor = float(valor) if valor and doacao.tipo == 'financeira' else None
             doacao.quantidade = int(quantidade) if quantidade and doacao.tipo in ['material', 'servico'] else None
             doacao.unidade = unidade if doacao.tipo in ['material', 'servico'] else None
-            doacao.pais = pais if pais else None
+            doacao.pais = pais
             doacao.telefone = telefone if telefone else None
-            doacao.tipo_documento = tipo_documento if tipo_documento else None
-            doacao.documento = documento if documento else None
+            doacao.tipo_documento = tipo_documento
+            doacao.documento = documento
             doacao.data_doacao = datetime.strptime(data_doacao_str, "%Y-%m-%d").date()
             
             db.session.commit()
@@ -7200,9 +4511,9 @@ def admin_doacao_editar(id):
             db.session.rollback()
             flash(f'Erro ao atualizar doação: {str(e)}', 'error')
     
-    return render_template('admin/doacao_form.html', doacao=doacao)
+    return render_template('admin/doacao_form.html', doacao=doacao, paises=PAISES, paises_versao=PAISES_VERSAO)
 
-@app.route('/admin/contas/doacao/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/contas/doacao/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_doacao_excluir(id):
     doacao = Doacao.query.get_or_404(id)
@@ -7215,7 +4526,7 @@ def admin_doacao_excluir(id):
         flash(f'Erro ao excluir doação: {str(e)}', 'error')
     return redirect(url_for('admin_contas'))
 
-@app.route('/admin/contas/gasto/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/contas/gasto/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_gasto_novo():
     if request.method == 'POST':
@@ -7246,7 +4557,7 @@ def admin_gasto_novo():
     
     return render_template('admin/gasto_form.html')
 
-@app.route('/admin/contas/gasto/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/contas/gasto/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_gasto_editar(id):
     gasto = Gasto.query.get_or_404(id)
@@ -7272,7 +4583,7 @@ def admin_gasto_editar(id):
     
     return render_template('admin/gasto_form.html', gasto=gasto)
 
-@app.route('/admin/contas/gasto/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/contas/gasto/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_gasto_excluir(id):
     gasto = Gasto.query.get_or_404(id)
@@ -7289,13 +4600,13 @@ def admin_gasto_excluir(id):
 # GERENCIAMENTO DE USUÁRIOS ADMINISTRATIVOS
 # ============================================
 
-@app.route('/admin/usuarios')
+@rotas.route('/admin/usuarios')
 @admin_required
 def admin_usuarios():
     usuarios = Usuario.query.order_by(Usuario.created_at.desc()).all()
     return render_template('admin/usuarios.html', usuarios=usuarios)
 
-@app.route('/admin/usuarios/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/usuarios/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_usuarios_novo():
     if request.method == 'POST':
@@ -7360,7 +4671,7 @@ def admin_usuarios_novo():
     
     return render_template('admin/usuario_form.html', permissoes_por_categoria=permissoes_por_categoria)
 
-@app.route('/admin/usuarios/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/usuarios/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_usuarios_editar(id):
     usuario = Usuario.query.get_or_404(id)
@@ -7427,7 +4738,7 @@ def admin_usuarios_editar(id):
     
     return render_template('admin/usuario_form.html', usuario=usuario, permissoes_por_categoria=permissoes_por_categoria)
 
-@app.route('/admin/usuarios/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/usuarios/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_usuarios_excluir(id):
     usuario = Usuario.query.get_or_404(id)
@@ -7457,13 +4768,13 @@ def admin_usuarios_excluir(id):
 # GERENCIAMENTO DE APOIADORES
 # ============================================
 
-@app.route('/admin/apoiadores')
+@rotas.route('/admin/apoiadores')
 @admin_required
 def admin_apoiadores():
     apoiadores = Apoiador.query.order_by(Apoiador.nome.asc()).all()
     return render_template('admin/apoiadores.html', apoiadores=apoiadores)
 
-@app.route('/admin/apoiadores/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/apoiadores/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_apoiadores_novo():
     if request.method == 'POST':
@@ -7492,7 +4803,7 @@ def admin_apoiadores_novo():
                 
                 # Também salvar localmente para desenvolvimento local (opcional)
                 try:
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     filename = secure_filename(file.filename)
                     unique_filename = f"{uuid.uuid4()}_{filename}"
@@ -7533,7 +4844,7 @@ def admin_apoiadores_novo():
     
     return render_template('admin/apoiador_form.html')
 
-@app.route('/admin/apoiadores/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/apoiadores/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_apoiadores_editar(id):
     apoiador = Apoiador.query.get_or_404(id)
@@ -7572,7 +4883,7 @@ def admin_apoiadores_editar(id):
                 
                 # Também salvar localmente para desenvolvimento local (opcional)
                 try:
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     filename = secure_filename(file.filename)
                     unique_filename = f"{uuid.uuid4()}_{filename}"
@@ -7610,7 +4921,7 @@ def admin_apoiadores_editar(id):
     
     return render_template('admin/apoiador_form.html', apoiador=apoiador)
 
-@app.route('/qrcode/imagem')
+@rotas.route('/qrcode/imagem')
 def qrcode_imagem():
     """Rota para servir QR code do banco de dados (base64)"""
     try:
@@ -7626,7 +4937,11 @@ def qrcode_imagem():
             try:
                 image_data = base64.b64decode(config_base64.valor)
                 from flask import Response
-                return Response(image_data, mimetype=mime_type)
+                resposta = Response(image_data, mimetype=mime_type)
+                if request.args.get('v'):
+                    # URL versionada por qrcode_url(): o conteúdo nunca muda
+                    resposta.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+                return resposta
             except Exception as e:
                 print(f"Erro ao decodificar QR code base64: {e}")
                 from flask import abort
@@ -7649,7 +4964,7 @@ def qrcode_imagem():
         from flask import abort
         abort(500)
 
-@app.route('/apoiador/<int:id>/logo')
+@rotas.route('/apoiador/<int:id>/logo')
 def apoiador_logo(id):
     """Rota para servir imagens do apoiador do banco de dados (base64)"""
     try:
@@ -7691,7 +5006,7 @@ def apoiador_logo(id):
         from flask import abort
         abort(500)
 
-@app.route('/admin/apoiadores/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/apoiadores/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_apoiadores_excluir(id):
     apoiador = Apoiador.query.get_or_404(id)
@@ -7722,13 +5037,13 @@ def admin_apoiadores_excluir(id):
 # CRUD - SLIDER (HOME)
 # ============================================
 
-@app.route('/admin/slider')
+@rotas.route('/admin/slider')
 @admin_required
 def admin_slider():
     slider_images = SliderImage.query.order_by(SliderImage.ordem.asc(), SliderImage.created_at.asc()).all()
     return render_template('admin/slider.html', slider_images=slider_images)
 
-@app.route('/admin/slider/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/slider/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_slider_novo():
     if request.method == 'POST':
@@ -7769,7 +5084,7 @@ def admin_slider_novo():
                 
                 # Também salvar localmente para desenvolvimento local (opcional)
                 try:
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     filename = secure_filename(file.filename)
                     unique_filename = f"{uuid.uuid4()}_{filename}"
@@ -7809,7 +5124,7 @@ def admin_slider_novo():
     
     return render_template('admin/slider_form.html')
 
-@app.route('/admin/slider/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/slider/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_slider_editar(id):
     slider_image = SliderImage.query.get_or_404(id)
@@ -7879,7 +5194,7 @@ def admin_slider_editar(id):
     
     return render_template('admin/slider_form.html', slider_image=slider_image)
 
-@app.route('/slider/<int:id>/imagem')
+@rotas.route('/slider/<int:id>/imagem')
 def slider_imagem(id):
     """Rota para servir imagens do slider do banco de dados (base64)"""
     try:
@@ -7926,13 +5241,13 @@ def slider_imagem(id):
         from flask import abort
         abort(404)
 
-@app.route('/projeto/<int:id>/imagem')
-@app.route('/projeto/<slug>/imagem')
+@rotas.route('/projeto/<int:id>/imagem')
+@rotas.route('/projeto/<slug>/imagem')
 def projeto_imagem(id=None, slug=None):
     """Rota para servir imagens de projetos do banco de dados (base64)"""
     try:
         if slug:
-            projeto = Projeto.query.filter_by(slug=slug).first_or_404()
+            projeto = buscar_por_slug_ou_404(Projeto, slug)
         else:
             projeto = Projeto.query.get_or_404(id)
         
@@ -7979,7 +5294,7 @@ def projeto_imagem(id=None, slug=None):
         from flask import abort
         abort(404)
 
-@app.route('/radio-programa/<int:id>/imagem')
+@rotas.route('/radio-programa/<int:id>/imagem')
 def radio_programa_imagem(id):
     """Rota para servir imagens de programas de rádio do banco de dados (base64)"""
     try:
@@ -8028,13 +5343,13 @@ def radio_programa_imagem(id):
         from flask import abort
         abort(404)
 
-@app.route('/acao/<int:id>/imagem')
-@app.route('/acao/<slug>/imagem')
+@rotas.route('/acao/<int:id>/imagem')
+@rotas.route('/acao/<slug>/imagem')
 def acao_imagem(id=None, slug=None):
     """Rota para servir imagens de ações do banco de dados (base64)"""
     try:
         if slug:
-            acao = Acao.query.filter_by(slug=slug).first_or_404()
+            acao = buscar_por_slug_ou_404(Acao, slug)
         else:
             acao = Acao.query.get_or_404(id)
         
@@ -8081,13 +5396,13 @@ def acao_imagem(id=None, slug=None):
         from flask import abort
         abort(404)
 
-@app.route('/informativo/<int:id>/imagem')
-@app.route('/informativo/<slug>/imagem')
+@rotas.route('/informativo/<int:id>/imagem')
+@rotas.route('/informativo/<slug>/imagem')
 def informativo_imagem(id=None, slug=None):
     """Rota para servir imagens de informativos do banco de dados (base64)"""
     try:
         if slug:
-            informativo = Informativo.query.filter_by(slug=slug).first_or_404()
+            informativo = buscar_por_slug_ou_404(Informativo, slug)
         else:
             informativo = Informativo.query.get_or_404(id)
         
@@ -8134,7 +5449,7 @@ def informativo_imagem(id=None, slug=None):
         from flask import abort
         abort(404)
 
-@app.route('/diretoria/<int:id>/foto')
+@rotas.route('/diretoria/<int:id>/foto')
 def diretoria_foto(id):
     """Rota para servir fotos da diretoria do banco de dados (base64)"""
     try:
@@ -8180,7 +5495,7 @@ def diretoria_foto(id):
         from flask import abort
         abort(404)
 
-@app.route('/conselho/<int:id>/foto')
+@rotas.route('/conselho/<int:id>/foto')
 def conselho_foto(id):
     """Rota para servir fotos do conselho fiscal do banco de dados (base64)"""
     try:
@@ -8226,7 +5541,7 @@ def conselho_foto(id):
         from flask import abort
         abort(404)
 
-@app.route('/associado/<int:id>/foto')
+@rotas.route('/associado/<int:id>/foto')
 def associado_foto(id):
     """Rota para servir fotos de associados do banco de dados (base64)"""
     try:
@@ -8273,13 +5588,10 @@ def associado_foto(id):
         from flask import abort
         abort(404)
 
-@app.route('/banner-conteudo/<int:id>/imagem')
+@rotas.route('/banner-conteudo/<int:id>/imagem')
 def banner_conteudo_imagem(id):
     """Rota para servir imagens do banner conteúdo do banco de dados (base64)"""
     try:
-        # Garantir que colunas base64 existem antes de fazer queries
-        ensure_base64_columns()
-        
         conteudo = BannerConteudo.query.get_or_404(id)
         
         # Verificar se tem imagem_base64 (usando getattr para evitar erro se coluna não existir)
@@ -8325,7 +5637,7 @@ def banner_conteudo_imagem(id):
         from flask import abort
         abort(500)
 
-@app.route('/admin/slider/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/slider/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_slider_excluir(id):
     slider_image = SliderImage.query.get_or_404(id)
@@ -8356,50 +5668,13 @@ def admin_slider_excluir(id):
 # CRUD - INFORMATIVOS
 # ============================================
 
-def gerar_slug(titulo):
-    """Gera um slug amigável a partir do título"""
-    # Converter para minúsculas
-    slug = titulo.lower()
-    # Remover acentos
-    slug = unicodedata.normalize('NFKD', slug).encode('ascii', 'ignore').decode('ascii')
-    # Substituir espaços e caracteres especiais por hífen
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
-    # Remover hífens no início e fim
-    slug = slug.strip('-')
-    # Limitar tamanho
-    if len(slug) > 200:
-        slug = slug[:200].rstrip('-')
-    return slug
-
-def gerar_slug_unico(titulo, model_class, item_id=None):
-    """Gera um slug único para qualquer modelo, adicionando número se necessário"""
-    base_slug = gerar_slug(titulo)
-    slug = base_slug
-    
-    # Verificar se já existe um item com esse slug (exceto o atual)
-    contador = 1
-    while True:
-        query = model_class.query.filter_by(slug=slug)
-        if item_id:
-            query = query.filter(model_class.id != item_id)
-        if not query.first():
-            break
-        slug = f"{base_slug}-{contador}"
-        contador += 1
-        if contador > 1000:  # Limite de segurança
-            slug = f"{base_slug}-{uuid.uuid4().hex[:8]}"
-            break
-    
-    return slug
-
-@app.route('/admin/informativos')
+@rotas.route('/admin/informativos')
 @admin_required
 def admin_informativos():
     informativos = Informativo.query.order_by(Informativo.data_publicacao.desc(), Informativo.created_at.desc()).all()
     return render_template('admin/informativos.html', informativos=informativos)
 
-@app.route('/admin/informativos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/informativos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_informativos_novo():
     if request.method == 'POST':
@@ -8457,7 +5732,7 @@ def admin_informativos_novo():
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -8475,6 +5750,7 @@ def admin_informativos_novo():
             informativo = Informativo(
                 tipo=tipo,
                 titulo=titulo,
+                slug=gerar_slug_unico(titulo, Informativo),
                 subtitulo=subtitulo if subtitulo else None,
                 conteudo=conteudo if tipo == 'Noticia' else None,
                 url_soundcloud=url_soundcloud if tipo == 'Podcast' else None,
@@ -8493,7 +5769,7 @@ def admin_informativos_novo():
     
     return render_template('admin/informativo_form.html')
 
-@app.route('/admin/informativos/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/informativos/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_informativos_editar(id):
     informativo = Informativo.query.get_or_404(id)
@@ -8561,7 +5837,7 @@ def admin_informativos_editar(id):
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -8608,7 +5884,7 @@ def admin_informativos_editar(id):
     
     return render_template('admin/informativo_form.html', informativo=informativo)
 
-@app.route('/admin/informativos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/informativos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_informativos_excluir(id):
     informativo = Informativo.query.get_or_404(id)
@@ -8647,7 +5923,7 @@ def admin_informativos_excluir(id):
 # CRUD - VOLUNTÁRIOS
 # ============================================
 
-@app.route('/admin/voluntarios')
+@rotas.route('/admin/voluntarios')
 @admin_required
 def admin_voluntarios():
     status_filter = request.args.get('status', 'todos')
@@ -8663,7 +5939,7 @@ def admin_voluntarios():
     voluntarios = voluntarios.order_by(Voluntario.created_at.desc()).all()
     return render_template('admin/voluntarios.html', voluntarios=voluntarios, status_filter=status_filter)
 
-@app.route('/admin/voluntarios/<int:id>')
+@rotas.route('/admin/voluntarios/<int:id>')
 @admin_required
 def admin_voluntarios_detalhe(id):
     voluntario = Voluntario.query.get_or_404(id)
@@ -8671,7 +5947,7 @@ def admin_voluntarios_detalhe(id):
     agendamentos = AgendamentoVoluntario.query.filter_by(voluntario_id=id).order_by(AgendamentoVoluntario.data_agendamento.desc()).all()
     return render_template('admin/voluntarios_detalhe.html', voluntario=voluntario, ofertas=ofertas, agendamentos=agendamentos)
 
-@app.route('/admin/voluntarios/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/voluntarios/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_voluntarios_editar(id):
     voluntario = Voluntario.query.get_or_404(id)
@@ -8728,7 +6004,7 @@ def admin_voluntarios_editar(id):
     
     return render_template('admin/voluntarios_form.html', voluntario=voluntario)
 
-@app.route('/admin/voluntarios/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/voluntarios/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_voluntarios_excluir(id):
     voluntario = Voluntario.query.get_or_404(id)
@@ -8745,7 +6021,7 @@ def admin_voluntarios_excluir(id):
 # CRUD - OFERTAS DE HORAS
 # ============================================
 
-@app.route('/admin/ofertas-horas')
+@rotas.route('/admin/ofertas-horas')
 @admin_required
 def admin_ofertas_horas():
     status_filter = request.args.get('status', 'todos')
@@ -8761,7 +6037,7 @@ def admin_ofertas_horas():
     ofertas = ofertas.order_by(OfertaHoras.data_inicio.desc()).all()
     return render_template('admin/ofertas_horas.html', ofertas=ofertas, status_filter=status_filter)
 
-@app.route('/admin/ofertas-horas/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/ofertas-horas/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_ofertas_horas_novo():
     voluntario_id = request.args.get('voluntario_id')
@@ -8804,7 +6080,7 @@ def admin_ofertas_horas_novo():
     
     return render_template('admin/ofertas_horas_form.html', oferta=None, voluntarios=voluntarios, voluntario_id=voluntario_id)
 
-@app.route('/admin/ofertas-horas/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/ofertas-horas/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_ofertas_horas_editar(id):
     oferta = OfertaHoras.query.get_or_404(id)
@@ -8841,7 +6117,7 @@ def admin_ofertas_horas_editar(id):
     
     return render_template('admin/ofertas_horas_form.html', oferta=oferta, voluntarios=voluntarios)
 
-@app.route('/admin/ofertas-horas/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/ofertas-horas/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_ofertas_horas_excluir(id):
     oferta = OfertaHoras.query.get_or_404(id)
@@ -8858,7 +6134,7 @@ def admin_ofertas_horas_excluir(id):
 # CRUD - AGENDAMENTOS DE VOLUNTÁRIOS
 # ============================================
 
-@app.route('/admin/agendamentos-voluntarios')
+@rotas.route('/admin/agendamentos-voluntarios')
 @admin_required
 def admin_agendamentos_voluntarios():
     status_filter = request.args.get('status', 'todos')
@@ -8878,7 +6154,52 @@ def admin_agendamentos_voluntarios():
     agendamentos = agendamentos.order_by(AgendamentoVoluntario.data_agendamento.desc()).all()
     return render_template('admin/agendamentos_voluntarios.html', agendamentos=agendamentos, status_filter=status_filter)
 
-@app.route('/admin/agendamentos-voluntarios/novo', methods=['GET', 'POST'])
+def validar_horario_agendamento(voluntario_id, data_agendamento, hora_inicio, hora_fim, ignorar_id=None):
+    """Mensagem de erro se o horário for inválido ou sobrepuser outro agendamento do voluntário"""
+    from disponibilidade import conflitos, parse_hora
+    inicio, fim = parse_hora(hora_inicio), parse_hora(hora_fim)
+    if inicio is None or fim is None or fim <= inicio:
+        return 'A hora de fim deve ser posterior à hora de início.'
+    ocupados = conflitos(voluntario_id, data_agendamento, hora_inicio, hora_fim, ignorar_id=ignorar_id)
+    if ocupados:
+        detalhes = ', '.join(f'{a.hora_inicio}-{a.hora_fim} ({a.atividade})' for a in ocupados)
+        return f'O voluntário já tem agendamento neste horário: {detalhes}.'
+    return None
+
+@rotas.route('/admin/agendamentos-voluntarios/disponiveis')
+@admin_required
+def admin_agendamentos_voluntarios_disponiveis():
+    """Voluntários livres para data/horário/área (consultado pelo formulário de agendamento)"""
+    from disponibilidade import voluntarios_disponiveis
+    try:
+        disponiveis, ocupados = voluntarios_disponiveis(
+            request.args.get('data', ''),
+            request.args.get('hora_inicio'),
+            request.args.get('hora_fim'),
+            area=request.args.get('area') or None,
+            ignorar_id=request.args.get('ignorar', type=int),
+        )
+    except ValueError as e:
+        return jsonify({'erro': str(e)}), 400
+
+    def serializar(item):
+        return {
+            'id': item['voluntario'].id,
+            'nome': item['voluntario'].nome_completo,
+            'area_interesse': item['voluntario'].area_interesse,
+            'ofertas': item['ofertas'],
+            'conflitos': [
+                {'id': a.id, 'hora_inicio': a.hora_inicio, 'hora_fim': a.hora_fim, 'atividade': a.atividade}
+                for a in item['conflitos']
+            ],
+        }
+
+    return jsonify({
+        'disponiveis': [serializar(i) for i in disponiveis],
+        'ocupados': [serializar(i) for i in ocupados],
+    })
+
+@rotas.route('/admin/agendamentos-voluntarios/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_agendamentos_voluntarios_novo():
     voluntario_id = request.args.get('voluntario_id')
@@ -8895,6 +6216,13 @@ def admin_agendamentos_voluntarios_novo():
             if oferta_horas_id == '':
                 oferta_horas_id = None
             
+            if request.form.get('status') != 'cancelado':
+                erro = validar_horario_agendamento(request.form.get('voluntario_id'), data_agendamento,
+                                                   request.form.get('hora_inicio'), request.form.get('hora_fim'))
+                if erro:
+                    flash(erro, 'error')
+                    return redirect(url_for('admin_agendamentos_voluntarios_novo', voluntario_id=request.form.get('voluntario_id')))
+            
             agendamento = AgendamentoVoluntario(
                 voluntario_id=request.form.get('voluntario_id'),
                 oferta_horas_id=oferta_horas_id,
@@ -8926,7 +6254,7 @@ def admin_agendamentos_voluntarios_novo():
     
     return render_template('admin/agendamentos_voluntarios_form.html', agendamento=None, voluntarios=voluntarios, ofertas=ofertas, voluntario_id=voluntario_id, oferta_id=oferta_id)
 
-@app.route('/admin/agendamentos-voluntarios/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/agendamentos-voluntarios/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_agendamentos_voluntarios_editar(id):
     agendamento = AgendamentoVoluntario.query.get_or_404(id)
@@ -8936,7 +6264,15 @@ def admin_agendamentos_voluntarios_editar(id):
     if request.method == 'POST':
         try:
             data_agendamento_str = request.form.get('data_agendamento')
-            agendamento.data_agendamento = datetime.strptime(data_agendamento_str, "%Y-%m-%d").date() if data_agendamento_str else None
+            data_agendamento = datetime.strptime(data_agendamento_str, "%Y-%m-%d").date() if data_agendamento_str else None
+            if request.form.get('status') != 'cancelado':
+                erro = validar_horario_agendamento(agendamento.voluntario_id, data_agendamento,
+                                                   request.form.get('hora_inicio'), request.form.get('hora_fim'),
+                                                   ignorar_id=agendamento.id)
+                if erro:
+                    flash(erro, 'error')
+                    return redirect(url_for('admin_agendamentos_voluntarios_editar', id=id))
+            agendamento.data_agendamento = data_agendamento
             agendamento.hora_inicio = request.form.get('hora_inicio')
             agendamento.hora_fim = request.form.get('hora_fim')
             agendamento.atividade = request.form.get('atividade')
@@ -8961,7 +6297,7 @@ def admin_agendamentos_voluntarios_editar(id):
     
     return render_template('admin/agendamentos_voluntarios_form.html', agendamento=agendamento, voluntarios=voluntarios, ofertas=ofertas)
 
-@app.route('/admin/agendamentos-voluntarios/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/agendamentos-voluntarios/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_agendamentos_voluntarios_excluir(id):
     agendamento = AgendamentoVoluntario.query.get_or_404(id)
@@ -8984,7 +6320,7 @@ def admin_agendamentos_voluntarios_excluir(id):
 # CRUD - RÁDIO AADVITA
 # ============================================
 
-@app.route('/admin/radio')
+@rotas.route('/admin/radio')
 @admin_required
 def admin_radio():
     programas = RadioPrograma.query.order_by(RadioPrograma.ordem.asc(), RadioPrograma.created_at.desc()).all()
@@ -8996,7 +6332,7 @@ def admin_radio():
         db.session.commit()
     return render_template('admin/radio.html', programas=programas, radio_config=radio_config)
 
-@app.route('/admin/radio/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/radio/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_radio_novo():
     if request.method == 'POST':
@@ -9043,7 +6379,7 @@ def admin_radio_novo():
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -9081,7 +6417,7 @@ def admin_radio_novo():
     
     return render_template('admin/radio_form.html')
 
-@app.route('/admin/radio/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/radio/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_radio_editar(id):
     programa = RadioPrograma.query.get_or_404(id)
@@ -9138,7 +6474,7 @@ def admin_radio_editar(id):
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         
                         filename = secure_filename(file.filename)
@@ -9172,7 +6508,7 @@ def admin_radio_editar(id):
     
     return render_template('admin/radio_form.html', programa=programa)
 
-@app.route('/admin/radio/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/radio/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_radio_excluir(id):
     programa = RadioPrograma.query.get_or_404(id)
@@ -9197,7 +6533,7 @@ def admin_radio_excluir(id):
         traceback.print_exc()
     return redirect(url_for('admin_radio'))
 
-@app.route('/admin/radio/config', methods=['POST'])
+@rotas.route('/admin/radio/config', methods=['POST'])
 @admin_required
 def admin_radio_config():
     try:
@@ -9226,7 +6562,7 @@ def admin_radio_config():
 # CRUD - RECICLAGEM
 # ============================================
 
-@app.route('/admin/reciclagem')
+@rotas.route('/admin/reciclagem')
 @admin_required
 def admin_reciclagem():
     """Lista todas as solicitações de reciclagem"""
@@ -9257,7 +6593,7 @@ def admin_reciclagem():
                          coletados_count=coletados_count,
                          cancelados_count=cancelados_count)
 
-@app.route('/admin/reciclagem/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/reciclagem/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_reciclagem_editar(id):
     """Edita uma solicitação de reciclagem"""
@@ -9278,7 +6614,7 @@ def admin_reciclagem_editar(id):
     
     return render_template('admin/reciclagem_form.html', reciclagem=reciclagem)
 
-@app.route('/admin/reciclagem/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/reciclagem/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_reciclagem_excluir(id):
     """Exclui uma solicitação de reciclagem"""
@@ -9298,12 +6634,9 @@ def admin_reciclagem_excluir(id):
 # CRUD - BANNERS
 # ============================================
 
-@app.route('/admin/banners')
+@rotas.route('/admin/banners')
 @admin_required
 def admin_banners():
-    # Garantir que colunas base64 existem antes de fazer queries
-    ensure_base64_columns()
-    
     banners = Banner.query.order_by(Banner.ordem.asc()).all()
     # Garantir que existam os 3 banners padrão
     tipos_banners = ['Campanhas', 'Apoie-nos', 'Editais']
@@ -9351,12 +6684,9 @@ def admin_banners():
     
     return render_template('admin/banners.html', banners=banners)
 
-@app.route('/admin/banners/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/banners/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_banners_editar(id):
-    # Garantir que colunas base64 existem antes de fazer queries
-    ensure_base64_columns()
-    
     banner = Banner.query.get_or_404(id)
     conteudos = BannerConteudo.query.filter_by(banner_id=id).order_by(BannerConteudo.ordem.asc()).all()
     
@@ -9396,7 +6726,7 @@ def admin_banners_editar(id):
                             except:
                                 pass
                     
-                    upload_folder = app.config['UPLOAD_FOLDER']
+                    upload_folder = current_app.config['UPLOAD_FOLDER']
                     os.makedirs(upload_folder, exist_ok=True)
                     
                     filename = secure_filename(file.filename)
@@ -9442,12 +6772,9 @@ def admin_banners_editar(id):
 # CRUD - BANNER CONTEUDOS
 # ============================================
 
-@app.route('/admin/banners/<int:banner_id>/conteudos/novo', methods=['GET', 'POST'])
+@rotas.route('/admin/banners/<int:banner_id>/conteudos/novo', methods=['GET', 'POST'])
 @admin_required
 def admin_banner_conteudo_novo(banner_id):
-    # Garantir que colunas base64 existem antes de fazer queries
-    ensure_base64_columns()
-    
     banner = Banner.query.get_or_404(banner_id)
     
     if request.method == 'POST':
@@ -9489,7 +6816,7 @@ def admin_banner_conteudo_novo(banner_id):
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         filename = secure_filename(file.filename)
                         unique_filename = f"{uuid.uuid4()}_{filename}"
@@ -9508,16 +6835,7 @@ def admin_banner_conteudo_novo(banner_id):
             if 'arquivo_pdf' in request.files:
                 file = request.files['arquivo_pdf']
                 if file and file.filename != '' and allowed_pdf_file(file.filename):
-                    # Criar pasta para PDFs se não existir
-                    upload_folder_pdf = os.path.join('static', 'documents', 'banners')
-                    os.makedirs(upload_folder_pdf, exist_ok=True)
-                    
-                    filename = secure_filename(file.filename)
-                    unique_filename = f"{uuid.uuid4()}_{filename}"
-                    filepath = os.path.join(upload_folder_pdf, unique_filename)
-                    file.save(filepath)
-                    
-                    pdf_path = f"documents/banners/{unique_filename}"
+                    pdf_path = ingerir_upload(file, mime_type='application/pdf').referencia
                 elif file and file.filename != '':
                     flash('Tipo de arquivo não permitido para PDF. Use apenas arquivos .pdf', 'error')
                     return redirect(url_for('admin_banner_conteudo_novo', banner_id=banner_id))
@@ -9550,12 +6868,9 @@ def admin_banner_conteudo_novo(banner_id):
     
     return render_template('admin/banner_conteudo_form.html', banner=banner, conteudo=None)
 
-@app.route('/admin/banners/conteudos/<int:id>/editar', methods=['GET', 'POST'])
+@rotas.route('/admin/banners/conteudos/<int:id>/editar', methods=['GET', 'POST'])
 @admin_required
 def admin_banner_conteudo_editar(id):
-    # Garantir que colunas base64 existem antes de fazer queries
-    ensure_base64_columns()
-    
     conteudo = BannerConteudo.query.get_or_404(id)
     banner = conteudo.banner
     
@@ -9606,7 +6921,7 @@ def admin_banner_conteudo_editar(id):
                     
                     # Também salvar localmente para desenvolvimento local (opcional)
                     try:
-                        upload_folder = app.config['UPLOAD_FOLDER']
+                        upload_folder = current_app.config['UPLOAD_FOLDER']
                         os.makedirs(upload_folder, exist_ok=True)
                         filename = secure_filename(file.filename)
                         unique_filename = f"{uuid.uuid4()}_{filename}"
@@ -9645,16 +6960,7 @@ def admin_banner_conteudo_editar(id):
                             except:
                                 pass
                     
-                    # Criar pasta para PDFs se não existir
-                    upload_folder_pdf = os.path.join('static', 'documents', 'banners')
-                    os.makedirs(upload_folder_pdf, exist_ok=True)
-                    
-                    filename = secure_filename(file.filename)
-                    unique_filename = f"{uuid.uuid4()}_{filename}"
-                    filepath = os.path.join(upload_folder_pdf, unique_filename)
-                    file.save(filepath)
-                    
-                    conteudo.arquivo_pdf = f"documents/banners/{unique_filename}"
+                    conteudo.arquivo_pdf = ingerir_upload(file, mime_type='application/pdf').referencia
                 elif file and file.filename != '':
                     flash('Tipo de arquivo não permitido para PDF. Use apenas arquivos .pdf', 'error')
                     return redirect(url_for('admin_banner_conteudo_editar', id=id))
@@ -9691,7 +6997,7 @@ def admin_banner_conteudo_editar(id):
     
     return render_template('admin/banner_conteudo_form.html', banner=banner, conteudo=conteudo)
 
-@app.route('/admin/banners/conteudos/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/banners/conteudos/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_banner_conteudo_excluir(id):
     conteudo = BannerConteudo.query.get_or_404(id)
@@ -9728,7 +7034,7 @@ def admin_banner_conteudo_excluir(id):
     
     return redirect(url_for('admin_banners_editar', id=banner_id))
 
-@app.route('/admin/financeiro')
+@rotas.route('/admin/financeiro')
 @admin_required
 def admin_financeiro():
     # Gerar mensalidades automaticamente antes de exibir (verifica se faltam)
@@ -9749,32 +7055,10 @@ def admin_financeiro():
             Mensalidade.data_vencimento.asc()
         ).all()
         
-        # Estatísticas para o associado
-        mensalidades_pendentes = Mensalidade.query.filter_by(associado_id=associado_id, status='pendente').count()
-        mensalidades_pagas = Mensalidade.query.filter_by(associado_id=associado_id, status='paga').count()
-        total_pendente = db.session.query(db.func.sum(Mensalidade.valor_final)).filter_by(associado_id=associado_id, status='pendente').scalar() or 0
-        total_pago = db.session.query(db.func.sum(Mensalidade.valor_final)).filter_by(associado_id=associado_id, status='paga').scalar() or 0
-        
-        # Buscar mensalidades atrasadas (pendentes com vencimento < hoje)
-        hoje = date.today()
-        mensalidades_atrasadas = Mensalidade.query.filter(
-            Mensalidade.associado_id == associado_id,
-            Mensalidade.status == 'pendente',
-            Mensalidade.data_vencimento < hoje
-        ).all()
-        total_atrasadas = len(mensalidades_atrasadas)
-        total_valor_atrasadas = sum(float(m.valor_final) for m in mensalidades_atrasadas)
-        associados_atrasados = list(set([m.associado for m in mensalidades_atrasadas]))
-        
-        stats = {
-            'mensalidades_pendentes': mensalidades_pendentes,
-            'mensalidades_pagas': mensalidades_pagas,
-            'total_pendente': float(total_pendente),
-            'total_pago': float(total_pago),
-            'mensalidades_atrasadas': total_atrasadas,
-            'total_atrasadas': total_valor_atrasadas,
-            'associados_atrasados': associados_atrasados
-        }
+        # Estatísticas para o associado (saldo materializado)
+        atualizar_atrasos()
+        stats = resumo_associado(associado_id)
+        stats['associados_atrasados'] = [associado] if stats['mensalidades_atrasadas'] else []
         
         return render_template('admin/financeiro.html', 
                              mensalidades=mensalidades, 
@@ -9788,40 +7072,17 @@ def admin_financeiro():
             tipo_associado='contribuinte'
         ).order_by(Associado.nome_completo.asc()).all()
         
-        # Estatísticas gerais
-        mensalidades_pendentes = Mensalidade.query.filter_by(status='pendente').count()
-        mensalidades_pagas = Mensalidade.query.filter_by(status='paga').count()
-        total_pendente = db.session.query(db.func.sum(Mensalidade.valor_final)).filter_by(status='pendente').scalar() or 0
-        total_pago = db.session.query(db.func.sum(Mensalidade.valor_final)).filter_by(status='paga').scalar() or 0
-        
-        # Buscar mensalidades atrasadas (pendentes com vencimento < hoje)
-        hoje = date.today()
-        mensalidades_atrasadas_query = Mensalidade.query.filter(
-            Mensalidade.status == 'pendente',
-            Mensalidade.data_vencimento < hoje
-        ).all()
-        total_atrasadas = len(mensalidades_atrasadas_query)
-        total_valor_atrasadas = sum(float(m.valor_final) for m in mensalidades_atrasadas_query)
-        # Obter associados únicos com mensalidades atrasadas
-        associados_ids_atrasados = list(set([m.associado_id for m in mensalidades_atrasadas_query]))
-        associados_atrasados = Associado.query.filter(Associado.id.in_(associados_ids_atrasados)).all() if associados_ids_atrasados else []
-        
-        stats = {
-            'mensalidades_pendentes': mensalidades_pendentes,
-            'mensalidades_pagas': mensalidades_pagas,
-            'total_pendente': float(total_pendente),
-            'total_pago': float(total_pago),
-            'mensalidades_atrasadas': total_atrasadas,
-            'total_atrasadas': total_valor_atrasadas,
-            'associados_atrasados': associados_atrasados
-        }
+        # Estatísticas gerais (soma dos saldos materializados)
+        atualizar_atrasos()
+        stats = resumo_geral()
+        stats['associados_atrasados'] = associados_atrasados()
         
         return render_template('admin/financeiro.html', 
                              associados=associados, 
                              stats=stats,
                              view_mode='associados')
 
-@app.route('/admin/financeiro/associado/<int:id>/configurar', methods=['GET', 'POST'])
+@rotas.route('/admin/financeiro/associado/<int:id>/configurar', methods=['GET', 'POST'])
 @admin_required
 def admin_financeiro_configurar_associado(id):
     associado = Associado.query.get_or_404(id)
@@ -9930,13 +7191,8 @@ def admin_financeiro_configurar_associado(id):
                                 ano = mensalidade.ano_referencia
                                 mes = mensalidade.mes_referencia
                                 
-                                # Verificar se o dia existe no mês
-                                ultimo_dia_mes = monthrange(ano, mes)[1]
-                                dia_vencimento = min(novo_dia_vencimento, ultimo_dia_mes)
-                                
-                                # Atualizar data de vencimento
-                                nova_data_vencimento = date(ano, mes, dia_vencimento)
-                                mensalidade.data_vencimento = nova_data_vencimento
+                                # Dia limitado ao último dia do mês (ex.: 31 -> 28/02)
+                                mensalidade.data_vencimento = vencimento_no_mes(ano, mes, novo_dia_vencimento)
                             
                             # Aplicar desconto e recalcular valor_final
                             valor_base = float(mensalidade.valor_base)
@@ -9980,13 +7236,8 @@ def admin_financeiro_configurar_associado(id):
                             ano = mensalidade.ano_referencia
                             mes = mensalidade.mes_referencia
                             
-                            # Verificar se o dia existe no mês
-                            ultimo_dia_mes = monthrange(ano, mes)[1]
-                            dia_vencimento = min(novo_dia_vencimento, ultimo_dia_mes)
-                            
-                            # Atualizar data de vencimento
-                            nova_data_vencimento = date(ano, mes, dia_vencimento)
-                            mensalidade.data_vencimento = nova_data_vencimento
+                            # Dia limitado ao último dia do mês (ex.: 31 -> 28/02)
+                            mensalidade.data_vencimento = vencimento_no_mes(ano, mes, novo_dia_vencimento)
                         
                         # Aplicar desconto e recalcular valor_final
                         valor_base = float(mensalidade.valor_base)
@@ -10095,7 +7346,7 @@ def admin_financeiro_configurar_associado(id):
                          mensalidades=mensalidades,
                          dia_vencimento_atual=dia_vencimento_atual)
 
-@app.route('/admin/financeiro/mensalidade/<int:id>/pagar', methods=['POST'])
+@rotas.route('/admin/financeiro/mensalidade/<int:id>/pagar', methods=['POST'])
 @admin_required
 def admin_financeiro_marcar_paga(id):
     mensalidade = Mensalidade.query.get_or_404(id)
@@ -10148,12 +7399,7 @@ def gerar_mensalidades_anuais(associado):
     ultimo_mes = ultima_mensalidade.mes_referencia
     
     # Determinar o próximo ano e mês a partir da última mensalidade
-    if ultimo_mes == 12:
-        proximo_ano = ultimo_ano + 1
-        mes_inicio = 1
-    else:
-        proximo_ano = ultimo_ano
-        mes_inicio = ultimo_mes + 1
+    proximo_ano, mes_inicio = somar_meses(ultimo_ano, ultimo_mes, 1)
     
     # Verificar se há mensalidades PENDENTES ou ATRASADAS do associado (qualquer ano)
     # O botão só pode gerar se NÃO houver mensalidades pendentes/atrasadas
@@ -10175,51 +7421,20 @@ def gerar_mensalidades_anuais(associado):
     # Calcular valor final
     valor_final = associado.calcular_valor_final()
     
-    # Obter dia base para vencimento (dia do cadastro ou dia da última mensalidade)
-    data_base = associado.created_at.date() if isinstance(associado.created_at, datetime) else associado.created_at
-    dia_cadastro = data_base.day
+    # Dia base para vencimento: dia do cadastro
+    dia_cadastro = data_base_associado(associado).day
+    
+    # Meses que já têm mensalidade (uma consulta em vez de uma por mês)
+    existentes = set(db.session.query(Mensalidade.mes_referencia, Mensalidade.ano_referencia).filter_by(
+        associado_id=associado.id
+    ).all())
     
     # Gerar 12 mensalidades
     mensalidades_geradas = 0
-    for i in range(12):
-        mes = mes_inicio + i
-        ano = proximo_ano
-        
-        # Ajustar se passar de dezembro
-        while mes > 12:
-            mes -= 12
-            ano += 1
-        
-        # Verificar se já existe mensalidade para este mês/ano
-        mensalidade_existente = Mensalidade.query.filter_by(
-            associado_id=associado.id,
-            mes_referencia=mes,
-            ano_referencia=ano
-        ).first()
-        
-        if mensalidade_existente:
+    for mes, ano, data_vencimento in cronograma_mensal(proximo_ano, mes_inicio, dia_cadastro):
+        if (mes, ano) in existentes:
             continue  # Pular se já existe
-        
-        # Verificar se o dia existe no mês
-        ultimo_dia_mes = monthrange(ano, mes)[1]
-        dia_vencimento = min(dia_cadastro, ultimo_dia_mes)
-        
-        # Data de vencimento
-        data_vencimento = date(ano, mes, dia_vencimento)
-        
-        # Criar mensalidade
-        mensalidade = Mensalidade(
-            associado_id=associado.id,
-            valor_base=float(associado.valor_mensalidade),
-            desconto_tipo=associado.desconto_tipo,
-            desconto_valor=float(associado.desconto_valor) if associado.desconto_valor else 0.0,
-            valor_final=valor_final,
-            mes_referencia=mes,
-            ano_referencia=ano,
-            data_vencimento=data_vencimento,
-            status='pendente'
-        )
-        db.session.add(mensalidade)
+        db.session.add(nova_mensalidade(associado, mes, ano, data_vencimento, valor_final))
         mensalidades_geradas += 1
     
     if mensalidades_geradas > 0:
@@ -10228,7 +7443,7 @@ def gerar_mensalidades_anuais(associado):
     else:
         return False, 'Todas as mensalidades do período já foram geradas.', None
 
-@app.route('/admin/financeiro/gerar', methods=['POST'])
+@rotas.route('/admin/financeiro/gerar', methods=['POST'])
 @admin_required
 def admin_financeiro_gerar():
     associados_ids = request.form.getlist('associados_selecionados')
@@ -10266,46 +7481,9 @@ def admin_financeiro_gerar():
                     associados_com_mensalidade.append(associado.nome_completo)
                     continue  # Pular este associado, já tem mensalidade do mês
                 
-                # Calcular valor final
-                valor_final = associado.calcular_valor_final()
-                
-                # Obter dia base para vencimento (dia do cadastro)
-                data_base = associado.created_at.date() if isinstance(associado.created_at, datetime) else associado.created_at
-                dia_cadastro = data_base.day
-                
-                # Verificar se o dia existe no mês
-                ultimo_dia_mes = monthrange(ano_atual, mes_atual)[1]
-                dia_vencimento = min(dia_cadastro, ultimo_dia_mes)
-                
-                # Data de vencimento
-                data_vencimento = date(ano_atual, mes_atual, dia_vencimento)
-                
-                # Se a data já passou, usar o próximo mês
-                if hoje > data_vencimento:
-                    if mes_atual == 12:
-                        mes_vencimento = 1
-                        ano_vencimento = ano_atual + 1
-                    else:
-                        mes_vencimento = mes_atual + 1
-                        ano_vencimento = ano_atual
-                    
-                    ultimo_dia_prox_mes = monthrange(ano_vencimento, mes_vencimento)[1]
-                    dia_vencimento = min(dia_cadastro, ultimo_dia_prox_mes)
-                    data_vencimento = date(ano_vencimento, mes_vencimento, dia_vencimento)
-                
-                # Criar mensalidade
-                mensalidade = Mensalidade(
-                    associado_id=associado.id,
-                    valor_base=float(associado.valor_mensalidade),
-                    desconto_tipo=associado.desconto_tipo,
-                    desconto_valor=float(associado.desconto_valor) if associado.desconto_valor else 0.0,
-                    valor_final=valor_final,
-                    mes_referencia=mes_atual,
-                    ano_referencia=ano_atual,
-                    data_vencimento=data_vencimento,
-                    status='pendente'
-                )
-                db.session.add(mensalidade)
+                # Vencimento no dia do cadastro (se já passou neste mês, no próximo)
+                data_vencimento = proximo_vencimento(hoje, data_base_associado(associado).day)
+                db.session.add(nova_mensalidade(associado, mes_atual, ano_atual, data_vencimento))
                 mensalidades_geradas += 1
         
         if mensalidades_geradas > 0:
@@ -10331,7 +7509,7 @@ def admin_financeiro_gerar():
     
     return redirect(url_for('admin_financeiro'))
 
-@app.route('/admin/financeiro/gerar-anual', methods=['POST'])
+@rotas.route('/admin/financeiro/gerar-anual', methods=['POST'])
 @admin_required
 def admin_financeiro_gerar_anual():
     associados_ids = request.form.getlist('associados_selecionados')
@@ -10370,31 +7548,38 @@ def admin_financeiro_gerar_anual():
     return redirect(url_for('admin_financeiro'))
 
 # Rota para cron job ou tarefa agendada (geração automática mensal)
-@app.route('/api/gerar-mensalidades/<token>')
+@rotas.route('/api/gerar-mensalidades/<token>')
 def api_gerar_mensalidades(token):
     """
     Rota para ser chamada por cron job ou tarefa agendada
     Token de segurança: 'aadvita-gerar-mensalidades-2025'
+    Prefira ``flask manutencao mensalidades`` (gerar_mensalidades_cron.py), que não ocupa um worker web
     """
     # Token de segurança simples (em produção, use algo mais seguro)
     if token != 'aadvita-gerar-mensalidades-2025':
         return jsonify({'error': 'Token inválido'}), 401
     
     try:
-        mensalidades_geradas = gerar_mensalidades_automaticas()
+        with trava_execucao('mensalidades'):
+            mensalidades_geradas = gerar_mensalidades_automaticas()
         return jsonify({
             'success': True,
             'mensalidades_geradas': mensalidades_geradas,
             'data': date.today().strftime('%d/%m/%Y'),
             'mensagem': f'{mensalidades_geradas} mensalidade(s) gerada(s) com sucesso!'
         })
+    except TarefaEmExecucao as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 409
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-@app.route('/admin/financeiro/mensalidade/<int:id>/cancelar', methods=['POST'])
+@rotas.route('/admin/financeiro/mensalidade/<int:id>/cancelar', methods=['POST'])
 @admin_required
 def admin_financeiro_cancelar(id):
     mensalidade = Mensalidade.query.get_or_404(id)
@@ -10413,7 +7598,7 @@ def admin_financeiro_cancelar(id):
         return redirect(url_for('admin_financeiro', associado_id=associado_id))
     return redirect(url_for('admin_financeiro'))
 
-@app.route('/admin/financeiro/mensalidade/<int:id>/excluir', methods=['POST'])
+@rotas.route('/admin/financeiro/mensalidade/<int:id>/excluir', methods=['POST'])
 @admin_required
 def admin_financeiro_excluir(id):
     mensalidade = Mensalidade.query.get_or_404(id)
@@ -10432,7 +7617,7 @@ def admin_financeiro_excluir(id):
         return redirect(url_for('admin_financeiro', associado_id=associado_id))
     return redirect(url_for('admin_financeiro'))
 
-@app.route('/admin/financeiro/mensalidades/marcar-paga-lote', methods=['POST'])
+@rotas.route('/admin/financeiro/mensalidades/marcar-paga-lote', methods=['POST'])
 @admin_required
 def admin_financeiro_marcar_paga_lote():
     associado_id = request.args.get('associado_id', type=int)
@@ -10453,16 +7638,7 @@ def admin_financeiro_marcar_paga_lote():
         else:
             data_pagamento = date.today()
         
-        mensalidades_atualizadas = 0
-        for mensalidade_id in mensalidades_ids:
-            mensalidade = Mensalidade.query.get(int(mensalidade_id))
-            if mensalidade and mensalidade.status != 'paga':
-                mensalidade.data_pagamento = data_pagamento
-                mensalidade.status = 'paga'
-                if observacoes:
-                    mensalidade.observacoes = observacoes
-                mensalidades_atualizadas += 1
-        
+        mensalidades_atualizadas = marcar_pagas_em_lote(ids_validos(mensalidades_ids), data_pagamento, observacoes)
         db.session.commit()
         flash(f'{mensalidades_atualizadas} mensalidade(s) marcada(s) como paga(s)!', 'success')
     except Exception as e:
@@ -10473,7 +7649,7 @@ def admin_financeiro_marcar_paga_lote():
         return redirect(url_for('admin_financeiro', associado_id=associado_id))
     return redirect(url_for('admin_financeiro'))
 
-@app.route('/admin/financeiro/mensalidades/cancelar-lote', methods=['POST'])
+@rotas.route('/admin/financeiro/mensalidades/cancelar-lote', methods=['POST'])
 @admin_required
 def admin_financeiro_cancelar_lote():
     associado_id = request.args.get('associado_id', type=int)
@@ -10486,13 +7662,7 @@ def admin_financeiro_cancelar_lote():
         return redirect(url_for('admin_financeiro'))
     
     try:
-        mensalidades_canceladas = 0
-        for mensalidade_id in mensalidades_ids:
-            mensalidade = Mensalidade.query.get(int(mensalidade_id))
-            if mensalidade and mensalidade.status != 'paga' and mensalidade.status != 'cancelada':
-                mensalidade.status = 'cancelada'
-                mensalidades_canceladas += 1
-        
+        mensalidades_canceladas = cancelar_em_lote(ids_validos(mensalidades_ids))
         db.session.commit()
         flash(f'{mensalidades_canceladas} mensalidade(s) cancelada(s)!', 'success')
     except Exception as e:
@@ -10503,7 +7673,7 @@ def admin_financeiro_cancelar_lote():
         return redirect(url_for('admin_financeiro', associado_id=associado_id))
     return redirect(url_for('admin_financeiro'))
 
-@app.route('/admin/financeiro/mensalidades/excluir-lote', methods=['POST'])
+@rotas.route('/admin/financeiro/mensalidades/excluir-lote', methods=['POST'])
 @admin_required
 def admin_financeiro_excluir_lote():
     associado_id = request.args.get('associado_id', type=int)
@@ -10516,13 +7686,7 @@ def admin_financeiro_excluir_lote():
         return redirect(url_for('admin_financeiro'))
     
     try:
-        mensalidades_excluidas = 0
-        for mensalidade_id in mensalidades_ids:
-            mensalidade = Mensalidade.query.get(int(mensalidade_id))
-            if mensalidade and mensalidade.status != 'paga':
-                db.session.delete(mensalidade)
-                mensalidades_excluidas += 1
-        
+        mensalidades_excluidas = excluir_em_lote(ids_validos(mensalidades_ids))
         db.session.commit()
         flash(f'{mensalidades_excluidas} mensalidade(s) excluída(s) com sucesso!', 'success')
     except Exception as e:
@@ -10537,9 +7701,8 @@ def admin_financeiro_excluir_lote():
 # ROTAS PÚBLICAS
 # ============================================
 
-@app.route('/')
+@rotas.route('/')
 def index():
-    # NOTA: ensure_base64_columns() já roda no startup, não precisa chamar aqui a cada requisição
     
     try:
         # Buscar as reuniões presenciais ordenadas pela data mais atual primeiro
@@ -10814,42 +7977,48 @@ def index():
                          get_video_text=get_video_text,
                          get_banner_text=get_banner_text)
 
-@app.route('/agenda-presencial')
+@rotas.route('/agenda-presencial')
 def agenda_presencial():
     reuniones = ReunionPresencial.query.order_by(ReunionPresencial.fecha.desc()).all()
     return render_template('agenda_presencial.html', reuniones=reuniones)
 
-@app.route('/agenda-virtual')
+@rotas.route('/agenda-virtual')
 def agenda_virtual():
     reuniones = ReunionVirtual.query.order_by(ReunionVirtual.fecha.desc()).all()
     return render_template('agenda_virtual.html', reuniones=reuniones)
 
-@app.route('/projetos')
+@rotas.route('/projetos')
 def projetos():
-    ensure_base64_columns()
     projetos = Projeto.query.order_by(Projeto.data_inicio.desc(), Projeto.created_at.desc()).all()
     return render_template('projetos.html', projetos=projetos)
 
-@app.route('/projetos/<int:id>')
-@app.route('/projetos/<slug>')
+@rotas.route('/projetos/<int:id>')
+@rotas.route('/projetos/<slug>')
+@detalhe_condicional(Projeto)
 def projeto(id=None, slug=None):
-    ensure_base64_columns()
     # Suportar tanto ID quanto slug para compatibilidade
     if slug:
-        projeto = Projeto.query.filter_by(slug=slug).first_or_404()
+        projeto = buscar_por_slug_ou_404(Projeto, slug)
     else:
         projeto = Projeto.query.get_or_404(id)
+        # URL numérica antiga: redirecionar para a URL canônica
+        redirecionamento = redirecionar_para_slug(projeto)
+        if redirecionamento:
+            return redirecionamento
     return render_template('projeto.html', projeto=projeto)
 
-@app.route('/projetos/<int:id>/download')
+@rotas.route('/projetos/<int:id>/download')
 def projeto_download_pdf(id):
-    """Rota para download do PDF do projeto (do banco de dados base64 ou arquivo estático)"""
+    """Rota para download do PDF do projeto (do banco de dados, blob ou base64, ou arquivo estático)"""
     projeto = Projeto.query.get_or_404(id)
     
     if not projeto.arquivo_pdf:
         from flask import abort
         abort(404)
     
+    if eh_blob(projeto.arquivo_pdf):
+        return resposta_blob(projeto.arquivo_pdf, download_name=f'projeto_{projeto.titulo.replace(" ", "_")}.pdf')
+    
     # Verificar se tem PDF em base64 (prioridade para persistência no Render)
     pdf_base64 = getattr(projeto, 'arquivo_pdf_base64', None)
     
@@ -10894,7 +8063,7 @@ def projeto_download_pdf(id):
     from flask import abort
     abort(404)
 
-@app.route('/acoes')
+@rotas.route('/acoes')
 def acoes():
     current_lang = session.get('language', 'pt')
     acoes = Acao.query.order_by(Acao.data.desc()).all()
@@ -10909,12 +8078,12 @@ def acoes():
     
     return render_template('acoes.html', acoes=acoes, get_titulo_album=get_titulo_album, current_lang=current_lang)
 
-@app.route('/apoiadores')
+@rotas.route('/apoiadores')
 def apoiadores():
     apoiadores = Apoiador.query.order_by(Apoiador.nome.asc()).all()
     return render_template('apoiadores.html', apoiadores=apoiadores)
 
-@app.route('/informativo')
+@rotas.route('/informativo')
 def informativo():
     tipo_filtro = request.args.get('tipo', 'todos')  # 'todos', 'Noticia', 'Podcast'
     
@@ -10931,17 +8100,21 @@ def informativo():
     
     return render_template('informativo.html', informativos=informativos, noticias=noticias, podcasts=podcasts, tipo_filtro=tipo_filtro)
 
-@app.route('/informativo/<int:id>')
-@app.route('/informativo/<slug>')
+@rotas.route('/informativo/<int:id>')
+@rotas.route('/informativo/<slug>')
+@detalhe_condicional(Informativo)
 def informativo_detalhe(id=None, slug=None):
     # Suportar tanto ID quanto slug para compatibilidade
     if slug:
-        informativo = Informativo.query.filter_by(slug=slug).first_or_404()
+        informativo = buscar_por_slug_ou_404(Informativo, slug)
     else:
         informativo = Informativo.query.get_or_404(id)
+        redirecionamento = redirecionar_para_slug(informativo)
+        if redirecionamento:
+            return redirecionamento
     return render_template('informativo_detalhe.html', informativo=informativo)
 
-@app.route('/radio')
+@rotas.route('/radio')
 def radio():
     programas = RadioPrograma.query.filter_by(ativo=True).order_by(RadioPrograma.ordem.asc(), RadioPrograma.created_at.desc()).all()
     # Buscar configuração da rádio, criar uma padrão se não existir
@@ -10952,12 +8125,9 @@ def radio():
         db.session.commit()
     return render_template('radio.html', programas=programas, radio_config=radio_config)
 
-@app.route('/campanhas')
+@rotas.route('/campanhas')
 def campanhas():
     try:
-        # Garantir que colunas base64 existem antes de fazer queries
-        ensure_base64_columns()
-        
         banner = Banner.query.filter_by(tipo='Campanhas', ativo=True).first()
         conteudos = []
         if banner:
@@ -10970,11 +8140,8 @@ def campanhas():
         # Retornar página mesmo com erro, mas sem conteudos
         return render_template('campanhas.html', banner=None, conteudos=[])
 
-@app.route('/apoie')
+@rotas.route('/apoie')
 def apoie():
-    # Garantir que colunas base64 existem antes de fazer queries
-    ensure_base64_columns()
-    
     banner = Banner.query.filter_by(tipo='Apoie-nos', ativo=True).first()
     conteudos = []
     if banner:
@@ -11000,23 +8167,20 @@ def apoie():
     
     return render_template('apoie.html', banner=banner, conteudos=conteudos)
 
-@app.route('/editais')
+@rotas.route('/editais')
 def editais():
-    # Garantir que colunas base64 existem antes de fazer queries
-    ensure_base64_columns()
-    
     banner = Banner.query.filter_by(tipo='Editais', ativo=True).first()
     conteudos = []
     if banner:
         conteudos = BannerConteudo.query.filter_by(banner_id=banner.id, ativo=True).order_by(BannerConteudo.ordem.asc()).all()
     return render_template('editais.html', banner=banner, conteudos=conteudos)
 
-@app.route('/videos')
+@rotas.route('/videos')
 def videos():
     videos = Video.query.order_by(Video.created_at.desc()).all()
     return render_template('videos.html', videos=videos)
 
-@app.route('/galeria')
+@rotas.route('/galeria')
 def galeria():
     current_lang = session.get('language', 'pt')
     
@@ -11045,7 +8209,7 @@ def galeria():
                          get_descricao=get_descricao,
                          current_lang=current_lang)
 
-@app.route('/galeria/album/<int:id>')
+@rotas.route('/galeria/album/<int:id>')
 def galeria_album(id):
     current_lang = session.get('language', 'pt')
     album = Album.query.get_or_404(id)
@@ -11092,7 +8256,7 @@ def galeria_album(id):
                          get_descricao_album=get_descricao_album,
                          current_lang=current_lang)
 
-@app.route('/sobre')
+@rotas.route('/sobre')
 def sobre():
     # Buscar conteúdos do banco
     current_lang = session.get('language', 'pt')
@@ -11154,7 +8318,7 @@ def sobre():
                          membros_conselho=membros_conselho,
                          get_nome=get_nome)
 
-@app.route('/transparencia')
+@rotas.route('/transparencia')
 def transparencia():
     current_lang = session.get('language', 'pt')
     
@@ -11184,7 +8348,7 @@ def transparencia():
                          get_text=get_text,
                          current_lang=current_lang)
 
-@app.route('/transparencia/relatorios-financeiros')
+@rotas.route('/transparencia/relatorios-financeiros')
 def relatorios_financeiros():
     current_lang = session.get('language', 'pt')
     
@@ -11229,7 +8393,7 @@ def relatorios_financeiros():
                          data_inicio=data_inicio,
                          data_fim=data_fim)
 
-@app.route('/transparencia/estatuto-documentos')
+@rotas.route('/transparencia/estatuto-documentos')
 def estatuto_documentos():
     current_lang = session.get('language', 'pt')
     
@@ -11251,7 +8415,7 @@ def estatuto_documentos():
                          get_text=get_text,
                          current_lang=current_lang)
 
-@app.route('/transparencia/relatorios-atividades')
+@rotas.route('/transparencia/relatorios-atividades')
 def relatorios_atividades():
     current_lang = session.get('language', 'pt')
     
@@ -11297,27 +8461,6 @@ def relatorios_atividades():
     
     relatorios = query.order_by(RelatorioAtividade.ordem.asc(), RelatorioAtividade.periodo_inicio.desc()).all()
     
-    # Limpar tags <br> dos dados existentes automaticamente
-    campos_texto = [
-        'descricao_pt', 'descricao_es', 'descricao_en',
-        'atividades_realizadas_pt', 'atividades_realizadas_es', 'atividades_realizadas_en',
-        'resultados_pt', 'resultados_es', 'resultados_en'
-    ]
-    precisa_salvar = False
-    for relatorio in relatorios:
-        for campo in campos_texto:
-            valor = getattr(relatorio, campo, None)
-            if valor and ('<br>' in valor or '<br/>' in valor or '<br />' in valor):
-                valor_limpo = processar_texto_relatorio(valor)
-                setattr(relatorio, campo, valor_limpo)
-                precisa_salvar = True
-    
-    if precisa_salvar:
-        try:
-            db.session.commit()
-        except:
-            db.session.rollback()
-    
     # Função auxiliar para obter texto no idioma correto
     def get_text(obj, field):
         if not obj:
@@ -11335,7 +8478,7 @@ def relatorios_atividades():
                          data_inicio=data_inicio,
                          data_fim=data_fim)
 
-@app.route('/transparencia/prestacao-contas')
+@rotas.route('/transparencia/prestacao-contas')
 def prestacao_contas():
     current_lang = session.get('language', 'pt')
     
@@ -11398,7 +8541,7 @@ def prestacao_contas():
                          data_inicio=data_inicio,
                          data_fim=data_fim)
 
-@app.route('/transparencia/doacoes-recursos')
+@rotas.route('/transparencia/doacoes-recursos')
 def doacoes_recursos():
     current_lang = session.get('language', 'pt')
     
@@ -11420,7 +8563,7 @@ def doacoes_recursos():
                          get_text=get_text,
                          current_lang=current_lang)
 
-@app.route('/eventos')
+@rotas.route('/eventos')
 def eventos():
     current_lang = session.get('language', 'pt')
     eventos = Evento.query.order_by(Evento.data.asc()).all()
@@ -11435,49 +8578,63 @@ def eventos():
     
     return render_template('eventos.html', eventos=eventos, get_titulo_album=get_titulo_album, current_lang=current_lang)
 
-@app.route('/evento/<int:id>')
-@app.route('/evento/<slug>')
+@rotas.route('/evento/<int:id>')
+@rotas.route('/evento/<slug>')
+@detalhe_condicional(Evento, evento_album)
 def evento_detalhe(id=None, slug=None):
     """Rota para página de detalhe do evento"""
-    ensure_base64_columns()
     if slug:
-        evento = Evento.query.filter_by(slug=slug).first_or_404()
+        evento = buscar_por_slug_ou_404(Evento, slug)
     else:
         evento = Evento.query.get_or_404(id)
+        redirecionamento = redirecionar_para_slug(evento)
+        if redirecionamento:
+            return redirecionamento
     return render_template('evento.html', evento=evento)
 
-@app.route('/acao/<int:id>')
-@app.route('/acao/<slug>')
+@rotas.route('/acao/<int:id>')
+@rotas.route('/acao/<slug>')
+@detalhe_condicional(Acao, acao_album)
 def acao_detalhe(id=None, slug=None):
     """Rota para página de detalhe da ação"""
-    ensure_base64_columns()
     if slug:
-        acao = Acao.query.filter_by(slug=slug).first_or_404()
+        acao = buscar_por_slug_ou_404(Acao, slug)
     else:
         acao = Acao.query.get_or_404(id)
+        redirecionamento = redirecionar_para_slug(acao)
+        if redirecionamento:
+            return redirecionamento
     return render_template('acao.html', acao=acao)
 
-@app.route('/agenda-presencial/<int:id>')
-@app.route('/agenda-presencial/<slug>')
+@rotas.route('/agenda-presencial/<int:id>')
+@rotas.route('/agenda-presencial/<slug>')
+@detalhe_condicional(ReunionPresencial)
 def agenda_presencial_detalhe(id=None, slug=None):
     """Rota para página de detalhe da reunião presencial"""
     if slug:
-        reunion = ReunionPresencial.query.filter_by(slug=slug).first_or_404()
+        reunion = buscar_por_slug_ou_404(ReunionPresencial, slug)
     else:
         reunion = ReunionPresencial.query.get_or_404(id)
+        redirecionamento = redirecionar_para_slug(reunion)
+        if redirecionamento:
+            return redirecionamento
     return render_template('agenda_presencial_detalhe.html', reunion=reunion)
 
-@app.route('/agenda-virtual/<int:id>')
-@app.route('/agenda-virtual/<slug>')
+@rotas.route('/agenda-virtual/<int:id>')
+@rotas.route('/agenda-virtual/<slug>')
+@detalhe_condicional(ReunionVirtual)
 def agenda_virtual_detalhe(id=None, slug=None):
     """Rota para página de detalhe da reunião virtual"""
     if slug:
-        reunion = ReunionVirtual.query.filter_by(slug=slug).first_or_404()
+        reunion = buscar_por_slug_ou_404(ReunionVirtual, slug)
     else:
         reunion = ReunionVirtual.query.get_or_404(id)
+        redirecionamento = redirecionar_para_slug(reunion)
+        if redirecionamento:
+            return redirecionamento
     return render_template('agenda_virtual_detalhe.html', reunion=reunion)
 
-@app.route('/associe-se', methods=['GET', 'POST'])
+@rotas.route('/associe-se', methods=['GET', 'POST'])
 def associe_se():
     if request.method == 'POST':
         try:
@@ -11488,9 +8645,9 @@ def associe_se():
                 flash('A senha deve ter no mínimo 6 caracteres', 'error')
                 return redirect(url_for('associe_se'))
             
-            # Verificar se CPF já existe
+            # Verificar se CPF já existe (em qualquer formato)
             cpf = request.form.get('cpf')
-            associado_existente = Associado.query.filter_by(cpf=cpf).first()
+            associado_existente = associado_por_cpf(cpf)
             if associado_existente:
                 flash('Este CPF já está cadastrado. Entre em contato conosco se precisar de ajuda.', 'error')
                 return redirect(url_for('associe_se'))
@@ -11522,17 +8679,20 @@ def associe_se():
 # ROTAS PÚBLICAS - VOLUNTÁRIOS
 # ============================================
 
-@app.route('/voluntario/cadastro', methods=['GET', 'POST'])
+@rotas.route('/voluntario/cadastro', methods=['GET', 'POST'])
 def voluntario_cadastro():
     """Página pública para cadastro de voluntários"""
     if request.method == 'POST':
         try:
-            # Verificar se email já existe
+            # Verificar se email ou CPF já estão cadastrados (uma consulta, qualquer formato)
             email = request.form.get('email')
-            voluntario_existente = Voluntario.query.filter_by(email=email).first()
-            if voluntario_existente:
+            existentes = [p for p in resolver(cpf=request.form.get('cpf'), email=email) if p.tipo == 'voluntario']
+            if any(p.por_email for p in existentes):
                 flash('Este email já está cadastrado. Entre em contato conosco se precisar de ajuda.', 'error')
                 return redirect(url_for('voluntario_cadastro'))
+            if any(p.por_cpf for p in existentes):
+                flash('Este CPF já está cadastrado como voluntário. Entre em contato conosco se precisar de ajuda.', 'error')
+                return redirect(url_for('voluntario_cadastro'))
             
             data_nascimento_str = request.form.get('data_nascimento')
             data_nascimento = None
@@ -11601,7 +8761,7 @@ def voluntario_cadastro():
     
     return render_template('voluntario/cadastro.html')
 
-@app.route('/entrar', methods=['GET', 'POST'])
+@rotas.route('/entrar', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         tipo = request.form.get('tipo')
@@ -11610,10 +8770,8 @@ def login():
             cpf = request.form.get('cpf')
             senha = request.form.get('senha')
             
-            # Remover formatação do CPF para busca
-            cpf_limpo = cpf.replace('.', '').replace('-', '')
-            
-            associado = Associado.query.filter_by(cpf=cpf).first()
+            # Busca pelo CPF normalizado (aceita com ou sem pontuação)
+            associado = associado_por_cpf(cpf)
             
             if associado and associado.check_password(senha):
                 # Verificar status do associado
@@ -11638,9 +8796,7 @@ def login():
             senha = request.form.get('senha')
             cpf_limpo = cpf.replace('.', '').replace('-', '') if cpf else None
 
-            voluntario = None
-            if cpf_limpo:
-                voluntario = Voluntario.query.filter_by(cpf=cpf_limpo).first()
+            voluntario = voluntario_por_cpf(cpf_limpo)
 
             # Se houver um voluntário cadastrado, tentar autenticar usando password_hash (se existir)
             if voluntario:
@@ -11665,7 +8821,7 @@ def login():
                         return redirect(url_for('login'))
                 else:
                     # Fallback: se não há senha no modelo Voluntario, tentar autenticar contra Associado (se existir)
-                    associado = Associado.query.filter_by(cpf=cpf_limpo).first()
+                    associado = associado_por_cpf(cpf_limpo)
                     if associado and associado.check_password(senha):
                         # permitir acesso à área de voluntário se o associado estiver com login válido
                         session['voluntario_logged_in'] = True
@@ -11678,7 +8834,7 @@ def login():
                         return redirect(url_for('login'))
             else:
                 # Se não existir voluntário, tentar autenticar como associado e negar acesso se não for voluntário
-                associado = Associado.query.filter_by(cpf=cpf_limpo).first()
+                associado = associado_por_cpf(cpf_limpo)
                 if associado and associado.check_password(senha):
                     # Se existe um associado com esse CPF e senha, permitir acesso à área de voluntário
                     session['voluntario_logged_in'] = True
@@ -11693,7 +8849,7 @@ def login():
     
     return render_template('login.html')
 
-@app.route('/associado/logout')
+@rotas.route('/associado/logout')
 def associado_logout():
     session.pop('associado_logged_in', None)
     session.pop('associado_id', None)
@@ -11703,7 +8859,7 @@ def associado_logout():
     return redirect(url_for('index'))
 
 
-@app.route('/voluntario/logout')
+@rotas.route('/voluntario/logout')
 def voluntario_logout():
     session.pop('voluntario_logged_in', None)
     session.pop('voluntario_id', None)
@@ -11712,7 +8868,7 @@ def voluntario_logout():
     return redirect(url_for('index'))
 
 
-@app.route('/voluntario')
+@rotas.route('/voluntario')
 @voluntario_required
 def voluntario_dashboard():
     # Tentar obter o id do voluntário da sessão
@@ -11725,7 +8881,7 @@ def voluntario_dashboard():
         # Caso o login tenha sido feito via associado (fallback), tentar localizar voluntario pelo CPF em sessão
         associado_cpf = session.get('associado_cpf')
         if associado_cpf:
-            voluntario = Voluntario.query.filter_by(cpf=associado_cpf).first()
+            voluntario = voluntario_por_cpf(associado_cpf)
 
     # Se ainda não houver voluntario, criar um objeto mínimo para template (apenas nome)
     if not voluntario:
@@ -11744,7 +8900,7 @@ def voluntario_dashboard():
 
     return render_template('voluntario/dashboard.html', voluntario=voluntario, ofertas=ofertas, agendamentos=agendamentos)
 
-@app.route('/associado')
+@rotas.route('/associado')
 @associado_required
 def associado_dashboard():
     associado = Associado.query.get_or_404(session.get('associado_id'))
@@ -11758,7 +8914,7 @@ def associado_dashboard():
     
     return render_template('associado/dashboard.html', associado=associado, mensalidades=mensalidades)
 
-@app.route('/associado/perfil', methods=['GET', 'POST'])
+@rotas.route('/associado/perfil', methods=['GET', 'POST'])
 @associado_required
 def associado_perfil():
     associado = Associado.query.get_or_404(session.get('associado_id'))
@@ -11797,7 +8953,7 @@ def associado_perfil():
     
     return render_template('associado/perfil.html', associado=associado)
 
-@app.route('/associado/carteira')
+@rotas.route('/associado/carteira')
 @associado_required
 def associado_carteira():
     associado = Associado.query.get_or_404(session.get('associado_id'))
@@ -11825,7 +8981,7 @@ def associado_carteira():
     
     return send_from_directory('static', associado.carteira_pdf, as_attachment=False)
 
-@app.route('/associado/carteira/download')
+@rotas.route('/associado/carteira/download')
 @associado_required
 def associado_carteira_download():
     associado = Associado.query.get_or_404(session.get('associado_id'))
@@ -11860,11 +9016,11 @@ def associado_carteira_download():
 # Funções auxiliares para upload de imagens
 def allowed_file(filename):
     return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+           filename.rsplit('.', 1)[1].lower() in current_app.config['ALLOWED_EXTENSIONS']
 
 def allowed_document_file(filename):
     return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_DOCUMENT_EXTENSIONS']
+           filename.rsplit('.', 1)[1].lower() in current_app.config['ALLOWED_DOCUMENT_EXTENSIONS']
 
 def allowed_pdf_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() == 'pdf'
@@ -11872,24 +9028,6 @@ def allowed_pdf_file(filename):
 def gerar_codigo_certificado():
     return f"CERT-{uuid.uuid4().hex[:10].upper()}"
 
-def salvar_qr_certificado(numero_validacao):
-    validation_url = url_for('certificado_validar', codigo=numero_validacao, _external=True)
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_H,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(validation_url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    qr_dir = os.path.join('static', 'qrcodes', 'certificados')
-    os.makedirs(qr_dir, exist_ok=True)
-    filename = f"certificado_{numero_validacao}.png"
-    qr_path = os.path.join(qr_dir, filename)
-    img.save(qr_path)
-    return f"qrcodes/certificados/{filename}"
-
 def certificado_esta_valido(certificado):
     """Verifica se um certificado está válido baseado apenas no status (certificados são vitalícios)"""
     if not certificado:
@@ -11905,30 +9043,8 @@ def certificado_esta_valido(certificado):
     # Se status é válido, ativo, None ou vazio, considerar válido
     return True
 
-def garantir_qr_certificado(certificado):
-    if not certificado:
-        return None
-    rel_path = certificado.qr_code_path
-    precisa_regenerar = False
-    if not rel_path:
-        precisa_regenerar = True
-    else:
-        file_path = os.path.join('static', rel_path.replace('\\', '/').replace('/', os.sep))
-        if not os.path.exists(file_path):
-            precisa_regenerar = True
-    if precisa_regenerar:
-        try:
-            rel_path = salvar_qr_certificado(certificado.numero_validacao)
-            certificado.qr_code_path = rel_path
-            db.session.commit()
-        except Exception as e:
-            db.session.rollback()
-            print(f'Erro ao regenerar QR do certificado {certificado.numero_validacao}:', e)
-            return None
-    return rel_path
-
 # Rota para upload de imagens
-@app.route('/upload-imagem', methods=['POST'])
+@rotas.route('/upload-imagem', methods=['POST'])
 def upload_imagem():
     if 'file' not in request.files:
         flash('Nenhum arquivo selecionado', 'error')
@@ -11941,7 +9057,7 @@ def upload_imagem():
     
     if file and allowed_file(file.filename):
         # Criar diretório se não existir
-        upload_folder = app.config['UPLOAD_FOLDER']
+        upload_folder = current_app.config['UPLOAD_FOLDER']
         os.makedirs(upload_folder, exist_ok=True)
         
         # Gerar nome único para o arquivo
@@ -11970,14 +9086,14 @@ def upload_imagem():
     return redirect(url_for('index'))
 
 # Rota para servir imagens (não necessária se usar static, mas mantida para compatibilidade)
-@app.route('/images/uploads/<filename>')
+@rotas.route('/images/uploads/<filename>')
 def uploaded_file(filename):
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return send_from_directory(current_app.config['UPLOAD_FOLDER'], filename)
 
 # Rota para mudança de idioma
-@app.route('/set-language/<lang>')
+@rotas.route('/set-language/<lang>')
 def set_language(lang):
-    if lang in app.config['LANGUAGES'].keys():
+    if lang in current_app.config['LANGUAGES'].keys():
         session['language'] = lang
     return redirect(request.referrer or url_for('index'))
 
@@ -11993,7 +9109,7 @@ def is_mobile_device():
     return any(keyword in user_agent for keyword in mobile_keywords)
 
 # Context processor para disponibilizar variáveis em todos os templates
-@app.context_processor
+@rotas.context_processor
 def inject_conf():
     def user_tem_permissao(codigo_permissao):
         """Função helper para verificar permissões nos templates"""
@@ -12303,57 +9419,27 @@ def inject_conf():
                 pass
             return None
     
-    def qrcode_url():
-        """Helper function para obter URL do QR code de forma segura"""
-        try:
-            # Verificar se tem footer_qrcode_base64
-            config_base64 = Configuracao.query.filter_by(chave='footer_qrcode_base64').first()
-            if config_base64 and config_base64.valor:
-                return "/qrcode/imagem"
-            
-            # Fallback para arquivo estático
-            config = Configuracao.query.filter_by(chave='footer_qrcode').first()
-            if config and config.valor:
-                from flask import url_for
-                return url_for('static', filename=config.valor)
-            
-            # Fallback padrão
-            from flask import url_for
-            return url_for('static', filename='images/qrcode.png')
-        except Exception as e:
-            print(f"Erro ao obter URL do QR code: {e}")
-            import traceback
-            traceback.print_exc()
-            # Fallback final
-            try:
-                from flask import url_for
-                return url_for('static', filename='images/qrcode.png')
-            except:
-                return None
-    
-    def certificado_qr_url(certificado):
-        rel_path = garantir_qr_certificado(certificado)
-        if rel_path:
-            try:
-                from flask import url_for
-                return url_for('static', filename=rel_path.replace('\\', '/'))
-            except Exception as e:
-                print(f'Erro ao gerar URL do QR do certificado: {e}')
-                return None
+    def certificado_qr_url(certificado, formato='png'):
+        """URL do QR Code do certificado (gerado em memória pela rota certificado_qr)"""
+        if not certificado or not certificado.numero_validacao:
+            return None
+        from flask import url_for
+        return url_for('certificado_qr', codigo=certificado.numero_validacao, formato=formato)
     
-    # Buscar dados da associação
+    # Configurações do rodapé e dados da associação (em memória enquanto não mudarem)
     try:
-        dados_associacao = DadosAssociacao.get_dados()
+        footer_configs, dados_associacao = configuracoes_site()
     except:
-        dados_associacao = None
+        footer_configs, dados_associacao = {}, None
     
-    # Buscar configurações do rodapé
-    try:
-        footer_configs = {}
-        for config in Configuracao.query.filter(Configuracao.chave.like('footer_%')).all():
-            footer_configs[config.chave] = config.valor
-    except:
-        footer_configs = {}
+    def qrcode_url():
+        """URL do QR Code do rodapé a partir das configurações já carregadas (sem nova consulta)"""
+        from flask import url_for
+        qrcode_base64 = footer_configs.get('footer_qrcode_base64')
+        if qrcode_base64:
+            # A versão muda quando a imagem muda, então a resposta pode ser imutável
+            return url_for('qrcode_imagem', v=format(zlib.crc32(qrcode_base64.encode('ascii', 'ignore')), '08x'))
+        return url_for('static', filename=footer_configs.get('footer_qrcode') or 'images/qrcode.png')
     
     def diretoria_foto_url(membro):
         """Helper function para obter URL da foto da diretoria"""
@@ -12383,6 +9469,15 @@ def inject_conf():
         from flask import url_for
         return url_for('static', filename=membro.foto)
     
+    def get_titulo_album(album):
+        """Título do álbum no idioma atual (páginas de detalhe de ação e evento)"""
+        current_lang = session.get('language', 'pt')
+        if current_lang == 'es' and album.titulo_es:
+            return album.titulo_es
+        elif current_lang == 'en' and album.titulo_en:
+            return album.titulo_en
+        return album.titulo_pt
+    
     # Detectar dispositivo mobile
     is_mobile = is_mobile_device()
     
@@ -12393,12 +9488,14 @@ def inject_conf():
         radio_programa_imagem_url=radio_programa_imagem_url,
         acao_imagem_url=acao_imagem_url,
         informativo_imagem_url=informativo_imagem_url,
+        evento_imagem_url=evento_imagem_url,
         diretoria_foto_url=diretoria_foto_url,
         conselho_foto_url=conselho_foto_url,
+        get_titulo_album=get_titulo_album,
         qrcode_url=qrcode_url,
         current_user=session.get('admin_username'),
         current_language=session.get('language', 'pt'),
-        languages=app.config['LANGUAGES'],
+        languages=current_app.config['LANGUAGES'],
         _=_,
         date=date,  # Disponibilizar date para templates
         user_tem_permissao=user_tem_permissao,
@@ -12407,1215 +9504,17 @@ def inject_conf():
         footer_configs=footer_configs,  # Configurações do rodapé
         certificado_esta_valido=certificado_esta_valido,
         certificado_qr_url=certificado_qr_url,
+        arquivo_url=arquivo_url,
+        nome_pais=nome_pais,
         is_mobile_device=is_mobile  # Detecção de dispositivo mobile
     )
 
-# API endpoints para obtener datos
-@app.route('/api/reuniones-presenciales')
-def api_reuniones_presenciales():
-    reuniones = ReunionPresencial.query.order_by(ReunionPresencial.fecha.asc()).all()
-    return jsonify([{
-        'id': r.id,
-        'titulo': r.titulo,
-        'descripcion': r.descripcion,
-        'fecha': r.fecha.strftime('%Y-%m-%d'),
-        'hora': r.hora,
-        'lugar': r.lugar,
-        'direccion': r.direccion
-    } for r in reuniones])
-
-@app.route('/api/reuniones-virtuales')
-def api_reuniones_virtuales():
-    reuniones = ReunionVirtual.query.order_by(ReunionVirtual.fecha.asc()).all()
-    return jsonify([{
-        'id': r.id,
-        'titulo': r.titulo,
-        'descripcion': r.descripcion,
-        'fecha': r.fecha.strftime('%Y-%m-%d'),
-        'hora': r.hora,
-        'plataforma': r.plataforma,
-        'link': r.link
-    } for r in reuniones])
-
-def init_permissoes():
-    """Inicializa as permissões do sistema"""
-    permissoes_data = [
-        # Dashboard
-        {'codigo': 'dashboard', 'nome': 'Dashboard', 'descricao': 'Acessar o painel principal', 'categoria': 'Geral'},
-        
-        # Reuniões
-        {'codigo': 'reuniones_presenciales', 'nome': 'Reuniões Presenciais', 'descricao': 'Gerenciar reuniões presenciais', 'categoria': 'Reuniões'},
-        {'codigo': 'reuniones_virtuales', 'nome': 'Reuniões Virtuais', 'descricao': 'Gerenciar reuniões virtuais', 'categoria': 'Reuniões'},
-        
-        # Conteúdo
-        {'codigo': 'projetos', 'nome': 'Projetos', 'descricao': 'Gerenciar projetos', 'categoria': 'Conteúdo'},
-        {'codigo': 'eventos', 'nome': 'Eventos', 'descricao': 'Gerenciar eventos', 'categoria': 'Conteúdo'},
-        {'codigo': 'acoes', 'nome': 'Ações', 'descricao': 'Gerenciar ações', 'categoria': 'Conteúdo'},
-        {'codigo': 'albuns', 'nome': 'Álbuns', 'descricao': 'Gerenciar álbuns da galeria', 'categoria': 'Conteúdo'},
-        {'codigo': 'imagens', 'nome': 'Imagens', 'descricao': 'Gerenciar imagens', 'categoria': 'Conteúdo'},
-        {'codigo': 'videos', 'nome': 'Vídeos', 'descricao': 'Gerenciar vídeos', 'categoria': 'Conteúdo'},
-        {'codigo': 'apoiadores', 'nome': 'Apoiadores', 'descricao': 'Gerenciar apoiadores', 'categoria': 'Conteúdo'},
-        
-        # Associados
-        {'codigo': 'associados', 'nome': 'Associados', 'descricao': 'Gerenciar associados', 'categoria': 'Associados'},
-        
-        # Financeiro
-        {'codigo': 'financeiro', 'nome': 'Sistema Financeiro', 'descricao': 'Acessar sistema financeiro', 'categoria': 'Financeiro'},
-        {'codigo': 'contas', 'nome': 'Contas - Doações e Gastos', 'descricao': 'Gerenciar doações e gastos', 'categoria': 'Financeiro'},
-        
-        # Transparência
-        {'codigo': 'transparencia', 'nome': 'Transparência', 'descricao': 'Gerenciar página de transparência', 'categoria': 'Transparência'},
-        
-        # Configurações
-        {'codigo': 'sobre', 'nome': 'Página Sobre', 'descricao': 'Gerenciar página sobre', 'categoria': 'Configurações'},
-        {'codigo': 'usuarios', 'nome': 'Usuários Administrativos', 'descricao': 'Gerenciar usuários do admin', 'categoria': 'Configurações'},
-        {'codigo': 'configuracao', 'nome': 'Configurações Gerais', 'descricao': 'Acessar configurações gerais', 'categoria': 'Configurações'},
-    ]
-    
-    for perm_data in permissoes_data:
-        permissao = Permissao.query.filter_by(codigo=perm_data['codigo']).first()
-        if not permissao:
-            permissao = Permissao(**perm_data)
-            db.session.add(permissao)
-    
-    db.session.commit()
-
-def init_db():
-    """Inicializa a base de dados com dados de exemplo"""
-    with app.app_context():
-        db.create_all()
-        
-        # Inicializar permissões
-        init_permissoes()
-        
-        # Tentar verificar usuários (pode falhar se a coluna não existir ainda)
-        try:
-            usuario_count = Usuario.query.count()
-        except Exception:
-            # Se falhar, provavelmente a coluna is_super_admin não existe
-            # Tentar adicionar via SQL direto
-            from sqlalchemy import text, inspect
-            try:
-                # Verificar se é SQLite ou PostgreSQL
-                is_sqlite = db.engine.url.drivername == 'sqlite'
-                
-                with db.engine.connect() as conn:
-                    # Verificar se a coluna existe
-                    if is_sqlite:
-                        result = conn.execute(text("PRAGMA table_info(usuario)"))
-                        columns = [row[1] for row in result]
-                    else:
-                        # PostgreSQL
-                        result = conn.execute(text("""
-                            SELECT column_name 
-                            FROM information_schema.columns 
-                            WHERE table_name = 'usuario' AND column_name = 'is_super_admin'
-                        """))
-                        columns = [row[0] for row in result]
-                    
-                    if (is_sqlite and 'is_super_admin' not in columns) or (not is_sqlite and len(columns) == 0):
-                        # PostgreSQL usa BOOLEAN, SQLite também suporta
-                        conn.execute(text("ALTER TABLE usuario ADD COLUMN is_super_admin BOOLEAN DEFAULT FALSE"))
-                        conn.commit()
-                        print("Coluna is_super_admin adicionada ao banco de dados.")
-            except Exception as e:
-                print(f"Aviso: Não foi possível adicionar coluna automaticamente: {e}")
-                print("Execute o script migrate_permissoes.py manualmente.")
-            usuario_count = 0
-        
-        # Se não houver usuários, criar um super admin padrão
-        if usuario_count == 0:
-            admin = Usuario(
-                username='admin',
-                nome='Administrador',
-                is_super_admin=True
-            )
-            admin.set_password('admin123')
-            db.session.add(admin)
-            db.session.commit()
-            print('Usuário admin criado (username: admin, senha: admin123) - ALTERE A SENHA!')
-        
-        # Marcar o primeiro usuário como super admin se não houver nenhum super admin
-        try:
-            super_admin_count = Usuario.query.filter_by(is_super_admin=True).count()
-            if super_admin_count == 0:
-                primeiro_usuario = Usuario.query.first()
-                if primeiro_usuario:
-                    primeiro_usuario.is_super_admin = True
-                    db.session.commit()
-                    print(f'Usuário {primeiro_usuario.username} marcado como super admin automaticamente.')
-        except Exception as e:
-            print(f"Aviso: Não foi possível verificar/atualizar super admins: {e}")
-        
-        # Migração da coluna imagem_base64 já foi feita no início da função
-        
-        # Verificar se já existem dados no banco (primeira inicialização)
-        # Se já houver qualquer dado, não criar dados de exemplo
-        has_any_data = (
-            ReunionPresencial.query.count() > 0 or
-            ReunionVirtual.query.count() > 0 or
-            Projeto.query.count() > 0 or
-            Acao.query.count() > 0 or
-            Evento.query.count() > 0
-        )
-        
-        # Criar dados de exemplo APENAS se não houver NENHUM dado no banco
-        if not has_any_data:
-            # Reuniones presenciales de ejemplo
-            r1 = ReunionPresencial(
-                titulo="Assembleia Geral Mensal",
-                descripcion="Reunião mensal para discutir atividades e projetos da associação",
-                fecha=datetime(2025, 2, 15, 14, 0),
-                hora="14:00",
-                lugar="Sede da AADVITA",
-                direccion="Rua das Flores, 123, Centro"
-            )
-            db.session.add(r1)
-            
-            r2 = ReunionPresencial(
-                titulo="Workshop de Acessibilidade",
-                descripcion="Workshop sobre tecnologias assistivas e acessibilidade para deficientes visuais",
-                fecha=datetime(2025, 2, 20, 15, 0),
-                hora="15:00",
-                lugar="Centro Comunitário",
-                direccion="Avenida Principal, 456, Bairro Novo"
-            )
-            db.session.add(r2)
-            
-            r3 = ReunionPresencial(
-                titulo="Reunião de Planejamento",
-                descripcion="Reunião para planejar as próximas atividades e eventos da associação",
-                fecha=datetime(2025, 3, 5, 10, 0),
-                hora="10:00",
-                lugar="Sede da AADVITA",
-                direccion="Rua das Flores, 123, Centro"
-            )
-            db.session.add(r3)
-            
-            r4 = ReunionPresencial(
-                titulo="Palestra sobre Inclusão Digital",
-                descripcion="Palestra sobre como a tecnologia pode promover inclusão para pessoas com deficiência visual",
-                fecha=datetime(2025, 3, 15, 16, 0),
-                hora="16:00",
-                lugar="Auditório Municipal",
-                direccion="Praça Central, s/n, Centro"
-            )
-            db.session.add(r4)
-            
-            # Reuniones virtuales de ejemplo
-            rv1 = ReunionVirtual(
-                titulo="Workshop de Tecnologia Assistiva",
-                descripcion="Workshop sobre ferramentas tecnológicas para deficientes visuais",
-                fecha=datetime(2025, 2, 18, 19, 0),
-                hora="19:00",
-                plataforma="Google Meet",
-                link="https://meet.google.com/abc-defg-hij"
-            )
-            db.session.add(rv1)
-            
-            rv2 = ReunionVirtual(
-                titulo="Oficina de Leitura Digital",
-                descripcion="Aprenda a usar leitores de tela e ferramentas de leitura digital",
-                fecha=datetime(2025, 2, 25, 20, 0),
-                hora="20:00",
-                plataforma="Google Meet",
-                link="https://meet.google.com/xyz-uvw-rst"
-            )
-            db.session.add(rv2)
-            
-            rv3 = ReunionVirtual(
-                titulo="Reunião de Acolhimento",
-                descripcion="Reunião para acolher novos membros e apresentar a associação",
-                fecha=datetime(2025, 3, 8, 18, 30),
-                hora="18:30",
-                plataforma="Google Meet",
-                link="https://meet.google.com/mno-pqr-stu"
-            )
-            db.session.add(rv3)
-            
-            rv4 = ReunionVirtual(
-                titulo="Palestra sobre Direitos das Pessoas com Deficiência",
-                descripcion="Palestra sobre direitos e legislação para pessoas com deficiência visual",
-                fecha=datetime(2025, 3, 20, 19, 0),
-                hora="19:00",
-                plataforma="Google Meet",
-                link="https://meet.google.com/ghi-jkl-mno"
-            )
-            db.session.add(rv4)
-            
-            # Projetos de exemplo
-            p1 = Projeto(
-                titulo="Inclusão Digital",
-                descripcion="Projeto para capacitar pessoas com deficiência visual no uso de tecnologias assistivas",
-                estado="Ativo",
-                data_inicio=datetime(2024, 1, 1).date()
-            )
-            db.session.add(p1)
-            
-            p2 = Projeto(
-                titulo="Acessibilidade em Espaços Públicos",
-                descripcion="Projeto voltado para promover melhorias na acessibilidade de espaços públicos para pessoas com deficiência visual",
-                estado="Ativo",
-                data_inicio=datetime(2024, 3, 1).date()
-            )
-            db.session.add(p2)
-            
-            p3 = Projeto(
-                titulo="Formação Profissional",
-                descripcion="Iniciativa para oferecer cursos e treinamentos profissionais para pessoas com deficiência visual",
-                estado="Em Andamento",
-                data_inicio=datetime(2024, 5, 1).date()
-            )
-            db.session.add(p3)
-            
-            p4 = Projeto(
-                titulo="Apoio Educacional",
-                descripcion="Projeto de apoio educacional e inclusão escolar para crianças e jovens com deficiência visual",
-                estado="Ativo",
-                data_inicio=datetime(2024, 2, 1).date()
-            )
-            db.session.add(p4)
-            
-            # Ações de ejemplo
-            a1 = Acao(
-                titulo="Campanha de Conscientização",
-                descricao="Campanha para aumentar a conscientização sobre acessibilidade",
-                data=datetime(2024, 3, 15).date(),
-                categoria="Conscientização"
-            )
-            db.session.add(a1)
-            
-            a2 = Acao(
-                titulo="Doação de Materiais Educativos",
-                descricao="Ação de doação de materiais educativos em braille para escolas da região",
-                data=datetime(2024, 4, 10).date(),
-                categoria="Educação"
-            )
-            db.session.add(a2)
-            
-            a3 = Acao(
-                titulo="Parceria com Empresas Locais",
-                descricao="Iniciativa para estabelecer parcerias com empresas locais para inclusão de pessoas com deficiência visual",
-                data=datetime(2024, 5, 20).date(),
-                categoria="Parcerias"
-            )
-            db.session.add(a3)
-            
-            a4 = Acao(
-                titulo="Workshop de Mobilidade Urbana",
-                descricao="Workshop prático sobre técnicas de mobilidade urbana para pessoas com deficiência visual",
-                data=datetime(2024, 6, 5).date(),
-                categoria="Capacitação"
-            )
-            db.session.add(a4)
-            
-            # Apoiadores de ejemplo
-            ap1 = Apoiador(
-                nome="Empresa Solidária",
-                tipo="Empresa",
-                website="https://exemplo.com",
-                descricao="Empresa parceira que apoia nossos projetos"
-            )
-            db.session.add(ap1)
-            
-            # Vídeos de exemplo
-            v1 = Video(
-                titulo="Apresentação da AADVITA",
-                descricao="Conheça mais sobre a Associação de Deficientes Visuais AADVITA e nossos projetos",
-                url_youtube="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                categoria="Institucional",
-                ordem=1
-            )
-            db.session.add(v1)
-            
-            v2 = Video(
-                titulo="Tecnologias Assistivas para Deficientes Visuais",
-                descricao="Vídeo educativo sobre tecnologias assistivas que facilitam o dia a dia de pessoas com deficiência visual",
-                url_youtube="https://www.youtube.com/watch?v=jNQXAC9IVRw",
-                categoria="Educacional",
-                ordem=2
-            )
-            db.session.add(v2)
-            
-            v3 = Video(
-                titulo="Inclusão e Acessibilidade",
-                descricao="Palestra sobre inclusão e acessibilidade para pessoas com deficiência visual na sociedade",
-                url_youtube="https://www.youtube.com/watch?v=9bZkp7q19f0",
-                categoria="Conscientização",
-                ordem=3
-            )
-            db.session.add(v3)
-            
-            # Imagens de exemplo - usando logo existente como placeholder
-            img1 = Imagem(
-                titulo="Atividade com Membros",
-                descricao="Membros da AADVITA participando de uma atividade comunitária",
-                filename="logo.png",
-                caminho="images/logo.png"
-            )
-            db.session.add(img1)
-            
-            img2 = Imagem(
-                titulo="Workshop de Tecnologia",
-                descricao="Workshop sobre tecnologias assistivas realizado pela associação",
-                filename="logo.png",
-                caminho="images/logo.png"
-            )
-            db.session.add(img2)
-            
-            img3 = Imagem(
-                titulo="Evento de Conscientização",
-                descricao="Evento público para conscientização sobre deficiência visual",
-                filename="logo.png",
-                caminho="images/logo.png"
-            )
-            db.session.add(img3)
-            
-            img4 = Imagem(
-                titulo="Reunião de Planejamento",
-                descricao="Equipe da AADVITA em reunião de planejamento de atividades",
-                filename="logo.png",
-                caminho="images/logo.png"
-            )
-            db.session.add(img4)
-            
-            # Eventos de exemplo
-            e1 = Evento(
-                titulo="Dia da Conscientização sobre Deficiência Visual",
-                descricao="Evento especial para promover a conscientização sobre deficiência visual e inclusão",
-                data=datetime(2025, 4, 15, 14, 0),
-                hora="14:00",
-                local="Praça Central",
-                endereco="Centro da cidade",
-                tipo="Presencial"
-            )
-            db.session.add(e1)
-            
-            e2 = Evento(
-                titulo="Feira de Inclusão e Acessibilidade",
-                descricao="Feira com exposição de tecnologias assistivas e produtos para pessoas com deficiência visual",
-                data=datetime(2025, 5, 10, 9, 0),
-                hora="09:00",
-                local="Centro de Convenções",
-                endereco="Avenida das Flores, 500, Centro",
-                tipo="Presencial"
-            )
-            db.session.add(e2)
-            
-            e3 = Evento(
-                titulo="Seminário sobre Tecnologias Assistivas",
-                descricao="Seminário online sobre as mais recentes tecnologias assistivas para deficiência visual",
-                data=datetime(2025, 6, 20, 19, 0),
-                hora="19:00",
-                local="Online",
-                endereco="Plataforma Google Meet",
-                tipo="Virtual",
-                link="https://meet.google.com/event-tech"
-            )
-            db.session.add(e3)
-            
-            e4 = Evento(
-                titulo="Caminhada pela Inclusão",
-                descricao="Caminhada comunitária para promover a inclusão e acessibilidade no município",
-                data=datetime(2025, 7, 12, 8, 0),
-                hora="08:00",
-                local="Parque Municipal",
-                endereco="Rua da Natureza, s/n",
-                tipo="Presencial"
-            )
-            db.session.add(e4)
-            
-            db.session.commit()
-        
-        # NOTA: Código que recriava automaticamente reuniões, projetos, ações, eventos, imagens e vídeos
-        # foi removido para garantir que exclusões sejam permanentes.
-        # Dados de exemplo são criados apenas na primeira inicialização do banco (quando não há nenhum registro).
-        
-        # Criar usuário admin padrão se não existir
-        if Usuario.query.count() == 0:
-            admin = Usuario(
-                username='admin',
-                nome='Administrador',
-            )
-            admin.set_password('admin123')  # Senha padrão - altere depois!
-            db.session.add(admin)
-            db.session.commit()
-        
-        # Criar configurações padrão do rodapé se não existirem
-        configs_default = {
-            'footer_email': 'contato@aadvita.org.br',
-            'footer_telefone': '(00) 0000-0000',
-            'footer_whatsapp': '(00) 00000-0000',
-            'footer_whatsapp_link': 'https://wa.me/5500000000000',
-            'footer_instagram': 'https://www.instagram.com/aadvita',
-            'footer_facebook': 'https://www.facebook.com/aadvita',
-            'footer_youtube': '',
-            'footer_qrcode': 'images/qrcode.png',
-            'footer_copyright_year': '2025'
-        }
-        
-        for chave, valor in configs_default.items():
-            if not Configuracao.query.filter_by(chave=chave).first():
-                config = Configuracao(chave=chave, valor=valor, tipo='texto')
-                db.session.add(config)
-        
-        db.session.commit()
-        
-        # Gerar mensalidades automaticamente ao iniciar (se não existirem)
-        try:
-            gerar_mensalidades_automaticas()
-        except Exception as e:
-            print(f"Aviso: Erro ao gerar mensalidades automaticamente: {str(e)}")
-
-def _add_column(inspector, conn, table_name, column_name, is_sqlite, column_type='TEXT'):
-    """Função auxiliar para adicionar coluna a uma tabela"""
-    from sqlalchemy import text
-    try:
-        column_exists = False
-        
-        if is_sqlite:
-            result = conn.execute(text("PRAGMA table_info({})".format(table_name)))
-            columns = [row[1] for row in result]
-            column_exists = column_name in columns
-        else:
-            # PostgreSQL
-            result = conn.execute(text("""
-                SELECT EXISTS (
-                    SELECT 1 
-                    FROM information_schema.columns 
-                    WHERE table_name = :table_name 
-                    AND column_name = :column_name
-                )
-            """), {'table_name': table_name, 'column_name': column_name})
-            column_exists = result.scalar()
-        
-        if not column_exists:
-            print(f"📝 Adicionando coluna {column_name} à tabela {table_name}...")
-            try:
-                if is_sqlite:
-                    conn.execute(text("ALTER TABLE {} ADD COLUMN {} {}".format(table_name, column_name, column_type)))
-                else:
-                    # PostgreSQL - usar IF NOT EXISTS via DO block com format dinâmico
-                    sql = f"""
-                        DO $$ 
-                        BEGIN
-                            IF NOT EXISTS (
-                                SELECT 1 FROM information_schema.columns 
-                                WHERE table_name = '{table_name}' 
-                                AND column_name = '{column_name}'
-                            ) THEN
-                                EXECUTE format('ALTER TABLE %I ADD COLUMN %I {column_type}', '{table_name}', '{column_name}');
-                            END IF;
-                        END $$;
-                    """
-                    conn.execute(text(sql))
-                conn.commit()
-                print(f"✅ Coluna {column_name} adicionada à tabela {table_name}.")
-            except Exception as e:
-                # Se a coluna já existe (erro de duplicação), ignorar
-                error_str = str(e).lower()
-                if 'duplicate' in error_str or 'already exists' in error_str or ('column' in error_str and 'already' in error_str):
-                    print(f"ℹ️ Coluna {table_name}.{column_name} já existe.")
-                else:
-                    raise
-        return True
-    except Exception as e:
-        print(f"⚠️ Erro ao adicionar coluna {table_name}.{column_name}: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-# Função para inicializar o banco de dados quando necessário
-def ensure_db_initialized():
-    """Garante que o banco de dados está inicializado"""
-    try:
-        with app.app_context():
-            # Verificar qual banco está sendo usado
-            db_type = db.engine.url.drivername
-            print(f"📊 Tipo de banco de dados: {db_type}")
-            
-            # PRIMEIRO: Adicionar colunas base64 se necessário ANTES de qualquer query
-            try:
-                from sqlalchemy import text, inspect
-                inspector = inspect(db.engine)
-                
-                # Adicionar coluna imagem_base64 à tabela slider_image
-                table_exists = 'slider_image' in inspector.get_table_names()
-                if table_exists:
-                    is_sqlite = db_type == 'sqlite'
-                    with db.engine.connect() as conn:
-                        if is_sqlite:
-                            result = conn.execute(text("PRAGMA table_info(slider_image)"))
-                            columns = [row[1] for row in result]
-                        else:
-                            result = conn.execute(text("""
-                                SELECT column_name 
-                                FROM information_schema.columns 
-                                WHERE table_name = 'slider_image' AND column_name = 'imagem_base64'
-                            """))
-                            columns = [row[0] for row in result]
-                        
-                        if (is_sqlite and 'imagem_base64' not in columns) or (not is_sqlite and len(columns) == 0):
-                            print("📝 Adicionando coluna imagem_base64 à tabela slider_image...")
-                            if is_sqlite:
-                                conn.execute(text("ALTER TABLE slider_image ADD COLUMN imagem_base64 TEXT"))
-                            else:
-                                conn.execute(text("ALTER TABLE slider_image ADD COLUMN imagem_base64 TEXT"))
-                            conn.commit()
-                            print("✅ Coluna imagem_base64 adicionada.")
-                
-                # Adicionar coluna logo_base64 à tabela apoiador
-                table_exists = 'apoiador' in inspector.get_table_names()
-                if table_exists:
-                    is_sqlite = db_type == 'sqlite'
-                    with db.engine.connect() as conn:
-                        if is_sqlite:
-                            result = conn.execute(text("PRAGMA table_info(apoiador)"))
-                            columns = [row[1] for row in result]
-                        else:
-                            result = conn.execute(text("""
-                                SELECT column_name 
-                                FROM information_schema.columns 
-                                WHERE table_name = 'apoiador' AND column_name = 'logo_base64'
-                            """))
-                            columns = [row[0] for row in result]
-                        
-                        if (is_sqlite and 'logo_base64' not in columns) or (not is_sqlite and len(columns) == 0):
-                            print("📝 Adicionando coluna logo_base64 à tabela apoiador...")
-                            if is_sqlite:
-                                conn.execute(text("ALTER TABLE apoiador ADD COLUMN logo_base64 TEXT"))
-                            else:
-                                conn.execute(text("ALTER TABLE apoiador ADD COLUMN logo_base64 TEXT"))
-                            conn.commit()
-                            print("✅ Coluna logo_base64 adicionada.")
-                
-                # Adicionar coluna imagem_base64 à tabela banner_conteudo
-                table_exists = 'banner_conteudo' in inspector.get_table_names()
-                if table_exists:
-                    is_sqlite = db_type == 'sqlite'
-                    with db.engine.connect() as conn:
-                        column_exists = False
-                        
-                        if is_sqlite:
-                            result = conn.execute(text("PRAGMA table_info(banner_conteudo)"))
-                            columns = [row[1] for row in result]
-                            column_exists = 'imagem_base64' in columns
-                        else:
-                            # PostgreSQL - usar EXISTS para verificação mais robusta
-                            result = conn.execute(text("""
-                                SELECT EXISTS (
-                                    SELECT 1 
-                                    FROM information_schema.columns 
-                                    WHERE table_name = 'banner_conteudo' 
-                                    AND column_name = 'imagem_base64'
-                                )
-                            """))
-                            column_exists = result.scalar()
-                        
-                        if not column_exists:
-                            print("📝 Adicionando coluna imagem_base64 à tabela banner_conteudo...")
-                            try:
-                                if is_sqlite:
-                                    conn.execute(text("ALTER TABLE banner_conteudo ADD COLUMN imagem_base64 TEXT"))
-                                else:
-                                    # PostgreSQL - usar IF NOT EXISTS via DO block
-                                    conn.execute(text("""
-                                        DO $$ 
-                                        BEGIN
-                                            IF NOT EXISTS (
-                                                SELECT 1 FROM information_schema.columns 
-                                                WHERE table_name = 'banner_conteudo' 
-                                                AND column_name = 'imagem_base64'
-                                            ) THEN
-                                                ALTER TABLE banner_conteudo ADD COLUMN imagem_base64 TEXT;
-                                            END IF;
-                                        END $$;
-                                    """))
-                                conn.commit()
-                                print("✅ Coluna imagem_base64 adicionada à tabela banner_conteudo.")
-                            except Exception as e:
-                                if 'duplicate' in str(e).lower() or 'already exists' in str(e).lower():
-                                    print("ℹ️ Coluna banner_conteudo.imagem_base64 já existe.")
-                                else:
-                                    raise
-                
-                # Adicionar coluna imagem_base64 à tabela banner
-                table_exists = 'banner' in inspector.get_table_names()
-                if table_exists:
-                    is_sqlite = db_type == 'sqlite'
-                    with db.engine.connect() as conn:
-                        column_exists = False
-                        
-                        if is_sqlite:
-                            result = conn.execute(text("PRAGMA table_info(banner)"))
-                            columns = [row[1] for row in result]
-                            column_exists = 'imagem_base64' in columns
-                        else:
-                            # PostgreSQL - usar EXISTS para verificação mais robusta
-                            result = conn.execute(text("""
-                                SELECT EXISTS (
-                                    SELECT 1 
-                                    FROM information_schema.columns 
-                                    WHERE table_name = 'banner' 
-                                    AND column_name = 'imagem_base64'
-                                )
-                            """))
-                            column_exists = result.scalar()
-                        
-                        if not column_exists:
-                            print("📝 Adicionando coluna imagem_base64 à tabela banner...")
-                            try:
-                                if is_sqlite:
-                                    conn.execute(text("ALTER TABLE banner ADD COLUMN imagem_base64 TEXT"))
-                                else:
-                                    # PostgreSQL - usar IF NOT EXISTS via DO block
-                                    conn.execute(text("""
-                                        DO $$ 
-                                        BEGIN
-                                            IF NOT EXISTS (
-                                                SELECT 1 FROM information_schema.columns 
-                                                WHERE table_name = 'banner' 
-                                                AND column_name = 'imagem_base64'
-                                            ) THEN
-                                                ALTER TABLE banner ADD COLUMN imagem_base64 TEXT;
-                                            END IF;
-                                        END $$;
-                                    """))
-                                conn.commit()
-                                print("✅ Coluna imagem_base64 adicionada à tabela banner.")
-                            except Exception as e:
-                                if 'duplicate' in str(e).lower() or 'already exists' in str(e).lower():
-                                    print("ℹ️ Coluna banner.imagem_base64 já existe.")
-                                else:
-                                    raise
-                
-                # Adicionar colunas base64 para os outros modelos
-                # IMPORTANTE: Adicionar também colunas que não são base64 mas foram adicionadas ao modelo
-                tables_to_migrate = [
-                    ('projeto', 'imagen_base64'),  # Projeto usa "imagen" em vez de "imagem"
-                    ('projeto', 'arquivo_pdf'),  # Campo arquivo_pdf (pode ser caminho ou 'base64:...')
-                    ('projeto', 'arquivo_pdf_base64'),  # PDF do projeto em base64
-                    ('acao', 'imagem_base64'),
-                    ('evento', 'imagem_base64'),
-                    ('informativo', 'imagem_base64'),
-                    ('radio_programa', 'imagem_base64'),
-                    ('membro_diretoria', 'foto_base64'),
-                    ('membro_conselho_fiscal', 'foto_base64'),
-                    ('relatorio_atividade', 'arquivo_base64'),
-                    ('associado', 'carteira_pdf_base64'),
-                ]
-                
-                for table_name, column_name in tables_to_migrate:
-                    table_exists = table_name in inspector.get_table_names()
-                    if table_exists:
-                        is_sqlite = db_type == 'sqlite'
-                        with db.engine.connect() as conn:
-                            _add_column(inspector, conn, table_name, column_name, is_sqlite, 'TEXT')
-            except Exception as e:
-                print(f"⚠️ Aviso ao verificar colunas base64: {e}")
-            
-            # Criar todas as tabelas (idempotente - não recria se já existirem)
-            db.create_all()
-            print("✅ Tabelas do banco de dados verificadas/criadas")
-            
-            # Executar migração problema_acessibilidade para garantir que a tabela exista
-            try:
-                import migrate_postgres_problema_acessibilidade as mig_problema
-                print('Executando migração problema_acessibilidade (startup)...')
-                mig_problema.migrate()
-                print('Migração problema_acessibilidade executada com sucesso (startup)')
-            except Exception as e:
-                print(f'⚠️ Aviso: Não foi possível executar migração problema_acessibilidade no startup: {e}')
-                # Tentar criar a tabela manualmente se a migração falhar
-                try:
-                    from sqlalchemy import inspect, text
-                    inspector = inspect(db.engine)
-                    if 'problema_acessibilidade' not in inspector.get_table_names():
-                        print('Criando tabela problema_acessibilidade manualmente...')
-                        is_sqlite = db_type == 'sqlite'
-                        with db.engine.connect() as conn:
-                            if is_sqlite:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS problema_acessibilidade (
-                                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                        tipo_problema VARCHAR(100) NOT NULL,
-                                        descricao TEXT NOT NULL,
-                                        localizacao VARCHAR(500) NOT NULL,
-                                        nome_denunciante VARCHAR(200) NOT NULL,
-                                        telefone VARCHAR(100) NOT NULL,
-                                        email VARCHAR(200),
-                                        anexos TEXT,
-                                        status VARCHAR(50) DEFAULT 'novo',
-                                        observacoes_admin TEXT,
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            else:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS problema_acessibilidade (
-                                        id SERIAL PRIMARY KEY,
-                                        tipo_problema VARCHAR(100) NOT NULL,
-                                        descricao TEXT NOT NULL,
-                                        localizacao VARCHAR(500) NOT NULL,
-                                        nome_denunciante VARCHAR(200) NOT NULL,
-                                        telefone VARCHAR(100) NOT NULL,
-                                        email VARCHAR(200),
-                                        anexos TEXT,
-                                        status VARCHAR(50) DEFAULT 'novo',
-                                        observacoes_admin TEXT,
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            conn.commit()
-                        print('✅ Tabela problema_acessibilidade criada manualmente')
-                except Exception as manual_error:
-                    print(f'⚠️ Erro ao criar tabela manualmente: {manual_error}')
-
-            # Executar migração certificado para garantir que a tabela exista
-            try:
-                import migrate_postgres_certificado as mig_cert
-                print('Executando migração certificado (startup)...')
-                mig_cert.migrate()
-                print('Migração certificado executada com sucesso (startup)')
-            except Exception as e:
-                print(f'⚠️ Aviso: Não foi possível executar migração certificado no startup: {e}')
-                try:
-                    from sqlalchemy import inspect, text
-                    inspector = inspect(db.engine)
-                    if 'certificado' not in inspector.get_table_names():
-                        print('Criando tabela certificado manualmente...')
-                        is_sqlite = db_type == 'sqlite'
-                        with db.engine.connect() as conn:
-                            if is_sqlite:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS certificado (
-                                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                        numero_validacao VARCHAR(50) UNIQUE NOT NULL,
-                                        nome_pessoa VARCHAR(200) NOT NULL,
-                                        documento VARCHAR(100),
-                                        descricao TEXT,
-                                        curso VARCHAR(200),
-                                        data_emissao TIMESTAMP,
-                                        data_validade TIMESTAMP,
-                                        status VARCHAR(50) DEFAULT 'valido',
-                                        qr_code_path VARCHAR(300),
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            else:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS certificado (
-                                        id SERIAL PRIMARY KEY,
-                                        numero_validacao VARCHAR(50) UNIQUE NOT NULL,
-                                        nome_pessoa VARCHAR(200) NOT NULL,
-                                        documento VARCHAR(100),
-                                        descricao TEXT,
-                                        curso VARCHAR(200),
-                                        data_emissao TIMESTAMP,
-                                        data_validade TIMESTAMP,
-                                        status VARCHAR(50) DEFAULT 'valido',
-                                        qr_code_path VARCHAR(300),
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            conn.commit()
-                        print('✅ Tabela certificado criada manualmente')
-                except Exception as cert_manual_error:
-                    print(f'⚠️ Erro ao criar tabela certificado manualmente: {cert_manual_error}')
-            
-            # Executar migração reciclagem para garantir que a tabela exista
-            try:
-                import migrate_postgres_reciclagem as mig_reciclagem
-                print('Executando migração reciclagem (startup)...')
-                mig_reciclagem.migrate()
-                print('Migração reciclagem executada com sucesso (startup)')
-            except Exception as e:
-                print(f'⚠️ Aviso: Não foi possível executar migração reciclagem no startup: {e}')
-                try:
-                    from sqlalchemy import inspect, text
-                    inspector = inspect(db.engine)
-                    if 'reciclagem' not in inspector.get_table_names():
-                        print('Criando tabela reciclagem manualmente...')
-                        is_sqlite = db_type == 'sqlite'
-                        with db.engine.connect() as conn:
-                            if is_sqlite:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS reciclagem (
-                                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                        tipo_material VARCHAR(50) NOT NULL,
-                                        nome_completo VARCHAR(200) NOT NULL,
-                                        telefone VARCHAR(20) NOT NULL,
-                                        endereco_retirada TEXT NOT NULL,
-                                        observacoes TEXT,
-                                        status VARCHAR(20) DEFAULT 'pendente',
-                                        observacoes_admin TEXT,
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            else:
-                                conn.execute(text('''
-                                    CREATE TABLE IF NOT EXISTS reciclagem (
-                                        id SERIAL PRIMARY KEY,
-                                        tipo_material VARCHAR(50) NOT NULL,
-                                        nome_completo VARCHAR(200) NOT NULL,
-                                        telefone VARCHAR(20) NOT NULL,
-                                        endereco_retirada TEXT NOT NULL,
-                                        observacoes TEXT,
-                                        status VARCHAR(20) DEFAULT 'pendente',
-                                        observacoes_admin TEXT,
-                                        created_at TIMESTAMP,
-                                        updated_at TIMESTAMP
-                                    )
-                                '''))
-                            conn.commit()
-                        print('✅ Tabela reciclagem criada manualmente')
-                except Exception as rec_manual_error:
-                    print(f'⚠️ Erro ao criar tabela reciclagem manualmente: {rec_manual_error}')
-            
-            # Verificar se há usuários, se não houver, inicializar dados
-            try:
-                from sqlalchemy import inspect
-                inspector = inspect(db.engine)
-                tables = inspector.get_table_names()
-                print(f"📋 Tabelas encontradas: {len(tables)}")
-                
-                if tables and 'usuario' in tables:
-                    try:
-                        usuario_count = Usuario.query.count()
-                        print(f"👥 Usuários no banco: {usuario_count}")
-                        if usuario_count == 0:
-                            # Se não houver usuários, inicializar o banco completamente
-                            print("🔄 Nenhum usuário encontrado. Inicializando banco de dados...")
-                            init_db()
-                        else:
-                            print("✅ Banco de dados já possui dados - não será reinicializado")
-                    except Exception as e:
-                        print(f"⚠️ Nota: Erro ao verificar usuários: {e}")
-                        # Se não conseguir verificar, tentar inicializar
-                        try:
-                            init_db()
-                        except:
-                            pass
-                else:
-                    print("⚠️ Tabela 'usuario' não encontrada - inicializando banco...")
-                    init_db()
-            except Exception as e:
-                print(f"⚠️ Nota: Erro ao verificar tabelas: {e}")
-                # Tentar inicializar de qualquer forma
-                try:
-                    init_db()
-                except:
-                    pass
-    except Exception as e:
-        print(f"❌ Aviso: Erro ao inicializar banco de dados: {e}")
-        # Não falhar a importação se houver erro no banco
-        # O banco será inicializado na primeira requisição
-
-# Cache para evitar verificar migrações em todas as requisições
-# Incluir TODOS os modelos que têm colunas base64
-# Usar tupla (table, column) como chave para permitir múltiplas colunas por tabela
-_migration_cache = {}
-_migration_lock = False
-_migration_initialized = False
-
 # Controle de atualização do Instagram para evitar múltiplas threads simultâneas
 _instagram_update_lock = False
 _instagram_last_update_time = None
 _instagram_update_interval = timedelta(hours=6)  # Atualizar no máximo a cada 6 horas
 
-def _add_base64_column(inspector, conn, table_name, column_name, is_sqlite):
-    """Função auxiliar para adicionar coluna base64 a uma tabela (alias para _add_column)"""
-    return _add_column(inspector, conn, table_name, column_name, is_sqlite, 'TEXT')
-
-def ensure_base64_columns(force=False):
-    """
-    Garante que as colunas base64 existem antes de fazer queries.
-    Esta função é CRÍTICA e deve ser executada antes de qualquer query que use modelos com imagens.
-    """
-    global _migration_cache, _migration_lock, _migration_initialized
-    
-    # Evitar execuções simultâneas
-    if _migration_lock:
-        # Aguardar um pouco e tentar novamente
-        import time
-        time.sleep(0.1)
-        if _migration_lock:
-            return False
-    
-    _migration_lock = True
-    
-    try:
-        from sqlalchemy import text, inspect
-        from sqlalchemy.exc import ProgrammingError, OperationalError
-        
-        inspector = inspect(db.engine)
-        db_type = db.engine.url.drivername
-        is_sqlite = db_type == 'sqlite'
-        
-        success = True
-        
-        # Lista de tabelas e suas colunas base64
-        # IMPORTANTE: Adicionar também colunas que não são base64 mas foram adicionadas ao modelo
-        tables_to_migrate = [
-            ('banner', 'imagem_base64'),
-            ('banner_conteudo', 'imagem_base64'),
-            ('projeto', 'imagen_base64'),  # Projeto usa "imagen" em vez de "imagem"
-            ('projeto', 'arquivo_pdf'),  # Campo arquivo_pdf (pode ser caminho ou 'base64:...')
-            ('projeto', 'arquivo_pdf_base64'),  # PDF do projeto em base64
-            ('acao', 'imagem_base64'),
-            ('evento', 'imagem_base64'),
-            ('informativo', 'imagem_base64'),
-            ('radio_programa', 'imagem_base64'),
-            ('membro_diretoria', 'foto_base64'),
-            ('membro_conselho_fiscal', 'foto_base64'),
-            ('relatorio_atividade', 'arquivo_base64'),
-            ('associado', 'carteira_pdf_base64'),
-        ]
-        
-        for table_name, column_name in tables_to_migrate:
-            cache_key = (table_name, column_name)  # Usar tupla como chave
-            
-            # SEMPRE verificar se a coluna realmente existe, não confiar apenas no cache
-            # Isso é crítico porque o cache pode estar incorreto após um deploy
-            try:
-                if table_name in inspector.get_table_names():
-                    # Verificar se a coluna realmente existe
-                    column_exists = False
-                    with db.engine.connect() as conn:
-                        if is_sqlite:
-                            result = conn.execute(text("PRAGMA table_info({})".format(table_name)))
-                            columns = [row[1] for row in result]
-                            column_exists = column_name in columns
-                        else:
-                            # PostgreSQL
-                            result = conn.execute(text("""
-                                SELECT EXISTS (
-                                    SELECT 1 
-                                    FROM information_schema.columns 
-                                    WHERE table_name = :table_name 
-                                    AND column_name = :column_name
-                                )
-                            """), {'table_name': table_name, 'column_name': column_name})
-                            column_exists = result.scalar()
-                    
-                    # Se a coluna não existe, criar agora
-                    if not column_exists:
-                        print(f"🔧 Coluna {table_name}.{column_name} não existe. Criando agora...")
-                        with db.engine.connect() as conn:
-                            result = _add_column(inspector, conn, table_name, column_name, is_sqlite, 'TEXT')
-                            if not result:
-                                success = False
-                                print(f"❌ Falha ao criar coluna {table_name}.{column_name}")
-                            else:
-                                print(f"✅ Coluna {table_name}.{column_name} criada com sucesso")
-                                _migration_cache[cache_key] = True
-                    else:
-                        # Coluna existe, marcar no cache
-                        _migration_cache[cache_key] = True
-                else:
-                    # Tabela não existe ainda, marcar no cache para não tentar novamente
-                    _migration_cache[cache_key] = True
-            except Exception as e:
-                print(f"⚠️ Erro ao verificar/adicionar coluna {table_name}.{column_name}: {e}")
-                import traceback
-                traceback.print_exc()
-                success = False
-                # NÃO marcar como verificado se houve erro - tentar novamente na próxima vez
-        
-        if success:
-            _migration_initialized = True
-        
-        return success
-        
-    except Exception as e:
-        print(f"⚠️ Erro geral em ensure_base64_columns: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-    finally:
-        _migration_lock = False
-
-# Inicializar banco quando o módulo for importado (para gunicorn)
-# Isso garante que as tabelas existam antes do servidor iniciar
-# Mas não falha a importação se houver problemas
-try:
-    with app.app_context():
-        ensure_db_initialized()
-        # Garantir que as colunas base64 existem logo após a inicialização
-        ensure_base64_columns(force=True)
-except Exception as e:
-    print(f"Nota: Banco será inicializado na primeira requisição: {e}")
-    pass
-
-def _ensure_informativo_slug_column():
-    """Garante que a coluna slug existe na tabela informativo"""
-    try:
-        from sqlalchemy import inspect, text
-        inspector = inspect(db.engine)
-        
-        # Verificar se a tabela existe
-        if 'informativo' not in inspector.get_table_names():
-            return
-        
-        # Verificar se a coluna slug existe
-        columns = [col['name'] for col in inspector.get_columns('informativo')]
-        if 'slug' not in columns:
-            print("Adicionando coluna 'slug' à tabela 'informativo'...")
-            db_type = db.engine.url.drivername
-            if db_type == 'postgresql':
-                db.session.execute(text("ALTER TABLE informativo ADD COLUMN IF NOT EXISTS slug VARCHAR(250)"))
-            else:
-                # SQLite
-                db.session.execute(text("ALTER TABLE informativo ADD COLUMN slug VARCHAR(250)"))
-            db.session.commit()
-            print("✅ Coluna 'slug' adicionada com sucesso!")
-            
-            # Gerar slugs para informativos existentes que não têm (usar query raw para evitar problemas)
-            result = db.session.execute(text("SELECT id, titulo FROM informativo WHERE slug IS NULL OR slug = ''"))
-            informativos_raw = result.fetchall()
-            
-            if informativos_raw:
-                print(f"Gerando slugs para {len(informativos_raw)} informativo(s) existente(s)...")
-                for row in informativos_raw:
-                    informativo_id = row[0]
-                    titulo = row[1]
-                    slug = gerar_slug_unico(titulo, Informativo, informativo_id)
-                    db.session.execute(
-                        text("UPDATE informativo SET slug = :slug WHERE id = :id"),
-                        {"slug": slug, "id": informativo_id}
-                    )
-                db.session.commit()
-                print(f"✅ {len(informativos_raw)} slug(s) gerado(s) com sucesso!")
-    except Exception as e:
-        db.session.rollback()
-        print(f"⚠️ Erro ao verificar/adicionar coluna slug: {e}")
-
-def _ensure_slug_columns():
-    """Garante que as colunas slug existem nas tabelas necessárias"""
-    try:
-        from sqlalchemy import inspect, text
-        inspector = inspect(db.engine)
-        
-        # Tabelas que precisam de slug - mapeamento table_name -> model_class
-        tables_with_slug = [
-            ('projeto', Projeto),
-            ('acao', Acao),
-            ('evento', Evento),
-            ('reunion_presencial', ReunionPresencial),
-            ('reunion_virtual', ReunionVirtual)
-        ]
-        
-        for table_name, model_class in tables_with_slug:
-            # Verificar se a tabela existe
-            if table_name not in inspector.get_table_names():
-                continue
-            
-            # Verificar se a coluna slug existe
-            columns = [col['name'] for col in inspector.get_columns(table_name)]
-            if 'slug' not in columns:
-                print(f"Adicionando coluna 'slug' à tabela '{table_name}'...")
-                db_type = db.engine.url.drivername
-                if db_type == 'postgresql':
-                    db.session.execute(text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS slug VARCHAR(250)"))
-                else:
-                    # SQLite
-                    db.session.execute(text(f"ALTER TABLE {table_name} ADD COLUMN slug VARCHAR(250)"))
-                db.session.commit()
-                print(f"✅ Coluna 'slug' adicionada à tabela '{table_name}'!")
-            
-            # Gerar slugs para registros existentes que não têm (usar query raw)
-            result = db.session.execute(text(f"SELECT id, titulo FROM {table_name} WHERE slug IS NULL OR slug = ''"))
-            records_raw = result.fetchall()
-            
-            if records_raw:
-                print(f"Gerando slugs para {len(records_raw)} registro(s) existente(s) em '{table_name}'...")
-                for row in records_raw:
-                    record_id = row[0]
-                    titulo = row[1]
-                    slug = gerar_slug_unico(titulo, model_class, record_id)
-                    db.session.execute(
-                        text(f"UPDATE {table_name} SET slug = :slug WHERE id = :id"),
-                        {"slug": slug, "id": record_id}
-                    )
-                db.session.commit()
-                print(f"✅ {len(records_raw)} slug(s) gerado(s) para '{table_name}'!")
-    except Exception as e:
-        db.session.rollback()
-        print(f"⚠️ Erro ao verificar/adicionar colunas slug: {e}")
-
-# Garantir que migrações sejam executadas ANTES de cada requisição
-# Isso é CRÍTICO para evitar erros de coluna não encontrada
-@app.before_request
-def before_request():
-    """Executa migrações antes de cada requisição se necessário"""
-    ensure_base64_columns()
-    _ensure_slug_columns()
-    _ensure_informativo_slug_column()
-
-# ============================================
-# SEO: Sitemap e Robots.txt
-# ============================================
-
-@app.route('/sitemap.xml')
-def sitemap():
-    """Gera sitemap.xml dinâmico para SEO"""
-    from flask import Response
-    from xml.etree.ElementTree import Element, SubElement, tostring
-    
-    url_root = request.url_root.rstrip('/')
-    
-    urlset = Element('urlset')
-    urlset.set('xmlns', 'http://www.sitemaps.org/schemas/sitemap/0.9')
-    
-    # Páginas principais (prioridade alta)
-    main_pages = [
-        ('/', '1.0', 'daily'),
-        ('/sobre', '0.9', 'weekly'),
-        ('/projetos', '0.9', 'weekly'),
-        ('/acoes', '0.9', 'weekly'),
-        ('/informativo', '0.8', 'daily'),
-        ('/radio', '0.8', 'daily'),
-        ('/videos', '0.8', 'weekly'),
-        ('/galeria', '0.8', 'weekly'),
-        ('/apoiadores', '0.7', 'monthly'),
-        ('/agenda-presencial', '0.8', 'weekly'),
-        ('/agenda-virtual', '0.8', 'weekly'),
-        ('/transparencia', '0.7', 'monthly'),
-        ('/problema-acessibilidade/registrar', '0.8', 'monthly'),
-        ('/certificados/validar', '0.6', 'monthly'),
-    ]
-    
-    for path, priority, changefreq in main_pages:
-        url_elem = SubElement(urlset, 'url')
-        SubElement(url_elem, 'loc').text = f"{url_root}{path}"
-        SubElement(url_elem, 'changefreq').text = changefreq
-        SubElement(url_elem, 'priority').text = priority
-        SubElement(url_elem, 'lastmod').text = datetime.utcnow().strftime('%Y-%m-%d')
-    
-    # Informativos (prioridade média-alta)
-    informativos = Informativo.query.filter_by(ativo=True).all()
-    for info in informativos:
-        url_elem = SubElement(urlset, 'url')
-        # Usar slug se disponível, senão usar ID
-        url_slug = info.slug if info.slug else str(info.id)
-        SubElement(url_elem, 'loc').text = f"{url_root}/informativo/{url_slug}"
-        SubElement(url_elem, 'changefreq').text = 'weekly'
-        SubElement(url_elem, 'priority').text = '0.8'
-        if info.created_at:
-            SubElement(url_elem, 'lastmod').text = info.created_at.strftime('%Y-%m-%d')
-    
-    xml_str = tostring(urlset, encoding='unicode')
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
-    
-    return Response(xml_str, mimetype='application/xml')
-
-
-@app.route('/admin/export-database')
+@rotas.route('/admin/export-database')
 @admin_required
 def admin_export_database():
     """Exporta o banco de dados completo para download"""
@@ -13693,26 +9592,10 @@ def admin_export_database():
         flash(f'Erro ao exportar banco: {str(e)}', 'error')
         return redirect(url_for('admin_dashboard'))
 
-@app.route('/robots.txt')
-def robots():
-    """Gera robots.txt para SEO"""
-    from flask import Response
-    url_root = request.url_root.rstrip('/')
-    robots_content = f"""User-agent: *
-Allow: /
-Disallow: /admin/
-Disallow: /associado/
-Disallow: /voluntario/
-Disallow: /login
-Disallow: /admin/login
-
-Sitemap: {url_root}/sitemap.xml
-"""
-    return Response(robots_content, mimetype='text/plain')
-
+app = create_app()
 
 if __name__ == '__main__':
-    init_db()
+    run_startup_tasks(app)
     port = int(os.environ.get('PORT', 5000))
     app.run(debug=True, host='0.0.0.0', port=port)
 
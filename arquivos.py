@@ -0,0 +1,220 @@
+"""Ingestão de uploads em streaming, com deduplicação por conteúdo
+
+``ingerir_upload`` lê o arquivo enviado em partes de ``TAMANHO_PARTE`` bytes,
+calculando SHA-256 e tamanho sem carregar o arquivo inteiro na memória, e grava
+o conteúdo uma única vez no banco (``arquivo_blob`` + ``arquivo_blob_parte``),
+que é o armazenamento durável no Render. Se já existe um arquivo com o mesmo
+hash, nada é gravado de novo.
+
+Os registros guardam a referência ``blob:<sha256>/<nome>`` no lugar do caminho
+em ``static/``; ``arquivo_url`` monta a URL de qualquer um dos dois formatos e
+``resposta_blob`` devolve o arquivo em streaming, uma parte por vez.
+
+A rota pública /arquivos/<sha256>/<nome> só serve blobs referenciados por
+documentos publicados no site (``COLUNAS_PUBLICAS``); anexos enviados pelos
+visitantes e relatórios exportados só saem por rotas de administração.
+"""
+import hashlib
+import tempfile
+from collections import namedtuple
+from urllib.parse import quote
+
+from flask import Response, abort, request, stream_with_context, url_for
+from sqlalchemy import delete, select
+from werkzeug.utils import secure_filename
+
+from extensions import db
+from models import (
+    ArquivoBlob, ArquivoBlobParte, BannerConteudo, ExportacaoRelatorio, ModeloDocumento, PrestacaoConta,
+    ProblemaAcessibilidade, Projeto, RelatorioAtividade,
+)
+
+# Memória máxima usada por upload/download, independente do tamanho do arquivo
+TAMANHO_PARTE = 256 * 1024
+
+PREFIXO = 'blob:'
+
+# Documentos publicados no site: os únicos blobs servidos pela rota pública
+COLUNAS_PUBLICAS = (
+    Projeto.arquivo_pdf,
+    RelatorioAtividade.arquivo,
+    PrestacaoConta.arquivo,
+    ModeloDocumento.arquivo,
+    BannerConteudo.arquivo_pdf,
+)
+
+# Anexos de visitantes e relatórios com dados pessoais: só por rotas autenticadas
+COLUNAS_PRIVADAS = (
+    ProblemaAcessibilidade.anexos,
+    ExportacaoRelatorio.arquivo,
+)
+
+# Colunas que podem conter referências blob: (usadas para encontrar órfãos)
+COLUNAS_COM_ARQUIVO = COLUNAS_PUBLICAS + COLUNAS_PRIVADAS
+
+ArquivoIngerido = namedtuple('ArquivoIngerido', 'sha256 tamanho mime_type nome referencia novo')
+
+
+def _insert_ignorando_existente(conn, model):
+    if conn.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model.__table__).on_conflict_do_nothing()
+
+
+def _partes(stream):
+    while True:
+        parte = stream.read(TAMANHO_PARTE)
+        if not parte:
+            return
+        yield parte
+
+
+def _fluxo_reposicionavel(stream):
+    """O próprio stream se aceitar seek; senão uma cópia em arquivo temporário"""
+    try:
+        if stream.seekable():
+            stream.seek(0)
+            return stream
+    except (AttributeError, OSError, ValueError):
+        pass
+    copia = tempfile.SpooledTemporaryFile(max_size=TAMANHO_PARTE)
+    for parte in _partes(stream):
+        copia.write(parte)
+    copia.seek(0)
+    return copia
+
+
+def ingerir_upload(file_storage, mime_type=None):
+    """Grava o upload (werkzeug ``FileStorage``) no armazenamento de blobs
+
+    Não faz commit: a gravação entra na transação do registro que referencia o
+    arquivo. Retorna ``ArquivoIngerido`` com a referência a guardar no registro.
+    """
+    stream = _fluxo_reposicionavel(file_storage.stream)
+    nome = secure_filename(file_storage.filename or '') or 'arquivo'
+    mime_type = mime_type or file_storage.mimetype or 'application/octet-stream'
+
+    # 1ª passada: hash e tamanho, uma parte por vez
+    sha = hashlib.sha256()
+    tamanho = 0
+    partes = 0
+    for parte in _partes(stream):
+        sha.update(parte)
+        tamanho += len(parte)
+        partes += 1
+    sha256 = sha.hexdigest()
+
+    conn = db.session.connection()
+    existe = conn.execute(select(ArquivoBlob.sha256).where(ArquivoBlob.sha256 == sha256)).first() is not None
+    if not existe:
+        # 2ª passada: grava cada parte assim que é lida
+        conn.execute(_insert_ignorando_existente(conn, ArquivoBlob), {
+            'sha256': sha256, 'tamanho': tamanho, 'partes': partes,
+            'mime_type': mime_type, 'nome_original': nome,
+        })
+        stream.seek(0)
+        stmt = _insert_ignorando_existente(conn, ArquivoBlobParte)
+        for ordem, parte in enumerate(_partes(stream)):
+            conn.execute(stmt, {'sha256': sha256, 'ordem': ordem, 'dados': parte})
+
+    return ArquivoIngerido(sha256, tamanho, mime_type, nome, f'{PREFIXO}{sha256}/{nome}', not existe)
+
+
+def eh_blob(valor):
+    return bool(valor) and valor.startswith(PREFIXO)
+
+
+def separar_referencia(valor):
+    """(sha256, nome) de uma referência ``blob:<sha256>/<nome>``"""
+    sha256, _, nome = valor[len(PREFIXO):].partition('/')
+    return sha256, nome or None
+
+
+def blob_publico(sha256):
+    """Se o blob é referenciado por um documento publicado (``COLUNAS_PUBLICAS``)"""
+    referencia = f'{PREFIXO}{sha256}/%'
+    return any(
+        db.session.execute(select(coluna).where(coluna.like(referencia)).limit(1)).first() is not None
+        for coluna in COLUNAS_PUBLICAS
+    )
+
+
+def arquivo_url(valor):
+    """URL de um arquivo referenciado como blob ou como caminho em static/"""
+    if not valor:
+        return None
+    valor = valor.strip()
+    if eh_blob(valor):
+        sha256, nome = separar_referencia(valor)
+        return url_for('arquivos.arquivo', sha256=sha256, nome=nome or 'arquivo')
+    return url_for('static', filename=valor)
+
+
+def _content_disposition(nome, as_attachment):
+    tipo = 'attachment' if as_attachment else 'inline'
+    ascii_nome = nome.encode('ascii', 'ignore').decode('ascii').replace('"', '') or 'arquivo'
+    return f"{tipo}; filename=\"{ascii_nome}\"; filename*=UTF-8''{quote(nome)}"
+
+
+def resposta_blob(valor_ou_sha, download_name=None, as_attachment=True, imutavel=False, privado=False):
+    """Resposta em streaming com o conteúdo do blob (memória de uma parte por vez)
+
+    ``imutavel`` permite cache público por um ano; ``privado`` proíbe qualquer
+    cache (navegador ou proxy), para arquivos com dados pessoais.
+    """
+    if eh_blob(valor_ou_sha):
+        sha256, nome = separar_referencia(valor_ou_sha)
+    else:
+        sha256, nome = valor_ou_sha, None
+    blob = db.session.get(ArquivoBlob, sha256)
+    if blob is None:
+        abort(404)
+
+    if request.if_none_match.contains(sha256):
+        resposta = Response(status=304)
+    else:
+        total_partes = blob.partes
+
+        def gerar():
+            for ordem in range(total_partes):
+                dados = db.session.execute(
+                    select(ArquivoBlobParte.dados).where(
+                        ArquivoBlobParte.sha256 == sha256, ArquivoBlobParte.ordem == ordem,
+                    )
+                ).scalar()
+                if dados is None:
+                    return
+                yield bytes(dados)
+
+        resposta = Response(stream_with_context(gerar()), mimetype=blob.mime_type or 'application/octet-stream')
+        resposta.headers['Content-Length'] = str(blob.tamanho)
+        resposta.headers['Content-Disposition'] = _content_disposition(
+            download_name or nome or blob.nome_original or 'arquivo', as_attachment)
+    resposta.set_etag(sha256)
+    if privado:
+        resposta.headers['Cache-Control'] = 'private, no-store'
+    elif imutavel:
+        resposta.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return resposta
+
+
+def remover_orfaos(commit=True):
+    """Remove blobs que nenhum registro referencia mais; retorna quantos foram removidos"""
+    referenciados = set()
+    for coluna in COLUNAS_COM_ARQUIVO:
+        for valor in db.session.execute(select(coluna).where(coluna.like(f'%{PREFIXO}%'))).scalars():
+            for item in (valor or '').split(','):
+                item = item.strip()
+                if eh_blob(item):
+                    referenciados.add(separar_referencia(item)[0])
+
+    orfaos = [s for s in db.session.execute(select(ArquivoBlob.sha256)).scalars() if s not in referenciados]
+    for i in range(0, len(orfaos), 500):
+        lote = orfaos[i:i + 500]
+        db.session.execute(delete(ArquivoBlobParte).where(ArquivoBlobParte.sha256.in_(lote)))
+        db.session.execute(delete(ArquivoBlob).where(ArquivoBlob.sha256.in_(lote)))
+    if commit:
+        db.session.commit()
+    return len(orfaos)
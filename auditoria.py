@@ -0,0 +1,27 @@
+"""Trilha de auditoria das operações administrativas (tabela registro_auditoria)"""
+import json
+
+from flask import has_request_context, session
+
+from extensions import db
+from models import RegistroAuditoria
+
+# Limite de ids gravados por registro (a quantidade é sempre a real)
+MAX_IDS_REGISTRADOS = 10000
+
+
+def registrar_auditoria(acao, entidade, ids=(), detalhes=None):
+    """Adiciona um registro de auditoria à sessão atual (gravado no commit da operação)"""
+    ids = sorted(ids)
+    registro = RegistroAuditoria(
+        acao=acao,
+        entidade=entidade,
+        quantidade=len(ids),
+        ids=','.join(str(i) for i in ids[:MAX_IDS_REGISTRADOS]),
+        detalhes=json.dumps(detalhes, default=str, ensure_ascii=False) if detalhes else None,
+    )
+    if has_request_context():
+        registro.usuario_id = session.get('admin_user_id')
+        registro.usuario_nome = session.get('admin_nome') or session.get('admin_username')
+    db.session.add(registro)
+    return registro
@@ -0,0 +1,57 @@
+"""Decoradores de autenticação e permissão das rotas"""
+from functools import wraps
+
+from flask import flash, redirect, session, url_for
+
+from models import Usuario
+
+
+# Decorador para proteger rotas administrativas
+def admin_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not session.get('admin_logged_in'):
+            flash('Você precisa fazer login para acessar esta página', 'error')
+            return redirect(url_for('admin_login'))
+        return f(*args, **kwargs)
+    return decorated_function
+
+def permissao_required(codigo_permissao):
+    """Decorador para verificar se o usuário tem uma permissão específica"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not session.get('admin_logged_in'):
+                flash('Você precisa fazer login para acessar esta página', 'error')
+                return redirect(url_for('admin_login'))
+            
+            usuario_id = session.get('admin_user_id')
+            if usuario_id:
+                usuario = Usuario.query.get(usuario_id)
+                if usuario and usuario.tem_permissao(codigo_permissao):
+                    return f(*args, **kwargs)
+            
+            flash('Você não tem permissão para acessar esta funcionalidade', 'error')
+            return redirect(url_for('admin_dashboard'))
+        return decorated_function
+    return decorator
+
+# Decorador para proteger rotas de associados
+def associado_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not session.get('associado_logged_in'):
+            flash('Você precisa fazer login para acessar esta página', 'error')
+            return redirect(url_for('login'))
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+def voluntario_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not session.get('voluntario_logged_in'):
+            flash('Você precisa fazer login como voluntário para acessar esta página', 'error')
+            return redirect(url_for('login'))
+        return f(*args, **kwargs)
+    return decorated_function
@@ -0,0 +1,403 @@
+"""Backups incrementais do banco, com conteúdo endereçado por hash
+
+Substituem os dumps SQL completos, que re-serializavam a cada execução todas
+as imagens em base64 e todos os PDFs. Estrutura de ``BACKUP_DIR`` (padrão:
+instance/backups):
+
+    manifestos/000001.json   um por backup; cada um guarda o sha256 do anterior (cadeia)
+    blobs/ab/abcdef...       conteúdo comprimido (gzip), nomeado pelo sha256 do conteúdo original
+
+Tudo o que o backup grava além do manifesto vai para ``blobs/``: as linhas
+exportadas de cada tabela (JSON, uma lista por linha), o conjunto de chaves
+primárias presentes (que revela as exclusões) e os valores grandes das linhas
+(base64 de imagens, PDFs, partes de arquivos), que nas linhas viram referências
+``{"$blob": sha256}``. Conteúdo que já existe não é copiado de novo: uma foto
+que não mudou ocupa espaço uma única vez, em todos os backups.
+
+Cada tabela declarada nos modelos é exportada de um destes modos:
+
+- ``marca``: tabelas com ``updated_at`` (ou só de inserção com ``created_at``):
+  linhas com a coluna maior ou igual à marca do backup anterior;
+- ``novas``: tabelas só de inserção sem data (partes de arquivos): linhas cuja
+  chave não existia no backup anterior;
+- ``digest``: as demais (alteradas sem ``updated_at``): todas as linhas são
+  lidas, mas só as que mudaram (hash da linha) são gravadas.
+
+Um backup completo (todas as linhas de todas as tabelas) é feito no primeiro
+backup, a cada ``BACKUP_COMPLETO_A_CADA`` incrementais e com ``completo=True``;
+uma tabela cujas colunas mudaram é exportada inteira. Alterações em massa que
+não atualizam ``updated_at`` só entram no próximo completo.
+
+``verificar_backups`` confere a cadeia de manifestos e o hash de cada blob.
+
+Variáveis de ambiente:
+
+    BACKUP_DIR              diretório dos backups (padrão: instance/backups)
+    BACKUP_COMPLETO_A_CADA  backups incrementais entre dois completos (padrão: 7)
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime, time as dtime
+from decimal import Decimal
+
+from flask import current_app
+from sqlalchemy import func, inspect, select, tuple_
+
+from extensions import db
+
+VERSAO_FORMATO = 1
+
+# Valores (texto ou binário) a partir deste tamanho são guardados como blob
+TAMANHO_MINIMO_BLOB = 4096
+
+# Tabelas em que as linhas só são inseridas (nunca alteradas)
+SOMENTE_INSERCAO = {'registro_auditoria', 'arquivo_blob', 'arquivo_blob_parte'}
+
+
+def diretorio_backups(app=None):
+    app = app or current_app
+    return app.config.get('BACKUP_DIR') or os.path.join(app.instance_path, 'backups')
+
+
+def completo_a_cada():
+    try:
+        return max(int(os.environ.get('BACKUP_COMPLETO_A_CADA', '7')), 0)
+    except ValueError:
+        return 7
+
+
+# ============================================
+# BLOBS
+# ============================================
+
+class Blobs:
+    """Armazenamento por conteúdo: ``gravar`` devolve o sha256 e só escreve o que é novo"""
+
+    def __init__(self, diretorio, simular=False):
+        self.diretorio = os.path.join(diretorio, 'blobs')
+        self.simular = simular
+        self.novos = 0
+        self.bytes_novos = 0
+        self._conhecidos = set()
+
+    def caminho(self, sha256):
+        return os.path.join(self.diretorio, sha256[:2], sha256)
+
+    def existe(self, sha256):
+        return sha256 in self._conhecidos or os.path.exists(self.caminho(sha256))
+
+    def gravar(self, dados):
+        sha256 = hashlib.sha256(dados).hexdigest()
+        if self.existe(sha256):
+            return sha256
+        self._conhecidos.add(sha256)
+        self.novos += 1
+        if self.simular:
+            self.bytes_novos += len(gzip.compress(dados, compresslevel=6))
+            return sha256
+        caminho = self.caminho(sha256)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        temporario = f'{caminho}.{os.getpid()}.tmp'
+        with gzip.open(temporario, 'wb', compresslevel=6) as f:
+            f.write(dados)
+        self.bytes_novos += os.path.getsize(temporario)
+        os.replace(temporario, caminho)
+        return sha256
+
+    def ler(self, sha256):
+        with gzip.open(self.caminho(sha256), 'rb') as f:
+            return f.read()
+
+    def gravar_json(self, valor):
+        return self.gravar(json.dumps(valor, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+    def ler_json(self, sha256):
+        return json.loads(self.ler(sha256))
+
+
+# ============================================
+# SERIALIZAÇÃO
+# ============================================
+
+def valor_json(valor, blobs):
+    """Valor de coluna -> JSON (valores grandes viram referência a blob)"""
+    if isinstance(valor, memoryview):
+        valor = bytes(valor)
+    if isinstance(valor, (str, bytes)) and len(valor) >= TAMANHO_MINIMO_BLOB:
+        if isinstance(valor, str):
+            return {'$blob': blobs.gravar(valor.encode('utf-8')), 'tipo': 'str'}
+        return {'$blob': blobs.gravar(valor), 'tipo': 'bytes'}
+    if isinstance(valor, bytes):
+        return {'$bytes': base64.b64encode(valor).decode('ascii')}
+    if isinstance(valor, (datetime, date, dtime)):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return str(valor)
+    return valor
+
+
+def _chave(valores):
+    return json.dumps([valor_json(v, None) for v in valores], separators=(',', ':'))
+
+
+def _digest(linha):
+    return hashlib.sha256(json.dumps(linha, separators=(',', ':'), ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+def modo_tabela(tabela):
+    """(modo, coluna da marca) da tabela"""
+    if 'updated_at' in tabela.c:
+        return 'marca', 'updated_at'
+    if tabela.name in SOMENTE_INSERCAO:
+        return ('marca', 'created_at') if 'created_at' in tabela.c else ('novas', None)
+    return 'digest', None
+
+
+def tabelas_do_banco(conn):
+    """[(tabela, [colunas])] declaradas nos modelos e existentes no banco, em ordem de dependência"""
+    inspector = inspect(conn)
+    existentes = set(inspector.get_table_names())
+    resultado = []
+    for tabela in db.metadata.sorted_tables:
+        if tabela.name not in existentes or not tabela.primary_key.columns:
+            continue
+        no_banco = {c['name'] for c in inspector.get_columns(tabela.name)}
+        resultado.append((tabela, [c.name for c in tabela.columns if c.name in no_banco]))
+    return resultado
+
+
+# ============================================
+# MANIFESTOS
+# ============================================
+
+def _caminho_manifesto(diretorio, numero):
+    return os.path.join(diretorio, 'manifestos', f'{numero:06d}.json')
+
+
+def numeros_manifestos(diretorio):
+    pasta = os.path.join(diretorio, 'manifestos')
+    if not os.path.isdir(pasta):
+        return []
+    return sorted(int(n[:-5]) for n in os.listdir(pasta) if n.endswith('.json') and n[:-5].isdigit())
+
+
+def ler_manifesto(diretorio, numero):
+    """(manifesto, sha256 do arquivo)"""
+    with open(_caminho_manifesto(diretorio, numero), 'rb') as f:
+        dados = f.read()
+    return json.loads(dados), hashlib.sha256(dados).hexdigest()
+
+
+# ============================================
+# BACKUP
+# ============================================
+
+def _linhas(conn, tabela, colunas, condicao=None, lote=500):
+    stmt = select(*[tabela.c[c] for c in colunas])
+    if condicao is not None:
+        stmt = stmt.where(condicao)
+    return conn.execute(stmt.execution_options(yield_per=lote))
+
+
+def _exportar_tabela(conn, tabela, colunas, anterior, blobs, lote):
+    """Exporta as linhas novas/alteradas da tabela; retorna a entrada do manifesto"""
+    modo, coluna_marca = modo_tabela(tabela)
+    chave_cols = [c.name for c in tabela.primary_key.columns]
+    indices_chave = [colunas.index(c) for c in chave_cols]
+    completa = anterior is None or anterior['colunas'] != colunas or anterior['modo'] != modo
+    entrada = {'colunas': colunas, 'chave': chave_cols, 'modo': modo, 'completa': completa, 'marca': None}
+
+    linhas = []
+    if modo == 'digest':
+        digests_anteriores = {} if completa else blobs.ler_json(anterior['chaves'])
+        digests = {}
+        for linha in _linhas(conn, tabela, colunas, lote=lote):
+            valores = [valor_json(v, blobs) for v in linha]
+            chave = _chave([linha[i] for i in indices_chave])
+            digests[chave] = _digest(valores)
+            if digests_anteriores.get(chave) != digests[chave]:
+                linhas.append(valores)
+        entrada['chaves'] = blobs.gravar_json(digests)
+        entrada['total'] = len(digests)
+    else:
+        chaves = sorted(
+            _chave(linha) for linha in conn.execute(select(*[tabela.c[c] for c in chave_cols]))
+        )
+        entrada['chaves'] = blobs.gravar_json(chaves)
+        entrada['total'] = len(chaves)
+
+        if modo == 'marca':
+            coluna = tabela.c[coluna_marca]
+            # Marca lida antes das linhas: o que for alterado durante o backup entra no próximo
+            marca = conn.execute(select(func.max(coluna))).scalar()
+            entrada['marca'] = valor_json(marca, blobs) if marca is not None else None
+            condicao = None
+            if not completa and anterior.get('marca'):
+                condicao = coluna >= datetime.fromisoformat(anterior['marca'])
+            for linha in _linhas(conn, tabela, colunas, condicao, lote):
+                linhas.append([valor_json(v, blobs) for v in linha])
+        else:
+            anteriores = set() if completa else set(blobs.ler_json(anterior['chaves']))
+            novas = [json.loads(c) for c in chaves if c not in anteriores]
+            colunas_chave = tuple_(*[tabela.c[c] for c in chave_cols]) if len(chave_cols) > 1 else tabela.c[chave_cols[0]]
+            for i in range(0, len(novas), lote):
+                parte = [tuple(c) for c in novas[i:i + lote]] if len(chave_cols) > 1 else [c[0] for c in novas[i:i + lote]]
+                for linha in _linhas(conn, tabela, colunas, colunas_chave.in_(parte), lote):
+                    linhas.append([valor_json(v, blobs) for v in linha])
+
+    entrada['linhas'] = len(linhas)
+    entrada['dados'] = blobs.gravar_json(linhas) if linhas else None
+    return entrada
+
+
+def fazer_backup(completo=False, simular=False, lote=500, progresso=None):
+    """Grava um backup (incremental ou completo); retorna o resumo
+
+    ``progresso(tabela, linhas)`` é chamado depois de cada tabela.
+    """
+    inicio = time.perf_counter()
+    diretorio = diretorio_backups()
+    blobs = Blobs(diretorio, simular)
+
+    numeros = numeros_manifestos(diretorio)
+    anterior, sha_anterior = (None, None)
+    if numeros:
+        try:
+            anterior, sha_anterior = ler_manifesto(diretorio, numeros[-1])
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Manifesto {numeros[-1]} ilegível ({e}); fazendo backup completo")
+    if anterior is None or anterior.get('versao') != VERSAO_FORMATO:
+        completo = True
+    elif anterior['desde_completo'] + 1 > completo_a_cada():
+        completo = True
+
+    # No PostgreSQL todas as tabelas são lidas do mesmo instantâneo
+    opcoes = {'isolation_level': 'REPEATABLE READ'} if db.engine.dialect.name == 'postgresql' else {}
+    conn = db.session.connection(execution_options=opcoes)
+    tabelas = {}
+    try:
+        for tabela, colunas in tabelas_do_banco(conn):
+            tabela_anterior = None if completo else anterior['tabelas'].get(tabela.name)
+            tabelas[tabela.name] = _exportar_tabela(conn, tabela, colunas, tabela_anterior, blobs, lote)
+            if progresso:
+                progresso(tabela.name, tabelas[tabela.name]['linhas'])
+    finally:
+        db.session.rollback()
+
+    numero = (numeros[-1] if numeros else 0) + 1
+    manifesto = {
+        'versao': VERSAO_FORMATO,
+        'numero': numero,
+        'tipo': 'completo' if completo else 'incremental',
+        'desde_completo': 0 if completo else anterior['desde_completo'] + 1,
+        'anterior': {'numero': numeros[-1], 'sha256': sha_anterior} if sha_anterior else None,
+        'criado_em': datetime.now().isoformat(timespec='seconds'),
+        'banco': db.engine.dialect.name,
+        'tabelas': tabelas,
+    }
+    if not simular:
+        caminho = _caminho_manifesto(diretorio, numero)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        temporario = f'{caminho}.{os.getpid()}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(manifesto, f, ensure_ascii=False, sort_keys=True, indent=1)
+        os.replace(temporario, caminho)
+
+    return {
+        'numero': numero,
+        'tipo': manifesto['tipo'],
+        'diretorio': diretorio,
+        'tabelas': len(tabelas),
+        'linhas': sum(t['linhas'] for t in tabelas.values()),
+        'blobs_novos': blobs.novos,
+        'bytes_novos': blobs.bytes_novos,
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+# ============================================
+# VERIFICAÇÃO
+# ============================================
+
+def _referencias(valores):
+    for valor in valores:
+        if isinstance(valor, dict) and '$blob' in valor:
+            yield valor['$blob']
+
+
+def verificar_backups(rapido=False, progresso=None):
+    """Confere a cadeia de manifestos e os blobs; retorna (resumo, erros)
+
+    Com ``rapido=True`` só confere se os blobs existem, sem descomprimir e
+    recalcular o hash de cada um. ``progresso(numero, erros)`` é chamado a cada manifesto.
+    """
+    diretorio = diretorio_backups()
+    blobs = Blobs(diretorio)
+    erros = []
+    conferidos = {}
+
+    def conferir(sha256, origem):
+        if sha256 not in conferidos:
+            if not os.path.exists(blobs.caminho(sha256)):
+                conferidos[sha256] = 'ausente'
+            elif rapido:
+                conferidos[sha256] = None
+            else:
+                try:
+                    conferidos[sha256] = None if hashlib.sha256(blobs.ler(sha256)).hexdigest() == sha256 else 'corrompido'
+                except (OSError, EOFError, gzip.BadGzipFile) as e:
+                    conferidos[sha256] = f'ilegível ({e})'
+        if conferidos[sha256]:
+            erros.append(f'{origem}: blob {sha256[:12]} {conferidos[sha256]}')
+        return not conferidos[sha256]
+
+    numeros = numeros_manifestos(diretorio)
+    anterior = None
+    for numero in numeros:
+        antes = len(erros)
+        try:
+            manifesto, sha256 = ler_manifesto(diretorio, numero)
+        except (OSError, ValueError) as e:
+            erros.append(f'manifesto {numero}: ilegível ({e})')
+            anterior = None
+            continue
+
+        elo = manifesto.get('anterior')
+        if manifesto.get('numero') != numero:
+            erros.append(f'manifesto {numero}: número interno {manifesto.get("numero")}')
+        if elo and (anterior is None or elo != {'numero': anterior[0], 'sha256': anterior[1]}):
+            erros.append(f'manifesto {numero}: não corresponde ao manifesto anterior ({elo["numero"]})')
+        elif not elo and manifesto.get('tipo') != 'completo':
+            erros.append(f'manifesto {numero}: incremental sem manifesto anterior')
+
+        for nome, tabela in manifesto.get('tabelas', {}).items():
+            origem = f'manifesto {numero}, {nome}'
+            conferir(tabela['chaves'], origem)
+            if tabela['dados'] and conferir(tabela['dados'], origem) and not rapido:
+                for linha in blobs.ler_json(tabela['dados']):
+                    for referencia in _referencias(linha):
+                        conferir(referencia, origem)
+        anterior = (numero, sha256)
+        if progresso:
+            progresso(numero, len(erros) - antes)
+
+    resumo = {
+        'diretorio': diretorio,
+        'manifestos': len(numeros),
+        'blobs': len(conferidos),
+        'ultimo_completo': max(
+            (n for n in numeros if _tipo(diretorio, n) == 'completo'), default=None,
+        ),
+    }
+    return resumo, erros
+
+
+def _tipo(diretorio, numero):
+    try:
+        return ler_manifesto(diretorio, numero)[0].get('tipo')
+    except (OSError, ValueError):
+        return None
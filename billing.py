@@ -0,0 +1,178 @@
+"""Geração de mensalidades dos associados e operações em lote sobre mensalidades"""
+from datetime import date
+
+from sqlalchemy import delete, select, update
+
+from auditoria import registrar_auditoria
+from calendario import cronograma_inicial, data_base_associado, proximo_vencimento
+from extensions import db
+from models import Associado, Mensalidade
+from saldos import LOTE_IDS, recalcular_saldos
+
+# Dia de vencimento das mensalidades geradas pela rotina mensal automática
+DIA_VENCIMENTO_AUTOMATICO = 10
+
+
+def nova_mensalidade(associado, mes, ano, data_vencimento, valor_final=None):
+    """Mensalidade pendente com o valor e o desconto atuais do associado (não adiciona à sessão)"""
+    return Mensalidade(
+        associado_id=associado.id,
+        valor_base=float(associado.valor_mensalidade),
+        desconto_tipo=associado.desconto_tipo,
+        desconto_valor=float(associado.desconto_valor) if associado.desconto_valor else 0.0,
+        valor_final=associado.calcular_valor_final() if valor_final is None else valor_final,
+        mes_referencia=mes,
+        ano_referencia=ano,
+        data_vencimento=data_vencimento,
+        status='pendente'
+    )
+
+
+def gerar_primeira_mensalidade(associado):
+    """
+    Gera mensalidades para 1 ano (12 meses) para um associado recém-cadastrado ou aprovado
+    - Primeira mensalidade: vencimento em 3 dias úteis após cadastro/aprovação
+    - Próximas 11 mensalidades: vencimento fixo no mesmo dia do mês do cadastro/aprovação
+    (datas calculadas por ``calendario.cronograma_inicial``)
+    """
+    # Verificar se é Associado Regular (não paga mensalidade)
+    if associado.tipo_associado == 'regular':
+        return  # Associados Regulares não pagam mensalidade
+    
+    # Verificar se já existe alguma mensalidade para este associado
+    mensalidade_existente = Mensalidade.query.filter_by(associado_id=associado.id).first()
+    if mensalidade_existente:
+        return  # Já existe mensalidade, não gerar
+    
+    # Verificar se o associado tem valor de mensalidade configurado
+    if not associado.valor_mensalidade or associado.valor_mensalidade <= 0:
+        return  # Não tem valor configurado, não gerar
+    
+    valor_final = associado.calcular_valor_final()
+    for mes, ano, data_vencimento in cronograma_inicial(data_base_associado(associado)):
+        db.session.add(nova_mensalidade(associado, mes, ano, data_vencimento, valor_final))
+    
+    db.session.commit()
+
+def gerar_mensalidades_automaticas(simular=False, lote=None, progresso=None):
+    """Gera mensalidades automaticamente para todos os associados ativos
+
+    Com ``simular=True`` só conta as mensalidades que seriam geradas. ``lote``
+    confirma a transação a cada N mensalidades (padrão: um único commit) e
+    ``progresso(feitas, total)`` é chamado depois de cada commit.
+    """
+    hoje = date.today()
+    mes_atual = hoje.month
+    ano_atual = hoje.year
+    # Vencimento no dia 10 (se o dia 10 já passou, no dia 10 do próximo mês)
+    data_vencimento = proximo_vencimento(hoje, DIA_VENCIMENTO_AUTOMATICO)
+    
+    # Buscar todos os associados aprovados, ativos, Contribuintes (não Regulares) com valor de mensalidade definido
+    associados = Associado.query.filter_by(
+        status='aprovado',
+        ativo=True,
+        tipo_associado='contribuinte'
+    ).filter(Associado.valor_mensalidade > 0).all()
+    
+    # Associados que já têm mensalidade deste mês/ano (uma consulta para todos)
+    ja_gerados = set(db.session.execute(
+        select(Mensalidade.associado_id).where(
+            Mensalidade.mes_referencia == mes_atual, Mensalidade.ano_referencia == ano_atual,
+        )
+    ).scalars())
+    
+    pendentes = [associado for associado in associados if associado.id not in ja_gerados]
+    if simular or not pendentes:
+        return len(pendentes)
+    
+    lote = lote or len(pendentes)
+    for i in range(0, len(pendentes), lote):
+        for associado in pendentes[i:i + lote]:
+            db.session.add(nova_mensalidade(associado, mes_atual, ano_atual, data_vencimento))
+        db.session.commit()
+        if progresso:
+            progresso(min(i + lote, len(pendentes)), len(pendentes))
+    
+    return len(pendentes)
+
+
+# ============================================
+# OPERAÇÕES EM LOTE (UPDATE/DELETE por conjunto)
+# ============================================
+
+def ids_validos(valores):
+    """Converte os ids enviados pelo formulário em um conjunto de inteiros (ignora inválidos)"""
+    ids = set()
+    for valor in valores:
+        try:
+            ids.add(int(valor))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def _executar_em_lote(montar_stmt, ids):
+    """Executa o UPDATE/DELETE em fatias de LOTE_IDS ids
+
+    Retorna as linhas afetadas como pares (id, associado_id), usando RETURNING
+    quando o banco suporta.
+    """
+    tabela = Mensalidade.__table__
+    conn = db.session.connection()
+    afetadas = []
+    ids = sorted(ids)
+    for i in range(0, len(ids), LOTE_IDS):
+        stmt = montar_stmt(ids[i:i + LOTE_IDS])
+        suporta_returning = conn.dialect.delete_returning if stmt.is_delete else conn.dialect.update_returning
+        if suporta_returning:
+            afetadas.extend(conn.execute(stmt.returning(tabela.c.id, tabela.c.associado_id)).all())
+        else:
+            afetadas.extend(conn.execute(select(tabela.c.id, tabela.c.associado_id).where(stmt.whereclause)).all())
+            conn.execute(stmt)
+    return afetadas
+
+
+def _concluir_lote(acao, afetadas, detalhes=None):
+    conn = db.session.connection()
+    recalcular_saldos(conn, {associado_id for _, associado_id in afetadas})
+    registrar_auditoria(acao, 'mensalidade', [mensalidade_id for mensalidade_id, _ in afetadas], detalhes)
+    return len(afetadas)
+
+
+def marcar_pagas_em_lote(ids, data_pagamento, observacoes=None):
+    """Marca como pagas as mensalidades não pagas dentre ``ids``; retorna quantas mudaram
+
+    Não faz commit: o chamador confirma a transação (mensalidades, saldos e auditoria juntos).
+    """
+    tabela = Mensalidade.__table__
+    valores = {'status': 'paga', 'data_pagamento': data_pagamento}
+    if observacoes:
+        valores['observacoes'] = observacoes
+    afetadas = _executar_em_lote(
+        lambda lote: update(tabela).where(tabela.c.id.in_(lote), tabela.c.status != 'paga').values(**valores),
+        ids,
+    )
+    return _concluir_lote('mensalidade.marcar_paga', afetadas,
+                          {'data_pagamento': data_pagamento, 'observacoes': observacoes or None})
+
+
+def cancelar_em_lote(ids):
+    """Cancela as mensalidades pendentes dentre ``ids``; retorna quantas mudaram"""
+    tabela = Mensalidade.__table__
+    afetadas = _executar_em_lote(
+        lambda lote: update(tabela).where(
+            tabela.c.id.in_(lote), tabela.c.status.notin_(['paga', 'cancelada'])
+        ).values(status='cancelada'),
+        ids,
+    )
+    return _concluir_lote('mensalidade.cancelar', afetadas)
+
+
+def excluir_em_lote(ids):
+    """Exclui as mensalidades não pagas dentre ``ids``; retorna quantas foram excluídas"""
+    tabela = Mensalidade.__table__
+    afetadas = _executar_em_lote(
+        lambda lote: delete(tabela).where(tabela.c.id.in_(lote), tabela.c.status != 'paga'),
+        ids,
+    )
+    return _concluir_lote('mensalidade.excluir', afetadas)
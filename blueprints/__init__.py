@@ -0,0 +1,12 @@
+"""Blueprints da aplicação registrados por ``app.create_app``"""
+
+
+def register_blueprints(app):
+    from blueprints import admin_sistema, api, api_v1, arquivos, exportacoes, seo
+
+    app.register_blueprint(admin_sistema.bp)
+    app.register_blueprint(api.bp)
+    app.register_blueprint(api_v1.bp)
+    app.register_blueprint(arquivos.bp)
+    app.register_blueprint(exportacoes.bp)
+    app.register_blueprint(seo.bp)
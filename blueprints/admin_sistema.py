@@ -0,0 +1,62 @@
+"""Rotas administrativas de diagnóstico do sistema"""
+from flask import Blueprint, abort, current_app, jsonify, render_template, request, send_from_directory
+
+from auth import admin_required
+from database import pool_stats
+from extensions import db
+
+bp = Blueprint('admin_sistema', __name__, url_prefix='/admin/sistema')
+
+
+@bp.route('/db-pool')
+@admin_required
+def db_pool():
+    """Métricas do pool de conexões deste worker (checkouts, espera, overflow)"""
+    return jsonify(pool_stats(db))
+
+
+@bp.route('/indices')
+@admin_required
+def indices():
+    """Uso dos índices e planos das consultas quentes (?formato=json para JSON)"""
+    from indices import relatorio
+
+    dados = relatorio()
+    if request.args.get('formato') == 'json':
+        return jsonify(dados)
+    return render_template('admin/sistema_indices.html', **dados)
+
+
+@bp.route('/limitador')
+@admin_required
+def limitador():
+    """Limites de requisições e contadores de permitidas/bloqueadas (?formato=json para JSON)"""
+    limitador = current_app.extensions.get('limitador')
+    dados = limitador.relatorio() if limitador else None
+    if request.args.get('formato') == 'json':
+        return jsonify(dados)
+    return render_template('admin/sistema_limitador.html', dados=dados)
+
+
+@bp.route('/perfis')
+@admin_required
+def perfis():
+    """Perfis de requisições gravados pelo perfilador (?formato=json para JSON)"""
+    perfilador = current_app.extensions.get('perfilador')
+    dados = perfilador.listar() if perfilador else None
+    if request.args.get('formato') == 'json':
+        return jsonify(dados)
+    return render_template('admin/sistema_perfis.html', perfis=dados, perfilador=perfilador)
+
+
+@bp.route('/perfis/<perfil_id>')
+@admin_required
+def perfil(perfil_id):
+    """Funções mais caras do perfil; ?baixar=1 baixa o arquivo (.prof ou pilhas collapsed)"""
+    perfilador = current_app.extensions.get('perfilador')
+    perfil = perfilador.carregar(perfil_id) if perfilador else None
+    if perfil is None:
+        abort(404)
+    if request.args.get('baixar'):
+        return send_from_directory(perfilador.diretorio, perfil['arquivo'], as_attachment=True)
+    return render_template('admin/sistema_perfil.html', perfil=perfil, resumo=perfilador.resumo(perfil))
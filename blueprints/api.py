@@ -0,0 +1,34 @@
+"""API JSON pública"""
+from flask import Blueprint, jsonify
+
+from models import ReunionPresencial, ReunionVirtual
+
+bp = Blueprint('api', __name__, url_prefix='/api')
+
+
+# API endpoints para obtener datos
+@bp.route('/reuniones-presenciales')
+def api_reuniones_presenciales():
+    reuniones = ReunionPresencial.query.order_by(ReunionPresencial.fecha.asc()).all()
+    return jsonify([{
+        'id': r.id,
+        'titulo': r.titulo,
+        'descripcion': r.descripcion,
+        'fecha': r.fecha.strftime('%Y-%m-%d'),
+        'hora': r.hora,
+        'lugar': r.lugar,
+        'direccion': r.direccion
+    } for r in reuniones])
+
+@bp.route('/reuniones-virtuales')
+def api_reuniones_virtuales():
+    reuniones = ReunionVirtual.query.order_by(ReunionVirtual.fecha.asc()).all()
+    return jsonify([{
+        'id': r.id,
+        'titulo': r.titulo,
+        'descripcion': r.descripcion,
+        'fecha': r.fecha.strftime('%Y-%m-%d'),
+        'hora': r.hora,
+        'plataforma': r.plataforma,
+        'link': r.link
+    } for r in reuniones])
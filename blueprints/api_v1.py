@@ -0,0 +1,383 @@
+"""API pública de leitura, versionada (/api/v1)
+
+Coleções: informativos, projetos, acoes, eventos, agenda/presencial,
+agenda/virtual, radio e galeria.
+
+Parâmetros comuns (query string):
+
+    limit    itens por página (padrão 20, máximo 100)
+    cursor   valor de ``next_cursor`` da página anterior (paginação keyset)
+    fields   campos separados por vírgula, dentre os públicos da coleção
+    desde    data inicial AAAA-MM-DD (inclusive)
+    ate      data final AAAA-MM-DD (inclusive)
+
+Cada coleção aceita ainda filtros de igualdade próprios (ex.: ``tipo`` em
+informativos). As consultas selecionam apenas colunas públicas: imagens e PDFs
+em base64 nunca são lidos; no lugar deles vai ``imagem_url``.
+
+A resposta traz um ETag fraco calculado a partir de max(updated_at) e da
+contagem do conjunto filtrado (uma única consulta agregada). Se o cliente
+manda o mesmo ETag em If-None-Match, a resposta é 304 sem buscar a página.
+"""
+import base64
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, jsonify, make_response, request, url_for
+from sqlalchemy import and_, func, or_, select
+
+from extensions import db
+from models import (
+    Acao, Album, Evento, Informativo, Projeto, RadioPrograma, ReunionPresencial, ReunionVirtual,
+)
+
+bp = Blueprint('api_v1', __name__, url_prefix='/api/v1')
+
+LIMIT_PADRAO = 20
+LIMIT_MAXIMO = 100
+CACHE_CONTROL = 'public, max-age=60'
+
+
+class ErroParametro(ValueError):
+    pass
+
+
+class Colecao:
+    """Descrição de uma coleção publicada pela API
+
+    ``ordem`` é a coluna da ordenação principal (o id desempata e fecha a chave
+    do cursor); ``campo_data`` é a coluna usada por ``desde``/``ate``.
+    ``rota_imagem`` é o endpoint que serve a imagem (base64 ou arquivo); sem
+    ele, ``imagem_url`` aponta para o arquivo em static.
+    """
+
+    def __init__(self, model, campos, ordem, campo_data, descendente=True,
+                 filtros=(), filtro_base=None, coluna_imagem=None, rota_imagem=None):
+        self.model = model
+        self.campos = campos
+        self.ordem = ordem
+        self.campo_data = campo_data
+        self.descendente = descendente
+        self.filtros = filtros
+        self.filtro_base = filtro_base
+        self.rota_imagem = rota_imagem
+        self.coluna_imagem = coluna_imagem
+
+    def coluna(self, nome):
+        return getattr(self.model, nome)
+
+    def expressao_ordem(self):
+        coluna = self.coluna(self.ordem)
+        # Colunas anuláveis (ordem) entram na chave como 0 para o cursor ser total
+        if coluna.nullable and coluna.type.python_type is int:
+            return func.coalesce(coluna, 0)
+        return coluna
+
+    def versao(self):
+        """Expressão do "última alteração" de cada linha"""
+        updated_at = getattr(self.model, 'updated_at', None)
+        if updated_at is None:
+            return self.model.created_at
+        return func.coalesce(updated_at, self.model.created_at)
+
+
+COLECOES = {
+    'informativos': Colecao(
+        Informativo,
+        ('id', 'tipo', 'titulo', 'slug', 'subtitulo', 'conteudo', 'url_soundcloud',
+         'descricao_imagem', 'data_publicacao', 'created_at', 'updated_at'),
+        ordem='data_publicacao', campo_data='data_publicacao',
+        filtros=('tipo',), coluna_imagem='imagem', rota_imagem='informativo_imagem',
+    ),
+    'projetos': Colecao(
+        Projeto,
+        ('id', 'titulo', 'slug', 'descripcion', 'identificacao', 'objetivos', 'publico_alvo',
+         'resultados_esperados', 'descricao_imagem', 'estado', 'data_inicio', 'data_fim',
+         'created_at', 'updated_at'),
+        # data_inicio é opcional; a ordem segue o cadastro
+        ordem='id', campo_data='data_inicio',
+        filtros=('estado',), coluna_imagem='imagen', rota_imagem='projeto_imagem',
+    ),
+    'acoes': Colecao(
+        Acao,
+        ('id', 'titulo', 'slug', 'descricao', 'data', 'categoria', 'descricao_imagem',
+         'created_at', 'updated_at'),
+        ordem='data', campo_data='data',
+        filtros=('categoria',), coluna_imagem='imagem', rota_imagem='acao_imagem',
+    ),
+    'eventos': Colecao(
+        Evento,
+        ('id', 'titulo', 'slug', 'descricao', 'data', 'hora', 'local', 'endereco', 'tipo',
+         'link', 'descricao_imagem', 'created_at', 'updated_at'),
+        ordem='data', campo_data='data', filtros=('tipo',), coluna_imagem='imagem',
+    ),
+    'agenda/presencial': Colecao(
+        ReunionPresencial,
+        ('id', 'titulo', 'slug', 'descripcion', 'fecha', 'hora', 'lugar', 'direccion',
+         'created_at', 'updated_at'),
+        ordem='fecha', campo_data='fecha', descendente=False,
+    ),
+    'agenda/virtual': Colecao(
+        ReunionVirtual,
+        ('id', 'titulo', 'slug', 'descripcion', 'fecha', 'hora', 'plataforma', 'link',
+         'created_at', 'updated_at'),
+        ordem='fecha', campo_data='fecha', descendente=False,
+    ),
+    'radio': Colecao(
+        RadioPrograma,
+        ('id', 'nome', 'descricao', 'apresentador', 'horario', 'url_streaming', 'url_arquivo',
+         'descricao_imagem', 'ordem', 'created_at', 'updated_at'),
+        ordem='ordem', campo_data='created_at', descendente=False,
+        filtro_base=lambda: RadioPrograma.ativo.is_(True),
+        coluna_imagem='imagem', rota_imagem='radio_programa_imagem',
+    ),
+    'galeria': Colecao(
+        Album,
+        ('id', 'titulo_pt', 'titulo_es', 'titulo_en', 'descricao_pt', 'descricao_es',
+         'descricao_en', 'ordem', 'created_at', 'updated_at'),
+        ordem='ordem', campo_data='created_at', descendente=False, coluna_imagem='capa',
+    ),
+}
+
+
+# ============================================
+# PARÂMETROS
+# ============================================
+
+def _parse_limit():
+    valor = request.args.get('limit')
+    if not valor:
+        return LIMIT_PADRAO
+    try:
+        limit = int(valor)
+    except ValueError:
+        raise ErroParametro('limit deve ser um número inteiro')
+    return max(1, min(limit, LIMIT_MAXIMO))
+
+
+def _parse_fields(colecao):
+    valor = request.args.get('fields')
+    if not valor:
+        return list(colecao.campos)
+    pedidos = [c.strip() for c in valor.split(',') if c.strip()]
+    invalidos = [c for c in pedidos if c not in colecao.campos]
+    if invalidos:
+        raise ErroParametro('campos desconhecidos: ' + ', '.join(invalidos))
+    # id é sempre devolvido (identifica o item e compõe o cursor)
+    return ['id'] + [c for c in pedidos if c != 'id']
+
+
+def _parse_data(nome):
+    valor = request.args.get(nome)
+    if not valor:
+        return None
+    try:
+        return date.fromisoformat(valor)
+    except ValueError:
+        raise ErroParametro(f'{nome} deve estar no formato AAAA-MM-DD')
+
+
+def _encode_cursor(valor_ordem, item_id):
+    if isinstance(valor_ordem, (date, datetime)):
+        valor_ordem = valor_ordem.isoformat()
+    bruto = json.dumps([valor_ordem, item_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(bruto).decode().rstrip('=')
+
+
+def _decode_cursor(colecao):
+    valor = request.args.get('cursor')
+    if not valor:
+        return None
+    try:
+        bruto = base64.urlsafe_b64decode(valor + '=' * (-len(valor) % 4))
+        valor_ordem, item_id = json.loads(bruto)
+        tipo = colecao.coluna(colecao.ordem).type.python_type
+        if tipo is datetime:
+            valor_ordem = datetime.fromisoformat(valor_ordem)
+        elif tipo is date:
+            valor_ordem = date.fromisoformat(valor_ordem)
+        elif valor_ordem is not None:
+            valor_ordem = int(valor_ordem)
+        return valor_ordem, int(item_id)
+    except (ValueError, TypeError):
+        raise ErroParametro('cursor inválido')
+
+
+# ============================================
+# CONSULTAS
+# ============================================
+
+def _filtros(colecao):
+    """Condições do conjunto (sem o cursor), usadas pelo ETag e pela página"""
+    condicoes = []
+    if colecao.filtro_base is not None:
+        condicoes.append(colecao.filtro_base())
+
+    for nome in colecao.filtros:
+        valor = request.args.get(nome)
+        if valor:
+            condicoes.append(colecao.coluna(nome) == valor)
+
+    coluna_data = colecao.coluna(colecao.campo_data)
+    com_hora = coluna_data.type.python_type is datetime
+    desde = _parse_data('desde')
+    ate = _parse_data('ate')
+    if desde:
+        condicoes.append(coluna_data >= (datetime.combine(desde, datetime.min.time()) if com_hora else desde))
+    if ate:
+        if com_hora:
+            condicoes.append(coluna_data < datetime.combine(ate + timedelta(days=1), datetime.min.time()))
+        else:
+            condicoes.append(coluna_data <= ate)
+    return condicoes
+
+
+def _condicao_cursor(colecao, cursor):
+    valor_ordem, item_id = cursor
+    ordem = colecao.expressao_ordem()
+    id_col = colecao.model.id
+    if colecao.ordem == 'id':
+        return id_col < item_id if colecao.descendente else id_col > item_id
+    if colecao.descendente:
+        return or_(ordem < valor_ordem, and_(ordem == valor_ordem, id_col < item_id))
+    return or_(ordem > valor_ordem, and_(ordem == valor_ordem, id_col > item_id))
+
+
+def _calcular_etag(nome, colecao, condicoes):
+    total, ultima_alteracao = db.session.execute(
+        select(func.count(colecao.model.id), func.max(colecao.versao())).where(*condicoes)
+    ).one()
+    # A página depende também dos parâmetros (cursor, fields, limit)
+    parametros = sorted(request.args.items(multi=True))
+    chave = json.dumps([nome, str(ultima_alteracao), total, parametros], default=str)
+    return hashlib.sha1(chave.encode()).hexdigest()[:32], total
+
+
+def _buscar_pagina(colecao, campos, condicoes, cursor, limit):
+    ordem = colecao.expressao_ordem()
+    colunas = [colecao.coluna(c) for c in campos]
+    if colecao.coluna_imagem:
+        colunas.append(colecao.coluna(colecao.coluna_imagem).label('_imagem'))
+    colunas.append(ordem.label('_ordem'))
+
+    if cursor is not None:
+        condicoes = condicoes + [_condicao_cursor(colecao, cursor)]
+
+    if colecao.descendente:
+        order_by = [ordem.desc(), colecao.model.id.desc()]
+    else:
+        order_by = [ordem.asc(), colecao.model.id.asc()]
+
+    return db.session.execute(
+        select(*colunas).where(*condicoes).order_by(*order_by).limit(limit + 1)
+    ).all()
+
+
+def _serializar(colecao, campos, linha):
+    item = {}
+    for campo in campos:
+        valor = getattr(linha, campo)
+        if isinstance(valor, (date, datetime)):
+            valor = valor.isoformat()
+        item[campo] = valor
+
+    if colecao.coluna_imagem:
+        imagem = linha._imagem
+        if imagem and colecao.rota_imagem:
+            item['imagem_url'] = url_for(colecao.rota_imagem, id=linha.id)
+        elif imagem and not imagem.startswith('base64:'):
+            item['imagem_url'] = url_for('static', filename=imagem)
+        else:
+            item['imagem_url'] = None
+    return item
+
+
+def _erro(mensagem, status=400):
+    return jsonify({'erro': mensagem}), status
+
+
+def _listar(nome):
+    colecao = COLECOES[nome]
+    try:
+        limit = _parse_limit()
+        campos = _parse_fields(colecao)
+        cursor = _decode_cursor(colecao)
+        condicoes = _filtros(colecao)
+    except ErroParametro as e:
+        return _erro(str(e))
+
+    etag, total = _calcular_etag(nome, colecao, condicoes)
+    if request.if_none_match.contains_weak(etag):
+        resposta = make_response('', 304)
+    else:
+        linhas = _buscar_pagina(colecao, campos, condicoes, cursor, limit)
+        proximo = None
+        if len(linhas) > limit:
+            linhas = linhas[:limit]
+            ultima = linhas[-1]
+            proximo = _encode_cursor(ultima._ordem, ultima.id)
+        resposta = jsonify({
+            'data': [_serializar(colecao, campos, linha) for linha in linhas],
+            'count': total,
+            'next_cursor': proximo,
+        })
+
+    resposta.set_etag(etag, weak=True)
+    resposta.headers['Cache-Control'] = CACHE_CONTROL
+    return resposta
+
+
+@bp.route('/')
+def indice():
+    return jsonify({
+        'versao': 1,
+        'colecoes': {
+            nome: {
+                'url': url_for('api_v1.' + nome.replace('/', '_')),
+                'fields': list(colecao.campos),
+                'filtros': list(colecao.filtros) + ['desde', 'ate'],
+            }
+            for nome, colecao in COLECOES.items()
+        },
+    })
+
+
+@bp.route('/informativos')
+def informativos():
+    return _listar('informativos')
+
+
+@bp.route('/projetos')
+def projetos():
+    return _listar('projetos')
+
+
+@bp.route('/acoes')
+def acoes():
+    return _listar('acoes')
+
+
+@bp.route('/eventos')
+def eventos():
+    return _listar('eventos')
+
+
+@bp.route('/agenda/presencial')
+def agenda_presencial():
+    return _listar('agenda/presencial')
+
+
+@bp.route('/agenda/virtual')
+def agenda_virtual():
+    return _listar('agenda/virtual')
+
+
+@bp.route('/radio')
+def radio():
+    return _listar('radio')
+
+
+@bp.route('/galeria')
+def galeria():
+    return _listar('galeria')
@@ -0,0 +1,21 @@
+"""Download dos arquivos enviados (armazenamento de blobs por conteúdo)"""
+import re
+
+from flask import Blueprint, abort
+
+bp = Blueprint('arquivos', __name__, url_prefix='/arquivos')
+
+_RE_SHA256 = re.compile(r'^[0-9a-f]{64}$')
+
+
+@bp.route('/<sha256>/<path:nome>')
+def arquivo(sha256, nome):
+    """Conteúdo imutável: a URL muda quando o arquivo muda
+
+    Só documentos publicados; anexos e exportações têm rotas autenticadas.
+    """
+    from arquivos import blob_publico, resposta_blob
+
+    if not _RE_SHA256.match(sha256) or not blob_publico(sha256):
+        abort(404)
+    return resposta_blob(sha256, download_name=nome, as_attachment=False, imutavel=True)
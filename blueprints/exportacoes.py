@@ -0,0 +1,102 @@
+"""Exportação de relatórios (CSV/XLSX) do painel administrativo"""
+import tempfile
+
+from flask import (
+    Blueprint, Response, abort, flash, redirect, render_template, request, send_file, session,
+    stream_with_context, url_for,
+)
+
+from auditoria import registrar_auditoria
+from auth import admin_required
+from database import definir_statement_timeout
+from extensions import db
+from exportacoes import (
+    EXPORTACAO_VALIDADE_DIAS, FORMATOS, RELATORIOS, escrever_arquivo, filtros_da_requisicao, iniciar_exportacao, linhas_para_csv,
+    nome_arquivo, xlsx_disponivel,
+)
+from models import Associado, ExportacaoRelatorio
+
+bp = Blueprint('exportacoes', __name__, url_prefix='/admin/exportacoes')
+
+
+@bp.route('/')
+@admin_required
+def index():
+    """Formulário de exportação e exportações feitas em segundo plano"""
+    exportacoes = ExportacaoRelatorio.query.order_by(ExportacaoRelatorio.created_at.desc()).limit(30).all()
+    associados = db.session.execute(
+        db.select(Associado.id, Associado.nome_completo).order_by(Associado.nome_completo)
+    ).all()
+    return render_template(
+        'admin/exportacoes.html',
+        exportacoes=exportacoes,
+        relatorios=RELATORIOS,
+        associados=associados,
+        xlsx_disponivel=xlsx_disponivel(),
+        validade_dias=EXPORTACAO_VALIDADE_DIAS,
+        em_andamento=any(e.status in ('pendente', 'processando') for e in exportacoes),
+    )
+
+
+@bp.route('/exportar')
+@bp.route('/<relatorio>.<formato>')
+@admin_required
+def exportar(relatorio=None, formato=None):
+    """Exporta o relatório com os filtros da query string (?segundo_plano=1 gera em background)"""
+    relatorio = relatorio or request.args.get('relatorio')
+    formato = formato or request.args.get('formato', 'csv')
+    if relatorio not in RELATORIOS or formato not in FORMATOS:
+        abort(404)
+
+    voltar = request.referrer or url_for('exportacoes.index')
+    try:
+        filtros = filtros_da_requisicao(relatorio, request.args)
+    except ValueError as e:
+        flash(str(e), 'error')
+        return redirect(voltar)
+
+    if formato == 'xlsx' and not xlsx_disponivel():
+        flash('Exportação XLSX indisponível: instale o pacote openpyxl. Use CSV.', 'error')
+        return redirect(voltar)
+
+    if request.args.get('segundo_plano') == '1':
+        usuario_nome = session.get('admin_nome') or session.get('admin_username')
+        exportacao = iniciar_exportacao(relatorio, formato, filtros, session.get('admin_user_id'), usuario_nome)
+        registrar_auditoria(f'exportacao.{relatorio}', 'exportacao_relatorio', [exportacao.id],
+                            {'formato': formato, 'filtros': filtros, 'segundo_plano': True})
+        db.session.commit()
+        flash('Exportação iniciada. O arquivo aparecerá na lista abaixo quando estiver pronto.', 'success')
+        return redirect(url_for('exportacoes.index'))
+
+    # Exportações podem ler muitas linhas: sem statement timeout nesta requisição
+    definir_statement_timeout(0)
+    registrar_auditoria(f'exportacao.{relatorio}', 'exportacao_relatorio',
+                        detalhes={'formato': formato, 'filtros': filtros})
+    db.session.commit()
+
+    download_name = nome_arquivo(relatorio, formato, filtros)
+    if formato == 'csv':
+        resposta = Response(stream_with_context(linhas_para_csv(relatorio, filtros)), mimetype=FORMATOS['csv'])
+        resposta.headers['Content-Disposition'] = f'attachment; filename="{download_name}"'
+        resposta.headers['Cache-Control'] = 'no-store'
+        return resposta
+
+    # XLSX precisa do arquivo completo (zip): grava em disco temporário e envia em streaming
+    arquivo = tempfile.TemporaryFile()
+    escrever_arquivo(relatorio, formato, filtros, arquivo)
+    arquivo.seek(0)
+    resposta = send_file(arquivo, mimetype=FORMATOS['xlsx'], as_attachment=True, download_name=download_name)
+    resposta.headers['Cache-Control'] = 'no-store'
+    return resposta
+
+
+@bp.route('/<int:id>/download')
+@admin_required
+def download(id):
+    from arquivos import resposta_blob
+
+    exportacao = ExportacaoRelatorio.query.get_or_404(id)
+    if exportacao.status != 'concluida' or not exportacao.arquivo:
+        flash('Esta exportação ainda não está disponível.', 'warning')
+        return redirect(url_for('exportacoes.index'))
+    return resposta_blob(exportacao.arquivo, privado=True)
@@ -0,0 +1,184 @@
+"""Calendário de cobrança: dias úteis, feriados nacionais e datas de vencimento
+
+Concentra as regras de data usadas na geração de mensalidades (``billing.py``,
+``app.py`` e ``gerar_mensalidades_existentes.py``):
+
+- dias úteis excluem sábados, domingos e os feriados nacionais (fixos e móveis,
+  calculados a partir da Páscoa). Carnaval e Corpus Christi entram como feriados
+  porque os bancos não abrem;
+- uma tabela com os dias úteis de ``ANO_INICIAL`` a ``ANO_FINAL`` (e a contagem
+  acumulada por dia) é montada uma vez por processo, e "N dias úteis depois de
+  uma data" vira duas consultas por índice em vez de um laço dia a dia;
+- vencimentos mensais usam o dia de referência limitado ao último dia do mês
+  (31 -> 28/29 em fevereiro).
+
+``cronogramas_coorte`` calcula de uma vez os 12 vencimentos de vários
+associados: associados com a mesma data base compartilham o mesmo cronograma,
+que é calculado uma única vez.
+"""
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+# Faixa coberta pela tabela de dias úteis (datas fora dela usam o cálculo direto)
+ANO_INICIAL = 2000
+ANO_FINAL = 2100
+
+# Dias úteis até o primeiro vencimento de um associado novo
+DIAS_UTEIS_PRIMEIRO_VENCIMENTO = 3
+
+# Mensalidades geradas de uma vez para um associado (cadastro/aprovação e geração anual)
+MESES_POR_CICLO = 12
+
+FERIADOS_FIXOS = {
+    (1, 1): 'Confraternização Universal',
+    (4, 21): 'Tiradentes',
+    (5, 1): 'Dia do Trabalho',
+    (9, 7): 'Independência do Brasil',
+    (10, 12): 'Nossa Senhora Aparecida',
+    (11, 2): 'Finados',
+    (11, 15): 'Proclamação da República',
+    (12, 25): 'Natal',
+}
+
+# Feriados móveis: dias em relação ao domingo de Páscoa
+FERIADOS_MOVEIS = {
+    -48: 'Carnaval (segunda-feira)',
+    -47: 'Carnaval (terça-feira)',
+    -2: 'Sexta-feira Santa',
+    60: 'Corpus Christi',
+}
+
+
+def pascoa(ano):
+    """Domingo de Páscoa (algoritmo de Meeus/Jones/Butcher, calendário gregoriano)"""
+    a = ano % 19
+    b, c = divmod(ano, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(ano, mes, dia + 1)
+
+
+@lru_cache(maxsize=256)
+def feriados(ano):
+    """{data: nome} dos feriados nacionais do ano"""
+    resultado = {date(ano, mes, dia): nome for (mes, dia), nome in FERIADOS_FIXOS.items()}
+    if ano >= 2024:
+        # Lei 14.759/2023
+        resultado[date(ano, 11, 20)] = 'Dia Nacional de Zumbi e da Consciência Negra'
+    domingo_pascoa = pascoa(ano)
+    for deslocamento, nome in FERIADOS_MOVEIS.items():
+        resultado[domingo_pascoa + timedelta(days=deslocamento)] = nome
+    return resultado
+
+
+def eh_dia_util(data):
+    return data.weekday() < 5 and data not in feriados(data.year)
+
+
+_PRIMEIRO = date(ANO_INICIAL, 1, 1).toordinal()
+_ULTIMO = date(ANO_FINAL, 12, 31).toordinal()
+
+
+def _montar_tabela():
+    """(dias úteis, contagem acumulada)
+
+    ``dias_uteis`` tem os ordinais (``date.toordinal``) de todos os dias úteis da
+    faixa, em ordem; ``acumulado[o - _PRIMEIRO]`` é quantos deles são <= o.
+    """
+    dias_uteis = []
+    acumulado = []
+    for ordinal in range(_PRIMEIRO, _ULTIMO + 1):
+        if eh_dia_util(date.fromordinal(ordinal)):
+            dias_uteis.append(ordinal)
+        acumulado.append(len(dias_uteis))
+    return dias_uteis, acumulado
+
+
+_DIAS_UTEIS, _ACUMULADO = _montar_tabela()
+
+
+def somar_dias_uteis(data, dias):
+    """Data ``dias`` dias úteis depois de ``data`` (sem contar a própria data)"""
+    if isinstance(data, datetime):
+        data = data.date()
+    if dias <= 0:
+        return data
+    ordinal = data.toordinal()
+    if _PRIMEIRO <= ordinal <= _ULTIMO:
+        # Os dias úteis <= data ocupam os índices 0..acumulado-1: o próximo é o índice acumulado
+        indice = _ACUMULADO[ordinal - _PRIMEIRO] + dias - 1
+        if indice < len(_DIAS_UTEIS):
+            return date.fromordinal(_DIAS_UTEIS[indice])
+
+    # Fora da tabela: avança dia a dia
+    while dias > 0:
+        data += timedelta(days=1)
+        if eh_dia_util(data):
+            dias -= 1
+    return data
+
+
+def somar_meses(ano, mes, meses):
+    """(ano, mês) ``meses`` meses depois de (ano, mês)"""
+    total = ano * 12 + (mes - 1) + meses
+    return total // 12, total % 12 + 1
+
+
+def vencimento_no_mes(ano, mes, dia):
+    """Data de vencimento no dia ``dia`` do mês, limitada ao último dia do mês"""
+    return date(ano, mes, min(dia, monthrange(ano, mes)[1]))
+
+
+def proximo_vencimento(hoje, dia):
+    """Vencimento no dia ``dia`` do mês de ``hoje``; se já passou, no mês seguinte"""
+    vencimento = vencimento_no_mes(hoje.year, hoje.month, dia)
+    if hoje > vencimento:
+        ano, mes = somar_meses(hoje.year, hoje.month, 1)
+        vencimento = vencimento_no_mes(ano, mes, dia)
+    return vencimento
+
+
+def cronograma_mensal(ano, mes, dia, quantidade=MESES_POR_CICLO):
+    """[(mês, ano, vencimento)] de ``quantidade`` meses a partir de (ano, mês)"""
+    cronograma = []
+    for i in range(quantidade):
+        ano_ref, mes_ref = somar_meses(ano, mes, i)
+        cronograma.append((mes_ref, ano_ref, vencimento_no_mes(ano_ref, mes_ref, dia)))
+    return cronograma
+
+
+@lru_cache(maxsize=4096)
+def cronograma_inicial(data_base):
+    """Os 12 vencimentos de um associado novo, a partir da data de cadastro/aprovação
+
+    A primeira mensalidade vence ``DIAS_UTEIS_PRIMEIRO_VENCIMENTO`` dias úteis
+    depois da data base (mês de referência = mês do vencimento); as 11 seguintes
+    vencem no dia da data base, a partir do mês seguinte ao primeiro vencimento.
+    Retorna uma tupla de (mês, ano, vencimento).
+    """
+    primeiro = somar_dias_uteis(data_base, DIAS_UTEIS_PRIMEIRO_VENCIMENTO)
+    ano, mes = somar_meses(primeiro.year, primeiro.month, 1)
+    return ((primeiro.month, primeiro.year, primeiro),) + tuple(
+        cronograma_mensal(ano, mes, data_base.day, MESES_POR_CICLO - 1))
+
+
+def data_base_associado(associado):
+    """Data de cadastro/aprovação usada como base dos vencimentos"""
+    created_at = associado.created_at
+    return created_at.date() if isinstance(created_at, datetime) else created_at
+
+
+def cronogramas_coorte(associados):
+    """{associado_id: cronograma_inicial} para vários associados de uma vez
+
+    Cada data base distinta é calculada uma única vez (associados cadastrados no
+    mesmo dia compartilham o cronograma).
+    """
+    return {a.id: cronograma_inicial(data_base_associado(a)) for a in associados}
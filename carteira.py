@@ -0,0 +1,379 @@
+"""Geração do PDF da carteira de associado (formato RG brasileiro)
+
+O reportlab é importado apenas aqui para não pesar na importação de app.py.
+"""
+import base64
+import os
+
+from reportlab.lib import colors
+from reportlab.lib.units import cm, mm
+
+from models import DadosAssociacao
+
+
+def draw_rg_border(canvas, doc, border_color, is_front):
+    """Desenha a borda azul do RG com design melhorado"""
+    # Desenhar borda azul mais espessa
+    canvas.setStrokeColor(border_color)
+    canvas.setLineWidth(3)
+    
+    # Retângulo externo com borda azul
+    canvas.rect(3*mm, 3*mm, doc.width - 6*mm, doc.height - 6*mm, stroke=1, fill=0)
+    
+    # Linha horizontal superior decorativa (como no RG)
+    canvas.setLineWidth(1.5)
+    canvas.line(3*mm, doc.height - 12*mm, doc.width - 3*mm, doc.height - 12*mm)
+    
+    # Linha horizontal inferior decorativa
+    canvas.line(3*mm, 8*mm, doc.width - 3*mm, 8*mm)
+    
+    # Se for a frente, adicionar texto "BRASIL" no topo com melhor estilo
+    if is_front:
+        canvas.setFillColor(border_color)
+        canvas.setFont("Helvetica-Bold", 10)
+        canvas.drawCentredString(doc.width / 2, doc.height - 9*mm, "BRASIL")
+
+def gerar_carteira_pdf(associado):
+    """Gera o PDF da carteira de associado no formato RG brasileiro (azul) - UMA PÁGINA com frente e verso"""
+    try:
+        # Criar diretório se não existir
+        upload_folder = 'static/documents/carteiras'
+        os.makedirs(upload_folder, exist_ok=True)
+        
+        # Nome do arquivo
+        filename = f"carteira_{associado.cpf.replace('.', '').replace('-', '')}.pdf"
+        filepath = os.path.join(upload_folder, filename)
+        
+        # Tamanho do RG brasileiro (10.5cm x 6.5cm)
+        card_width = 10.5 * cm
+        card_height = 6.5 * cm
+        
+        # Buscar dados da associação
+        dados_associacao = DadosAssociacao.get_dados()
+        
+        # Criar PDF usando canvas diretamente
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.pdfgen import canvas as pdfcanvas
+        
+        page_width, page_height = landscape(A4)
+        gap = 10*mm
+        total_width = card_width * 2 + gap
+        
+        # Posições centralizadas
+        frente_x = (page_width - total_width) / 2
+        frente_y = (page_height - card_height) / 2
+        verso_x = frente_x + card_width + gap
+        verso_y = frente_y
+        
+        # Criar canvas
+        c = pdfcanvas.Canvas(filepath, pagesize=landscape(A4))
+        border_color = colors.HexColor('#1e40af')
+        
+        # Variável para armazenar caminho do arquivo temporário (será deletado no final)
+        foto_temp_path = None
+        
+        # Logo
+        logo_path = os.path.join('static', 'images', 'logo.png')
+        if not os.path.exists(logo_path):
+            logo_path = os.path.join('static', 'images', 'logorodape.png')
+        
+        def draw_card_front(x, y, width, height):
+            """Desenha a frente da carteira"""
+            # Borda azul
+            c.setStrokeColor(border_color)
+            c.setLineWidth(3)
+            c.rect(x, y, width, height, stroke=1, fill=0)
+            
+            # Linhas decorativas
+            c.setLineWidth(1.5)
+            c.line(x, y + height - 12*mm, x + width, y + height - 12*mm)
+            c.line(x, y + 8*mm, x + width, y + 8*mm)
+            
+            # BRASIL no topo
+            c.setFillColor(border_color)
+            c.setFont("Helvetica-Bold", 9)
+            c.drawCentredString(x + width/2, y + height - 9*mm, "BRASIL")
+            
+            # Área interna com margem de 4mm
+            inner_x = x + 4*mm
+            inner_y = y + 4*mm
+            inner_w = width - 8*mm
+            inner_h = height - 8*mm
+            
+            # Logo (centro superior)
+            if os.path.exists(logo_path):
+                try:
+                    from PIL import Image as PILImage
+                    img = PILImage.open(logo_path)
+                    img_w, img_h = img.size
+                    aspect = img_w / img_h
+                    logo_h = 9*mm
+                    logo_w = logo_h * aspect
+                    if logo_w > inner_w - 2*mm:
+                        logo_w = inner_w - 2*mm
+                        logo_h = logo_w / aspect
+                    logo_x = x + (width - logo_w) / 2
+                    logo_y = y + height - 20*mm
+                    c.drawImage(logo_path, logo_x, logo_y, width=logo_w, height=logo_h, preserveAspectRatio=True)
+                except:
+                    pass
+            
+            # Título
+            c.setFillColor(border_color)
+            c.setFont("Helvetica-Bold", 7.5)
+            c.drawCentredString(x + width/2, y + height - 32*mm, "CARTEIRA DE ASSOCIADO")
+            
+            # Foto (esquerda, abaixo do título)
+            foto_x = inner_x
+            foto_y = y + 20*mm
+            foto_w_max = 22*mm
+            foto_h_max = 28*mm
+            
+            # Usar a variável do escopo externo
+            nonlocal foto_temp_path
+            
+            print(f"[Carteira] Verificando foto do associado {associado.id} ({associado.nome_completo})")
+            print(f"[Carteira] associado.foto = {associado.foto}")
+            print(f"[Carteira] associado.foto_base64 existe? {bool(getattr(associado, 'foto_base64', None))}")
+            
+            if associado.foto:
+                foto_path = None
+                
+                # Verificar se a foto está em base64 (Render)
+                if associado.foto.startswith('base64:'):
+                    foto_base64 = getattr(associado, 'foto_base64', None)
+                    if foto_base64:
+                        try:
+                            import tempfile
+                            from PIL import Image as PILImage
+                            from io import BytesIO
+                            
+                            # Extrair o tipo MIME
+                            mime_type = associado.foto.replace('base64:', '')
+                            print(f"[Carteira] Tipo MIME da foto: {mime_type}")
+                            print(f"[Carteira] Tamanho do base64: {len(foto_base64)} caracteres")
+                            
+                            # Decodificar base64
+                            image_data = base64.b64decode(foto_base64)
+                            print(f"[Carteira] Foto base64 decodificada, tamanho: {len(image_data)} bytes")
+                            
+                            # Criar imagem PIL a partir dos bytes
+                            img = PILImage.open(BytesIO(image_data))
+                            print(f"[Carteira] Imagem PIL criada: {img.size} pixels, formato: {img.format}")
+                            
+                            # Converter para RGB se necessário (para JPEG)
+                            if img.mode != 'RGB':
+                                print(f"[Carteira] Convertendo imagem de {img.mode} para RGB")
+                                img = img.convert('RGB')
+                            
+                            # Criar arquivo temporário
+                            foto_temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
+                            foto_temp_path = foto_temp_file.name
+                            foto_temp_file.close()
+                            
+                            # Salvar imagem no arquivo temporário
+                            img.save(foto_temp_path, 'JPEG', quality=95)
+                            print(f"[Carteira] Foto temporária salva em: {foto_temp_path}")
+                            print(f"[Carteira] Arquivo existe? {os.path.exists(foto_temp_path)}")
+                            
+                            foto_path = foto_temp_path
+                        except Exception as e:
+                            print(f"[Carteira] Erro ao processar foto base64: {e}")
+                            import traceback
+                            traceback.print_exc()
+                            foto_path = None
+                    else:
+                        print(f"[Carteira] Foto marcada como base64 mas foto_base64 está vazio")
+                else:
+                    # Tentar usar o caminho do arquivo
+                    foto_path = os.path.join('static', associado.foto)
+                    print(f"[Carteira] Tentando usar arquivo local: {foto_path}")
+                    if not os.path.exists(foto_path):
+                        print(f"[Carteira] Arquivo não encontrado: {foto_path}")
+                        foto_path = None
+                
+                if foto_path and os.path.exists(foto_path):
+                    try:
+                        from PIL import Image as PILImage
+                        img = PILImage.open(foto_path)
+                        img_w, img_h = img.size
+                        aspect = img_w / img_h
+                        foto_h = min(foto_h_max, inner_h - 40*mm)
+                        foto_w = foto_h * aspect
+                        if foto_w > foto_w_max:
+                            foto_w = foto_w_max
+                            foto_h = foto_w / aspect
+                        print(f"[Carteira] Desenhando foto: {foto_path}, tamanho: {foto_w}x{foto_h}, posição: ({foto_x}, {foto_y})")
+                        c.drawImage(foto_path, foto_x, foto_y, width=foto_w, height=foto_h, preserveAspectRatio=True)
+                        print(f"[Carteira] Foto desenhada com sucesso!")
+                    except Exception as e:
+                        print(f"[Carteira] Erro ao desenhar foto na carteira: {e}")
+                        import traceback
+                        traceback.print_exc()
+                else:
+                    print(f"[Carteira] Foto não encontrada ou inválida: {foto_path}")
+            else:
+                print(f"[Carteira] Associado não possui foto cadastrada")
+            
+            # Nome e CPF (direita da foto)
+            text_x = inner_x + 24*mm
+            text_y = y + height - 42*mm
+            
+            nome = associado.nome_completo.upper()
+            c.setFillColor(colors.HexColor('#1f2937'))
+            c.setFont("Helvetica-Bold", 7.5)
+            
+            # Quebrar nome se necessário
+            max_chars = 22
+            if len(nome) > max_chars:
+                palavras = nome.split()
+                meio = len(palavras) // 2
+                linha1 = ' '.join(palavras[:meio])
+                linha2 = ' '.join(palavras[meio:])
+                c.drawString(text_x, text_y, linha1[:max_chars])
+                c.drawString(text_x, text_y - 6*mm, linha2[:max_chars])
+                cpf_y = text_y - 12*mm
+            else:
+                c.drawString(text_x, text_y, nome[:max_chars])
+                cpf_y = text_y - 7*mm
+            
+            c.setFont("Helvetica", 6)
+            c.drawString(text_x, cpf_y, f"CPF: {associado.cpf}")
+        
+        def draw_card_back(x, y, width, height):
+            """Desenha o verso da carteira"""
+            # Borda azul
+            c.setStrokeColor(border_color)
+            c.setLineWidth(3)
+            c.rect(x, y, width, height, stroke=1, fill=0)
+            
+            # Linhas decorativas
+            c.setLineWidth(1.5)
+            c.line(x, y + height - 12*mm, x + width, y + height - 12*mm)
+            c.line(x, y + 8*mm, x + width, y + 8*mm)
+            
+            # Área interna com margem de 4mm
+            inner_x = x + 4*mm
+            inner_y = y + 4*mm
+            inner_w = width - 8*mm
+            inner_h = height - 8*mm
+            
+            # Título (centro superior, dentro da borda)
+            c.setFillColor(border_color)
+            c.setFont("Helvetica-Bold", 7.5)
+            titulo_y = y + height - 25*mm
+            c.drawCentredString(x + width/2, titulo_y, "DADOS DA ASSOCIAÇÃO")
+            
+            # Dados (abaixo do título, dentro da borda)
+            dados_start_y = y + height - 38*mm
+            label_x = inner_x
+            value_x = inner_x + 14*mm
+            line_h = 6*mm
+            
+            # Layout em duas colunas: esquerda (Nome, CNPJ) e direita (Endereço)
+            col_left_x = inner_x
+            col_right_x = inner_x + inner_w / 2
+            col_width = inner_w / 2 - 2*mm
+            
+            c.setFillColor(colors.HexColor('#1f2937'))
+            
+            # Nome (coluna esquerda)
+            c.setFont("Helvetica-Bold", 5.5)
+            c.drawString(col_left_x, dados_start_y, "Nome:")
+            c.setFont("Helvetica", 5.5)
+            nome_assoc = dados_associacao.nome
+            max_chars = 25
+            nome_value_x = col_left_x + 12*mm
+            if len(nome_assoc) > max_chars:
+                palavras = nome_assoc.split()
+                meio = len(palavras) // 2
+                linha1 = ' '.join(palavras[:meio])
+                linha2 = ' '.join(palavras[meio:])
+                c.drawString(nome_value_x, dados_start_y, linha1[:max_chars])
+                c.drawString(nome_value_x, dados_start_y - line_h, linha2[:max_chars])
+                cnpj_y = dados_start_y - (line_h * 2)
+            else:
+                c.drawString(nome_value_x, dados_start_y, nome_assoc[:max_chars])
+                cnpj_y = dados_start_y - line_h
+            
+            # Endereço (coluna direita, alinhado verticalmente com Nome)
+            end_y = dados_start_y
+            c.setFont("Helvetica-Bold", 5.5)
+            c.drawString(col_right_x, end_y, "Endereço:")
+            c.setFont("Helvetica", 5.5)
+            endereco = dados_associacao.endereco
+            max_chars_line = 20
+            endereco_x = col_right_x + 16*mm
+            
+            # Quebrar endereço em múltiplas linhas se necessário
+            if len(endereco) > max_chars_line:
+                partes = endereco.split(', ')
+                current = partes[0]
+                offset = 0
+                for parte in partes[1:]:
+                    if len(current + ', ' + parte) <= max_chars_line:
+                        current += ', ' + parte
+                    else:
+                        c.drawString(endereco_x, end_y - offset, current[:max_chars_line])
+                        offset += line_h
+                        current = parte
+                if current:
+                    c.drawString(endereco_x, end_y - offset, current[:max_chars_line])
+            else:
+                c.drawString(endereco_x, end_y, endereco[:max_chars_line])
+            
+            # CNPJ (coluna esquerda, abaixo do Nome)
+            c.setFont("Helvetica-Bold", 5.5)
+            c.drawString(col_left_x, cnpj_y, "CNPJ:")
+            c.setFont("Helvetica", 5.5)
+            c.drawString(col_left_x + 12*mm, cnpj_y, dados_associacao.cnpj)
+        
+        # Desenhar frente e verso
+        draw_card_front(frente_x, frente_y, card_width, card_height)
+        draw_card_back(verso_x, verso_y, card_width, card_height)
+        
+        # Salvar
+        c.showPage()
+        c.save()
+        
+        # Ler o PDF gerado e converter para base64
+        pdf_base64 = None
+        try:
+            with open(filepath, 'rb') as pdf_file:
+                pdf_bytes = pdf_file.read()
+                pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+                print(f"[Carteira] PDF convertido para base64, tamanho: {len(pdf_base64)} caracteres")
+        except Exception as e:
+            print(f"[Carteira] Erro ao converter PDF para base64: {e}")
+        
+        # Salvar base64 no banco de dados (sem commit - será feito pela função chamadora)
+        if pdf_base64:
+            try:
+                associado.carteira_pdf_base64 = pdf_base64
+                associado.carteira_pdf = f"base64:application/pdf"  # Marcar como base64
+                # Não fazer commit aqui - será feito pela função que chama
+                print(f"[Carteira] PDF preparado para salvar em base64 no banco de dados")
+            except Exception as e:
+                print(f"[Carteira] Erro ao preparar PDF base64: {e}")
+        
+        # Limpar arquivo temporário se foi criado (após salvar o PDF)
+        if foto_temp_path and os.path.exists(foto_temp_path):
+            try:
+                os.unlink(foto_temp_path)
+                print(f"[Carteira] Arquivo temporário removido: {foto_temp_path}")
+            except Exception as e:
+                print(f"[Carteira] Erro ao remover arquivo temporário: {e}")
+        
+        return f"documents/carteiras/{filename}"
+        
+    except Exception as e:
+        print(f"Erro ao gerar carteira PDF: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        # Limpar arquivo temporário em caso de erro
+        if 'foto_temp_path' in locals() and foto_temp_path and os.path.exists(foto_temp_path):
+            try:
+                os.unlink(foto_temp_path)
+            except:
+                pass
+        raise
@@ -0,0 +1,405 @@
+"""Comandos de manutenção (``flask manutencao ...``)
+
+Substituem a chamada HTTP de ``gerar_mensalidades_cron.py`` (a geração rodava
+dentro de um worker web, disputando com os visitantes) e reúnem as tarefas
+antes espalhadas em scripts soltos, todas no mesmo contexto de aplicação:
+
+    flask --app app manutencao mensalidades   gera as mensalidades do mês
+    flask --app app manutencao migrar         migrações migrate_postgres_* e tarefas do startup
+    flask --app app manutencao snapshot       regenera o snapshot estático do site público
+    flask --app app manutencao reindexar      CPF/telefone/e-mail normalizados e HTML dos textos
+    flask --app app manutencao imagens        copia para o banco (base64) imagens que só existem em static/
+    flask --app app manutencao exportar       exporta um relatório (CSV/XLSX) para arquivo
+    flask --app app manutencao backup         backup incremental do banco (ver backups.py)
+    flask --app app manutencao verificar-backup  confere a cadeia de backups e os blobs
+    flask --app app manutencao restaurar      restaura um backup ou export .sql com carga em massa
+
+Todos aceitam ``--simular`` (ou ``--dry-run``), que só mostra o que seria
+feito, e os que processam registros em lotes aceitam ``--lote N``. Cada comando
+segura uma trava consultiva durante a execução (``pg_try_advisory_lock`` no
+PostgreSQL, trava de arquivo em ``instance/travas`` nos demais bancos): uma
+segunda execução simultânea da mesma tarefa termina com erro em vez de rodar
+em paralelo.
+"""
+import base64
+import functools
+import hashlib
+import mimetypes
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import select, text
+
+from exportacoes import FORMATOS, RELATORIOS
+from extensions import db
+from models import (
+    Acao, Associado, Banner, BannerConteudo, Evento, Informativo, MembroConselhoFiscal, MembroDiretoria,
+    Projeto, RadioPrograma, SliderImage,
+)
+
+manutencao = AppGroup('manutencao', help='Tarefas de manutenção (mensalidades, migrações, snapshot etc.)')
+
+# Imagens com o caminho em static/ na primeira coluna e a cópia persistente na segunda
+# (o caminho vira 'base64:<mime>' quando a imagem passa a ser servida do banco)
+COLUNAS_IMAGEM = (
+    (Projeto, 'imagen', 'imagen_base64'),
+    (Acao, 'imagem', 'imagem_base64'),
+    (Evento, 'imagem', 'imagem_base64'),
+    (Informativo, 'imagem', 'imagem_base64'),
+    (RadioPrograma, 'imagem', 'imagem_base64'),
+    (SliderImage, 'imagem', 'imagem_base64'),
+    (Banner, 'imagem', 'imagem_base64'),
+    (BannerConteudo, 'imagem', 'imagem_base64'),
+    (MembroDiretoria, 'foto', 'foto_base64'),
+    (MembroConselhoFiscal, 'foto', 'foto_base64'),
+    (Associado, 'foto', 'foto_base64'),
+)
+
+
+# ============================================
+# TRAVA CONTRA EXECUÇÕES SIMULTÂNEAS
+# ============================================
+
+class TarefaEmExecucao(Exception):
+    def __init__(self, nome):
+        super().__init__(f"Já existe uma execução de '{nome}' em andamento")
+        self.nome = nome
+
+
+def _travar_arquivo(arquivo):
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+
+        arquivo.seek(0)
+        msvcrt.locking(arquivo.fileno(), msvcrt.LK_NBLCK, 1)
+        return
+    fcntl.flock(arquivo, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+@contextmanager
+def trava_execucao(nome):
+    """Trava consultiva da tarefa ``nome``; levanta ``TarefaEmExecucao`` se já estiver em uso
+
+    No PostgreSQL a trava vale para todos os hosts que usam o banco e é liberada
+    automaticamente se o processo morrer (a conexão cai).
+    """
+    if db.engine.dialect.name == 'postgresql':
+        chave = int.from_bytes(hashlib.sha256(f'aadvita:{nome}'.encode()).digest()[:8], 'big', signed=True)
+        with db.engine.connect() as conn:
+            if not conn.execute(text('SELECT pg_try_advisory_lock(:chave)'), {'chave': chave}).scalar():
+                raise TarefaEmExecucao(nome)
+            # A trava é da sessão: confirmar evita deixar a conexão "idle in transaction"
+            conn.commit()
+            try:
+                yield
+            finally:
+                conn.execute(text('SELECT pg_advisory_unlock(:chave)'), {'chave': chave})
+                conn.commit()
+        return
+
+    diretorio = os.path.join(current_app.instance_path, 'travas')
+    os.makedirs(diretorio, exist_ok=True)
+    # Fechar o arquivo libera a trava (inclusive se o processo morrer)
+    with open(os.path.join(diretorio, f'{nome}.lock'), 'a+') as arquivo:
+        try:
+            _travar_arquivo(arquivo)
+        except OSError:
+            raise TarefaEmExecucao(nome)
+        yield
+
+
+# ============================================
+# INFRAESTRUTURA DOS COMANDOS
+# ============================================
+
+def _progresso(rotulo, a_cada=1):
+    """Callback ``progresso(feitos, total)`` que imprime o andamento a cada ``a_cada`` itens"""
+    def progresso(feitos, total=None):
+        if feitos % a_cada and feitos != total:
+            return
+        click.echo(f"   {rotulo}: {feitos}" + (f"/{total}" if total else ''))
+    return progresso
+
+
+def tarefa(nome, lote=None):
+    """Registra ``funcao`` como ``flask manutencao <nome>`` com --simular, --lote e a trava da tarefa"""
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def executar(simular, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                if simular:
+                    funcao(simular=True, **kwargs)
+                else:
+                    with trava_execucao(nome):
+                        funcao(simular=False, **kwargs)
+            except TarefaEmExecucao as e:
+                raise click.ClickException(str(e))
+            click.echo(f"⏱️ {nome}: {time.perf_counter() - inicio:.1f} s")
+
+        executar = click.option(
+            '--simular', '--dry-run', 'simular', is_flag=True,
+            help='Só mostra o que seria feito, sem gravar nada.',
+        )(executar)
+        if lote:
+            executar = click.option(
+                '--lote', default=lote, show_default=True, type=click.IntRange(min=1),
+                help='Registros processados (e confirmados) por vez.',
+            )(executar)
+        return manutencao.command(nome, help=funcao.__doc__)(executar)
+    return decorador
+
+
+# ============================================
+# COMANDOS
+# ============================================
+
+@tarefa('mensalidades', lote=200)
+def mensalidades(simular, lote):
+    """Gera as mensalidades do mês dos associados contribuintes ativos"""
+    from billing import gerar_mensalidades_automaticas
+
+    if simular:
+        total = gerar_mensalidades_automaticas(simular=True)
+        click.echo(f"📝 {total} mensalidade(s) seriam geradas.")
+        return
+    total = gerar_mensalidades_automaticas(lote=lote, progresso=_progresso('mensalidades'))
+    click.echo(f"✅ {total} mensalidade(s) gerada(s).")
+
+
+@tarefa('migrar')
+def migrar(simular):
+    """Executa as migrações migrate_postgres_* e as tarefas de banco do startup"""
+    from startup import MIGRATION_MODULES, run_startup_tasks
+
+    if simular:
+        click.echo(f"📝 {len(MIGRATION_MODULES)} migração(ões) seriam executadas, nesta ordem:")
+        for module_name in MIGRATION_MODULES:
+            click.echo(f"   {module_name}")
+        click.echo("   + colunas, índices e dados iniciais do startup")
+        return
+    run_startup_tasks(current_app._get_current_object(), migrations=True)
+    click.echo("✅ Migrações e tarefas do startup concluídas.")
+
+
+@tarefa('snapshot')
+@click.option('--completo', is_flag=True, help='Renderiza todas as páginas, ignorando o snapshot anterior.')
+def snapshot(simular, completo):
+    """Regenera o snapshot estático do site público (só as páginas alteradas)"""
+    from snapshot import diretorio_snapshot, gerar_snapshot, paginas_pendentes
+
+    app = current_app._get_current_object()
+    if simular:
+        pendentes = paginas_pendentes(app, completo=completo)
+        click.echo(f"📝 {len(pendentes)} página(s) seriam renderizadas em {diretorio_snapshot(app)}:")
+        for idioma, url in pendentes:
+            click.echo(f"   [{idioma}] {url}")
+        return
+    r = gerar_snapshot(app, completo=completo, progresso=_progresso('páginas', a_cada=50))
+    click.echo(f"✅ Snapshot: {r['renderizadas']} página(s) renderizada(s), {r['mantidas']} sem alteração, "
+               f"{r['arquivos']} imagem(ns), {r['falhas']} falha(s).")
+
+
+@tarefa('reindexar', lote=500)
+@click.option('--todos', is_flag=True, help='Re-renderiza o HTML de todos os textos, não só os pendentes.')
+def reindexar(simular, lote, todos):
+    """Preenche CPF/telefone/e-mail normalizados (índices de identidade) e o HTML dos textos"""
+    import conteudo
+    import identidade
+
+    if simular:
+        click.echo(f"📝 {identidade.contar_pendentes()} pessoa(s) seriam normalizadas e "
+                   f"{conteudo.contar_pendentes(todos)} texto(s) renderizados.")
+        return
+    total = identidade.preencher_pendentes(lote=lote, progresso=_progresso('pessoas'))
+    click.echo(f"✅ CPF/telefone/e-mail normalizados em {total} registro(s).")
+    total = conteudo.renderizar_pendentes(todos=todos, lote=lote, progresso=_progresso('textos'))
+    click.echo(f"✅ HTML renderizado para {total} registro(s).")
+
+
+def _caminho_estatico(caminho):
+    caminho = caminho.strip().lstrip('/')
+    if caminho.startswith('static/'):
+        caminho = caminho[len('static/'):]
+    return os.path.join(current_app.static_folder, *caminho.split('/'))
+
+
+@tarefa('imagens', lote=50)
+def imagens(simular, lote):
+    """Copia para o banco (base64) as imagens que só existem em static/, que o Render apaga a cada deploy"""
+    preenchidas = sem_arquivo = 0
+    for model, coluna_caminho, coluna_base64 in COLUNAS_IMAGEM:
+        caminho_col, base64_col = getattr(model, coluna_caminho), getattr(model, coluna_base64)
+        pendentes = (
+            base64_col.is_(None), caminho_col.isnot(None), caminho_col != '',
+            ~caminho_col.like('base64:%'), ~caminho_col.like('http%'),
+        )
+        ultimo_id = 0
+        while True:
+            # Só id e caminho: as linhas já preenchidas têm imagens em base64
+            linhas = db.session.execute(
+                select(model.id, caminho_col).where(*pendentes, model.id > ultimo_id).order_by(model.id).limit(lote)
+            ).all()
+            if not linhas:
+                break
+            ultimo_id = linhas[-1].id
+
+            valores = []
+            for id_, caminho in linhas:
+                arquivo = _caminho_estatico(caminho)
+                if not os.path.isfile(arquivo):
+                    sem_arquivo += 1
+                    continue
+                if simular:
+                    valores.append({'id': id_})
+                    continue
+                with open(arquivo, 'rb') as f:
+                    dados = base64.b64encode(f.read()).decode('utf-8')
+                mime_type = mimetypes.guess_type(arquivo)[0] or 'image/jpeg'
+                item = {'id': id_, coluna_caminho: f'base64:{mime_type}', coluna_base64: dados}
+                if hasattr(model, 'updated_at'):
+                    item['updated_at'] = datetime.utcnow()
+                valores.append(item)
+
+            if valores and not simular:
+                db.session.execute(db.update(model), valores)
+                db.session.commit()
+            preenchidas += len(valores)
+            if valores:
+                click.echo(f"   {model.__tablename__}: {preenchidas}")
+
+    verbo = 'seriam copiada(s)' if simular else 'copiada(s)'
+    click.echo(f"{'📝' if simular else '✅'} {preenchidas} imagem(ns) {verbo} para o banco; "
+               f"{sem_arquivo} sem arquivo em static/.")
+
+
+@tarefa('exportar', lote=1000)
+@click.argument('relatorio', type=click.Choice(sorted(RELATORIOS)))
+@click.option('--formato', type=click.Choice(sorted(FORMATOS)), default='csv', show_default=True)
+@click.option('--saida', type=click.Path(dir_okay=False), help='Arquivo de destino (padrão: nome do relatório e data).')
+@click.option('--filtro', 'filtros', multiple=True, metavar='CHAVE=VALOR',
+              help='Filtros do relatório, ex.: de=2025-01-01, ate=2025-12-31, status=pago.')
+def exportar(simular, lote, relatorio, formato, saida, filtros):
+    """Exporta um relatório administrativo para arquivo CSV ou XLSX"""
+    from exportacoes import contar_linhas, escrever_arquivo, filtros_da_requisicao, nome_arquivo, xlsx_disponivel
+
+    if formato == 'xlsx' and not xlsx_disponivel():
+        raise click.ClickException('Exportação XLSX requer o pacote openpyxl.')
+    try:
+        filtros = filtros_da_requisicao(relatorio, dict(f.partition('=')[::2] for f in filtros))
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--filtro')
+
+    saida = saida or nome_arquivo(relatorio, formato, filtros)
+    if simular:
+        click.echo(f"📝 {contar_linhas(relatorio, filtros)} linha(s) seriam exportadas para {saida}.")
+        return
+    with open(saida, 'wb') as destino:
+        total = escrever_arquivo(relatorio, formato, filtros, destino, lote=lote, progresso=_progresso('linhas'))
+    click.echo(f"✅ {total} linha(s) exportada(s) para {saida}.")
+
+
+@tarefa('backup', lote=500)
+@click.option('--completo', is_flag=True, help='Exporta todas as linhas, ignorando o backup anterior.')
+def backup(simular, lote, completo):
+    """Backup incremental do banco (linhas novas/alteradas e blobs ainda não copiados)"""
+    from backups import fazer_backup
+
+    r = fazer_backup(completo=completo, simular=simular, lote=lote,
+                     progresso=lambda tabela, linhas: linhas and click.echo(f"   {tabela}: {linhas}"))
+    resumo = (f"backup {r['tipo']} nº {r['numero']}: {r['linhas']} linha(s) de {r['tabelas']} tabela(s), "
+              f"{r['blobs_novos']} blob(s) novo(s) ({r['bytes_novos'] / 1024:.0f} KB)")
+    if simular:
+        click.echo(f"📝 Seria gravado o {resumo}.")
+        return
+    click.echo(f"✅ Gravado o {resumo} em {r['diretorio']}.")
+
+
+@tarefa('verificar-backup')
+@click.option('--rapido', is_flag=True, help='Só confere se os blobs existem, sem recalcular os hashes.')
+def verificar_backup(simular, rapido):
+    """Confere a cadeia de manifestos dos backups e o hash de cada blob"""
+    from backups import diretorio_backups, ler_manifesto, numeros_manifestos, verificar_backups
+
+    if simular:
+        diretorio = diretorio_backups()
+        numeros = numeros_manifestos(diretorio)
+        click.echo(f"📝 {len(numeros)} manifesto(s) seriam conferidos em {diretorio}:")
+        for numero in numeros:
+            manifesto = ler_manifesto(diretorio, numero)[0]
+            click.echo(f"   {numero:6d}  {manifesto['tipo']:<11}  {manifesto['criado_em']}")
+        return
+    resumo, erros = verificar_backups(
+        rapido=rapido, progresso=lambda numero, falhas: falhas and click.echo(f"   manifesto {numero}: {falhas} erro(s)"),
+    )
+    for erro in erros:
+        click.echo(f"   {erro}", err=True)
+    if erros:
+        raise click.ClickException(f"{len(erros)} problema(s) em {resumo['diretorio']}.")
+    if resumo['ultimo_completo'] is None:
+        click.echo("⚠️ Nenhum backup completo encontrado.")
+    click.echo(f"✅ {resumo['manifestos']} manifesto(s) e {resumo['blobs']} blob(s) conferidos; "
+               f"último backup completo: nº {resumo['ultimo_completo']}.")
+
+
+@tarefa('restaurar', lote=1000)
+@click.option('--backup', 'numero', type=click.IntRange(min=1), help='Número do backup (padrão: o último).')
+@click.option('--sql', 'arquivo_sql', type=click.Path(exists=True, dir_okay=False),
+              help='Export .sql (um INSERT por linha) em vez de um backup.')
+@click.option('--substituir', is_flag=True,
+              help='Esvazia as tabelas de destino antes da carga (depois de gravar um backup delas).')
+@click.option('--paralelo', default=4, show_default=True, type=click.IntRange(min=1),
+              help='Tabelas carregadas ao mesmo tempo (só PostgreSQL).')
+def restaurar(simular, lote, numero, arquivo_sql, substituir, paralelo):
+    """Restaura o banco de um backup ou de um export .sql (COPY no PostgreSQL, em paralelo por tabela)"""
+    import restauracao
+
+    if numero and arquivo_sql:
+        raise click.UsageError('Use --backup ou --sql, não os dois.')
+
+    def progresso(tabela, linhas, segundos):
+        click.echo(f"   {tabela}: {linhas} linha(s) em {segundos:.1f} s ({linhas / max(segundos, 0.001):.0f} linhas/s)")
+
+    inicio = time.perf_counter()
+    try:
+        if arquivo_sql:
+            origem, blobs = restauracao.linhas_do_sql(arquivo_sql), None
+        else:
+            origem, blobs = restauracao.linhas_do_backup(numero)
+        click.echo(f"   leitura: {sum(len(linhas) for _, linhas in origem.values())} linha(s) de "
+                   f"{len(origem)} tabela(s) em {time.perf_counter() - inicio:.1f} s")
+        r = restauracao.restaurar(origem, blobs, substituir=substituir, paralelo=paralelo, lote=lote,
+                                  simular=simular, progresso=progresso)
+    except restauracao.ErroRestauracao as e:
+        raise click.ClickException(str(e))
+
+    if r['ignoradas']:
+        click.echo(f"⚠️ Sem tabela no destino (ignoradas): {', '.join(r['ignoradas'])}")
+    if simular:
+        click.echo(f"📝 {r['linhas']} linha(s) de {r['tabelas']} tabela(s) seriam carregadas:")
+        for tabela, linhas in r['por_tabela'].items():
+            click.echo(f"   {tabela}: {linhas}" + (' (destino com dados)' if tabela in r['ocupadas'] else ''))
+        if r['ocupadas'] and r['bloqueantes']:
+            click.echo(f"⚠️ Restauração seria recusada: {', '.join(r['bloqueantes'])} referenciam as tabelas "
+                       "restauradas, têm dados e não estão na origem.")
+        elif r['ocupadas'] and substituir:
+            click.echo("📝 O banco atual seria gravado em um backup antes de esvaziar as tabelas.")
+        return
+    if r['backup'] is not None:
+        click.echo(f"📝 Estado anterior guardado no backup nº {r['backup']}.")
+    click.echo(f"✅ {r['linhas']} linha(s) restaurada(s) em {r['tabelas']} tabela(s) em {r['segundos']:.1f} s "
+               f"({r['linhas'] / max(r['segundos'], 0.001):.0f} linhas/s).")
+    if r['saldos'] is not None:
+        click.echo(f"✅ Saldos recalculados para {r['saldos']} associado(s).")
+    click.echo("📝 Regenere o snapshot do site: flask --app app manutencao snapshot --completo")
+
+
+def init_comandos(app):
+    app.cli.add_command(manutencao)
@@ -0,0 +1,67 @@
+"""Cache de bytecode do Jinja e compilação antecipada dos templates
+
+Cada worker novo do gunicorn compilava os templates (mais de 100, alguns com
+centenas de linhas) na primeira requisição que usava cada um. Com
+``init_bytecode_cache`` o código compilado fica em disco (``JINJA_CACHE_DIR``,
+padrão: <tmp>/aadvita-jinja, fora do checkout) e é compartilhado pelos workers
+do mesmo host: um worker novo só lê o bytecode. O Jinja guarda junto do
+bytecode o checksum do fonte, então um template alterado é recompilado
+automaticamente; a chave inclui também as extensões do ambiente (ex.: a tag
+``{% cache %}`` de ``fragmentos.py``).
+
+``compilar_templates`` compila todos os templates de uma vez. Roda antes do
+fork dos workers (``start.py`` e ``on_starting`` do gunicorn), preenchendo o
+cache em disco, e em cada worker logo após o boot (``post_worker_init``),
+carregando os templates na memória antes da primeira requisição.
+
+Variáveis de ambiente:
+
+    JINJA_CACHE_DIR         diretório do cache de bytecode (padrão: <tmp>/aadvita-jinja)
+    JINJA_BYTECODE_CACHE    0 desativa o cache de bytecode (padrão: 1)
+    JINJA_PRECOMPILAR       0 desativa a compilação antecipada (padrão: 1)
+"""
+import os
+import tempfile
+import time
+
+from jinja2 import FileSystemBytecodeCache, TemplateError
+
+
+class _BytecodeCache(FileSystemBytecodeCache):
+    def __init__(self, diretorio, extensoes):
+        super().__init__(diretorio)
+        self.extensoes = '|'.join(sorted(extensoes))
+
+    def get_cache_key(self, name, filename=None):
+        return super().get_cache_key(f'{name}|{self.extensoes}', filename)
+
+
+def init_bytecode_cache(app):
+    if os.environ.get('JINJA_BYTECODE_CACHE', '1') == '0':
+        return
+    diretorio = app.config.get('JINJA_CACHE_DIR') or os.path.join(tempfile.gettempdir(), 'aadvita-jinja')
+    try:
+        os.makedirs(diretorio, exist_ok=True)
+    except OSError as e:
+        print(f"⚠️ Cache de bytecode do Jinja desativado ({diretorio}): {e}")
+        return
+    app.jinja_env.bytecode_cache = _BytecodeCache(diretorio, app.jinja_env.extensions)
+
+
+def compilar_templates(app):
+    """Compila (ou carrega do cache de bytecode) todos os templates; retorna quantos"""
+    if os.environ.get('JINJA_PRECOMPILAR', '1') == '0':
+        return 0
+
+    inicio = time.perf_counter()
+    total = 0
+    with app.app_context():
+        env = app.jinja_env
+        for nome in env.list_templates(filter_func=lambda n: n.endswith('.html')):
+            try:
+                env.get_template(nome)
+                total += 1
+            except TemplateError as e:
+                print(f"⚠️ Template {nome} não compilou: {e}")
+    print(f"✅ {total} templates compilados em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+    return total
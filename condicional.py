@@ -0,0 +1,130 @@
+"""GET condicional (ETag/Last-Modified) para as páginas de detalhe do site público
+
+As páginas de projeto, ação, evento, informativo e reuniões da agenda dependem
+só do registro, dos álbuns ligados a ele, do layout (``Configuracao`` e
+``DadosAssociacao``), do idioma da sessão e dos templates. O decorator
+``detalhe_condicional`` calcula um validador com uma consulta que lê apenas
+``id``/``slug``/``updated_at``/``created_at`` (os registros têm imagens e PDFs
+em base64) e, se o navegador já tem a versão atual (``If-None-Match`` ou
+``If-Modified-Since``), responde 304 sem carregar o registro nem renderizar o
+template.
+
+Páginas com mensagens flash pendentes e URLs numéricas que serão redirecionadas
+para o slug passam direto para a rota.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import Response, current_app, make_response, request, session
+from sqlalchemy import func, select
+from werkzeug.http import is_resource_modified
+
+from database import usuario_autenticado
+from extensions import db
+from models import Album, Configuracao, DadosAssociacao
+
+# Arquivos que mudam o HTML das páginas (além dos dados)
+ARQUIVOS_TEMPLATE = ('templates', 'translations.py', 'app.py')
+
+_versao_templates = None
+
+
+def versao_templates(app):
+    """Hash dos templates/traduções, calculado uma vez por processo (a cada requisição em debug)"""
+    global _versao_templates
+    if _versao_templates is None or app.debug or app.config.get('TEMPLATES_AUTO_RELOAD'):
+        from snapshot import assinatura_arquivos
+
+        partes = assinatura_arquivos(app, *ARQUIVOS_TEMPLATE)
+        ultima_alteracao = max((p[2] for p in partes), default=0) // 1_000_000_000
+        _versao_templates = (
+            hashlib.sha256(json.dumps(partes).encode('utf-8')).hexdigest()[:16],
+            ultima_alteracao,
+        )
+    return _versao_templates
+
+
+def _colunas_versao(model):
+    return [getattr(model, nome) for nome in ('updated_at', 'created_at') if hasattr(model, nome)]
+
+
+def _validador(model, id, slug, tabela_albuns):
+    """(etag, last_modified) da página, ou None se a rota deve ser executada normalmente"""
+    consulta = select(model.id, model.slug, *_colunas_versao(model))
+    consulta = consulta.where(model.slug == slug) if slug else consulta.where(model.id == id)
+    linha = db.session.execute(consulta).first()
+    if linha is None:
+        return None
+    if not slug and linha.slug and not linha.slug.isdigit():
+        # A rota vai redirecionar para a URL com slug
+        return None
+
+    datas = list(linha[2:])
+    layout = [
+        select(func.max(Configuracao.updated_at)).scalar_subquery(),
+        select(func.max(DadosAssociacao.updated_at)).scalar_subquery(),
+    ]
+    if tabela_albuns is not None:
+        chave = [c for c in tabela_albuns.c if c.name != 'album_id'][0]
+        albuns = (
+            select(Album.id, Album.updated_at)
+            .join(tabela_albuns, tabela_albuns.c.album_id == Album.id)
+            .where(chave == linha.id)
+            .subquery()
+        )
+        layout += [
+            select(func.count(albuns.c.id)).scalar_subquery(),
+            select(func.max(albuns.c.updated_at)).scalar_subquery(),
+        ]
+    relacionados = list(db.session.execute(select(*layout)).one())
+    datas += [v for v in relacionados if hasattr(v, 'year')]
+
+    versao, mtime_templates = versao_templates(current_app)
+    etag = hashlib.sha1(json.dumps(
+        [model.__tablename__, linha.id, linha.slug, list(linha[2:]), relacionados,
+         session.get('language', 'pt'), versao],
+        default=str,
+    ).encode('utf-8')).hexdigest()[:32]
+
+    datas = [d.replace(tzinfo=timezone.utc) for d in datas if d is not None]
+    ultima_alteracao = max(datas, default=None)
+    if ultima_alteracao is not None:
+        ultima_alteracao = max(ultima_alteracao, datetime.fromtimestamp(mtime_templates, timezone.utc))
+    return etag, ultima_alteracao
+
+
+def detalhe_condicional(model, tabela_albuns=None):
+    """Responde 304 às requisições condicionais da página de detalhe de ``model``
+
+    ``tabela_albuns`` é a tabela de associação com ``Album`` quando a página
+    lista os álbuns do registro (``acao_album``, ``evento_album``).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(id=None, slug=None):
+            if request.method not in ('GET', 'HEAD') or session.get('_flashes'):
+                return view(id=id, slug=slug)
+
+            validador = _validador(model, id, slug, tabela_albuns)
+            if validador is None:
+                return view(id=id, slug=slug)
+            etag, ultima_alteracao = validador
+
+            if is_resource_modified(request.environ, etag=etag, last_modified=ultima_alteracao):
+                resposta = make_response(view(id=id, slug=slug))
+                if resposta.status_code != 200:
+                    return resposta
+            else:
+                resposta = Response(status=304)
+
+            resposta.set_etag(etag)
+            if ultima_alteracao is not None:
+                resposta.last_modified = ultima_alteracao
+            # Sempre revalida; o idioma vem do cookie de sessão
+            resposta.headers['Cache-Control'] = 'private, no-cache' if usuario_autenticado() else 'public, no-cache'
+            resposta.vary.add('Cookie')
+            return resposta
+        return wrapper
+    return decorator
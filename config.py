@@ -0,0 +1,65 @@
+"""Configuração da aplicação Flask (banco de dados, uploads, idiomas)"""
+import os
+import tempfile
+
+from database import configure_database
+
+
+def normalizar_database_url(database_url):
+    """Ajusta URLs postgres:// do Render para o driver psycopg (versão 3)"""
+    # Render usa PostgreSQL, mas se for SQLite, ajustar o formato
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql+psycopg://', 1)
+    elif database_url.startswith('postgresql://') and '+psycopg' not in database_url:
+        # Garantir que usa psycopg (versão 3) ao invés de psycopg2
+        database_url = database_url.replace('postgresql://', 'postgresql+psycopg://', 1)
+    return database_url
+
+
+def resolver_database_url():
+    """Retorna a URI do banco a partir de DATABASE_URL, ou SQLite local como fallback"""
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        database_url = normalizar_database_url(database_url)
+        print(f"✅ Usando PostgreSQL: {database_url[:50]}...")  # Log parcial da URL por segurança
+        return database_url
+
+    # SQLite local - usar caminho absoluto para persistência no Render
+    # AVISO: SQLite não persiste no Render! Use PostgreSQL em produção.
+    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'aadvita.db')
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    print("⚠️ AVISO: Usando SQLite local - dados NÃO persistirão no Render!")
+    print("⚠️ Configure DATABASE_URL no Render para usar PostgreSQL!")
+    return f'sqlite:///{db_path}'
+
+
+def configure_app(app):
+    """Aplica a configuração padrão à instância Flask"""
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'aadvita-secret-key-2024')
+    # Configurar banco de dados - usar variável de ambiente se disponível, senão usar SQLite local
+    database_uri = resolver_database_url()
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Pool, statement timeout e réplica de leitura (ver database.py)
+    configure_database(app, database_uri)
+    app.config['LANGUAGES'] = {
+        'pt': 'Português',
+        'es': 'Español',
+        'en': 'English'
+    }
+    # Endereço canônico do site (ex.: https://www.aadvita.org.br) para URLs absolutas
+    # que vão para conteúdo cacheado, como o QR Code dos certificados
+    app.config['SITE_URL'] = (os.environ.get('SITE_URL') or '').rstrip('/')
+    app.config['UPLOAD_FOLDER'] = 'static/images/uploads'
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+    app.config['ALLOWED_DOCUMENT_EXTENSIONS'] = {'pdf', 'doc', 'docx', 'xls', 'xlsx', 'txt', 'odt', 'ods'}
+    # Snapshot estático do site público (ver snapshot.py); padrão: instance/snapshot
+    app.config['SNAPSHOT_DIR'] = os.environ.get('SNAPSHOT_DIR') or os.path.join(app.instance_path, 'snapshot')
+    # Bytecode compilado dos templates, compartilhado pelos workers (ver compilacao.py);
+    # padrão fora do checkout, no diretório temporário do sistema
+    app.config['JINJA_CACHE_DIR'] = os.environ.get('JINJA_CACHE_DIR') or os.path.join(tempfile.gettempdir(), 'aadvita-jinja')
+    # Perfis de requisições gravados pelo perfilador (ver perfilador.py)
+    app.config['PERFILADOR_DIR'] = os.environ.get('PERFILADOR_DIR') or os.path.join(app.instance_path, 'perfis')
+    # Manifestos e blobs dos backups incrementais (ver backups.py)
+    app.config['BACKUP_DIR'] = os.environ.get('BACKUP_DIR') or os.path.join(app.instance_path, 'backups')
@@ -0,0 +1,119 @@
+"""Renderização de texto rico para HTML no momento da gravação
+
+Os textos longos dos relatórios de atividades e das prestações de contas são
+digitados em textarea (às vezes colados com ``<br>`` e outras tags). Ao gravar,
+o texto-fonte é normalizado (``<br>`` vira quebra de linha, demais tags são
+removidas) e o HTML sanitizado de cada idioma é guardado ao lado da fonte, em
+``<campo>_html_<idioma>``. As páginas públicas só imprimem esse HTML pronto.
+
+- ``normalizar_texto``: texto-fonte limpo, mostrado no formulário de edição
+- ``renderizar_texto``: HTML seguro (texto escapado, quebras em ``<br>``)
+- ``renderizar_campos``: chamado pelos formulários do admin antes do commit
+- ``renderizar_pendentes``: preenche o HTML de registros antigos (backfill)
+"""
+import html
+import re
+
+from markupsafe import escape
+from sqlalchemy import or_
+
+from extensions import db
+from models import PrestacaoConta, RelatorioAtividade
+
+IDIOMAS = ('pt', 'es', 'en')
+
+# Campos de texto rico de cada modelo; o HTML fica em <campo>_html_<idioma>
+CAMPOS_RENDERIZADOS = {
+    RelatorioAtividade: ('descricao', 'atividades_realizadas', 'resultados'),
+    PrestacaoConta: ('descricao', 'recursos_recebidos', 'resultados'),
+}
+
+_RE_BR = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_RE_TAG = re.compile(r'<[^>]+>')
+
+
+def normalizar_texto(texto):
+    """Converte tags <br> em quebras de linha e remove as demais tags HTML"""
+    if not texto:
+        return texto
+    texto = texto.replace('\r\n', '\n').replace('\r', '\n')
+    texto = _RE_BR.sub('\n', texto)
+    return _RE_TAG.sub('', texto)
+
+
+def renderizar_texto(texto):
+    """HTML seguro do texto: entidades resolvidas, conteúdo escapado e quebras em <br>
+
+    Retorna None para texto vazio, para que ``get_text`` caia no idioma padrão.
+    """
+    texto = normalizar_texto(texto)
+    if not texto or not texto.strip():
+        return None
+    return str(escape(html.unescape(texto))).replace('\n', '<br>')
+
+
+def renderizar_campos(obj):
+    """Normaliza a fonte e grava o HTML de todos os campos/idiomas do objeto"""
+    for campo in CAMPOS_RENDERIZADOS[type(obj)]:
+        for idioma in IDIOMAS:
+            fonte = normalizar_texto(getattr(obj, f'{campo}_{idioma}', None))
+            setattr(obj, f'{campo}_{idioma}', fonte)
+            setattr(obj, f'{campo}_html_{idioma}', renderizar_texto(fonte))
+
+
+def _pendentes(model):
+    """Filtro dos registros com fonte preenchida e HTML ainda não gerado"""
+    condicoes = []
+    for campo in CAMPOS_RENDERIZADOS[model]:
+        for idioma in IDIOMAS:
+            fonte = getattr(model, f'{campo}_{idioma}')
+            destino = getattr(model, f'{campo}_html_{idioma}')
+            condicoes.append(db.and_(fonte.isnot(None), fonte != '', destino.is_(None)))
+    return or_(*condicoes)
+
+
+def contar_pendentes(todos=False):
+    total = 0
+    for model in CAMPOS_RENDERIZADOS:
+        query = model.query
+        if not todos:
+            query = query.filter(_pendentes(model))
+        total += query.count()
+    return total
+
+
+def renderizar_pendentes(todos=False, commit=True, lote=None, progresso=None):
+    """Gera o HTML dos registros gravados antes desta etapa existir
+
+    Com ``todos=True`` re-renderiza todos os registros (por exemplo depois de
+    mudar ``renderizar_texto``). Com ``lote`` os registros são carregados e
+    confirmados N por vez, chamando ``progresso(feitos, None)`` após cada lote.
+    Retorna quantos registros foram processados.
+    """
+    total = 0
+    for model in CAMPOS_RENDERIZADOS:
+        query = model.query.order_by(model.id.asc())
+        if not todos:
+            query = query.filter(_pendentes(model))
+        if not lote:
+            for obj in query.all():
+                renderizar_campos(obj)
+                total += 1
+            continue
+
+        ultimo_id = 0
+        while True:
+            objs = query.filter(model.id > ultimo_id).limit(lote).all()
+            if not objs:
+                break
+            for obj in objs:
+                renderizar_campos(obj)
+            total += len(objs)
+            ultimo_id = objs[-1].id
+            if commit:
+                db.session.commit()
+            if progresso:
+                progresso(total, None)
+    if commit:
+        db.session.commit()
+    return total
@@ -0,0 +1,256 @@
+"""Gerenciamento de conexões com o banco de dados
+
+- Opções do pool (tamanho, overflow, recycle, pre-ping) lidas de variáveis de ambiente
+- Statement timeout por requisição (Postgres, via ``SET LOCAL``)
+- Réplica de leitura opcional: GETs anônimos leem da réplica, escritas vão ao primário
+- Métricas de checkout e espera do pool, por engine
+
+Variáveis de ambiente:
+
+    DB_POOL_SIZE              conexões mantidas por worker (padrão: GUNICORN_THREADS, mín. 2)
+    DB_MAX_OVERFLOW           conexões extras sob pico (padrão: GUNICORN_THREADS)
+    DB_POOL_TIMEOUT           segundos esperando uma conexão livre (padrão: 10)
+    DB_POOL_RECYCLE           recicla conexões mais velhas que N segundos (padrão: 1800)
+    DB_POOL_PRE_PING          testa a conexão no checkout (padrão: 1)
+    DB_STATEMENT_TIMEOUT_MS   timeout de cada comando durante requisições (padrão: 0 = sem limite)
+    DB_CONNECT_TIMEOUT        segundos para abrir uma conexão com o Postgres (padrão: 10)
+    DATABASE_REPLICA_URL      URL de uma réplica somente leitura (opcional)
+
+Para testar a réplica localmente basta apontar DATABASE_URL e DATABASE_REPLICA_URL
+para dois arquivos SQLite diferentes.
+"""
+import os
+import threading
+import time
+
+from flask import current_app, g, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+REPLICA_BIND_KEY = 'replica'
+
+
+def _env_int(nome, padrao):
+    try:
+        return int(os.environ.get(nome, padrao))
+    except (TypeError, ValueError):
+        return padrao
+
+
+def _env_bool(nome, padrao):
+    valor = os.environ.get(nome)
+    if valor is None:
+        return padrao
+    return valor.strip().lower() in ('1', 'true', 'yes', 'sim', 'on')
+
+
+def engine_options(database_uri):
+    """Opções de create_engine para a URI, a partir das variáveis de ambiente"""
+    options = {
+        'pool_pre_ping': _env_bool('DB_POOL_PRE_PING', True),
+        'pool_recycle': _env_int('DB_POOL_RECYCLE', 1800),
+    }
+
+    # Sem limite, uma conexão com o banco fora do ar pode travar a requisição (e a
+    # verificação de saúde do snapshot) até o timeout do sistema operacional
+    if database_uri.startswith('postgresql'):
+        options['connect_args'] = {'connect_timeout': _env_int('DB_CONNECT_TIMEOUT', 10)}
+
+    # SQLite em memória usa StaticPool (aplicado pelo Flask-SQLAlchemy), que não aceita
+    # opções de dimensionamento
+    if database_uri.startswith('sqlite') and (database_uri.endswith(':memory:') or database_uri in ('sqlite://', 'sqlite:///')):
+        return options
+
+    # Cada thread do worker usa no máximo uma conexão por vez; o overflow absorve
+    # picos (ex.: tarefas em background) sem manter conexões ociosas abertas
+    threads = max(_env_int('GUNICORN_THREADS', 1), 1)
+    options.update({
+        'poolclass': TimedQueuePool,
+        'pool_size': _env_int('DB_POOL_SIZE', max(threads, 2)),
+        'max_overflow': _env_int('DB_MAX_OVERFLOW', threads),
+        'pool_timeout': _env_int('DB_POOL_TIMEOUT', 10),
+    })
+    return options
+
+
+def configure_database(app, database_uri):
+    """Preenche SQLALCHEMY_ENGINE_OPTIONS/BINDS e o timeout padrão na config da aplicação"""
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(database_uri)
+    app.config['DB_STATEMENT_TIMEOUT_MS'] = _env_int('DB_STATEMENT_TIMEOUT_MS', 0)
+
+    replica_url = os.environ.get('DATABASE_REPLICA_URL')
+    if replica_url:
+        from config import normalizar_database_url
+
+        replica_url = normalizar_database_url(replica_url)
+        app.config['SQLALCHEMY_BINDS'] = {
+            REPLICA_BIND_KEY: dict(url=replica_url, **engine_options(replica_url)),
+        }
+        print(f"✅ Réplica de leitura configurada: {replica_url[:50]}...")
+
+
+# ============================================
+# MÉTRICAS DO POOL
+# ============================================
+
+class PoolMetrics:
+    """Contadores de uso de um pool de conexões (por processo)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def incrementar(self, campo):
+        with self._lock:
+            setattr(self, campo, getattr(self, campo) + 1)
+
+    def registrar_espera(self, ms, timeout=False):
+        with self._lock:
+            self.waits += 1
+            self.wait_total_ms += ms
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+            if timeout:
+                self.timeouts += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                'connects': self.connects,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'invalidations': self.invalidations,
+                'timeouts': self.timeouts,
+                'wait_avg_ms': round(self.wait_total_ms / self.waits, 3) if self.waits else 0.0,
+                'wait_max_ms': round(self.wait_max_ms, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool que mede o tempo de espera por uma conexão livre"""
+
+    metrics = None
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        timeout = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timeout = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.registrar_espera((time.perf_counter() - inicio) * 1000, timeout)
+
+
+_pool_metrics = {}
+
+
+def _instrumentar_engine(nome, engine):
+    metrics = _pool_metrics.setdefault(nome, PoolMetrics())
+    pool = engine.pool
+    if isinstance(pool, TimedQueuePool):
+        pool.metrics = metrics
+
+    event.listen(pool, 'connect', lambda *a: metrics.incrementar('connects'))
+    event.listen(pool, 'checkout', lambda *a: metrics.incrementar('checkouts'))
+    event.listen(pool, 'checkin', lambda *a: metrics.incrementar('checkins'))
+    event.listen(pool, 'invalidate', lambda *a: metrics.incrementar('invalidations'))
+
+
+def pool_stats(db):
+    """Retorna métricas e estado atual de cada pool (primário e réplica)"""
+    stats = {}
+    for bind_key, engine in db.engines.items():
+        nome = bind_key or 'primary'
+        metrics = _pool_metrics.get(nome)
+        pool = engine.pool
+        dados = metrics.as_dict() if metrics else {}
+        dados['pool_class'] = type(pool).__name__
+        for attr in ('size', 'checkedout', 'overflow', 'checkedin'):
+            fn = getattr(pool, attr, None)
+            if callable(fn):
+                dados[attr] = fn()
+        stats[nome] = dados
+    return stats
+
+
+# ============================================
+# ROTEAMENTO PRIMÁRIO / RÉPLICA
+# ============================================
+
+def _leitura_na_replica(clause):
+    if not has_request_context() or not g.get('db_use_replica') or g.get('db_wrote'):
+        return False
+    # Apenas SELECTs; UPDATE/INSERT/DELETE e SQL textual sempre vão ao primário
+    return clause is not None and getattr(clause, 'is_select', False)
+
+
+class RoutingSession(Session):
+    """Sessão que envia SELECTs de requisições anônimas para a réplica de leitura"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and _leitura_na_replica(clause):
+            replica = self._db.engines.get(REPLICA_BIND_KEY)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _marcar_escrita(session, flush_context):
+    # Depois de escrever, o resto da requisição lê do primário (evita ler dados atrasados)
+    if has_request_context():
+        g.db_wrote = True
+
+
+@event.listens_for(RoutingSession, 'after_begin')
+def _aplicar_statement_timeout(session, transaction, connection):
+    if not has_request_context() or connection.dialect.name != 'postgresql':
+        return
+    timeout_ms = g.get('db_statement_timeout_ms')
+    if timeout_ms is None:
+        timeout_ms = current_app.config.get('DB_STATEMENT_TIMEOUT_MS', 0)
+    if timeout_ms:
+        connection.exec_driver_sql(f'SET LOCAL statement_timeout = {int(timeout_ms)}')
+
+
+def definir_statement_timeout(ms):
+    """Sobrescreve o statement timeout da requisição atual (0 = sem limite)
+
+    Deve ser chamado antes da primeira query da requisição.
+    """
+    g.db_statement_timeout_ms = int(ms)
+
+
+def usuario_autenticado():
+    return bool(
+        session.get('admin_logged_in')
+        or session.get('associado_logged_in')
+        or session.get('voluntario_logged_in')
+    )
+
+
+def init_database(app, db):
+    """Instrumenta os pools e registra o roteamento de leitura por requisição"""
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            _instrumentar_engine(bind_key or 'primary', engine)
+
+    tem_replica = REPLICA_BIND_KEY in app.config.get('SQLALCHEMY_BINDS', {})
+
+    @app.before_request
+    def _escolher_banco_da_requisicao():
+        g.db_use_replica = (
+            tem_replica
+            and request.method in ('GET', 'HEAD')
+            and not usuario_autenticado()
+        )
@@ -0,0 +1,332 @@
+"""Disponibilidade de voluntários e conflitos de agendamento
+
+As ofertas de horas (``OfertaHoras``) guardam os dias da semana como texto livre
+("Segunda, Quarta e Sexta", "seg a sex", "Todos os dias") e os horários como
+string. Aqui elas são convertidas em intervalos semanais normalizados
+(dia da semana + minutos desde a meia-noite + vigência em datas) e organizadas
+em um índice por dia da semana:
+
+- cada dia tem a lista ordenada dos pontos de início/fim dos intervalos e, para
+  cada trecho entre dois pontos consecutivos, os intervalos que o cobrem;
+- a pergunta "quem está livre de 14:00 às 16:00 na segunda?" vira uma busca
+  binária pelo trecho que contém 14:00 (O(log n)) seguida do filtro dos poucos
+  intervalos que cobrem esse trecho.
+
+O índice é montado uma vez por processo e reconstruído quando ofertas ou
+voluntários mudam (assinatura com contagem + maior ``updated_at``).
+
+``conflitos`` verifica sobreposição com os agendamentos do voluntário no dia;
+``voluntarios_disponiveis`` junta as duas coisas para o formulário do admin.
+"""
+import threading
+import unicodedata
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, select
+
+from extensions import db
+from models import AgendamentoVoluntario, OfertaHoras, Voluntario
+
+MINUTOS_DIA = 24 * 60
+
+# Ofertas consideradas no índice; 'agendada' continua valendo para os demais horários
+STATUS_OFERTA_ATIVA = ('disponivel', 'agendada')
+
+# Agendamentos que não ocupam o horário do voluntário
+STATUS_AGENDAMENTO_LIVRE = ('cancelado',)
+
+_DIAS = {
+    'segunda': 0, 'seg': 0, 'lunes': 0, 'lun': 0, 'monday': 0, 'mon': 0,
+    'terca': 1, 'ter': 1, 'martes': 1, 'mar': 1, 'tuesday': 1, 'tue': 1,
+    'quarta': 2, 'qua': 2, 'miercoles': 2, 'mie': 2, 'wednesday': 2, 'wed': 2,
+    'quinta': 3, 'qui': 3, 'jueves': 3, 'jue': 3, 'thursday': 3, 'thu': 3,
+    'sexta': 4, 'sex': 4, 'viernes': 4, 'vie': 4, 'friday': 4, 'fri': 4,
+    'sabado': 5, 'sab': 5, 'saturday': 5, 'sat': 5,
+    'domingo': 6, 'dom': 6, 'sunday': 6, 'sun': 6,
+}
+_TODOS_OS_DIAS = frozenset(range(7))
+_EXPRESSOES = (
+    (('todos os dias', 'todos los dias', 'every day', 'diariamente', 'qualquer dia'), _TODOS_OS_DIAS),
+    (('dias uteis', 'dia util', 'dias habiles', 'weekdays'), frozenset(range(5))),
+    (('fim de semana', 'fins de semana', 'fin de semana', 'weekend'), frozenset((5, 6))),
+)
+_SEPARADORES_FAIXA = (' a ', ' ate ', ' al ', ' to ', '-')
+
+IntervaloSemanal = namedtuple(
+    'IntervaloSemanal',
+    'voluntario_id oferta_id dia inicio fim data_inicio data_fim area',
+)
+
+
+def _sem_acentos(texto):
+    texto = unicodedata.normalize('NFKD', texto or '')
+    return ''.join(c for c in texto if not unicodedata.combining(c)).lower().strip()
+
+
+def _token_dia(token):
+    token = token.strip(' .;,').replace('-feira', '').replace('feira', '').strip()
+    if token in _DIAS:
+        return _DIAS[token]
+    return _DIAS.get(token[:3])
+
+
+def parse_hora(valor):
+    """Minutos desde a meia-noite para "08:00", "8h", "8h30", "08:00:00"; None se inválido"""
+    texto = _sem_acentos(str(valor)) if valor is not None else ''
+    if not texto:
+        return None
+    texto = texto.replace('h', ':').rstrip(':')
+    partes = texto.split(':')
+    try:
+        horas = int(partes[0])
+        minutos = int(partes[1]) if len(partes) > 1 and partes[1] else 0
+    except ValueError:
+        return None
+    if not (0 <= horas <= 24 and 0 <= minutos < 60) or (horas == 24 and minutos):
+        return None
+    return horas * 60 + minutos
+
+
+def formatar_hora(minutos):
+    return f'{minutos // 60:02d}:{minutos % 60:02d}'
+
+
+def parse_dias_semana(texto):
+    """Conjunto de dias da semana (0 = segunda) descritos no texto livre
+
+    Texto vazio ou não reconhecido significa todos os dias.
+    """
+    texto = _sem_acentos(texto)
+    if not texto:
+        return _TODOS_OS_DIAS
+    for expressoes, dias in _EXPRESSOES:
+        if any(e in texto for e in expressoes):
+            return dias
+
+    dias = set()
+    for parte in texto.replace(' e ', ',').replace(' y ', ',').replace(' and ', ',').replace(';', ',').replace('/', ',').split(','):
+        parte = parte.strip()
+        if not parte:
+            continue
+        for separador in _SEPARADORES_FAIXA:
+            if separador in parte:
+                inicio, _, fim = parte.partition(separador)
+                # "de segunda a sexta": último termo antes e primeiro depois do separador
+                d1 = _token_dia(inicio.split()[-1]) if inicio.split() else None
+                d2 = _token_dia(fim.split()[0]) if fim.split() else None
+                if d1 is not None and d2 is not None:
+                    # Faixa circular: "sexta a segunda" = sex, sab, dom, seg
+                    d = d1
+                    dias.add(d)
+                    while d != d2:
+                        d = (d + 1) % 7
+                        dias.add(d)
+                    break
+        else:
+            for token in parte.split():
+                d = _token_dia(token)
+                if d is not None:
+                    dias.add(d)
+    return frozenset(dias) or _TODOS_OS_DIAS
+
+
+def intervalos_da_oferta(oferta, voluntario_id=None, area=None):
+    """Intervalos semanais normalizados de uma oferta
+
+    Sem ``data_fim`` a oferta vale só em ``data_inicio``, a menos que informe dias
+    da semana (nesse caso é recorrente a partir de ``data_inicio``). Horários que
+    cruzam a meia-noite são divididos entre os dois dias.
+    """
+    inicio = parse_hora(oferta.hora_inicio)
+    fim = parse_hora(oferta.hora_fim)
+    if inicio is None:
+        inicio = 0
+    if fim is None or fim == inicio:
+        fim = MINUTOS_DIA
+
+    data_inicio = oferta.data_inicio
+    data_fim = oferta.data_fim
+    if data_fim is None and not (oferta.dias_semana or '').strip():
+        data_fim = data_inicio
+    dias = parse_dias_semana(oferta.dias_semana)
+    if data_inicio and data_fim == data_inicio:
+        dias = frozenset((data_inicio.weekday(),))
+
+    voluntario_id = voluntario_id if voluntario_id is not None else oferta.voluntario_id
+    area = _sem_acentos(area if area is not None else oferta.area_atividade)
+    intervalos = []
+    for dia in sorted(dias):
+        if fim > inicio:
+            intervalos.append(IntervaloSemanal(voluntario_id, oferta.id, dia, inicio, fim, data_inicio, data_fim, area))
+        else:
+            intervalos.append(IntervaloSemanal(voluntario_id, oferta.id, dia, inicio, MINUTOS_DIA, data_inicio, data_fim, area))
+            fim_seguinte = data_fim + timedelta(days=1) if data_fim else None
+            intervalos.append(IntervaloSemanal(voluntario_id, oferta.id, (dia + 1) % 7, 0, fim, data_inicio, fim_seguinte, area))
+    return intervalos
+
+
+class IndiceDisponibilidade:
+    """Índice de intervalos semanais por dia da semana (consulta por ponto em O(log n + k))"""
+
+    def __init__(self, intervalos):
+        self.total = len(intervalos)
+        self._pontos = {}
+        self._trechos = {}
+        por_dia = defaultdict(list)
+        for intervalo in intervalos:
+            por_dia[intervalo.dia].append(intervalo)
+        for dia, lista in por_dia.items():
+            pontos = sorted({i.inicio for i in lista} | {i.fim for i in lista})
+            trechos = [[] for _ in pontos]
+            for intervalo in lista:
+                # Trechos [pontos[k], pontos[k+1]) inteiramente cobertos pelo intervalo
+                k = bisect_right(pontos, intervalo.inicio) - 1
+                while k < len(pontos) and pontos[k] < intervalo.fim:
+                    trechos[k].append(intervalo)
+                    k += 1
+            self._pontos[dia] = pontos
+            self._trechos[dia] = [tuple(t) for t in trechos]
+
+    def cobrindo(self, data, inicio, fim, area=None):
+        """Intervalos vigentes em ``data`` que cobrem [inicio, fim) inteiro"""
+        pontos = self._pontos.get(data.weekday())
+        if not pontos:
+            return []
+        k = bisect_right(pontos, inicio) - 1
+        if k < 0:
+            return []
+        area = _sem_acentos(area)
+        encontrados = []
+        for intervalo in self._trechos[data.weekday()][k]:
+            if intervalo.fim < fim:
+                continue
+            if intervalo.data_inicio and data < intervalo.data_inicio:
+                continue
+            if intervalo.data_fim and data > intervalo.data_fim:
+                continue
+            if area and intervalo.area and area not in intervalo.area and intervalo.area not in area:
+                continue
+            encontrados.append(intervalo)
+        return encontrados
+
+
+_indice = None
+_assinatura = None
+_lock = threading.Lock()
+
+
+def _assinatura_atual():
+    return tuple(db.session.execute(select(
+        select(func.count(OfertaHoras.id)).scalar_subquery(),
+        select(func.max(OfertaHoras.updated_at)).scalar_subquery(),
+        select(func.count(Voluntario.id)).scalar_subquery(),
+        select(func.max(Voluntario.updated_at)).scalar_subquery(),
+    )).one())
+
+
+def construir_indice():
+    """Monta o índice com as ofertas ativas de voluntários aprovados e ativos"""
+    linhas = db.session.execute(
+        select(OfertaHoras)
+        .join(Voluntario, Voluntario.id == OfertaHoras.voluntario_id)
+        .where(
+            OfertaHoras.status.in_(STATUS_OFERTA_ATIVA),
+            Voluntario.status == 'aprovado',
+            Voluntario.ativo.is_(True),
+        )
+    ).scalars().all()
+    intervalos = []
+    for oferta in linhas:
+        intervalos.extend(intervalos_da_oferta(oferta))
+    return IndiceDisponibilidade(intervalos)
+
+
+def obter_indice():
+    """Índice do processo, reconstruído quando a assinatura das tabelas muda"""
+    global _indice, _assinatura
+    assinatura = _assinatura_atual()
+    with _lock:
+        if _indice is None or assinatura != _assinatura:
+            _indice = construir_indice()
+            _assinatura = assinatura
+        return _indice
+
+
+def _agendamentos_ocupando(data, voluntario_ids, ignorar_id=None):
+    if not voluntario_ids:
+        return []
+    query = AgendamentoVoluntario.query.filter(
+        AgendamentoVoluntario.data_agendamento == data,
+        AgendamentoVoluntario.voluntario_id.in_(list(voluntario_ids)),
+        ~AgendamentoVoluntario.status.in_(STATUS_AGENDAMENTO_LIVRE),
+    )
+    if ignorar_id:
+        query = query.filter(AgendamentoVoluntario.id != ignorar_id)
+    return query.all()
+
+
+def _sobrepoe(agendamento, inicio, fim):
+    a_inicio = parse_hora(agendamento.hora_inicio)
+    a_fim = parse_hora(agendamento.hora_fim)
+    if a_inicio is None or a_fim is None:
+        return True  # Horário ilegível: tratar como conflito para o admin conferir
+    if a_fim <= a_inicio:
+        a_fim = MINUTOS_DIA
+    return a_inicio < fim and inicio < a_fim
+
+
+def conflitos(voluntario_id, data, hora_inicio, hora_fim, ignorar_id=None):
+    """Agendamentos do voluntário no dia que se sobrepõem ao horário informado"""
+    inicio, fim = parse_hora(hora_inicio), parse_hora(hora_fim)
+    if not voluntario_id or data is None or inicio is None or fim is None:
+        return []
+    return [
+        a for a in _agendamentos_ocupando(data, [int(voluntario_id)], ignorar_id)
+        if _sobrepoe(a, inicio, fim)
+    ]
+
+
+def voluntarios_disponiveis(data, hora_inicio, hora_fim, area=None, ignorar_id=None):
+    """Voluntários com oferta cobrindo o horário e sem agendamento sobreposto
+
+    Retorna ``(disponiveis, ocupados)``: listas de dicts com o voluntário, as
+    ofertas que cobrem o horário e (para os ocupados) os agendamentos em conflito.
+    """
+    if isinstance(data, str):
+        try:
+            data = datetime.strptime(data, '%Y-%m-%d').date()
+        except ValueError:
+            data = None
+    if not isinstance(data, date):
+        raise ValueError('Data inválida')
+    inicio, fim = parse_hora(hora_inicio), parse_hora(hora_fim)
+    if inicio is None or fim is None or fim <= inicio:
+        raise ValueError('Horário inválido')
+
+    intervalos = obter_indice().cobrindo(data, inicio, fim, area)
+    ofertas_por_voluntario = defaultdict(list)
+    for intervalo in intervalos:
+        if intervalo.oferta_id not in ofertas_por_voluntario[intervalo.voluntario_id]:
+            ofertas_por_voluntario[intervalo.voluntario_id].append(intervalo.oferta_id)
+    if not ofertas_por_voluntario:
+        return [], []
+
+    conflitos_por_voluntario = defaultdict(list)
+    for agendamento in _agendamentos_ocupando(data, ofertas_por_voluntario, ignorar_id):
+        if _sobrepoe(agendamento, inicio, fim):
+            conflitos_por_voluntario[agendamento.voluntario_id].append(agendamento)
+
+    voluntarios = {
+        v.id: v for v in Voluntario.query.filter(Voluntario.id.in_(list(ofertas_por_voluntario))).all()
+    }
+    disponiveis, ocupados = [], []
+    for voluntario_id in sorted(voluntarios, key=lambda i: voluntarios[i].nome_completo.lower()):
+        item = {
+            'voluntario': voluntarios[voluntario_id],
+            'ofertas': ofertas_por_voluntario[voluntario_id],
+            'conflitos': conflitos_por_voluntario.get(voluntario_id, []),
+        }
+        (ocupados if item['conflitos'] else disponiveis).append(item)
+    return disponiveis, ocupados
@@ -0,0 +1,405 @@
+"""Exportação de relatórios administrativos em CSV e XLSX
+
+Os relatórios (associados, mensalidades, doações e gastos) selecionam só as
+colunas exportadas — nunca fotos, PDFs ou outros campos base64 — e percorrem o
+resultado com ``yield_per``, que no PostgreSQL usa cursor no servidor. O CSV é
+enviado em partes à medida que as linhas chegam; o XLSX usa workbook
+``write_only`` do openpyxl gravado em arquivo temporário. Em ambos a memória
+usada não depende da quantidade de linhas.
+
+Exportações grandes podem rodar em segundo plano (``iniciar_exportacao``): o
+arquivo gerado vai para o armazenamento de blobs (arquivos.py) e fica
+disponível para download só em /admin/exportacoes, sem cache: os relatórios
+têm CPF, telefone e endereço, e a rota pública /arquivos não serve esses blobs.
+"""
+import csv
+import importlib.util
+import io
+import json
+import tempfile
+import threading
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from flask import current_app
+from sqlalchemy import delete, func, select
+from werkzeug.datastructures import FileStorage
+
+from extensions import db
+from models import Associado, Doacao, ExportacaoRelatorio, Gasto, Mensalidade
+
+# Linhas buscadas por ida ao banco (e por parte enviada no CSV)
+LINHAS_POR_LOTE = 1000
+
+# Dias que uma exportação em segundo plano fica disponível para download
+EXPORTACAO_VALIDADE_DIAS = 7
+
+FORMATOS = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# origem: tabela (ou join) do FROM; data: coluna filtrada pelo período;
+# filtros: parâmetros aceitos -> coluna (comparação por igualdade)
+Relatorio = namedtuple('Relatorio', 'titulo colunas origem data filtros ordem')
+
+RELATORIOS = {
+    'associados': Relatorio(
+        titulo='Associados',
+        colunas=(
+            ('ID', Associado.id),
+            ('Nome completo', Associado.nome_completo),
+            ('CPF', Associado.cpf),
+            ('Data de nascimento', Associado.data_nascimento),
+            ('Telefone', Associado.telefone),
+            ('Endereço', Associado.endereco),
+            ('Status', Associado.status),
+            ('Tipo', Associado.tipo_associado),
+            ('Ativo', Associado.ativo),
+            ('Valor da mensalidade', Associado.valor_mensalidade),
+            ('Tipo de desconto', Associado.desconto_tipo),
+            ('Desconto', Associado.desconto_valor),
+            ('Cadastrado em', Associado.created_at),
+        ),
+        origem=Associado.__table__,
+        data=Associado.created_at,
+        filtros={
+            'status': Associado.status,
+            'tipo_associado': Associado.tipo_associado,
+            'associado_id': Associado.id,
+        },
+        ordem=(Associado.nome_completo, Associado.id),
+    ),
+    'mensalidades': Relatorio(
+        titulo='Mensalidades',
+        colunas=(
+            ('ID', Mensalidade.id),
+            ('ID do associado', Mensalidade.associado_id),
+            ('Associado', Associado.nome_completo),
+            ('CPF', Associado.cpf),
+            ('Mês', Mensalidade.mes_referencia),
+            ('Ano', Mensalidade.ano_referencia),
+            ('Vencimento', Mensalidade.data_vencimento),
+            ('Valor base', Mensalidade.valor_base),
+            ('Tipo de desconto', Mensalidade.desconto_tipo),
+            ('Desconto', Mensalidade.desconto_valor),
+            ('Valor final', Mensalidade.valor_final),
+            ('Status', Mensalidade.status),
+            ('Pagamento', Mensalidade.data_pagamento),
+            ('Observações', Mensalidade.observacoes),
+        ),
+        origem=Mensalidade.__table__.join(Associado.__table__, Mensalidade.associado_id == Associado.id),
+        data=Mensalidade.data_vencimento,
+        filtros={
+            'status': Mensalidade.status,
+            'associado_id': Mensalidade.associado_id,
+        },
+        ordem=(Mensalidade.data_vencimento, Mensalidade.id),
+    ),
+    'doacoes': Relatorio(
+        titulo='Doações',
+        colunas=(
+            ('ID', Doacao.id),
+            ('Data', Doacao.data_doacao),
+            ('Tipo', Doacao.tipo),
+            ('Descrição', Doacao.descricao),
+            ('Valor', Doacao.valor),
+            ('Quantidade', Doacao.quantidade),
+            ('Unidade', Doacao.unidade),
+            ('Doador', Doacao.doador),
+            ('País', Doacao.pais),
+            ('Telefone', Doacao.telefone),
+            ('Tipo de documento', Doacao.tipo_documento),
+            ('Documento', Doacao.documento),
+            ('Observações', Doacao.observacoes),
+        ),
+        origem=Doacao.__table__,
+        data=Doacao.data_doacao,
+        filtros={'tipo': Doacao.tipo},
+        ordem=(Doacao.data_doacao, Doacao.id),
+    ),
+    'gastos': Relatorio(
+        titulo='Gastos',
+        colunas=(
+            ('ID', Gasto.id),
+            ('Data', Gasto.data_gasto),
+            ('Descrição', Gasto.descricao),
+            ('Categoria', Gasto.categoria),
+            ('Fornecedor', Gasto.fornecedor),
+            ('Valor', Gasto.valor),
+            ('Observações', Gasto.observacoes),
+        ),
+        origem=Gasto.__table__,
+        data=Gasto.data_gasto,
+        filtros={'categoria': Gasto.categoria},
+        ordem=(Gasto.data_gasto, Gasto.id),
+    ),
+}
+
+
+# ============================================
+# CONSULTA
+# ============================================
+
+def _parse_data(valor):
+    try:
+        return datetime.strptime(valor, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f'Data inválida: {valor}')
+
+
+def filtros_da_requisicao(nome, args):
+    """Filtros válidos para o relatório a partir de ``request.args`` (ValueError se inválidos)"""
+    relatorio = RELATORIOS[nome]
+    filtros = {}
+    for chave in ('de', 'ate'):
+        if args.get(chave):
+            filtros[chave] = _parse_data(args[chave]).isoformat()
+    for chave in relatorio.filtros:
+        valor = (args.get(chave) or '').strip()
+        if not valor or valor == 'todos':
+            continue
+        if chave == 'associado_id':
+            if not valor.isdigit():
+                raise ValueError('Associado inválido')
+            valor = int(valor)
+        filtros[chave] = valor
+    return filtros
+
+
+def consulta(nome, filtros):
+    relatorio = RELATORIOS[nome]
+    stmt = select(*[coluna for _, coluna in relatorio.colunas]).select_from(relatorio.origem)
+    if filtros.get('de'):
+        stmt = stmt.where(relatorio.data >= _parse_data(filtros['de']))
+    if filtros.get('ate'):
+        ate = _parse_data(filtros['ate'])
+        # Colunas DateTime: inclui o dia inteiro
+        stmt = stmt.where(relatorio.data < ate + timedelta(days=1))
+    for chave, coluna in relatorio.filtros.items():
+        if chave in filtros:
+            stmt = stmt.where(coluna == filtros[chave])
+    return stmt.order_by(*relatorio.ordem)
+
+
+def contar_linhas(nome, filtros):
+    return db.session.execute(select(func.count()).select_from(consulta(nome, filtros).subquery())).scalar()
+
+
+def _linhas(nome, filtros, lote=LINHAS_POR_LOTE):
+    stmt = consulta(nome, filtros).execution_options(yield_per=lote)
+    for linha in db.session.execute(stmt):
+        yield tuple(linha)
+
+
+class _Contagem:
+    """Iterável que conta as linhas à medida que são consumidas
+
+    Se ``progresso`` for informado, é chamado com o total a cada ``a_cada`` linhas.
+    """
+
+    def __init__(self, linhas, progresso=None, a_cada=LINHAS_POR_LOTE):
+        self.linhas = linhas
+        self.total = 0
+        self.progresso = progresso
+        self.a_cada = a_cada
+
+    def __iter__(self):
+        for linha in self.linhas:
+            self.total += 1
+            if self.progresso and self.total % self.a_cada == 0:
+                self.progresso(self.total)
+            yield linha
+
+
+# ============================================
+# FORMATOS
+# ============================================
+
+# Caracteres iniciais que o Excel/LibreOffice interpretam como fórmula; números de
+# verdade chegam como int/Decimal e não passam por esse filtro
+INICIO_FORMULA = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _valor_csv(valor):
+    if valor is None:
+        return ''
+    if isinstance(valor, bool):
+        return 'Sim' if valor else 'Não'
+    if isinstance(valor, (Decimal, float)):
+        # Planilhas em pt-BR usam vírgula decimal (o separador do CSV é ';')
+        return f'{valor:.2f}'.replace('.', ',')
+    if isinstance(valor, datetime):
+        return valor.strftime('%d/%m/%Y %H:%M')
+    if isinstance(valor, date):
+        return valor.strftime('%d/%m/%Y')
+    if isinstance(valor, str):
+        # Evita que o conteúdo seja interpretado como fórmula ao abrir no Excel
+        if valor[:1] in INICIO_FORMULA:
+            return "'" + valor
+        return valor
+    return str(valor)
+
+
+def _valor_xlsx(ws, valor):
+    from openpyxl.cell import WriteOnlyCell
+
+    if isinstance(valor, bool):
+        return 'Sim' if valor else 'Não'
+    if isinstance(valor, Decimal):
+        return float(valor)
+    if isinstance(valor, date):
+        celula = WriteOnlyCell(ws, value=valor)
+        celula.number_format = 'DD/MM/YYYY HH:MM' if isinstance(valor, datetime) else 'DD/MM/YYYY'
+        return celula
+    if isinstance(valor, str) and valor.startswith('='):
+        # O openpyxl grava como fórmula todo texto iniciado por '='
+        celula = WriteOnlyCell(ws, value=valor)
+        celula.data_type = 's'
+        return celula
+    return valor
+
+
+def gerar_csv(nome, linhas):
+    """Gera o CSV em partes de ``LINHAS_POR_LOTE`` linhas (texto)"""
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer, delimiter=';')
+    # BOM para o Excel reconhecer o arquivo como UTF-8
+    buffer.write('\ufeff')
+    escritor.writerow([titulo for titulo, _ in RELATORIOS[nome].colunas])
+    for i, linha in enumerate(linhas, 1):
+        escritor.writerow([_valor_csv(v) for v in linha])
+        if i % LINHAS_POR_LOTE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def escrever_xlsx(nome, linhas, destino):
+    """Grava o XLSX em ``destino`` (arquivo binário) com workbook write-only"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    relatorio = RELATORIOS[nome]
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(relatorio.titulo[:31])
+    cabecalho = []
+    for titulo, _ in relatorio.colunas:
+        celula = WriteOnlyCell(ws, value=titulo)
+        celula.font = Font(bold=True)
+        cabecalho.append(celula)
+    ws.append(cabecalho)
+    for linha in linhas:
+        ws.append([_valor_xlsx(ws, v) for v in linha])
+    wb.save(destino)
+
+
+def xlsx_disponivel():
+    """O XLSX depende do openpyxl (opcional); sem ele só o CSV fica disponível"""
+    return importlib.util.find_spec('openpyxl') is not None
+
+
+def nome_arquivo(nome, formato, filtros=None):
+    partes = [nome]
+    if filtros:
+        partes += [str(filtros[k]) for k in ('de', 'ate') if filtros.get(k)]
+    partes.append(datetime.now().strftime('%Y%m%d_%H%M'))
+    return f"{'_'.join(partes)}.{formato}"
+
+
+def escrever_arquivo(nome, formato, filtros, destino, lote=LINHAS_POR_LOTE, progresso=None):
+    """Grava a exportação completa em ``destino``; retorna a quantidade de linhas"""
+    linhas = _Contagem(_linhas(nome, filtros, lote), progresso, lote)
+    if formato == 'xlsx':
+        escrever_xlsx(nome, linhas, destino)
+    else:
+        for parte in gerar_csv(nome, linhas):
+            destino.write(parte.encode('utf-8'))
+    return linhas.total
+
+
+def linhas_para_csv(nome, filtros):
+    """Partes do CSV para uma resposta em streaming"""
+    return gerar_csv(nome, _linhas(nome, filtros))
+
+
+# ============================================
+# SEGUNDO PLANO
+# ============================================
+
+def iniciar_exportacao(nome, formato, filtros, usuario_id=None, usuario_nome=None):
+    """Registra a exportação e a executa em uma thread do worker"""
+    exportacao = ExportacaoRelatorio(
+        relatorio=nome,
+        formato=formato,
+        filtros=json.dumps(filtros, ensure_ascii=False) if filtros else None,
+        status='pendente',
+        usuario_id=usuario_id,
+        usuario_nome=usuario_nome,
+    )
+    db.session.add(exportacao)
+    db.session.commit()
+
+    app = current_app._get_current_object()
+    threading.Thread(
+        target=_executar_em_segundo_plano,
+        args=(app, exportacao.id),
+        name=f'exportacao-{exportacao.id}',
+        daemon=True,
+    ).start()
+    return exportacao
+
+
+def _executar_em_segundo_plano(app, exportacao_id):
+    with app.app_context():
+        executar_exportacao(exportacao_id)
+
+
+def executar_exportacao(exportacao_id):
+    """Gera o arquivo de uma exportação registrada e guarda no armazenamento de blobs"""
+    from arquivos import ingerir_upload
+
+    exportacao = db.session.get(ExportacaoRelatorio, exportacao_id)
+    if exportacao is None:
+        return
+    exportacao.status = 'processando'
+    db.session.commit()
+
+    filtros = json.loads(exportacao.filtros) if exportacao.filtros else {}
+    try:
+        with tempfile.TemporaryFile() as arquivo:
+            total = escrever_arquivo(exportacao.relatorio, exportacao.formato, filtros, arquivo)
+            arquivo.seek(0)
+            ingerido = ingerir_upload(FileStorage(
+                stream=arquivo,
+                filename=nome_arquivo(exportacao.relatorio, exportacao.formato, filtros),
+                content_type=FORMATOS[exportacao.formato],
+            ))
+        exportacao.arquivo = ingerido.referencia
+        exportacao.tamanho = ingerido.tamanho
+        exportacao.linhas = total
+        exportacao.status = 'concluida'
+        exportacao.concluida_em = datetime.now()
+        db.session.commit()
+        print(f"✅ Exportação {exportacao_id} ({exportacao.relatorio}.{exportacao.formato}): {total} linha(s)")
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Erro na exportação {exportacao_id}: {e}")
+        exportacao = db.session.get(ExportacaoRelatorio, exportacao_id)
+        exportacao.status = 'erro'
+        exportacao.erro = str(e)[:500]
+        db.session.commit()
+    finally:
+        db.session.remove()
+
+
+def remover_expiradas(dias=EXPORTACAO_VALIDADE_DIAS, commit=True):
+    """Remove registros de exportações antigas (os blobs ficam órfãos para remover_orfaos)"""
+    limite = datetime.now() - timedelta(days=dias)
+    resultado = db.session.execute(delete(ExportacaoRelatorio).where(ExportacaoRelatorio.created_at < limite))
+    if commit:
+        db.session.commit()
+    return resultado.rowcount
@@ -0,0 +1,10 @@
+"""Extensões Flask compartilhadas entre a aplicação e os módulos auxiliares.
+
+Ficam aqui (e não em app.py) para que models, startup e scripts possam
+importar ``db`` sem carregar as rotas.
+"""
+from flask_sqlalchemy import SQLAlchemy
+
+from database import RoutingSession
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
@@ -0,0 +1,126 @@
+"""Cache de fragmentos de template (cabeçalho, navegação e rodapé)
+
+Registra a tag ``{% cache chave, ttl %}...{% endcache %}`` no Jinja: o HTML do
+bloco é guardado em memória (por processo) por ``ttl`` segundos e reutilizado
+nas próximas renderizações, inclusive em páginas que não podem ser cacheadas
+inteiras (áreas logadas, painel administrativo).
+
+A chave efetiva inclui, além da chave do template, o idioma da sessão, o host
+(URLs externas do JSON-LD) e a versão das configurações do site. A versão vem
+de uma consulta agregada (contagem e maior ``updated_at``) em ``Configuracao``
+e ``DadosAssociacao``, feita uma vez por requisição: quando o rodapé ou os
+dados da associação mudam, todos os workers passam a usar fragmentos novos.
+Os handlers de salvamento do admin chamam ``invalidar_fragmentos`` para que o
+worker que atendeu a alteração descarte os fragmentos imediatamente.
+
+``configuracoes_site`` reaproveita a mesma versão para guardar as configurações
+do rodapé e os dados da associação usados pelo context processor, que deixam de
+ser lidos do banco a cada renderização.
+
+Variáveis de ambiente:
+
+    FRAGMENTOS_CACHE    0 desativa o cache de fragmentos (padrão: 1; sempre desativado em debug)
+"""
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from flask import current_app, g, has_request_context, request, session
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+from sqlalchemy import func, select
+
+from extensions import db
+from models import Configuracao, DadosAssociacao
+
+# Limite de fragmentos em memória por processo (ao atingir, o cache é esvaziado)
+MAX_FRAGMENTOS = 512
+
+_fragmentos = {}
+_configuracoes = {'versao': None, 'footer_configs': {}, 'dados_associacao': None}
+_geracao = 0
+_lock = threading.Lock()
+
+
+def cache_ativo(app):
+    return app.config.get('FRAGMENTOS_CACHE', True) and not app.debug
+
+
+def versao_configuracoes():
+    """Versão das configurações do site (rodapé e dados da associação), uma consulta por requisição"""
+    if 'versao_configuracoes' not in g:
+        linha = db.session.execute(select(
+            select(func.count(Configuracao.id)).scalar_subquery(),
+            select(func.max(Configuracao.updated_at)).scalar_subquery(),
+            select(func.count(DadosAssociacao.id)).scalar_subquery(),
+            select(func.max(DadosAssociacao.updated_at)).scalar_subquery(),
+        )).one()
+        g.versao_configuracoes = (_geracao, *[str(v) for v in linha])
+    return g.versao_configuracoes
+
+
+def invalidar_fragmentos():
+    """Descarta os fragmentos e as configurações em memória deste processo"""
+    global _geracao
+    with _lock:
+        _geracao += 1
+        _fragmentos.clear()
+        _configuracoes['versao'] = None
+    g.pop('versao_configuracoes', None)
+
+
+def configuracoes_site():
+    """(footer_configs, dados_associacao) com cache pela versão das configurações"""
+    versao = versao_configuracoes()
+    if _configuracoes['versao'] == versao:
+        return _configuracoes['footer_configs'], _configuracoes['dados_associacao']
+
+    footer_configs = {
+        config.chave: config.valor
+        for config in Configuracao.query.filter(Configuracao.chave.like('footer_%')).all()
+    }
+    dados = DadosAssociacao.get_dados()
+    # Cópia simples: a instância do modelo não pode ser usada fora da sessão da requisição
+    dados_associacao = SimpleNamespace(id=dados.id, nome=dados.nome, cnpj=dados.cnpj, endereco=dados.endereco)
+    with _lock:
+        _configuracoes.update(versao=versao, footer_configs=footer_configs, dados_associacao=dados_associacao)
+    return footer_configs, dados_associacao
+
+
+class FragmentCacheExtension(Extension):
+    """``{% cache chave, ttl %}...{% endcache %}`` (ttl em segundos, padrão 300)"""
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(300))
+        corpo = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(self.call_method('_renderizar', args), [], [], corpo).set_lineno(lineno)
+
+    def _renderizar(self, chave, ttl, caller):
+        if not has_request_context() or not cache_ativo(current_app):
+            return caller()
+
+        chave_completa = (chave, session.get('language', 'pt'), request.host_url, versao_configuracoes())
+        agora = time.monotonic()
+        item = _fragmentos.get(chave_completa)
+        if item is not None and item[0] > agora:
+            return item[1]
+
+        html = Markup(caller())
+        with _lock:
+            if len(_fragmentos) >= MAX_FRAGMENTOS:
+                _fragmentos.clear()
+            _fragmentos[chave_completa] = (agora + ttl, html)
+        return html
+
+
+def init_fragmentos(app):
+    app.config.setdefault('FRAGMENTOS_CACHE', os.environ.get('FRAGMENTOS_CACHE', '1') != '0')
+    app.jinja_env.add_extension(FragmentCacheExtension)
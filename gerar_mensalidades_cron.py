@@ -1,33 +1,32 @@
+# -*- coding: utf-8 -*-
 """
 Script para ser executado via cron job/tarefa agendada
 Gera mensalidades automaticamente todo mês
 
+Roda a geração neste processo (``flask manutencao mensalidades``), sem chamar a
+rota /api/gerar-mensalidades nem ocupar um worker web. Uma execução simultânea
+(outro cron, ou a rota) é recusada pela trava da tarefa.
+
+Uso: python gerar_mensalidades_cron.py [--simular] [--lote N]
+  (equivalente a: flask --app app manutencao mensalidades [--simular] [--lote N])
+
 Para usar no Windows (Agendador de Tarefas):
 - Criar tarefa que executa este script diariamente ou mensalmente
 
 Para usar no Linux (cron):
-- Adicionar ao crontab: 0 0 1 * * python /caminho/para/gerar_mensalidades_cron.py
+- Adicionar ao crontab: 0 0 1 * * cd /caminho/para/projeto && python gerar_mensalidades_cron.py
   (executa no dia 1 de cada mês à meia-noite)
 """
-import requests
 import sys
+import io
 
-# URL do seu site (ajuste conforme necessário)
-URL = 'http://localhost:5000/api/gerar-mensalidades/aadvita-gerar-mensalidades-2025'
+# Configurar encoding para Windows
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-try:
-    response = requests.get(URL, timeout=30)
-    
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✅ Sucesso: {data.get('mensensagem', 'Mensalidades geradas')}")
-        print(f"   Mensalidades geradas: {data.get('mensalidades_geradas', 0)}")
-        sys.exit(0)
-    else:
-        print(f"❌ Erro: {response.status_code} - {response.text}")
-        sys.exit(1)
-        
-except requests.exceptions.RequestException as e:
-    print(f"❌ Erro ao conectar: {str(e)}")
-    sys.exit(1)
+from app import app
+from comandos import manutencao
 
+if __name__ == '__main__':
+    with app.app_context():
+        # Termina com código 0 em caso de sucesso e 1 se falhar (ou se já estiver rodando)
+        manutencao.main(['mensalidades', *sys.argv[1:]], prog_name='gerar_mensalidades_cron.py')
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Script para gerar o snapshot estático do site público (páginas e imagens), servido
+automaticamente pela aplicação quando o banco de dados está fora do ar
+
+Só as páginas cujo conteúdo mudou desde a última geração são renderizadas de novo.
+
+Uso: python gerar_snapshot.py [--completo] [--intervalo SEGUNDOS]
+  --completo   renderiza todas as páginas, ignorando o snapshot anterior
+  --intervalo  continua rodando e regenera a cada N segundos (0 = uma vez só)
+"""
+import sys
+import io
+import time
+
+# Configurar encoding para Windows
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
+
+from app import app
+from comandos import TarefaEmExecucao, trava_execucao
+from snapshot import diretorio_snapshot, gerar_snapshot
+
+
+def _intervalo(args):
+    if '--intervalo' in args:
+        try:
+            return max(int(args[args.index('--intervalo') + 1]), 0)
+        except (IndexError, ValueError):
+            print("⚠️ --intervalo precisa de um número de segundos")
+            sys.exit(2)
+    return 0
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    completo = '--completo' in args
+    intervalo = _intervalo(args)
+    while True:
+        print(f"Gerando snapshot em {diretorio_snapshot(app)}...")
+        try:
+            # Mesma trava de "flask manutencao snapshot": não gera duas vezes ao mesmo tempo
+            with app.app_context(), trava_execucao('snapshot'):
+                r = gerar_snapshot(app, completo=completo)
+            print(f"✅ Snapshot: {r['renderizadas']} página(s) renderizada(s), {r['mantidas']} sem alteração, "
+                  f"{r['arquivos']} imagem(ns), {r['falhas']} falha(s).")
+        except TarefaEmExecucao as e:
+            print(f"⚠️ {e}; pulando esta geração.")
+        except Exception as e:
+            # Banco fora do ar durante a geração: o snapshot anterior continua valendo
+            print(f"⚠️ Erro ao gerar snapshot: {e}")
+        if not intervalo:
+            break
+        completo = False
+        time.sleep(intervalo)
@@ -0,0 +1,40 @@
+"""Configuração do gunicorn (carregada automaticamente a partir do diretório atual)
+
+O hook ``on_starting`` roda no processo master, antes do fork dos workers, e
+executa as tarefas de banco de ``startup.py`` uma única vez e compila os
+templates (cache de bytecode em disco, ver compilacao.py). Quando o deploy
+passa por ``start.py`` isso já foi feito e o hook não faz nada.
+
+``post_worker_init`` carrega os templates na memória de cada worker (a partir
+do bytecode em disco) antes da primeira requisição.
+"""
+import os
+
+# Threads por worker; database.py usa o mesmo valor para dimensionar o pool
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+
+
+def on_starting(server):
+    from startup import STARTUP_DONE_ENV
+
+    if os.environ.get(STARTUP_DONE_ENV) == '1':
+        return
+
+    from app import app
+    from startup import run_startup_tasks
+
+    server.log.info('Executando tarefas de startup do banco (pre-fork)...')
+    run_startup_tasks(app)
+
+    from compilacao import compilar_templates
+    compilar_templates(app)
+
+    from snapshot import iniciar_gerador_em_segundo_plano
+    iniciar_gerador_em_segundo_plano()
+
+
+def post_worker_init(worker):
+    from app import app
+    from compilacao import compilar_templates
+
+    compilar_templates(app)
@@ -0,0 +1,176 @@
+"""Identidade das pessoas entre associados e voluntários (CPF, telefone e e-mail)
+
+``Associado.cpf`` é gravado como digitado (com ou sem pontuação) e
+``Voluntario.cpf`` só com dígitos, então as buscas por CPF dependiam do formato.
+Os modelos ganham colunas normalizadas e indexadas, preenchidas pelos eventos
+``before_insert``/``before_update`` registrados aqui:
+
+- ``cpf_normalizado``: só os dígitos;
+- ``telefone_normalizado``: formato E.164 (``+5586999998888``); números
+  brasileiros sem código do país recebem ``+55``;
+- ``email_normalizado`` (só voluntários): sem espaços e em minúsculas.
+
+Um valor preenchido que não pode ser normalizado (ex.: telefone sem DDD) é
+gravado como ``SEM_VALOR`` (texto vazio), e não NULL: NULL fica reservado aos
+registros ainda não processados, e o preenchimento dos antigos termina.
+
+``resolver`` responde "quem é esta pessoa" em associados e voluntários com uma
+única consulta (UNION ALL sobre os índices), usada no login e na detecção de
+cadastros duplicados.
+"""
+from sqlalchemy import event, func, literal, or_, select, union_all
+
+from extensions import db
+from models import Associado, Voluntario
+
+# Código do país assumido para telefones sem "+"
+DDI_PADRAO = '55'
+
+# Coluna normalizada de um valor preenchido mas inválido (NULL = ainda não processado)
+SEM_VALOR = ''
+
+
+def normalizar_cpf(valor):
+    digitos = ''.join(c for c in (valor or '') if c.isdigit())
+    return digitos or None
+
+
+def normalizar_telefone(valor):
+    """Telefone em E.164 ou None se não for possível determinar o número completo"""
+    valor = (valor or '').strip()
+    digitos = ''.join(c for c in valor if c.isdigit())
+    if not digitos:
+        return None
+    if valor.startswith('+') or valor.startswith('00'):
+        digitos = digitos[2:] if valor.startswith('00') else digitos
+        return f'+{digitos}' if 8 <= len(digitos) <= 15 else None
+
+    digitos = digitos.lstrip('0')  # prefixo de operadora/longa distância (0xx86...)
+    if len(digitos) in (10, 11):  # DDD + número
+        return f'+{DDI_PADRAO}{digitos}'
+    if len(digitos) in (12, 13) and digitos.startswith(DDI_PADRAO):
+        return f'+{digitos}'
+    return None
+
+
+def normalizar_email(valor):
+    valor = (valor or '').strip().lower()
+    return valor if '@' in valor else None
+
+
+def _coluna_normalizada(normalizar, valor):
+    """Valor da coluna normalizada: None se ``valor`` for NULL, ``SEM_VALOR`` se for inválido"""
+    if valor is None:
+        return None
+    return normalizar(valor) or SEM_VALOR
+
+
+def _normalizar(mapper, connection, target):
+    target.cpf_normalizado = _coluna_normalizada(normalizar_cpf, target.cpf)
+    target.telefone_normalizado = _coluna_normalizada(normalizar_telefone, target.telefone)
+    if hasattr(target, 'email_normalizado'):
+        target.email_normalizado = _coluna_normalizada(normalizar_email, target.email)
+
+
+for _model in (Associado, Voluntario):
+    event.listen(_model, 'before_insert', _normalizar)
+    event.listen(_model, 'before_update', _normalizar)
+
+
+def resolver(cpf=None, telefone=None, email=None):
+    """Associados e voluntários com o mesmo CPF, telefone ou e-mail
+
+    Retorna linhas com ``tipo`` ('associado' ou 'voluntario'), ``id``,
+    ``nome_completo``, ``status`` e ``por_cpf``/``por_telefone``/``por_email``
+    indicando o que coincidiu. Os valores podem vir em qualquer formato.
+    """
+    cpf, telefone, email = normalizar_cpf(cpf), normalizar_telefone(telefone), normalizar_email(email)
+    if not (cpf or telefone or email):
+        return []
+
+    consultas = []
+    for tipo, model in (('associado', Associado), ('voluntario', Voluntario)):
+        condicoes = []
+        colunas = [literal(tipo).label('tipo'), model.id, model.nome_completo, model.status]
+        for nome, valor in (('cpf', cpf), ('telefone', telefone), ('email', email)):
+            coluna = getattr(model, f'{nome}_normalizado', None)
+            if coluna is not None and valor:
+                condicoes.append(coluna == valor)
+                colunas.append((coluna == valor).label(f'por_{nome}'))
+            else:
+                colunas.append(literal(False).label(f'por_{nome}'))
+        if condicoes:
+            consultas.append(select(*colunas).where(or_(*condicoes)))
+
+    consulta = consultas[0] if len(consultas) == 1 else union_all(*consultas)
+    return db.session.execute(consulta).all()
+
+
+def associado_por_cpf(cpf):
+    cpf = normalizar_cpf(cpf)
+    if not cpf:
+        return None
+    return Associado.query.filter_by(cpf_normalizado=cpf).order_by(Associado.id).first()
+
+
+def voluntario_por_cpf(cpf):
+    cpf = normalizar_cpf(cpf)
+    if not cpf:
+        return None
+    return Voluntario.query.filter_by(cpf_normalizado=cpf).order_by(Voluntario.id).first()
+
+
+def _pendentes(model):
+    """Filtro dos registros com CPF/telefone/e-mail ainda sem a coluna normalizada"""
+    condicoes = [
+        model.cpf_normalizado.is_(None) & model.cpf.isnot(None),
+        model.telefone_normalizado.is_(None) & model.telefone.isnot(None),
+    ]
+    if hasattr(model, 'email_normalizado'):
+        condicoes.append(model.email_normalizado.is_(None) & model.email.isnot(None))
+    return or_(*condicoes)
+
+
+def contar_pendentes():
+    return sum(
+        db.session.execute(select(func.count(model.id)).where(_pendentes(model))).scalar()
+        for model in (Associado, Voluntario)
+    )
+
+
+def preencher_pendentes(lote=500, progresso=None):
+    """Preenche as colunas normalizadas dos registros gravados antes delas; retorna quantos
+
+    ``progresso(feitos, None)`` é chamado depois de cada lote confirmado.
+    """
+    total = 0
+    for model in (Associado, Voluntario):
+        colunas = [model.id, model.cpf, model.telefone]
+        if hasattr(model, 'email_normalizado'):
+            colunas.append(model.email)
+
+        ultimo_id = 0
+        while True:
+            linhas = db.session.execute(
+                select(*colunas).where(_pendentes(model), model.id > ultimo_id).order_by(model.id).limit(lote)
+            ).all()
+            if not linhas:
+                break
+            valores = []
+            for linha in linhas:
+                item = {
+                    'id': linha.id,
+                    'cpf_normalizado': _coluna_normalizada(normalizar_cpf, linha.cpf),
+                    'telefone_normalizado': _coluna_normalizada(normalizar_telefone, linha.telefone),
+                }
+                if hasattr(model, 'email_normalizado'):
+                    item['email_normalizado'] = _coluna_normalizada(normalizar_email, linha.email)
+                valores.append(item)
+            # UPDATE em lote pela chave primária, sem carregar os registros (e sem disparar os eventos)
+            db.session.execute(db.update(model), valores)
+            db.session.commit()
+            total += len(valores)
+            ultimo_id = linhas[-1].id
+            if progresso:
+                progresso(total, None)
+    return total
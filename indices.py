@@ -0,0 +1,150 @@
+"""Relatório de uso de índices
+
+- ``uso_indices``: varreduras por índice (``pg_stat_user_indexes``) e tamanho
+- ``varreduras_por_tabela``: seq scans x index scans por tabela (``pg_stat_user_tables``)
+- ``explicar_consultas``: EXPLAIN das consultas quentes da aplicação, indicando
+  quais ainda fazem varredura sequencial
+
+Em SQLite não há estatísticas de uso; o relatório lista os índices existentes e
+usa ``EXPLAIN QUERY PLAN``. Usado por /admin/sistema/indices e por
+``relatorio_indices.py``.
+"""
+import json
+from datetime import date
+
+from sqlalchemy import select, text
+
+from extensions import db
+from models import (
+    Acao, AlbumFoto, Associado, Configuracao, Evento, Informativo, Mensalidade, SaldoAssociado,
+    SliderImage,
+)
+
+
+def _consultas_monitoradas():
+    """Consultas dos caminhos quentes, com valores de exemplo nos parâmetros"""
+    hoje = date.today()
+    return [
+        ('Mensalidades do associado (financeiro)',
+         select(Mensalidade.id).where(Mensalidade.associado_id == 1)
+         .order_by(Mensalidade.data_vencimento.asc())),
+        ('Mensalidades pendentes vencidas do associado',
+         select(Mensalidade.id).where(Mensalidade.associado_id == 1, Mensalidade.status == 'pendente',
+                                      Mensalidade.data_vencimento < hoje)),
+        ('Mensalidade do associado no mês (geração)',
+         select(Mensalidade.id).where(Mensalidade.associado_id == 1, Mensalidade.ano_referencia == hoje.year,
+                                      Mensalidade.mes_referencia == hoje.month)),
+        ('Associados contribuintes ativos (geração de mensalidades)',
+         select(Associado.id).where(Associado.status == 'aprovado', Associado.tipo_associado == 'contribuinte',
+                                    Associado.ativo.is_(True))),
+        ('Saldos com atraso (dashboard financeiro)',
+         select(SaldoAssociado.associado_id).where(SaldoAssociado.mensalidades_atrasadas > 0)),
+        ('Lista de informativos',
+         select(Informativo.id).order_by(Informativo.data_publicacao.desc(), Informativo.created_at.desc())),
+        ('Ações por data',
+         select(Acao.id).order_by(Acao.data.desc()).limit(20)),
+        ('Próximos eventos',
+         select(Evento.id).where(Evento.data >= hoje).order_by(Evento.data.asc())),
+        ('Slider ativo (home)',
+         select(SliderImage.id).where(SliderImage.ativo.is_(True)).order_by(SliderImage.ordem.asc())),
+        ('Fotos do álbum',
+         select(AlbumFoto.id).where(AlbumFoto.album_id == 1).order_by(AlbumFoto.ordem.asc())),
+        ('Configurações do rodapé',
+         select(Configuracao.id).where(Configuracao.chave.like('footer_%'))),
+    ]
+
+
+def _is_postgres():
+    return db.engine.dialect.name == 'postgresql'
+
+
+def uso_indices():
+    """Índices com contagem de varreduras (Postgres) ou apenas a lista (SQLite)"""
+    if _is_postgres():
+        rows = db.session.execute(text("""
+            SELECT s.relname AS tabela, s.indexrelname AS indice, s.idx_scan AS varreduras,
+                   s.idx_tup_read AS tuplas_lidas, pg_relation_size(s.indexrelid) AS tamanho,
+                   i.indisunique AS unico, i.indisprimary AS primario
+            FROM pg_stat_user_indexes s
+            JOIN pg_index i ON i.indexrelid = s.indexrelid
+            ORDER BY s.idx_scan ASC, pg_relation_size(s.indexrelid) DESC
+        """)).mappings().all()
+        return [dict(r) for r in rows]
+
+    rows = db.session.execute(text(
+        "SELECT tbl_name, name FROM sqlite_master WHERE type = 'index' ORDER BY tbl_name, name"
+    )).all()
+    return [
+        {'tabela': tabela, 'indice': nome, 'varreduras': None, 'tuplas_lidas': None,
+         'tamanho': None, 'unico': nome.startswith('sqlite_autoindex'), 'primario': False}
+        for tabela, nome in rows
+    ]
+
+
+def varreduras_por_tabela():
+    """Seq scans x index scans por tabela (apenas Postgres)"""
+    if not _is_postgres():
+        return []
+    rows = db.session.execute(text("""
+        SELECT relname AS tabela, seq_scan, seq_tup_read, idx_scan, n_live_tup AS linhas
+        FROM pg_stat_user_tables
+        ORDER BY seq_tup_read DESC
+    """)).mappings().all()
+    return [dict(r) for r in rows]
+
+
+def _nos_do_plano(plano):
+    yield plano
+    for filho in plano.get('Plans', []):
+        yield from _nos_do_plano(filho)
+
+
+def _explicar(stmt):
+    dialect = db.engine.dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+    if dialect.name == 'postgresql':
+        bruto = db.session.execute(text('EXPLAIN (FORMAT JSON) ' + sql)).scalar()
+        plano = (json.loads(bruto) if isinstance(bruto, str) else bruto)[0]['Plan']
+        passos = []
+        sequencial = False
+        for no in _nos_do_plano(plano):
+            tipo = no['Node Type']
+            if 'Relation Name' in no or 'Index Name' in no:
+                passo = tipo
+                if no.get('Index Name'):
+                    passo += f" usando {no['Index Name']}"
+                if no.get('Relation Name'):
+                    passo += f" em {no['Relation Name']}"
+                passos.append(passo)
+            if tipo == 'Seq Scan':
+                sequencial = True
+        return sql, passos, sequencial
+
+    passos = [row[-1] for row in db.session.execute(text('EXPLAIN QUERY PLAN ' + sql)).all()]
+    sequencial = any(p.startswith('SCAN') and 'USING' not in p for p in passos)
+    return sql, passos, sequencial
+
+
+def explicar_consultas():
+    """Plano de execução de cada consulta monitorada"""
+    resultado = []
+    for nome, stmt in _consultas_monitoradas():
+        try:
+            sql, passos, sequencial = _explicar(stmt)
+            resultado.append({'consulta': nome, 'sql': sql, 'plano': passos,
+                              'varredura_sequencial': sequencial, 'erro': None})
+        except Exception as e:
+            db.session.rollback()
+            resultado.append({'consulta': nome, 'sql': None, 'plano': [],
+                              'varredura_sequencial': None, 'erro': str(e)})
+    return resultado
+
+
+def relatorio():
+    return {
+        'banco': db.engine.dialect.name,
+        'indices': uso_indices(),
+        'tabelas': varreduras_por_tabela(),
+        'consultas': explicar_consultas(),
+    }
@@ -3,7 +3,8 @@
 Script para inicializar o banco de dados
 Execute este script antes de iniciar o servidor em produção
 """
-from app import app, db, init_db
+from app import app, db
+from startup import init_db
 
 if __name__ == '__main__':
     with app.app_context():
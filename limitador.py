@@ -0,0 +1,277 @@
+"""Limite de requisições (token bucket) para o login e os formulários públicos
+
+Os POSTs de login (``check_password_hash`` é lento de propósito) e dos
+formulários públicos (gravações no banco, uploads) passam por um balde de
+fichas por IP e, no login, também por identificador (usuário ou CPF). Cada
+regra é "N requisições por janela de S segundos": o balde começa com N fichas
+e recupera N/S fichas por segundo. Sem ficha disponível, o ``before_request``
+responde 429 com ``Retry-After`` antes da rota rodar, sem consultar o banco,
+calcular hash de senha ou renderizar templates.
+
+Backends:
+
+- ``BackendMemoria`` (padrão): baldes na memória do processo; cada worker do
+  gunicorn tem os seus, então o limite efetivo é multiplicado pelo número de
+  workers;
+- ``BackendRedis``: baldes compartilhados por todos os workers e hosts
+  (``LIMITADOR_REDIS_URL``; requer o pacote ``redis``);
+- qualquer objeto com ``consumir``, ``contar`` e ``contadores`` pode ser
+  passado em ``app.config['LIMITADOR_BACKEND']``.
+
+Variáveis de ambiente:
+
+    LIMITADOR_ATIVO         0 desativa os limites (padrão: 1)
+    LIMITADOR_REDIS_URL     URL do Redis para o backend compartilhado (padrão: memória)
+    LIMITADOR_PROXIES       proxies reversos confiáveis na frente da aplicação; o IP do cliente é
+                            lido do X-Forwarded-For nessa posição a partir da direita (padrão: 0;
+                            no Render use 1, definido em render.yaml: com 0, todos os visitantes
+                            dividem o balde do IP do proxy)
+    LIMITES                 ajustes por rota, ex.: "admin_login.ip=20/60;associe_se.ip=10/3600"
+"""
+import ipaddress
+import os
+import threading
+import time
+from collections import Counter
+
+from flask import Response, request
+
+# Regras por endpoint: {regra: (requisições, janela em segundos)}
+# 'ip' limita por IP do cliente; as demais usam o campo do formulário de IDENTIFICADORES
+LIMITES_PADRAO = {
+    'admin_login': {'ip': (10, 60), 'usuario': (5, 300)},
+    'login': {'ip': (10, 60), 'cpf': (5, 300)},
+    'associe_se': {'ip': (5, 600)},
+    'voluntario_cadastro': {'ip': (5, 600)},
+    'reciclagem_form': {'ip': (5, 600)},
+    'problema_acessibilidade_registrar': {'ip': (5, 600)},
+}
+
+# Regra -> (campo do formulário, normalização)
+IDENTIFICADORES = {
+    'usuario': ('username', lambda v: v.strip().lower()),
+    'cpf': ('cpf', lambda v: ''.join(c for c in v if c.isdigit())),
+}
+
+# Baldes guardados em memória por processo (ao atingir, os cheios são descartados)
+MAX_BALDES = 10000
+
+MENSAGEM_429 = (
+    '<!DOCTYPE html><html lang="pt-BR"><head><meta charset="UTF-8"><title>Muitas tentativas - AADVITA</title></head>'
+    '<body><h1>Muitas tentativas</h1><p>Você enviou muitas requisições em pouco tempo. '
+    'Aguarde {segundos} segundo(s) e tente novamente.</p><p><a href="javascript:history.back()">Voltar</a></p></body></html>'
+)
+
+
+class BackendMemoria:
+    """Baldes e contadores na memória do processo"""
+    nome = 'memória (por worker)'
+
+    def __init__(self):
+        self._baldes = {}
+        self._contadores = Counter()
+        self._lock = threading.Lock()
+
+    def consumir(self, chave, capacidade, taxa, agora):
+        """Tenta tirar uma ficha do balde; retorna (permitido, segundos até a próxima ficha)"""
+        with self._lock:
+            fichas, atualizado_em, _ = self._baldes.get(chave, (capacidade, agora, agora))
+            fichas = min(capacidade, fichas + (agora - atualizado_em) * taxa)
+            permitido = fichas >= 1
+            if permitido:
+                fichas -= 1
+            if len(self._baldes) >= MAX_BALDES and chave not in self._baldes:
+                self._descartar_cheios(agora)
+            self._baldes[chave] = (fichas, agora, agora + (capacidade - fichas) / taxa)
+        return permitido, 0 if permitido else (1 - fichas) / taxa
+
+    def _descartar_cheios(self, agora):
+        # Balde que já recuperou todas as fichas equivale a um balde novo
+        self._baldes = {chave: balde for chave, balde in self._baldes.items() if balde[2] > agora}
+        if len(self._baldes) >= MAX_BALDES:
+            self._baldes.clear()
+
+    def contar(self, contador):
+        with self._lock:
+            self._contadores[contador] += 1
+
+    def contadores(self):
+        with self._lock:
+            return dict(self._contadores), len(self._baldes)
+
+
+class BackendRedis:
+    """Baldes e contadores no Redis, compartilhados entre workers e hosts"""
+    nome = 'redis (compartilhado)'
+
+    PREFIXO = 'aadvita:limitador:'
+
+    # Atualiza o balde atomicamente: {permitido, fichas restantes}
+    SCRIPT = """
+    local balde = redis.call('HMGET', KEYS[1], 'fichas', 'ts')
+    local capacidade = tonumber(ARGV[1])
+    local taxa = tonumber(ARGV[2])
+    local agora = tonumber(ARGV[3])
+    local fichas = tonumber(balde[1]) or capacidade
+    local ts = tonumber(balde[2]) or agora
+    fichas = math.min(capacidade, fichas + math.max(0, agora - ts) * taxa)
+    local permitido = 0
+    if fichas >= 1 then
+        fichas = fichas - 1
+        permitido = 1
+    end
+    redis.call('HSET', KEYS[1], 'fichas', tostring(fichas), 'ts', tostring(agora))
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacidade / taxa) + 1)
+    return {permitido, tostring(fichas)}
+    """
+
+    def __init__(self, url):
+        import redis
+
+        self._redis = redis.Redis.from_url(url)
+        self._script = self._redis.register_script(self.SCRIPT)
+
+    def consumir(self, chave, capacidade, taxa, agora):
+        permitido, fichas = self._script(keys=[self.PREFIXO + chave], args=[capacidade, taxa, agora])
+        if permitido:
+            return True, 0
+        return False, (1 - float(fichas)) / taxa
+
+    def contar(self, contador):
+        self._redis.hincrby(self.PREFIXO + 'contadores', contador, 1)
+
+    def contadores(self):
+        brutos = self._redis.hgetall(self.PREFIXO + 'contadores')
+        return {k.decode(): int(v) for k, v in brutos.items()}, None
+
+
+def parse_limites(texto):
+    """"endpoint.regra=N/S;..." -> {endpoint: {regra: (N, S)}}"""
+    limites = {}
+    for item in filter(None, (p.strip() for p in (texto or '').split(';'))):
+        try:
+            alvo, valor = item.split('=')
+            endpoint, regra = alvo.strip().rsplit('.', 1)
+            requisicoes, janela = (int(v) for v in valor.split('/'))
+        except ValueError:
+            raise ValueError(f'Limite inválido: {item!r} (use endpoint.regra=N/S)')
+        if requisicoes < 1 or janela < 1:
+            raise ValueError(f'Limite inválido: {item!r} (N e S devem ser positivos)')
+        limites.setdefault(endpoint, {})[regra] = (requisicoes, janela)
+    return limites
+
+
+def ip_cliente(proxies):
+    """IP do cliente, considerando ``proxies`` proxies reversos confiáveis"""
+    encaminhado = request.headers.get('X-Forwarded-For')
+    if proxies and encaminhado:
+        enderecos = [e.strip() for e in encaminhado.split(',') if e.strip()]
+        if enderecos:
+            return enderecos[-min(proxies, len(enderecos))]
+    return request.remote_addr or '-'
+
+
+def _atras_de_proxy():
+    """True se a requisição chegou por um proxy (X-Forwarded-For vindo de IP privado)"""
+    if not request.headers.get('X-Forwarded-For'):
+        return False
+    try:
+        return ipaddress.ip_address(request.remote_addr or '').is_private
+    except ValueError:
+        return False
+
+
+class Limitador:
+    def __init__(self, backend, limites, proxies=0):
+        self.backend = backend
+        self.limites = limites
+        self.proxies = proxies
+        self._aviso_proxy = proxies > 0
+
+    def _chaves(self, endpoint, regras):
+        for regra, (requisicoes, janela) in regras.items():
+            if regra == 'ip':
+                if not self._aviso_proxy and _atras_de_proxy():
+                    self._aviso_proxy = True
+                    print("⚠️ LIMITADOR_PROXIES=0, mas a requisição veio de um proxy "
+                          f"({request.remote_addr}): todos os clientes dividem o mesmo balde por IP")
+                yield regra, requisicoes, janela, f'{endpoint}:ip:{ip_cliente(self.proxies)}'
+                continue
+            campo, normalizar = IDENTIFICADORES.get(regra, (regra, str.strip))
+            valor = normalizar(request.form.get(campo) or '')
+            if valor:
+                yield regra, requisicoes, janela, f'{endpoint}:{regra}:{valor}'
+
+    def verificar(self):
+        """Resposta 429 se a requisição estourou algum limite (ou None)"""
+        regras = self.limites.get(request.endpoint)
+        if not regras or request.method != 'POST':
+            return None
+
+        agora = time.time()
+        espera = 0
+        try:
+            for regra, requisicoes, janela, chave in self._chaves(request.endpoint, regras):
+                permitido, segundos = self.backend.consumir(chave, requisicoes, requisicoes / janela, agora)
+                if not permitido:
+                    self.backend.contar(f'{request.endpoint}.{regra}.bloqueadas')
+                    espera = max(espera, segundos)
+            if not espera:
+                self.backend.contar(f'{request.endpoint}.permitidas')
+                return None
+        except Exception as e:
+            # Backend indisponível (ex.: Redis fora do ar): não bloqueia o site
+            print(f"⚠️ Limitador indisponível: {e}")
+            return None
+
+        segundos = max(1, int(espera + 0.999))
+        resposta = Response(MENSAGEM_429.format(segundos=segundos), status=429, mimetype='text/html')
+        resposta.headers['Retry-After'] = str(segundos)
+        resposta.headers['Cache-Control'] = 'no-store'
+        return resposta
+
+    def relatorio(self):
+        """Limites configurados e contadores (permitidas/bloqueadas) por endpoint"""
+        contadores, baldes = self.backend.contadores()
+        endpoints = []
+        for endpoint, regras in sorted(self.limites.items()):
+            endpoints.append({
+                'endpoint': endpoint,
+                'permitidas': contadores.get(f'{endpoint}.permitidas', 0),
+                'regras': [
+                    {
+                        'regra': regra,
+                        'requisicoes': requisicoes,
+                        'janela': janela,
+                        'bloqueadas': contadores.get(f'{endpoint}.{regra}.bloqueadas', 0),
+                    }
+                    for regra, (requisicoes, janela) in regras.items()
+                ],
+            })
+        return {'backend': self.backend.nome, 'baldes': baldes, 'proxies': self.proxies, 'endpoints': endpoints}
+
+
+def init_limitador(app):
+    """Registra o limite de requisições (``app.extensions['limitador']``)"""
+    if os.environ.get('LIMITADOR_ATIVO', '1') == '0':
+        return
+
+    limites = {endpoint: dict(regras) for endpoint, regras in LIMITES_PADRAO.items()}
+    try:
+        for endpoint, regras in parse_limites(os.environ.get('LIMITES')).items():
+            limites.setdefault(endpoint, {}).update(regras)
+    except ValueError as e:
+        print(f"⚠️ LIMITES ignorada: {e}")
+
+    backend = app.config.get('LIMITADOR_BACKEND')
+    if backend is None:
+        redis_url = os.environ.get('LIMITADOR_REDIS_URL')
+        try:
+            backend = BackendRedis(redis_url) if redis_url else BackendMemoria()
+        except ImportError:
+            print("⚠️ LIMITADOR_REDIS_URL definida, mas o pacote redis não está instalado; usando memória")
+            backend = BackendMemoria()
+
+    limitador = Limitador(backend, limites, int(os.environ.get('LIMITADOR_PROXIES', '0')))
+    app.extensions['limitador'] = limitador
+    app.before_request(limitador.verificar)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Script para remover do banco os arquivos enviados que nenhum registro referencia mais
+(ex.: PDF substituído em um projeto ou prestação de contas excluída) e as exportações
+de relatórios com mais de EXPORTACAO_VALIDADE_DIAS dias
+
+Uso: python limpar_arquivos_orfaos.py
+"""
+import sys
+import io
+
+# Configurar encoding para Windows
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from app import app
+from arquivos import remover_orfaos
+from exportacoes import remover_expiradas
+
+if __name__ == '__main__':
+    with app.app_context():
+        print("Removendo exportações expiradas...")
+        print(f"✅ {remover_expiradas()} exportação(ões) removida(s).")
+        print("Procurando arquivos órfãos...")
+        total = remover_orfaos()
+        print(f"✅ {total} arquivo(s) removido(s).")
@@ -0,0 +1,75 @@
+"""Migração: colunas normalizadas de CPF, telefone e e-mail (ver identidade.py)
+
+Uso: python migrate_postgres_identidade.py
+
+Só adiciona as colunas; os índices são criados por migrate_postgres_indices e
+o preenchimento dos registros existentes roda no startup
+(identidade.preencher_pendentes).
+"""
+import os
+import time
+import psycopg # type: ignore
+
+COLUNAS = [
+    ("associado", "cpf_normalizado", "VARCHAR(14)"),
+    ("associado", "telefone_normalizado", "VARCHAR(20)"),
+    ("voluntario", "cpf_normalizado", "VARCHAR(20)"),
+    ("voluntario", "telefone_normalizado", "VARCHAR(20)"),
+    ("voluntario", "email_normalizado", "VARCHAR(200)"),
+]
+
+def normalize_url(url):
+    if url and url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    if url and url.startswith("postgresql+psycopg://"):
+        return url.replace("postgresql+psycopg://", "postgresql://", 1)
+    return url
+
+def migrate(retries=8, delay=3.0):
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("DATABASE_URL não encontrada nas variáveis de ambiente. Abortando.")
+        return 1
+
+    database_url = normalize_url(database_url)
+    if not database_url.startswith("postgresql://"):
+        # SQLite: as colunas são criadas por startup._ensure_identidade
+        print("DATABASE_URL não é PostgreSQL. Nada a fazer.")
+        return 0
+
+    last_exc = None
+    for attempt in range(1, retries + 1):
+        try:
+            print(f"[{attempt}/{retries}] Tentando conectar ao banco para migração de identidade...")
+            conn = psycopg.connect(database_url)
+            conn.autocommit = True
+            cur = conn.cursor()
+
+            cur.execute("SELECT tablename FROM pg_tables WHERE schemaname = current_schema()")
+            tabelas = {row[0] for row in cur.fetchall()}
+
+            for tabela, coluna, tipo in COLUNAS:
+                if tabela not in tabelas:
+                    print(f"Tabela {tabela} não existe; coluna {coluna} ignorada.")
+                    continue
+                print(f"Executando: ALTER TABLE {tabela} ADD COLUMN IF NOT EXISTS {coluna} {tipo}")
+                cur.execute(f"ALTER TABLE {tabela} ADD COLUMN IF NOT EXISTS {coluna} {tipo}")
+
+            print("Migração de identidade executada com sucesso (Postgres).")
+            cur.close()
+            conn.close()
+            return 0
+
+        except Exception as e:
+            last_exc = e
+            print(f"Falha na tentativa {attempt}: {e}")
+            if attempt < retries:
+                sleep_time = delay * attempt
+                print(f"Aguardando {sleep_time}s antes de nova tentativa...")
+                time.sleep(sleep_time)
+
+    print("Todas as tentativas falharam. Último erro:", last_exc)
+    return 3
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,97 @@
+import os
+import time
+import psycopg # type: ignore
+
+# Índices secundários declarados nos modelos (__table_args__). Criados com
+# CONCURRENTLY para não bloquear escritas nas tabelas durante o deploy.
+INDICES = [
+    ("ix_mensalidade_associado_status_vencimento", "mensalidade", "(associado_id, status, data_vencimento)"),
+    ("ix_mensalidade_associado_referencia", "mensalidade", "(associado_id, ano_referencia, mes_referencia)"),
+    ("ix_informativo_publicacao", "informativo", "(data_publicacao, created_at)"),
+    ("ix_acao_data", "acao", "(data)"),
+    ("ix_evento_data", "evento", "(data)"),
+    ("ix_associado_status_tipo_ativo", "associado", "(status, tipo_associado, ativo)"),
+    ("ix_slider_image_ativo_ordem", "slider_image", "(ativo, ordem)"),
+    ("ix_album_foto_album_ordem", "album_foto", "(album_id, ordem)"),
+    ("ix_agendamento_voluntario_voluntario_data", "agendamento_voluntario", "(voluntario_id, data_agendamento)"),
+    # Colunas normalizadas de identidade.py (criadas por migrate_postgres_identidade)
+    ("ix_associado_cpf_normalizado", "associado", "(cpf_normalizado)"),
+    ("ix_associado_telefone_normalizado", "associado", "(telefone_normalizado)"),
+    ("ix_voluntario_cpf_normalizado", "voluntario", "(cpf_normalizado)"),
+    ("ix_voluntario_telefone_normalizado", "voluntario", "(telefone_normalizado)"),
+    ("ix_voluntario_email_normalizado", "voluntario", "(email_normalizado)"),
+    # LIKE 'footer_%' só usa índice com varchar_pattern_ops (collation != C)
+    ("ix_configuracao_chave_prefixo", "configuracao", "(chave varchar_pattern_ops)"),
+]
+
+def normalize_url(url):
+    if url and url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    if url and url.startswith("postgresql+psycopg://"):
+        return url.replace("postgresql+psycopg://", "postgresql://", 1)
+    return url
+
+def migrate(retries=8, delay=3.0):
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        print("DATABASE_URL não encontrada nas variáveis de ambiente. Abortando.")
+        return 1
+
+    database_url = normalize_url(database_url)
+    if not database_url.startswith("postgresql://"):
+        # SQLite: os índices são criados por startup._ensure_indices
+        print("DATABASE_URL não é PostgreSQL. Nada a fazer.")
+        return 0
+
+    last_exc = None
+    for attempt in range(1, retries + 1):
+        try:
+            print(f"[{attempt}/{retries}] Tentando conectar ao banco para migração de índices...")
+            conn = psycopg.connect(database_url)
+            # CREATE INDEX CONCURRENTLY não pode rodar dentro de transação
+            conn.autocommit = True
+            cur = conn.cursor()
+
+            cur.execute("SELECT tablename FROM pg_tables WHERE schemaname = current_schema()")
+            tabelas = {row[0] for row in cur.fetchall()}
+
+            for nome, tabela, colunas in INDICES:
+                if tabela not in tabelas:
+                    print(f"Tabela {tabela} não existe; índice {nome} ignorado.")
+                    continue
+
+                # Um CONCURRENTLY interrompido deixa o índice inválido: remover e recriar
+                cur.execute("""
+                    SELECT i.indisvalid FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE c.relname = %s
+                """, (nome,))
+                row = cur.fetchone()
+                if row is not None and not row[0]:
+                    print(f"Índice {nome} inválido; recriando...")
+                    cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {nome}")
+
+                print(f"Executando: CREATE INDEX CONCURRENTLY IF NOT EXISTS {nome} ON {tabela} {colunas}")
+                cur.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {nome} ON {tabela} {colunas}")
+
+            # Atualizar estatísticas para o planejador considerar os novos índices
+            for tabela in sorted({tabela for _, tabela, _ in INDICES} & tabelas):
+                cur.execute(f"ANALYZE {tabela}")
+            print("Migração de índices executada com sucesso (Postgres).")
+            cur.close()
+            conn.close()
+            return 0
+
+        except Exception as e:
+            last_exc = e
+            print(f"Falha na tentativa {attempt}: {e}")
+            if attempt < retries:
+                sleep_time = delay * attempt
+                print(f"Aguardando {sleep_time}s antes de nova tentativa...")
+                time.sleep(sleep_time)
+
+    print("Todas as tentativas falharam. Último erro:", last_exc)
+    return 3
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,909 @@
+"""Modelos SQLAlchemy da aplicação"""
+from datetime import datetime, date
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from extensions import db
+
+# Modelos de Base de Datos
+# Tabela de associação para Usuario e Permissao
+usuario_permissao = db.Table('usuario_permissao',
+    db.Column('usuario_id', db.Integer, db.ForeignKey('usuario.id'), primary_key=True),
+    db.Column('permissao_id', db.Integer, db.ForeignKey('permissao.id'), primary_key=True)
+)
+
+class Permissao(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    codigo = db.Column(db.String(50), unique=True, nullable=False)
+    nome = db.Column(db.String(100), nullable=False)
+    descricao = db.Column(db.String(255))
+    categoria = db.Column(db.String(50))  # Para agrupar permissões
+    
+    def __repr__(self):
+        return f'<Permissao {self.codigo}>'
+
+class Usuario(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    nome = db.Column(db.String(200), nullable=False)
+    is_super_admin = db.Column(db.Boolean, default=False)  # Super admin tem acesso a tudo
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+    
+    # Relacionamento many-to-many com permissões
+    permissoes = db.relationship('Permissao', secondary=usuario_permissao, lazy='subquery', backref=db.backref('usuarios', lazy=True))
+    
+    def set_password(self, password):
+        self.password_hash = generate_password_hash(password)
+    
+    def check_password(self, password):
+        return check_password_hash(self.password_hash, password)
+    
+    def tem_permissao(self, codigo_permissao):
+        """Verifica se o usuário tem uma permissão específica"""
+        if self.is_super_admin:
+            return True
+        return any(p.codigo == codigo_permissao for p in self.permissoes)
+
+class Configuracao(db.Model):
+    __table_args__ = (
+        # Busca por prefixo (chave LIKE 'footer_%'); o índice único não serve para LIKE no Postgres
+        db.Index('ix_configuracao_chave_prefixo', 'chave',
+                 postgresql_ops={'chave': 'varchar_pattern_ops'}).ddl_if(dialect='postgresql'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    chave = db.Column(db.String(100), unique=True, nullable=False)
+    valor = db.Column(db.Text)
+    tipo = db.Column(db.String(50))  # texto, numero, imagem, etc
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ReunionPresencial(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
+    descripcion = db.Column(db.Text)
+    fecha = db.Column(db.DateTime, nullable=False)
+    hora = db.Column(db.String(10), nullable=False)
+    lugar = db.Column(db.String(300), nullable=False)
+    direccion = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ReunionVirtual(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
+    descripcion = db.Column(db.Text)
+    fecha = db.Column(db.DateTime, nullable=False)
+    hora = db.Column(db.String(10), nullable=False)
+    plataforma = db.Column(db.String(100), nullable=False)
+    link = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Projeto(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
+    descripcion = db.Column(db.Text, nullable=False)
+    identificacao = db.Column(db.Text)
+    contexto_justificativa = db.Column(db.Text)
+    objetivos = db.Column(db.Text)
+    publico_alvo = db.Column(db.Text)
+    metodologia = db.Column(db.Text)
+    recursos_necessarios = db.Column(db.Text)
+    parcerias = db.Column(db.Text)
+    resultados_esperados = db.Column(db.Text)
+    monitoramento_avaliacao = db.Column(db.Text)
+    cronograma_execucao = db.Column(db.Text)
+    orcamento = db.Column(db.Text)
+    consideracoes_finais = db.Column(db.Text)
+    imagen = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagen_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    arquivo_pdf = db.Column(db.String(300))  # Caminho do arquivo PDF ou 'base64:application/pdf'
+    arquivo_pdf_base64 = db.Column(db.Text, nullable=True)  # PDF em base64 para persistência no Render (opcional)
+    estado = db.Column(db.String(50), default='Ativo')
+    data_inicio = db.Column(db.Date)
+    data_fim = db.Column(db.Date)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# Tabelas de associação (definidas antes das classes que as usam)
+evento_album = db.Table('evento_album',
+    db.Column('evento_id', db.Integer, db.ForeignKey('evento.id'), primary_key=True),
+    db.Column('album_id', db.Integer, db.ForeignKey('album.id'), primary_key=True)
+)
+
+acao_album = db.Table('acao_album',
+    db.Column('acao_id', db.Integer, db.ForeignKey('acao.id'), primary_key=True),
+    db.Column('album_id', db.Integer, db.ForeignKey('album.id'), primary_key=True)
+)
+
+class Acao(db.Model):
+    __table_args__ = (
+        db.Index('ix_acao_data', 'data'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
+    descricao = db.Column(db.Text, nullable=False)
+    data = db.Column(db.Date, nullable=False)
+    categoria = db.Column(db.String(100))
+    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relacionamento com fotos
+    fotos = db.relationship('AcaoFoto', backref='acao', lazy=True, cascade='all, delete-orphan')
+    
+    # Relacionamento many-to-many com álbuns
+    albuns = db.relationship('Album', secondary=acao_album, lazy='subquery', backref=db.backref('acoes', lazy=True))
+
+class AcaoFoto(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    acao_id = db.Column(db.Integer, db.ForeignKey('acao.id'), nullable=False)
+    caminho = db.Column(db.String(300), nullable=False)
+    titulo = db.Column(db.String(200))
+    descricao = db.Column(db.Text)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Apoiador(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(200), nullable=False)
+    tipo = db.Column(db.String(100))  # Empresa, Individual, Instituição
+    logo = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    logo_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem (logo) para acessibilidade
+    website = db.Column(db.String(500))
+    descricao = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+
+class Imagem(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200))
+    descricao = db.Column(db.Text)
+    filename = db.Column(db.String(300), nullable=False)
+    caminho = db.Column(db.String(500), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class SliderImage(db.Model):
+    __tablename__ = 'slider_image'
+    __table_args__ = (
+        db.Index('ix_slider_image_ativo_ordem', 'ativo', 'ordem'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200))
+    imagem = db.Column(db.String(300), nullable=False)  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    link = db.Column(db.String(500))  # Link clicável (opcional)
+    ordem = db.Column(db.Integer, default=0)  # Ordem de exibição
+    ativo = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __mapper_args__ = {
+        'confirm_deleted_rows': False
+    }
+    
+    def get_imagem_url(self):
+        """Retorna a URL da imagem, seja base64 ou arquivo"""
+        try:
+            from flask import url_for
+            # Verificar se tem imagem_base64 usando getattr (seguro se coluna não existir)
+            imagem_base64 = getattr(self, 'imagem_base64', None)
+            if imagem_base64:
+                return f"/slider/{self.id}/imagem"
+            elif self.imagem and 'base64:' in str(self.imagem):
+                return f"/slider/{self.id}/imagem"
+            elif self.imagem:
+                return url_for('static', filename=self.imagem)
+            return None
+        except Exception as e:
+            print(f"Erro em get_imagem_url: {e}")
+            try:
+                if self.imagem:
+                    from flask import url_for
+                    return url_for('static', filename=self.imagem)
+            except:
+                pass
+            return None
+    
+    def __repr__(self):
+        return f'<SliderImage {self.id}>'
+
+class Album(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo_pt = db.Column(db.String(200), nullable=False)
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    capa = db.Column(db.String(300))  # Caminho da foto de capa
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relacionamento com fotos
+    fotos = db.relationship('AlbumFoto', backref='album', lazy=True, cascade='all, delete-orphan')
+
+class AlbumFoto(db.Model):
+    __table_args__ = (
+        db.Index('ix_album_foto_album_ordem', 'album_id', 'ordem'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    album_id = db.Column(db.Integer, db.ForeignKey('album.id'), nullable=False)
+    caminho = db.Column(db.String(300), nullable=False)
+    titulo_pt = db.Column(db.String(200))
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Evento(db.Model):
+    __table_args__ = (
+        db.Index('ix_evento_data', 'data'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
+    descricao = db.Column(db.Text)
+    data = db.Column(db.DateTime, nullable=False)
+    hora = db.Column(db.String(10))
+    local = db.Column(db.String(300))
+    endereco = db.Column(db.Text)
+    tipo = db.Column(db.String(100))  # Presencial, Virtual, Híbrido
+    link = db.Column(db.String(500))
+    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relacionamento com fotos
+    fotos = db.relationship('EventoFoto', backref='evento', lazy=True, cascade='all, delete-orphan')
+    
+    # Relacionamento many-to-many com álbuns
+    albuns = db.relationship('Album', secondary=evento_album, lazy='subquery', backref=db.backref('eventos', lazy=True))
+
+class EventoFoto(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    evento_id = db.Column(db.Integer, db.ForeignKey('evento.id'), nullable=False)
+    caminho = db.Column(db.String(300), nullable=False)
+    titulo = db.Column(db.String(200))
+    descricao = db.Column(db.Text)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Video(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    descricao = db.Column(db.Text)
+    url_youtube = db.Column(db.String(500), nullable=False)
+    thumbnail = db.Column(db.String(500))
+    categoria = db.Column(db.String(100))
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def get_youtube_id(self):
+        """Extrai o ID do vídeo do YouTube da URL"""
+        import re
+        # Suporta diferentes formatos de URL do YouTube
+        patterns = [
+            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, self.url_youtube)
+            if match:
+                return match.group(1)
+        return None
+    
+    def get_embed_url(self):
+        """Retorna a URL para embed do vídeo"""
+        video_id = self.get_youtube_id()
+        if video_id:
+            return f"https://www.youtube.com/embed/{video_id}"
+        return None
+    
+    def get_thumbnail_url(self):
+        """Retorna a URL da thumbnail do YouTube"""
+        video_id = self.get_youtube_id()
+        if video_id:
+            return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+        return None
+
+class Associado(db.Model):
+    __table_args__ = (
+        db.Index('ix_associado_status_tipo_ativo', 'status', 'tipo_associado', 'ativo'),
+        db.Index('ix_associado_cpf_normalizado', 'cpf_normalizado'),
+        db.Index('ix_associado_telefone_normalizado', 'telefone_normalizado'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    nome_completo = db.Column(db.String(200), nullable=False)
+    cpf = db.Column(db.String(14), nullable=False, unique=True)
+    data_nascimento = db.Column(db.Date, nullable=False)
+    endereco = db.Column(db.Text, nullable=False)
+    telefone = db.Column(db.String(20), nullable=False)
+    # Preenchidas por identidade.py a partir de cpf/telefone (só dígitos / E.164)
+    cpf_normalizado = db.Column(db.String(14))
+    telefone_normalizado = db.Column(db.String(20))
+    password_hash = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pendente')  # pendente, aprovado, negado
+    tipo_associado = db.Column(db.String(20), nullable=False, default='contribuinte')  # 'regular' ou 'contribuinte'
+    # Campos para mensalidade
+    valor_mensalidade = db.Column(db.Numeric(10, 2), default=0.00)
+    desconto_tipo = db.Column(db.String(10), default=None)  # 'real' ou 'porcentagem'
+    desconto_valor = db.Column(db.Numeric(10, 2), default=0.00)
+    ativo = db.Column(db.Boolean, default=True)  # Controla se gera mensalidades automaticamente
+    carteira_pdf = db.Column(db.String(300))  # Caminho do PDF da carteira de associado
+    carteira_pdf_base64 = db.Column(db.Text, nullable=True)  # PDF da carteira em base64 para persistência no Render
+    foto = db.Column(db.String(300))  # Caminho da foto do associado
+    foto_base64 = db.Column(db.Text, nullable=True)  # salvar imagem em base64 para persistência no Render
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+    
+    def set_password(self, password):
+        self.password_hash = generate_password_hash(password)
+    
+    def check_password(self, password):
+        return check_password_hash(self.password_hash, password)
+    
+    def calcular_valor_final(self):
+        """Calcula o valor final da mensalidade com desconto"""
+        valor_base = float(self.valor_mensalidade) if self.valor_mensalidade else 0.0
+        desconto = float(self.desconto_valor) if self.desconto_valor else 0.0
+        
+        if self.desconto_tipo == 'porcentagem':
+            valor_final = valor_base * (1 - desconto / 100)
+        elif self.desconto_tipo == 'real':
+            valor_final = valor_base - desconto
+        else:
+            valor_final = valor_base
+        
+        return max(0.0, valor_final)  # Não permite valor negativo
+
+class Mensalidade(db.Model):
+    __table_args__ = (
+        db.Index('ix_mensalidade_associado_status_vencimento', 'associado_id', 'status', 'data_vencimento'),
+        db.Index('ix_mensalidade_associado_referencia', 'associado_id', 'ano_referencia', 'mes_referencia'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    associado_id = db.Column(db.Integer, db.ForeignKey('associado.id'), nullable=False)
+    valor_base = db.Column(db.Numeric(10, 2), nullable=False)
+    desconto_tipo = db.Column(db.String(10))  # 'real' ou 'porcentagem'
+    desconto_valor = db.Column(db.Numeric(10, 2), default=0.00)
+    valor_final = db.Column(db.Numeric(10, 2), nullable=False)
+    mes_referencia = db.Column(db.Integer, nullable=False)  # 1-12
+    ano_referencia = db.Column(db.Integer, nullable=False)
+    data_vencimento = db.Column(db.Date, nullable=False)
+    status = db.Column(db.String(20), default='pendente')  # pendente, paga, cancelada
+    data_pagamento = db.Column(db.Date)
+    observacoes = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+    
+    # Relacionamento
+    associado = db.relationship('Associado', backref='mensalidades')
+
+class SaldoAssociado(db.Model):
+    """Resumo financeiro materializado de um associado (mantido por saldos.py)
+
+    Os campos de atraso valem para a data ``atrasos_em``; ``proximo_vencimento``
+    é o vencimento em aberto mais próximo que ainda não estava atrasado nessa data.
+    """
+    __tablename__ = 'saldo_associado'
+
+    associado_id = db.Column(db.Integer, db.ForeignKey('associado.id', ondelete='CASCADE'), primary_key=True)
+    mensalidades_pendentes = db.Column(db.Integer, nullable=False, default=0)
+    mensalidades_atrasadas = db.Column(db.Integer, nullable=False, default=0, index=True)
+    mensalidades_pagas = db.Column(db.Integer, nullable=False, default=0)
+    total_pendente = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    total_atrasado = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    total_pago = db.Column(db.Numeric(12, 2), nullable=False, default=0)
+    ultimo_pagamento = db.Column(db.Date)
+    proximo_vencimento = db.Column(db.Date, index=True)
+    atrasos_em = db.Column(db.Date, nullable=False)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(), onupdate=lambda: datetime.now())
+
+    associado = db.relationship('Associado', backref=db.backref('saldo', uselist=False, passive_deletes=True))
+
+class RegistroAuditoria(db.Model):
+    """Trilha de auditoria de operações administrativas (ex.: ações em lote no financeiro)"""
+    __tablename__ = 'registro_auditoria'
+
+    id = db.Column(db.Integer, primary_key=True)
+    usuario_id = db.Column(db.Integer, db.ForeignKey('usuario.id', ondelete='SET NULL'), nullable=True)
+    usuario_nome = db.Column(db.String(200))  # Mantido mesmo se o usuário for excluído
+    acao = db.Column(db.String(100), nullable=False, index=True)  # ex.: 'mensalidade.marcar_paga'
+    entidade = db.Column(db.String(50), nullable=False)
+    quantidade = db.Column(db.Integer, nullable=False, default=0)
+    ids = db.Column(db.Text)  # ids afetados, separados por vírgula
+    detalhes = db.Column(db.Text)  # JSON com os parâmetros da operação
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(), index=True)
+
+class ArquivoBlob(db.Model):
+    """Arquivo enviado, endereçado pelo SHA-256 do conteúdo (arquivos.py)
+
+    Os registros referenciam o arquivo como ``blob:<sha256>/<nome>``; arquivos
+    idênticos são gravados uma única vez.
+    """
+    __tablename__ = 'arquivo_blob'
+
+    sha256 = db.Column(db.String(64), primary_key=True)
+    tamanho = db.Column(db.BigInteger, nullable=False)
+    partes = db.Column(db.Integer, nullable=False)
+    mime_type = db.Column(db.String(100))
+    nome_original = db.Column(db.String(300))
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+
+class ArquivoBlobParte(db.Model):
+    """Conteúdo do arquivo em partes de tamanho fixo (leitura e escrita em streaming)"""
+    __tablename__ = 'arquivo_blob_parte'
+
+    sha256 = db.Column(db.String(64), db.ForeignKey('arquivo_blob.sha256', ondelete='CASCADE'), primary_key=True)
+    ordem = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    dados = db.Column(db.LargeBinary, nullable=False)
+
+class ExportacaoRelatorio(db.Model):
+    """Exportação de relatório executada em segundo plano (exportacoes.py)"""
+    __tablename__ = 'exportacao_relatorio'
+
+    id = db.Column(db.Integer, primary_key=True)
+    relatorio = db.Column(db.String(50), nullable=False)  # associados, mensalidades, doacoes, gastos
+    formato = db.Column(db.String(10), nullable=False)  # csv, xlsx
+    filtros = db.Column(db.Text)  # JSON com os filtros aplicados
+    status = db.Column(db.String(20), nullable=False, default='pendente')  # pendente, processando, concluida, erro
+    arquivo = db.Column(db.String(400))  # Referência blob:<sha256>/<nome> do arquivo gerado
+    tamanho = db.Column(db.BigInteger)
+    linhas = db.Column(db.Integer)
+    erro = db.Column(db.Text)
+    usuario_id = db.Column(db.Integer, db.ForeignKey('usuario.id', ondelete='SET NULL'), nullable=True)
+    usuario_nome = db.Column(db.String(200))
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(), index=True)
+    concluida_em = db.Column(db.DateTime)
+
+class Reciclagem(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    tipo_material = db.Column(db.String(50), nullable=False)  # Ferro, Aluminio, Cobre, Plastico, Papel, Papelao
+    nome_completo = db.Column(db.String(200), nullable=False)
+    telefone = db.Column(db.String(20), nullable=False)
+    endereco_retirada = db.Column(db.Text, nullable=False)
+    observacoes = db.Column(db.Text)
+    status = db.Column(db.String(20), default='pendente')  # pendente, em_andamento, coletado, cancelado
+    observacoes_admin = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(), onupdate=lambda: datetime.now())
+
+class Doacao(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    tipo = db.Column(db.String(50), nullable=False)  # 'financeira', 'material', 'servico'
+    descricao = db.Column(db.Text, nullable=False)
+    valor = db.Column(db.Numeric(10, 2))  # Valor em dinheiro (para financeira e servico)
+    quantidade = db.Column(db.Integer)  # Quantidade (para material)
+    unidade = db.Column(db.String(50))  # Unidade (ex: 'kg', 'litros', 'unidades')
+    doador = db.Column(db.String(200))  # Nome do doador
+    pais = db.Column(db.String(100))  # País do doador
+    telefone = db.Column(db.String(50))  # Telefone do doador
+    tipo_documento = db.Column(db.String(20))  # 'cpf', 'cnpj', 'passaporte', 'dni', etc.
+    documento = db.Column(db.String(30))  # Documento (sem formatação)
+    data_doacao = db.Column(db.Date, nullable=False)
+    observacoes = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+
+class Gasto(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    descricao = db.Column(db.Text, nullable=False)
+    valor = db.Column(db.Numeric(10, 2), nullable=False)
+    categoria = db.Column(db.String(100))  # Ex: 'Aluguel', 'Material', 'Serviços', 'Salários', etc.
+    data_gasto = db.Column(db.Date, nullable=False)
+    fornecedor = db.Column(db.String(200))  # Nome do fornecedor
+    observacoes = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now())
+
+class SobreConteudo(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    chave = db.Column(db.String(50), unique=True, nullable=False)  # 'quem_somos', 'missao', 'valores'
+    conteudo_pt = db.Column(db.Text)
+    conteudo_es = db.Column(db.Text)
+    conteudo_en = db.Column(db.Text)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class MembroDiretoria(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    cargo = db.Column(db.String(100), nullable=False)  # 'Presidente', 'Vice-Presidente', etc.
+    nome_pt = db.Column(db.String(200), nullable=False)
+    nome_es = db.Column(db.String(200))
+    nome_en = db.Column(db.String(200))
+    foto = db.Column(db.String(500))
+    foto_base64 = db.Column(db.Text, nullable=True)  # salvar imagem em base64 para persistência no Render
+    ordem = db.Column(db.Integer, default=0)  # Para ordenar os cargos
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class MembroConselhoFiscal(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome_pt = db.Column(db.String(200), nullable=False)
+    nome_es = db.Column(db.String(200))
+    nome_en = db.Column(db.String(200))
+    foto = db.Column(db.String(500))
+    foto_base64 = db.Column(db.Text, nullable=True)  # salvar imagem em base64 para persistência no Render
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class MembroCoordenacaoSocial(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    cargo = db.Column(db.String(100), nullable=False)  # 'Membro da Coordenação Social', etc.
+    nome_pt = db.Column(db.String(200), nullable=False)
+    nome_es = db.Column(db.String(200))
+    nome_en = db.Column(db.String(200))
+    foto = db.Column(db.String(500))
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class DadosAssociacao(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(200), nullable=False)
+    cnpj = db.Column(db.String(18), nullable=False)
+    endereco = db.Column(db.Text, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @staticmethod
+    def get_dados():
+        """Retorna os dados da associação, criando um registro padrão se não existir"""
+        dados = DadosAssociacao.query.first()
+        if not dados:
+            dados = DadosAssociacao(
+                nome='Associação AADVITA',
+                cnpj='00.000.000/0001-00',
+                endereco='Endereço não informado'
+            )
+            db.session.add(dados)
+            db.session.commit()
+        return dados
+
+class OQueFazemosServico(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo = db.Column(db.String(200), nullable=False)
+    descricao = db.Column(db.Text, nullable=False)
+    cor_icone = db.Column(db.String(7), nullable=False, default='#3b82f6')  # Cor em hexadecimal
+    icone_svg = db.Column(db.Text)  # SVG do ícone
+    ordem = db.Column(db.Integer, default=0)
+    coluna = db.Column(db.Integer, nullable=False, default=1)  # 1, 2 ou 3
+    ativo = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<OQueFazemosServico {self.titulo}>'
+
+class InstagramPost(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    url_instagram = db.Column(db.String(500))  # URL do post no Instagram
+    imagem_url = db.Column(db.String(500), nullable=False)  # URL da imagem
+    legenda = db.Column(db.Text)  # Legenda do post
+    data_post = db.Column(db.DateTime, nullable=False)  # Data de publicação no Instagram
+    ordem = db.Column(db.Integer, default=0)  # Ordem de exibição
+    ativo = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<InstagramPost {self.id}>'
+
+class RelatorioFinanceiro(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo_pt = db.Column(db.String(200), nullable=False)
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    arquivo = db.Column(db.String(500))  # Caminho do arquivo PDF/documento
+    data_relatorio = db.Column(db.Date)
+    tipo = db.Column(db.String(50))  # 'relatorio', 'demonstrativo', 'balanco'
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class EstatutoDocumento(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo_pt = db.Column(db.String(200), nullable=False)
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    arquivo = db.Column(db.String(500))  # Caminho do arquivo PDF/documento
+    tipo = db.Column(db.String(50))  # 'estatuto', 'ata', 'documento'
+    data_documento = db.Column(db.Date)
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class PrestacaoConta(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo_pt = db.Column(db.String(200), nullable=False)
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    recursos_recebidos_pt = db.Column(db.Text)
+    recursos_recebidos_es = db.Column(db.Text)
+    recursos_recebidos_en = db.Column(db.Text)
+    resultados_pt = db.Column(db.Text)
+    resultados_es = db.Column(db.Text)
+    resultados_en = db.Column(db.Text)
+    # HTML renderizado na gravação (conteudo.py); as páginas públicas usam estes campos
+    descricao_html_pt = db.Column(db.Text)
+    descricao_html_es = db.Column(db.Text)
+    descricao_html_en = db.Column(db.Text)
+    recursos_recebidos_html_pt = db.Column(db.Text)
+    recursos_recebidos_html_es = db.Column(db.Text)
+    recursos_recebidos_html_en = db.Column(db.Text)
+    resultados_html_pt = db.Column(db.Text)
+    resultados_html_es = db.Column(db.Text)
+    resultados_html_en = db.Column(db.Text)
+    periodo_inicio = db.Column(db.Date)
+    periodo_fim = db.Column(db.Date)
+    arquivo = db.Column(db.String(500))
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class RelatorioAtividade(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo_pt = db.Column(db.String(200), nullable=False)
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    atividades_realizadas_pt = db.Column(db.Text)
+    atividades_realizadas_es = db.Column(db.Text)
+    atividades_realizadas_en = db.Column(db.Text)
+    resultados_pt = db.Column(db.Text)
+    resultados_es = db.Column(db.Text)
+    resultados_en = db.Column(db.Text)
+    # HTML renderizado na gravação (conteudo.py); as páginas públicas usam estes campos
+    descricao_html_pt = db.Column(db.Text)
+    descricao_html_es = db.Column(db.Text)
+    descricao_html_en = db.Column(db.Text)
+    atividades_realizadas_html_pt = db.Column(db.Text)
+    atividades_realizadas_html_es = db.Column(db.Text)
+    atividades_realizadas_html_en = db.Column(db.Text)
+    resultados_html_pt = db.Column(db.Text)
+    resultados_html_es = db.Column(db.Text)
+    resultados_html_en = db.Column(db.Text)
+    periodo_inicio = db.Column(db.Date)
+    periodo_fim = db.Column(db.Date)
+    arquivo = db.Column(db.String(500))  # Caminho do arquivo PDF/documento ou 'base64:application/pdf'
+    arquivo_base64 = db.Column(db.Text, nullable=True)  # Arquivo em base64 para persistência no Render
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class InformacaoDoacao(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    titulo_pt = db.Column(db.String(200), nullable=False)
+    titulo_es = db.Column(db.String(200))
+    titulo_en = db.Column(db.String(200))
+    descricao_pt = db.Column(db.Text)
+    descricao_es = db.Column(db.Text)
+    descricao_en = db.Column(db.Text)
+    como_contribuir_pt = db.Column(db.Text)
+    como_contribuir_es = db.Column(db.Text)
+    como_contribuir_en = db.Column(db.Text)
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Informativo(db.Model):
+    __table_args__ = (
+        db.Index('ix_informativo_publicacao', 'data_publicacao', 'created_at'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    tipo = db.Column(db.String(50), nullable=False)  # 'Noticia' ou 'Podcast'
+    titulo = db.Column(db.String(200), nullable=False)
+    slug = db.Column(db.String(250), unique=True, nullable=True)  # URL amigável
+    subtitulo = db.Column(db.String(300))  # Subtítulo opcional
+    conteudo = db.Column(db.Text)  # Texto para notícias
+    url_soundcloud = db.Column(db.String(500))  # URL do SoundCloud para podcasts
+    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    data_publicacao = db.Column(db.Date, nullable=False, default=date.today)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class RadioPrograma(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(200), nullable=False)
+    descricao = db.Column(db.Text)
+    apresentador = db.Column(db.String(200))  # Nome do apresentador
+    horario = db.Column(db.String(100))  # Ex: "Segunda a Sexta, 14h às 16h"
+    url_streaming = db.Column(db.String(500))  # URL para streaming ao vivo
+    url_arquivo = db.Column(db.String(500))  # URL para arquivo de áudio (episódio)
+    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    ativo = db.Column(db.Boolean, default=True)
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class RadioConfig(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    url_streaming_principal = db.Column(db.String(500))  # URL principal de streaming da rádio
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Voluntario(db.Model):
+    __table_args__ = (
+        db.Index('ix_voluntario_cpf_normalizado', 'cpf_normalizado'),
+        db.Index('ix_voluntario_telefone_normalizado', 'telefone_normalizado'),
+        db.Index('ix_voluntario_email_normalizado', 'email_normalizado'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    nome_completo = db.Column(db.String(200), nullable=False)
+    email = db.Column(db.String(200), nullable=False)
+    telefone = db.Column(db.String(50))
+    cpf = db.Column(db.String(20))
+    # Preenchidas por identidade.py a partir de cpf/telefone/email
+    cpf_normalizado = db.Column(db.String(20))
+    telefone_normalizado = db.Column(db.String(20))
+    email_normalizado = db.Column(db.String(200))
+    password_hash = db.Column(db.String(255), nullable=True)
+    endereco = db.Column(db.Text)
+    cidade = db.Column(db.String(100))
+    estado = db.Column(db.String(50))
+    cep = db.Column(db.String(20))
+    data_nascimento = db.Column(db.Date)
+    profissao = db.Column(db.String(200))
+    habilidades = db.Column(db.Text)  # Habilidades e competências do voluntário
+    disponibilidade = db.Column(db.Text)  # Dias e horários disponíveis
+    area_interesse = db.Column(db.String(200))  # Área de interesse para voluntariado
+    observacoes = db.Column(db.Text)
+    status = db.Column(db.String(50), default='pendente')  # pendente, aprovado, inativo
+    ativo = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relacionamentos
+    ofertas_horas = db.relationship('OfertaHoras', backref='voluntario', lazy=True, cascade='all, delete-orphan')
+    agendamentos = db.relationship('AgendamentoVoluntario', backref='voluntario', lazy=True, cascade='all, delete-orphan')
+
+    def set_password(self, password):
+        try:
+            self.password_hash = generate_password_hash(password)
+        except Exception:
+            # If DB column doesn't exist, set attribute anyway; commit will fail and should be handled by caller
+            self.password_hash = generate_password_hash(password)
+
+    def check_password(self, password):
+        if not getattr(self, 'password_hash', None):
+            return False
+        return check_password_hash(self.password_hash, password)
+
+class OfertaHoras(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    voluntario_id = db.Column(db.Integer, db.ForeignKey('voluntario.id'), nullable=False)
+    data_inicio = db.Column(db.Date, nullable=False)
+    data_fim = db.Column(db.Date)  # Opcional, se for um período
+    hora_inicio = db.Column(db.String(10))  # Ex: "08:00"
+    hora_fim = db.Column(db.String(10))  # Ex: "12:00"
+    dias_semana = db.Column(db.String(100))  # Ex: "Segunda, Quarta, Sexta" ou "Todos os dias"
+    horas_totais = db.Column(db.Float)  # Total de horas oferecidas
+    descricao = db.Column(db.Text)  # Descrição da oferta
+    area_atividade = db.Column(db.String(200))  # Área de atividade oferecida
+    status = db.Column(db.String(50), default='disponivel')  # disponivel, agendada, concluida, cancelada
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relacionamento com agendamentos
+    agendamentos = db.relationship('AgendamentoVoluntario', backref='oferta_horas', lazy=True, cascade='all, delete-orphan')
+
+class AgendamentoVoluntario(db.Model):
+    __table_args__ = (
+        # Conflitos de horário: agendamentos do voluntário no dia (disponibilidade.py)
+        db.Index('ix_agendamento_voluntario_voluntario_data', 'voluntario_id', 'data_agendamento'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    voluntario_id = db.Column(db.Integer, db.ForeignKey('voluntario.id'), nullable=False)
+    oferta_horas_id = db.Column(db.Integer, db.ForeignKey('oferta_horas.id'), nullable=True)  # Opcional, pode agendar sem oferta específica
+    data_agendamento = db.Column(db.Date, nullable=False)
+    hora_inicio = db.Column(db.String(10), nullable=False)
+    hora_fim = db.Column(db.String(10), nullable=False)
+    atividade = db.Column(db.String(200), nullable=False)  # Tipo de atividade/ajuda
+    descricao = db.Column(db.Text)  # Descrição detalhada do que será feito
+    responsavel = db.Column(db.String(200))  # Nome da pessoa que está agendando
+    contato_responsavel = db.Column(db.String(100))  # Telefone/email do responsável
+    local = db.Column(db.String(300))  # Local onde será a atividade
+    observacoes = db.Column(db.Text)
+    status = db.Column(db.String(50), default='agendado')  # agendado, confirmado, em_andamento, concluido, cancelado
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ProblemaAcessibilidade(db.Model):
+    __tablename__ = 'problema_acessibilidade'
+    id = db.Column(db.Integer, primary_key=True)
+    tipo_problema = db.Column(db.String(100), nullable=False)  # Ex: "acessibilidade urbana", "calçada", "faixa de pedestre", "sinal sonoro"
+    descricao = db.Column(db.Text, nullable=False)
+    localizacao = db.Column(db.String(500), nullable=False)  # Endereço ou localização
+    nome_denunciante = db.Column(db.String(200), nullable=False)
+    telefone = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(200))
+    anexos = db.Column(db.Text)  # caminhos separados por vírgula
+    status = db.Column(db.String(50), default='novo')  # novo, em_analise, encaminhado, resolvido
+    observacoes_admin = db.Column(db.Text)  # Observações internas da associação
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Certificado(db.Model):
+    __tablename__ = 'certificado'
+    id = db.Column(db.Integer, primary_key=True)
+    numero_validacao = db.Column(db.String(50), unique=True, nullable=False)
+    nome_pessoa = db.Column(db.String(200), nullable=False)
+    documento = db.Column(db.String(100), nullable=True)
+    descricao = db.Column(db.Text, nullable=True)
+    curso = db.Column(db.String(200), nullable=True)
+    data_emissao = db.Column(db.DateTime, default=datetime.utcnow)
+    data_validade = db.Column(db.DateTime, nullable=True)
+    status = db.Column(db.String(50), default='valido')  # valido, revogado, expirado
+    qr_code_path = db.Column(db.String(300), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Banner(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    tipo = db.Column(db.String(50), nullable=False, unique=True)  # 'Campanhas', 'Apoie-nos', 'Editais'
+    titulo = db.Column(db.String(200), nullable=False)
+    descricao = db.Column(db.String(300))
+    url = db.Column(db.String(500))  # URL de destino
+    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    cor_gradiente_inicio = db.Column(db.String(7), default='#667eea')  # Cor inicial do gradiente
+    cor_gradiente_fim = db.Column(db.String(7), default='#764ba2')  # Cor final do gradiente
+    ativo = db.Column(db.Boolean, default=True)
+    ordem = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relacionamento com conteúdos
+    conteudos = db.relationship('BannerConteudo', backref='banner', lazy=True, cascade='all, delete-orphan', order_by='BannerConteudo.ordem')
+
+class BannerConteudo(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    banner_id = db.Column(db.Integer, db.ForeignKey('banner.id'), nullable=False)
+    titulo = db.Column(db.String(200), nullable=False)
+    conteudo = db.Column(db.Text)  # Conteúdo HTML/texto
+    imagem = db.Column(db.String(300))  # Caminho da imagem ou 'base64:...'
+    imagem_base64 = db.Column(db.Text, nullable=True)  # Imagem em base64 para persistência no Render (opcional)
+    descricao_imagem = db.Column(db.Text, nullable=True)  # Descrição da imagem para acessibilidade
+    arquivo_pdf = db.Column(db.String(300))  # Arquivo PDF opcional
+    ordem = db.Column(db.Integer, default=0)
+    ativo = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ModeloDocumento(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(200), nullable=False)
+    descricao = db.Column(db.Text)
+    arquivo = db.Column(db.String(500), nullable=False)  # Caminho do arquivo Word
+    nome_arquivo_original = db.Column(db.String(300))  # Nome original do arquivo
+    tamanho_arquivo = db.Column(db.Integer)  # Tamanho em bytes
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
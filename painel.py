@@ -0,0 +1,79 @@
+"""Contadores do painel administrativo em uma única consulta
+
+Cada tabela contribui com uma subconsulta agregada de uma linha (total e
+contagens filtradas por status, no estilo ``COUNT(*) FILTER``), e as
+subconsultas são unidas em um único SELECT: o painel faz uma ida ao banco em
+vez de uma contagem por cartão. ``pendencias`` usa o mesmo mecanismo só com os
+contadores dos avisos, para a consulta periódica da barra lateral.
+"""
+from sqlalchemy import case, func, select, true
+
+from extensions import db
+from models import (
+    Acao, AgendamentoVoluntario, Associado, Certificado, Evento, Imagem, Informativo, OfertaHoras,
+    ProblemaAcessibilidade, Projeto, RadioPrograma, Reciclagem, ReunionPresencial, ReunionVirtual, Video,
+    Voluntario,
+)
+
+# Modelo -> {chave do contador: condição (None conta todos os registros)}
+ESTATISTICAS = (
+    (ReunionPresencial, {'reuniones_presenciales': None}),
+    (ReunionVirtual, {'reuniones_virtuales': None}),
+    (Projeto, {'projetos': None}),
+    (Evento, {'eventos': None}),
+    (Acao, {'acoes': None}),
+    (Informativo, {'informativos': None}),
+    (RadioPrograma, {'radio_programas': RadioPrograma.ativo.is_(True)}),
+    (Imagem, {'imagens': None}),
+    (Video, {'videos': None}),
+    (ProblemaAcessibilidade, {
+        'problemas_acessibilidade_novos': ProblemaAcessibilidade.status == 'novo',
+        'problemas_acessibilidade_total': None,
+    }),
+    (Certificado, {'certificados_total': None}),
+    (Associado, {
+        'associados': None,
+        'associados_pendentes': Associado.status == 'pendente',
+    }),
+    (Voluntario, {
+        'voluntarios': None,
+        'voluntarios_pendentes': Voluntario.status == 'pendente',
+    }),
+    (OfertaHoras, {'ofertas_horas': None}),
+    (AgendamentoVoluntario, {'agendamentos': None}),
+    (Reciclagem, {
+        'reciclagem_pendentes': Reciclagem.status == 'pendente',
+        'reciclagem_total': None,
+    }),
+)
+
+# Contadores exibidos como avisos no painel e na barra lateral
+PENDENCIAS = ('associados_pendentes', 'problemas_acessibilidade_novos', 'reciclagem_pendentes')
+
+
+def _consulta(chaves=None):
+    subconsultas = []
+    for model, contadores in ESTATISTICAS:
+        colunas = [
+            (func.count() if condicao is None else func.count(case((condicao, 1)))).label(chave)
+            for chave, condicao in contadores.items()
+            if chaves is None or chave in chaves
+        ]
+        if colunas:
+            subconsultas.append(select(*colunas).select_from(model).subquery())
+
+    origem = subconsultas[0]
+    for sub in subconsultas[1:]:
+        # Cada subconsulta tem uma linha: o produto cartesiano é a própria linha de resultado
+        origem = origem.join(sub, true())
+    return select(*[c for sub in subconsultas for c in sub.c]).select_from(origem)
+
+
+def estatisticas():
+    """Todos os contadores do painel: {chave: quantidade}"""
+    return dict(db.session.execute(_consulta()).mappings().one())
+
+
+def pendencias():
+    """Apenas os contadores de avisos (associados, acessibilidade, reciclagem)"""
+    return dict(db.session.execute(_consulta(PENDENCIAS)).mappings().one())
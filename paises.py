@@ -0,0 +1,496 @@
+"""Países, DDI e documentos aceitos nas doações
+
+Fonte única dos dados usados pelo formulário de doação e pela validação no
+servidor. O formulário lista ``PAISES`` no select e carrega ``CONFIG_PAISES``
+(DDI, máscara de telefone e documentos de cada país) de um arquivo JS gerado a
+partir deste módulo: o conteúdo é montado uma vez por processo e servido em uma
+URL com a versão (hash do conteúdo), cacheada como imutável pelo navegador.
+
+``normalizar_pais`` e ``normalizar_documento`` validam o que chega do
+formulário com consultas em dicionários, sem percorrer a lista de países.
+"""
+import hashlib
+import json
+import re
+
+# (código ISO, nome, DDI) na ordem exibida no formulário
+PAISES = (
+    ('AF', 'Afeganistão', '+93'),
+    ('AL', 'Albânia', '+355'),
+    ('DE', 'Alemanha', '+49'),
+    ('AD', 'Andorra', '+376'),
+    ('AO', 'Angola', '+244'),
+    ('AI', 'Anguilla', '+1264'),
+    ('AQ', 'Antártida', '+672'),
+    ('AG', 'Antígua e Barbuda', '+1268'),
+    ('AR', 'Argentina', '+54'),
+    ('DZ', 'Argélia', '+213'),
+    ('AM', 'Armênia', '+374'),
+    ('AW', 'Aruba', '+297'),
+    ('SA', 'Arábia Saudita', '+966'),
+    ('AU', 'Austrália', '+61'),
+    ('AZ', 'Azerbaijão', '+994'),
+    ('BS', 'Bahamas', '+1242'),
+    ('BH', 'Bahrein', '+973'),
+    ('BD', 'Bangladesh', '+880'),
+    ('BB', 'Barbados', '+1246'),
+    ('BZ', 'Belize', '+501'),
+    ('BJ', 'Benin', '+229'),
+    ('BM', 'Bermudas', '+1441'),
+    ('BY', 'Bielorrússia', '+375'),
+    ('BO', 'Bolívia', '+591'),
+    ('BW', 'Botsuana', '+267'),
+    ('BR', 'Brasil', '+55'),
+    ('BN', 'Brunei', '+673'),
+    ('BG', 'Bulgária', '+359'),
+    ('BF', 'Burkina Faso', '+226'),
+    ('BI', 'Burundi', '+257'),
+    ('BT', 'Butão', '+975'),
+    ('BE', 'Bélgica', '+32'),
+    ('BA', 'Bósnia e Herzegovina', '+387'),
+    ('CV', 'Cabo Verde', '+238'),
+    ('CM', 'Camarões', '+237'),
+    ('KH', 'Camboja', '+855'),
+    ('CA', 'Canadá', '+1'),
+    ('QA', 'Catar', '+974'),
+    ('KZ', 'Cazaquistão', '+7'),
+    ('TD', 'Chade', '+235'),
+    ('CL', 'Chile', '+56'),
+    ('CN', 'China', '+86'),
+    ('CY', 'Chipre', '+357'),
+    ('CO', 'Colômbia', '+57'),
+    ('KM', 'Comores', '+269'),
+    ('CG', 'Congo', '+242'),
+    ('CD', 'Congo (RDC)', '+243'),
+    ('KP', 'Coreia do Norte', '+850'),
+    ('KR', 'Coreia do Sul', '+82'),
+    ('CR', 'Costa Rica', '+506'),
+    ('CI', 'Costa do Marfim', '+225'),
+    ('HR', 'Croácia', '+385'),
+    ('CU', 'Cuba', '+53'),
+    ('CW', 'Curaçao', '+599'),
+    ('DK', 'Dinamarca', '+45'),
+    ('DJ', 'Djibuti', '+253'),
+    ('DM', 'Dominica', '+1767'),
+    ('EG', 'Egito', '+20'),
+    ('SV', 'El Salvador', '+503'),
+    ('AE', 'Emirados Árabes Unidos', '+971'),
+    ('EC', 'Equador', '+593'),
+    ('ER', 'Eritreia', '+291'),
+    ('SK', 'Eslováquia', '+421'),
+    ('SI', 'Eslovênia', '+386'),
+    ('ES', 'Espanha', '+34'),
+    ('US', 'Estados Unidos', '+1'),
+    ('EE', 'Estônia', '+372'),
+    ('SZ', 'Eswatini', '+268'),
+    ('ET', 'Etiópia', '+251'),
+    ('FJ', 'Fiji', '+679'),
+    ('PH', 'Filipinas', '+63'),
+    ('FI', 'Finlândia', '+358'),
+    ('FR', 'França', '+33'),
+    ('GA', 'Gabão', '+241'),
+    ('GH', 'Gana', '+233'),
+    ('GE', 'Geórgia', '+995'),
+    ('GI', 'Gibraltar', '+350'),
+    ('GD', 'Granada', '+1473'),
+    ('GL', 'Groenlândia', '+299'),
+    ('GR', 'Grécia', '+30'),
+    ('GP', 'Guadalupe', '+590'),
+    ('GU', 'Guam', '+1671'),
+    ('GT', 'Guatemala', '+502'),
+    ('GG', 'Guernsey', '+44'),
+    ('GY', 'Guiana', '+592'),
+    ('GF', 'Guiana Francesa', '+594'),
+    ('GN', 'Guiné', '+224'),
+    ('GQ', 'Guiné Equatorial', '+240'),
+    ('GW', 'Guiné-Bissau', '+245'),
+    ('GM', 'Gâmbia', '+220'),
+    ('HT', 'Haiti', '+509'),
+    ('HN', 'Honduras', '+504'),
+    ('HK', 'Hong Kong', '+852'),
+    ('HU', 'Hungria', '+36'),
+    ('BV', 'Ilha Bouvet', '+47'),
+    ('CX', 'Ilha Christmas', '+61'),
+    ('NF', 'Ilha Norfolk', '+672'),
+    ('IM', 'Ilha de Man', '+44'),
+    ('KY', 'Ilhas Cayman', '+1345'),
+    ('CC', 'Ilhas Cocos', '+61'),
+    ('CK', 'Ilhas Cook', '+682'),
+    ('FO', 'Ilhas Faroé', '+298'),
+    ('GS', 'Ilhas Geórgia do Sul', '+500'),
+    ('HM', 'Ilhas Heard', '+672'),
+    ('FK', 'Ilhas Malvinas', '+500'),
+    ('MP', 'Ilhas Marianas do Norte', '+1670'),
+    ('MH', 'Ilhas Marshall', '+692'),
+    ('UM', 'Ilhas Menores dos EUA', '+1'),
+    ('PN', 'Ilhas Pitcairn', '+64'),
+    ('SB', 'Ilhas Salomão', '+677'),
+    ('TC', 'Ilhas Turcas e Caicos', '+1649'),
+    ('VG', 'Ilhas Virgens Britânicas', '+1284'),
+    ('VI', 'Ilhas Virgens dos EUA', '+1340'),
+    ('AX', 'Ilhas Åland', '+358'),
+    ('ID', 'Indonésia', '+62'),
+    ('IQ', 'Iraque', '+964'),
+    ('IE', 'Irlanda', '+353'),
+    ('IR', 'Irã', '+98'),
+    ('IS', 'Islândia', '+354'),
+    ('IL', 'Israel', '+972'),
+    ('IT', 'Itália', '+39'),
+    ('YE', 'Iêmen', '+967'),
+    ('JM', 'Jamaica', '+1876'),
+    ('JP', 'Japão', '+81'),
+    ('JE', 'Jersey', '+44'),
+    ('JO', 'Jordânia', '+962'),
+    ('KI', 'Kiribati', '+686'),
+    ('KW', 'Kuwait', '+965'),
+    ('LA', 'Laos', '+856'),
+    ('LS', 'Lesoto', '+266'),
+    ('LV', 'Letônia', '+371'),
+    ('LR', 'Libéria', '+231'),
+    ('LI', 'Liechtenstein', '+423'),
+    ('LT', 'Lituânia', '+370'),
+    ('LU', 'Luxemburgo', '+352'),
+    ('LB', 'Líbano', '+961'),
+    ('LY', 'Líbia', '+218'),
+    ('MO', 'Macau', '+853'),
+    ('MK', 'Macedônia do Norte', '+389'),
+    ('MG', 'Madagascar', '+261'),
+    ('MW', 'Malawi', '+265'),
+    ('MV', 'Maldivas', '+960'),
+    ('ML', 'Mali', '+223'),
+    ('MT', 'Malta', '+356'),
+    ('MY', 'Malásia', '+60'),
+    ('MA', 'Marrocos', '+212'),
+    ('MQ', 'Martinica', '+596'),
+    ('MR', 'Mauritânia', '+222'),
+    ('MU', 'Maurício', '+230'),
+    ('YT', 'Mayotte', '+262'),
+    ('FM', 'Micronésia', '+691'),
+    ('MD', 'Moldávia', '+373'),
+    ('MN', 'Mongólia', '+976'),
+    ('ME', 'Montenegro', '+382'),
+    ('MS', 'Montserrat', '+1664'),
+    ('MZ', 'Moçambique', '+258'),
+    ('MM', 'Myanmar', '+95'),
+    ('MX', 'México', '+52'),
+    ('MC', 'Mônaco', '+377'),
+    ('NA', 'Namíbia', '+264'),
+    ('NR', 'Nauru', '+674'),
+    ('NP', 'Nepal', '+977'),
+    ('NI', 'Nicarágua', '+505'),
+    ('NG', 'Nigéria', '+234'),
+    ('NU', 'Niue', '+683'),
+    ('NO', 'Noruega', '+47'),
+    ('NC', 'Nova Caledônia', '+687'),
+    ('NZ', 'Nova Zelândia', '+64'),
+    ('NE', 'Níger', '+227'),
+    ('OM', 'Omã', '+968'),
+    ('PW', 'Palau', '+680'),
+    ('PS', 'Palestina', '+970'),
+    ('PA', 'Panamá', '+507'),
+    ('PG', 'Papua-Nova Guiné', '+675'),
+    ('PK', 'Paquistão', '+92'),
+    ('PY', 'Paraguai', '+595'),
+    ('NL', 'Países Baixos', '+31'),
+    ('PE', 'Peru', '+51'),
+    ('PF', 'Polinésia Francesa', '+689'),
+    ('PL', 'Polônia', '+48'),
+    ('PR', 'Porto Rico', '+1787'),
+    ('PT', 'Portugal', '+351'),
+    ('KG', 'Quirguistão', '+996'),
+    ('KE', 'Quênia', '+254'),
+    ('GB', 'Reino Unido', '+44'),
+    ('CF', 'República Centro-Africana', '+236'),
+    ('DO', 'República Dominicana', '+1809'),
+    ('CZ', 'República Tcheca', '+420'),
+    ('RE', 'Reunião', '+262'),
+    ('RO', 'Romênia', '+40'),
+    ('RW', 'Ruanda', '+250'),
+    ('RU', 'Rússia', '+7'),
+    ('EH', 'Saara Ocidental', '+212'),
+    ('PM', 'Saint Pierre e Miquelon', '+508'),
+    ('BL', 'Saint-Barthélemy', '+590'),
+    ('WS', 'Samoa', '+685'),
+    ('AS', 'Samoa Americana', '+1684'),
+    ('SM', 'San Marino', '+378'),
+    ('SH', 'Santa Helena', '+290'),
+    ('LC', 'Santa Lúcia', '+1758'),
+    ('SC', 'Seicheles', '+248'),
+    ('SN', 'Senegal', '+221'),
+    ('SL', 'Serra Leoa', '+232'),
+    ('SG', 'Singapura', '+65'),
+    ('SX', 'Sint Maarten', '+1721'),
+    ('SO', 'Somália', '+252'),
+    ('LK', 'Sri Lanka', '+94'),
+    ('SD', 'Sudão', '+249'),
+    ('SS', 'Sudão do Sul', '+211'),
+    ('SR', 'Suriname', '+597'),
+    ('SE', 'Suécia', '+46'),
+    ('CH', 'Suíça', '+41'),
+    ('SJ', 'Svalbard e Jan Mayen', '+47'),
+    ('KN', 'São Cristóvão e Névis', '+1869'),
+    ('ST', 'São Tomé e Príncipe', '+239'),
+    ('VC', 'São Vicente e Granadinas', '+1784'),
+    ('RS', 'Sérvia', '+381'),
+    ('SY', 'Síria', '+963'),
+    ('TJ', 'Tadjiquistão', '+992'),
+    ('TH', 'Tailândia', '+66'),
+    ('TW', 'Taiwan', '+886'),
+    ('TZ', 'Tanzânia', '+255'),
+    ('TF', 'Terras Austrais Francesas', '+262'),
+    ('IO', 'Território Britânico do Oceano Índico', '+246'),
+    ('TL', 'Timor-Leste', '+670'),
+    ('TG', 'Togo', '+228'),
+    ('TK', 'Tokelau', '+690'),
+    ('TO', 'Tonga', '+676'),
+    ('TT', 'Trinidad e Tobago', '+1868'),
+    ('TN', 'Tunísia', '+216'),
+    ('TM', 'Turcomenistão', '+993'),
+    ('TR', 'Turquia', '+90'),
+    ('TV', 'Tuvalu', '+688'),
+    ('UA', 'Ucrânia', '+380'),
+    ('UG', 'Uganda', '+249'),
+    ('UY', 'Uruguai', '+598'),
+    ('UZ', 'Uzbequistão', '+998'),
+    ('VU', 'Vanuatu', '+678'),
+    ('VA', 'Vaticano', '+39'),
+    ('VE', 'Venezuela', '+58'),
+    ('VN', 'Vietnã', '+84'),
+    ('WF', 'Wallis e Futuna', '+681'),
+    ('ZW', 'Zimbábue', '+193'),
+    ('ZM', 'Zâmbia', '+260'),
+    ('ZA', 'África do Sul', '+27'),
+    ('AT', 'Áustria', '+43'),
+    ('IN', 'Índia', '+91'),
+)
+
+# Documentos aceitos nos países sem configuração própria
+DOCUMENTOS_GENERICOS = (
+    {'value': 'passaporte', 'label': 'Passaporte', 'maxLength': 20, 'placeholder': 'Passaporte'},
+    {'value': 'outro', 'label': 'Outro Documento', 'maxLength': 30, 'placeholder': 'Documento'},
+)
+
+# Países com máscara de telefone e documentos próprios (os demais usam o formato genérico)
+CONFIG_ESPECIFICA = {
+    'BR': {
+        'telefone': {'format': 'br', 'placeholder': '+55 (00) 00000-0000'},
+        'documentos': (
+            {'value': 'cpf', 'label': 'CPF (Pessoa Física)', 'maxLength': 14, 'placeholder': '000.000.000-00'},
+            {'value': 'cnpj', 'label': 'CNPJ (Pessoa Jurídica)', 'maxLength': 18, 'placeholder': '00.000.000/0000-00'},
+        ),
+    },
+    'AR': {
+        'telefone': {'format': 'ar', 'placeholder': '+54 (000) 000 0000'},
+        'documentos': (
+            {'value': 'cuil', 'label': 'CUIL (Pessoa Física - CPF)', 'maxLength': 13, 'placeholder': '00-00000000-0'},
+            {'value': 'cuit', 'label': 'CUIT (Pessoa Jurídica - CNPJ)', 'maxLength': 13, 'placeholder': '00-00000000-0'},
+        ),
+    },
+    'UY': {
+        'telefone': {'format': 'uy', 'placeholder': '+598 0000 0000'},
+        'documentos': (
+            {'value': 'ruc', 'label': 'RUC (Pessoa Jurídica)', 'maxLength': 12, 'placeholder': '000000000000'},
+        ),
+    },
+    'PY': {
+        'telefone': {'format': 'py', 'placeholder': '+595 (000) 000-000'},
+        'documentos': (
+            {'value': 'ruc', 'label': 'RUC (Pessoa Jurídica)', 'maxLength': 10, 'placeholder': '0000000-0'},
+        ),
+    },
+    'CL': {
+        'telefone': {'format': 'cl', 'placeholder': '+56 9 0000 0000'},
+        'documentos': (
+            {'value': 'rut_empresa', 'label': 'RUT (Pessoa Jurídica)', 'maxLength': 12, 'placeholder': '00.000.000-0'},
+        ),
+    },
+    'CO': {
+        'telefone': {'format': 'co', 'placeholder': '+57 300 000 0000'},
+        'documentos': (
+            {'value': 'nit', 'label': 'NIT (Pessoa Jurídica)', 'maxLength': 12, 'placeholder': '000.000.000-0'},
+        ),
+    },
+    'PE': {
+        'telefone': {'format': 'pe', 'placeholder': '+51 000 000 000'},
+        'documentos': (
+            {'value': 'ruc', 'label': 'RUC (Pessoa Jurídica)', 'maxLength': 11, 'placeholder': '00000000000'},
+        ),
+    },
+    'BO': {
+        'telefone': {'format': 'bo', 'placeholder': '+591 000 00000'},
+        'documentos': (
+            {'value': 'nit', 'label': 'NIT (Pessoa Jurídica)', 'maxLength': 12, 'placeholder': '0000000000'},
+        ),
+    },
+    'VE': {
+        'telefone': {'format': 've', 'placeholder': '+58 000 000-0000'},
+        'documentos': (
+            {'value': 'rif', 'label': 'RIF (Pessoa Jurídica)', 'maxLength': 12, 'placeholder': 'J-00000000-0'},
+        ),
+    },
+    'EC': {
+        'telefone': {'format': 'ec', 'placeholder': '+593 00 000 0000'},
+        'documentos': (
+            {'value': 'ruc', 'label': 'RUC (Pessoa Jurídica)', 'maxLength': 13, 'placeholder': '0000000000000'},
+        ),
+    },
+    'US': {
+        'telefone': {'format': 'us', 'placeholder': '+1 (000) 000-0000'},
+        'documentos': (
+            {'value': 'ssn', 'label': 'SSN (Pessoa Física)', 'maxLength': 11, 'placeholder': '000-00-0000'},
+            {'value': 'ein', 'label': 'EIN (Pessoa Jurídica)', 'maxLength': 12, 'placeholder': '00-0000000'},
+            {'value': 'passaporte', 'label': 'Passaporte', 'maxLength': 20, 'placeholder': 'Passaporte'},
+        ),
+    },
+    'ES': {
+        'telefone': {'format': 'es', 'placeholder': '+34 000 000 000'},
+        'documentos': (
+            {'value': 'nie', 'label': 'NIE (Pessoa Física)', 'maxLength': 10, 'placeholder': 'X-0000000-A'},
+            {'value': 'cif', 'label': 'CIF (Pessoa Jurídica)', 'maxLength': 10, 'placeholder': 'A00000000'},
+            {'value': 'passaporte', 'label': 'Passaporte', 'maxLength': 20, 'placeholder': 'Passaporte'},
+        ),
+    },
+    'PT': {
+        'telefone': {'format': 'pt', 'placeholder': '+351 000 000 000'},
+        'documentos': (
+            {'value': 'nif', 'label': 'NIF (Pessoa Física)', 'maxLength': 11, 'placeholder': '000000000'},
+            {'value': 'nif_empresa', 'label': 'NIF (Pessoa Jurídica)', 'maxLength': 11, 'placeholder': '000000000'},
+            {'value': 'passaporte', 'label': 'Passaporte', 'maxLength': 20, 'placeholder': 'Passaporte'},
+        ),
+    },
+    'OUTRO': {
+        'ddi': '',
+        'telefone': {'format': 'outro', 'placeholder': 'Digite o telefone com DDI'},
+        'documentos': (
+            {'value': 'passaporte', 'label': 'Passaporte', 'maxLength': 30, 'placeholder': 'Passaporte'},
+            {'value': 'outro', 'label': 'Outro', 'maxLength': 30, 'placeholder': 'Documento'},
+        ),
+    },
+}
+
+
+def bandeira(codigo):
+    """Emoji da bandeira a partir do código ISO de duas letras"""
+    if not codigo or len(codigo) != 2 or not codigo.isalpha():
+        return ''
+    return ''.join(chr(0x1F1E6 + ord(letra) - ord('A')) for letra in codigo.upper())
+
+
+def _config(codigo, ddi):
+    config = {
+        'ddi': ddi,
+        'telefone': {'format': 'generico', 'placeholder': f'{ddi} 000 000 0000'},
+        'documentos': DOCUMENTOS_GENERICOS,
+    }
+    config.update(CONFIG_ESPECIFICA.get(codigo, {}))
+    return config
+
+
+# Código -> configuração usada pelo formulário (inclui 'OUTRO')
+CONFIG_PAISES = {codigo: _config(codigo, ddi) for codigo, _, ddi in PAISES}
+CONFIG_PAISES['OUTRO'] = _config('OUTRO', '')
+
+# Índices para validação em O(1)
+NOMES = {codigo: nome for codigo, nome, _ in PAISES}
+_CODIGO_POR_NOME = {nome.casefold(): codigo for codigo, nome, _ in PAISES}
+_DOCUMENTOS = {
+    codigo: {doc['value']: doc['maxLength'] for doc in config['documentos']}
+    for codigo, config in CONFIG_PAISES.items()
+}
+# Sem país informado: qualquer tipo conhecido, com o maior tamanho entre os países
+_TODOS_DOCUMENTOS = {}
+for _docs in _DOCUMENTOS.values():
+    for _tipo, _tamanho in _docs.items():
+        _TODOS_DOCUMENTOS[_tipo] = max(_tamanho, _TODOS_DOCUMENTOS.get(_tipo, 0))
+
+_RE_NAO_ALFANUMERICO = re.compile(r'[^0-9A-Za-z]')
+
+
+def nome_pais(codigo):
+    """'🇧🇷 Brasil' para 'BR'; códigos desconhecidos são devolvidos como estão"""
+    if not codigo:
+        return ''
+    nome = NOMES.get(codigo)
+    return f'{bandeira(codigo)} {nome}' if nome else codigo
+
+
+def normalizar_pais(valor):
+    """Código do país (ex.: 'BR') a partir do código ou do nome; None se vazio
+
+    Levanta ValueError se o país não existe na lista.
+    """
+    valor = (valor or '').strip()
+    if not valor:
+        return None
+    codigo = valor.upper()
+    if codigo in CONFIG_PAISES:
+        return codigo
+    codigo = _CODIGO_POR_NOME.get(valor.casefold())
+    if codigo is None:
+        raise ValueError(f'País inválido: {valor}')
+    return codigo
+
+
+def _digito_verificador(digitos, pesos):
+    resto = sum(int(d) * p for d, p in zip(digitos, pesos)) % 11
+    return '0' if resto < 2 else str(11 - resto)
+
+
+def cpf_valido(cpf):
+    if len(cpf) != 11 or not cpf.isdigit() or cpf == cpf[0] * 11:
+        return False
+    dv1 = _digito_verificador(cpf[:9], range(10, 1, -1))
+    dv2 = _digito_verificador(cpf[:9] + dv1, range(11, 1, -1))
+    return cpf[9:] == dv1 + dv2
+
+
+def cnpj_valido(cnpj):
+    if len(cnpj) != 14 or not cnpj.isdigit() or cnpj == cnpj[0] * 14:
+        return False
+    pesos = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+    dv1 = _digito_verificador(cnpj[:12], pesos)
+    dv2 = _digito_verificador(cnpj[:12] + dv1, (6,) + pesos)
+    return cnpj[12:] == dv1 + dv2
+
+
+_VALIDADORES = {
+    'cpf': (cpf_valido, 'CPF inválido.'),
+    'cnpj': (cnpj_valido, 'CNPJ inválido.'),
+}
+
+
+def normalizar_documento(pais, tipo_documento, documento):
+    """(tipo_documento, documento) normalizados para gravar na doação
+
+    O documento é guardado sem formatação (só letras maiúsculas e dígitos). O
+    tipo precisa ser um dos documentos do país; CPF e CNPJ têm os dígitos
+    verificadores conferidos. Levanta ValueError com a mensagem para o usuário.
+    """
+    tipo = (tipo_documento or '').strip().lower() or None
+    documento = _RE_NAO_ALFANUMERICO.sub('', documento or '').upper() or None
+    if tipo is None:
+        if documento:
+            raise ValueError('Selecione o tipo do documento.')
+        return None, None
+
+    permitidos = _DOCUMENTOS.get(pais) if pais else _TODOS_DOCUMENTOS
+    if permitidos is None or tipo not in permitidos:
+        raise ValueError('Tipo de documento inválido para o país selecionado.')
+    if documento is None:
+        return tipo, None
+    if len(documento) > permitidos[tipo]:
+        raise ValueError(f'Documento muito longo (máximo de {permitidos[tipo]} caracteres).')
+    validador = _VALIDADORES.get(tipo)
+    if validador and not validador[0](documento):
+        raise ValueError(validador[1])
+    return tipo, documento
+
+
+def _gerar_js():
+    dados = json.dumps(CONFIG_PAISES, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return f'window.configPaises = {dados};\n'.encode('utf-8')
+
+
+# Conteúdo do arquivo estático e versão (hash) usada na URL
+CONFIG_PAISES_JS = _gerar_js()
+VERSAO = hashlib.sha256(CONFIG_PAISES_JS).hexdigest()[:12]
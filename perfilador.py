@@ -0,0 +1,271 @@
+"""Perfilador de requisições sob demanda (cProfile ou amostragem de pilhas)
+
+Mostra onde o tempo de uma página lenta em produção é gasto (renderização
+Jinja, helpers de URL do context processor, decodificação de base64, SQL...).
+Uma requisição é perfilada quando:
+
+- a sessão é de administrador e a requisição traz ``?perfilar=1`` ou o
+  cabeçalho ``X-Perfilar: 1``: roda sob ``cProfile`` e grava o ``.prof``
+  (abrir com ``pstats``, snakeviz etc.); ``perfilar=pilhas`` usa o amostrador;
+- ou foi sorteada pela taxa ``PERFILADOR_AMOSTRAGEM``: o amostrador de pilhas,
+  uma thread que lê ``sys._current_frames()`` a cada ``PERFILADOR_INTERVALO_MS``,
+  grava as pilhas no formato "collapsed" (``func;func;func N``), pronto para
+  ``flamegraph.pl`` ou speedscope. O custo na requisição é praticamente nulo.
+
+Cada perfil fica em ``PERFILADOR_DIR`` (compartilhado pelos workers) com um
+``.json`` de metadados (rota, método, status, duração); só os
+``PERFILADOR_MAX`` mais recentes são mantidos. A resposta perfilada traz o
+cabeçalho ``X-Perfil`` com o id, e /admin/sistema/perfis lista e baixa os perfis.
+
+Variáveis de ambiente:
+
+    PERFILADOR_ATIVO          0 desativa o perfilador (padrão: 1; sob demanda só para administradores)
+    PERFILADOR_AMOSTRAGEM     fração das requisições perfiladas automaticamente, ex.: 0.01 (padrão: 0)
+    PERFILADOR_INTERVALO_MS   intervalo entre amostras de pilha em ms (padrão: 5)
+    PERFILADOR_DIR            diretório dos perfis (padrão: instance/perfis)
+    PERFILADOR_MAX            perfis mantidos em disco (padrão: 50)
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from flask import g, request, session
+
+MODOS = {'1': 'cprofile', 'cprofile': 'cprofile', 'pilhas': 'pilhas'}
+
+EXTENSOES = {'cprofile': '.prof', 'pilhas': '.txt'}
+
+# Rotas nunca sorteadas pela amostragem
+IGNORADAS = {'static'}
+
+
+def _nome_frame(frame):
+    codigo = frame.f_code
+    return f'{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})'
+
+
+def pilha_collapsed(frame):
+    """Pilha do frame no formato collapsed (raiz primeiro, separada por ';')"""
+    nomes = []
+    while frame is not None:
+        nomes.append(_nome_frame(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(nomes))
+
+
+class Amostrador:
+    """Thread que amostra as pilhas das threads registradas enquanto houver alguma"""
+
+    def __init__(self, intervalo):
+        self.intervalo = intervalo
+        self._alvos = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def iniciar(self, ident):
+        contagem = Counter()
+        with self._lock:
+            self._alvos[ident] = contagem
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._rodar, name='perfilador', daemon=True)
+                self._thread.start()
+        return contagem
+
+    def parar(self, ident):
+        with self._lock:
+            return self._alvos.pop(ident, None)
+
+    def _rodar(self):
+        while True:
+            time.sleep(self.intervalo)
+            with self._lock:
+                if not self._alvos:
+                    self._thread = None
+                    return
+                alvos = list(self._alvos.items())
+            frames = sys._current_frames()
+            for ident, contagem in alvos:
+                frame = frames.get(ident)
+                if frame is not None:
+                    contagem[pilha_collapsed(frame)] += 1
+
+
+class Perfilador:
+    def __init__(self, diretorio, amostragem=0.0, maximo=50, intervalo=0.005):
+        self.diretorio = diretorio
+        self.amostragem = amostragem
+        self.maximo = maximo
+        self.amostrador = Amostrador(intervalo)
+
+    # ============================================
+    # REQUISIÇÃO
+    # ============================================
+
+    def _modo(self):
+        pedido = request.args.get('perfilar') or request.headers.get('X-Perfilar')
+        if pedido:
+            if pedido in MODOS and session.get('admin_logged_in'):
+                return MODOS[pedido], 'sob demanda'
+            return None, None
+        if self.amostragem and request.endpoint not in IGNORADAS and random.random() < self.amostragem:
+            return 'pilhas', 'amostragem'
+        return None, None
+
+    def iniciar(self):
+        modo, origem = self._modo()
+        if not modo:
+            return
+        if modo == 'cprofile':
+            perfil = cProfile.Profile()
+            try:
+                perfil.enable()
+            except ValueError:
+                # Outro profiler já ativo neste processo (ex.: depurador)
+                return
+        else:
+            perfil = self.amostrador.iniciar(threading.get_ident())
+        g.perfil = (modo, origem, perfil, time.perf_counter())
+
+    def _encerrar(self):
+        modo, origem, perfil, inicio = g.pop('perfil')
+        duracao = time.perf_counter() - inicio
+        if modo == 'cprofile':
+            perfil.disable()
+        else:
+            perfil = self.amostrador.parar(threading.get_ident())
+        return modo, origem, perfil, duracao
+
+    def finalizar(self, resposta):
+        if 'perfil' not in g:
+            return resposta
+        modo, origem, perfil, duracao = self._encerrar()
+        try:
+            resposta.headers['X-Perfil'] = self.gravar(modo, origem, perfil, duracao, resposta.status_code)
+        except OSError as e:
+            print(f"⚠️ Perfil não gravado: {e}")
+        return resposta
+
+    def descartar(self, exc=None):
+        # Requisição interrompida antes do after_request: só desliga o profiler
+        if 'perfil' in g:
+            self._encerrar()
+
+    # ============================================
+    # ARMAZENAMENTO
+    # ============================================
+
+    def gravar(self, modo, origem, perfil, duracao, status):
+        """Grava o perfil e os metadados; retorna o id"""
+        os.makedirs(self.diretorio, exist_ok=True)
+        # Ordenável pelo horário e único entre os workers
+        id_ = f'{datetime.now():%Y%m%d-%H%M%S-%f}-{os.getpid()}'
+        arquivo = id_ + EXTENSOES[modo]
+        caminho = os.path.join(self.diretorio, arquivo)
+        if modo == 'cprofile':
+            perfil.dump_stats(caminho)
+            amostras = None
+        else:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                for pilha, quantidade in perfil.most_common():
+                    f.write(f'{pilha} {quantidade}\n')
+            amostras = sum(perfil.values())
+
+        metadados = {
+            'id': id_,
+            'arquivo': arquivo,
+            'modo': modo,
+            'origem': origem,
+            'quando': datetime.now().isoformat(timespec='seconds'),
+            'metodo': request.method,
+            'endpoint': request.endpoint,
+            'caminho': request.path,
+            'status': status,
+            'duracao_ms': round(duracao * 1000, 1),
+            'amostras': amostras,
+        }
+        with open(os.path.join(self.diretorio, f'{id_}.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadados, f, ensure_ascii=False)
+        self._podar()
+        return id_
+
+    def _podar(self):
+        """Remove os perfis além dos ``maximo`` mais recentes"""
+        antigos = sorted(n for n in os.listdir(self.diretorio) if n.endswith('.json'))[:-self.maximo]
+        for nome in antigos:
+            id_ = nome[:-len('.json')]
+            for extensao in ('.json', *EXTENSOES.values()):
+                try:
+                    os.remove(os.path.join(self.diretorio, id_ + extensao))
+                except FileNotFoundError:
+                    pass
+
+    def listar(self):
+        """Metadados dos perfis gravados, do mais recente para o mais antigo"""
+        if not os.path.isdir(self.diretorio):
+            return []
+        perfis = []
+        for nome in sorted(os.listdir(self.diretorio), reverse=True):
+            if not nome.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.diretorio, nome), encoding='utf-8') as f:
+                    perfis.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return perfis
+
+    def carregar(self, id_):
+        """Metadados do perfil ``id_`` ou None"""
+        return next((p for p in self.listar() if p['id'] == id_), None)
+
+    def resumo(self, perfil, linhas=40):
+        """Texto com as funções mais caras do perfil"""
+        caminho = os.path.join(self.diretorio, perfil['arquivo'])
+        if perfil['modo'] == 'cprofile':
+            saida = io.StringIO()
+            pstats.Stats(caminho, stream=saida).strip_dirs().sort_stats('cumulative').print_stats(linhas)
+            return saida.getvalue()
+
+        # Pilhas: tempo próprio (função no topo da pilha) e tempo total por função
+        proprio, total = Counter(), Counter()
+        with open(caminho, encoding='utf-8') as f:
+            for linha in f:
+                pilha, _, quantidade = linha.rstrip('\n').rpartition(' ')
+                frames = pilha.split(';')
+                proprio[frames[-1]] += int(quantidade)
+                for nome in set(frames):
+                    total[nome] += int(quantidade)
+        amostras = perfil.get('amostras') or 1
+        partes = [f'{amostras} amostra(s)', '', 'Tempo próprio:']
+        partes += [f'{100 * q / amostras:6.1f}%  {nome}' for nome, q in proprio.most_common(linhas)]
+        partes += ['', 'Tempo total (incluindo chamadas):']
+        partes += [f'{100 * q / amostras:6.1f}%  {nome}' for nome, q in total.most_common(linhas)]
+        return '\n'.join(partes)
+
+
+def init_perfilador(app):
+    """Registra o perfilador (``app.extensions['perfilador']``)"""
+    if os.environ.get('PERFILADOR_ATIVO', '1') == '0':
+        return
+    try:
+        amostragem = min(max(float(os.environ.get('PERFILADOR_AMOSTRAGEM', '0')), 0.0), 1.0)
+        intervalo = max(int(os.environ.get('PERFILADOR_INTERVALO_MS', '5')), 1) / 1000
+        maximo = max(int(os.environ.get('PERFILADOR_MAX', '50')), 1)
+    except ValueError as e:
+        print(f"⚠️ Configuração do perfilador inválida, usando os padrões: {e}")
+        amostragem, intervalo, maximo = 0.0, 0.005, 50
+
+    diretorio = app.config.get('PERFILADOR_DIR') or os.path.join(app.instance_path, 'perfis')
+    perfilador = Perfilador(diretorio, amostragem, maximo, intervalo)
+    app.extensions['perfilador'] = perfilador
+    app.before_request(perfilador.iniciar)
+    app.after_request(perfilador.finalizar)
+    app.teardown_request(perfilador.descartar)
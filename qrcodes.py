@@ -0,0 +1,60 @@
+"""QR Codes gerados em memória
+
+O QR de um certificado depende só da URL de validação (código + ``SITE_URL``),
+então é gerado sob demanda pela rota ``certificado_qr`` e guardado em um LRU
+limitado. Nada é gravado em disco ou no banco: a mesma entrada produz sempre os
+mesmos bytes. Com ``SITE_URL`` configurado a resposta é cacheada como imutável
+por navegadores e proxies; sem ele a URL vem do Host da requisição e o cache é
+só privado.
+"""
+import hashlib
+import io
+import re
+from functools import lru_cache
+
+# Quantidade máxima de imagens mantidas em memória por processo
+QR_CACHE_TAMANHO = 256
+
+FORMATOS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+# Códigos aceitos pela rota (ex.: CERT-7B062C2604)
+_RE_CODIGO = re.compile(r'^[A-Z0-9-]{1,50}$')
+
+
+def codigo_valido(codigo):
+    return bool(codigo) and _RE_CODIGO.match(codigo) is not None
+
+
+@lru_cache(maxsize=QR_CACHE_TAMANHO)
+def renderizar_qr(conteudo, formato='png'):
+    """Bytes do QR Code (PNG ou SVG) para o texto informado"""
+    import qrcode
+    import qrcode.image.svg
+
+    if formato not in FORMATOS:
+        raise ValueError(f'Formato de QR Code não suportado: {formato}')
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_H,
+        box_size=10,
+        border=4,
+        image_factory=qrcode.image.svg.SvgPathFillImage if formato == 'svg' else None,
+    )
+    qr.add_data(conteudo)
+    qr.make(fit=True)
+    if formato == 'svg':
+        img = qr.make_image()
+    else:
+        img = qr.make_image(fill_color="black", back_color="white")
+
+    buffer = io.BytesIO()
+    img.save(buffer)
+    return buffer.getvalue()
+
+
+def etag_qr(conteudo, formato):
+    return hashlib.sha1(f'{formato}:{conteudo}'.encode('utf-8')).hexdigest()
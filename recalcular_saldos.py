@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+Script para recalcular o saldo financeiro (tabela saldo_associado) de todos os associados
+Use depois de importar dados ou de alterar mensalidades direto no banco
+
+Uso: python recalcular_saldos.py
+"""
+import sys
+import io
+
+# Configurar encoding para Windows
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from app import app
+from saldos import recalcular_todos
+
+if __name__ == '__main__':
+    with app.app_context():
+        print("Recalculando saldos dos associados...")
+        total, orfaos = recalcular_todos()
+        print(f"✅ {total} saldo(s) recalculado(s), {orfaos} saldo(s) órfão(s) removido(s).")
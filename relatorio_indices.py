@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Script para exibir o uso dos índices e os planos das consultas mais frequentes
+Mostra quais índices nunca foram usados e quais consultas ainda fazem varredura sequencial
+
+Uso: python relatorio_indices.py
+"""
+import sys
+import io
+
+# Configurar encoding para Windows
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from app import app
+from indices import relatorio
+
+if __name__ == '__main__':
+    with app.app_context():
+        dados = relatorio()
+
+    print(f"Banco: {dados['banco']}\n")
+
+    print("=== Consultas monitoradas ===")
+    for consulta in dados['consultas']:
+        if consulta['erro']:
+            marcador = '??'
+        else:
+            marcador = 'SEQ' if consulta['varredura_sequencial'] else 'ok '
+        print(f"[{marcador}] {consulta['consulta']}")
+        for passo in consulta['plano']:
+            print(f"        {passo}")
+        if consulta['erro']:
+            print(f"        erro: {consulta['erro']}")
+
+    if dados['tabelas']:
+        print("\n=== Varreduras por tabela ===")
+        for t in dados['tabelas']:
+            print(f"{t['tabela']:<30} linhas={t['linhas']:<8} seq_scan={t['seq_scan']:<8} "
+                  f"seq_tup_read={t['seq_tup_read']:<10} idx_scan={t['idx_scan']}")
+
+    print("\n=== Índices ===")
+    for i in dados['indices']:
+        varreduras = '-' if i['varreduras'] is None else i['varreduras']
+        aviso = '  <- sem uso' if i['varreduras'] == 0 and not i['primario'] else ''
+        print(f"{i['tabela']:<30} {i['indice']:<50} varreduras={varreduras}{aviso}")
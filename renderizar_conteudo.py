@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Script para gerar o HTML renderizado dos relatórios de atividades e prestações de contas
+Use uma vez depois do deploy (o startup também renderiza os registros pendentes)
+
+Uso: python renderizar_conteudo.py [--todos]
+  --todos  re-renderiza todos os registros, não só os que ainda não têm HTML
+"""
+import sys
+import io
+
+# Configurar encoding para Windows
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from app import app
+from conteudo import renderizar_pendentes
+
+if __name__ == '__main__':
+    todos = '--todos' in sys.argv[1:]
+    with app.app_context():
+        print("Renderizando textos de transparência...")
+        total = renderizar_pendentes(todos=todos)
+        print(f"✅ {total} registro(s) renderizado(s).")
@@ -0,0 +1,436 @@
+"""Restauração rápida do banco a partir dos backups ou dos exports SQL
+
+Os exports (``admin_export_database``, ``export_database.py``) trazem um
+``INSERT`` por linha: reexecutá-los no PostgreSQL gratuito custa uma ida e volta
+por registro, e a restauração costuma estourar o tempo limite. Aqui as linhas,
+de um backup de backups.py ou de um desses arquivos .sql (interpretado em
+Python, sem executar o SQL), são carregadas em massa:
+
+- PostgreSQL: ``COPY ... FROM STDIN`` (psycopg 3), um único fluxo por tabela;
+- SQLite (e PostgreSQL com outro driver): ``executemany`` em lotes;
+- tabelas que não dependem umas das outras são carregadas em paralelo, uma
+  conexão por tabela, nível a nível da ordem das chaves estrangeiras;
+- os índices que não sustentam restrições (chave primária, UNIQUE) são
+  removidos antes da carga e recriados depois, na mesma transação da tabela;
+- ao final, as sequências dos ids passam a continuar do maior id carregado,
+  as tabelas são analisadas (``ANALYZE``) e ``saldo_associado``, mantido por
+  listeners do ORM que a carga em massa não dispara, é recalculado se não
+  vier na origem.
+
+O esquema de destino é o dos modelos (``db.create_all``): o ``CREATE TABLE``
+dos exports é ignorado e só as colunas existentes nos dois lados são
+carregadas. Cada tabela é carregada na sua própria transação: uma falha
+interrompe a restauração depois do nível em andamento e deixa o destino
+parcialmente restaurado. Por isso, antes de esvaziar tabelas com dados
+(``substituir``), o estado atual é gravado em um backup (``fazer_backup``), e a
+mensagem de erro indica o número dele para voltar ao estado anterior.
+"""
+import ast
+import base64
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, time as dtime
+from decimal import Decimal
+
+from sqlalchemy import func, insert, select, text
+
+from backups import Blobs, diretorio_backups, fazer_backup, ler_manifesto, numeros_manifestos, tabelas_do_banco
+from extensions import db
+
+
+# Tabelas recalculadas a partir das restauradas (podem ser esvaziadas junto com elas)
+DERIVADAS = {'saldo_associado'}
+
+
+class ErroRestauracao(Exception):
+    pass
+
+
+# ============================================
+# ORIGENS
+# ============================================
+
+def linhas_do_backup(numero=None):
+    """({tabela: (colunas, linhas)}, blobs) com o estado do banco no backup ``numero`` (padrão: o último)
+
+    Parte do último backup completo anterior (conferindo o hash de cada elo da
+    cadeia) e aplica os incrementais até ``numero``; as linhas ausentes do
+    conjunto de chaves do backup escolhido foram excluídas e ficam de fora.
+    """
+    diretorio = diretorio_backups()
+    numeros = numeros_manifestos(diretorio)
+    if not numeros:
+        raise ErroRestauracao(f'Nenhum backup em {diretorio}')
+    numero = numero or numeros[-1]
+    if numero not in numeros:
+        raise ErroRestauracao(f'Backup nº {numero} não encontrado em {diretorio}')
+
+    cadeia = [ler_manifesto(diretorio, numero)[0]]
+    while cadeia[0]['tipo'] != 'completo':
+        elo = cadeia[0]['anterior']
+        if not elo:
+            raise ErroRestauracao(f"Backup nº {cadeia[0]['numero']} é incremental e não tem backup anterior")
+        try:
+            manifesto, sha256 = ler_manifesto(diretorio, elo['numero'])
+        except (OSError, ValueError) as e:
+            raise ErroRestauracao(f"Backup nº {elo['numero']} ilegível: {e}")
+        if sha256 != elo['sha256']:
+            raise ErroRestauracao(f"Backup nº {elo['numero']} não corresponde ao registrado no nº {cadeia[0]['numero']}")
+        cadeia.insert(0, manifesto)
+
+    blobs = Blobs(diretorio)
+    tabelas = {}
+    for nome, final in cadeia[-1]['tabelas'].items():
+        inicio = max(i for i, m in enumerate(cadeia) if m['tabelas'].get(nome, {}).get('completa'))
+        indices_chave = [final['colunas'].index(c) for c in final['chave']]
+        linhas = {}
+        for manifesto in cadeia[inicio:]:
+            entrada = manifesto['tabelas'].get(nome)
+            if entrada and entrada['dados']:
+                for linha in blobs.ler_json(entrada['dados']):
+                    # Mesmo formato das chaves gravadas por backups.py
+                    linhas[json.dumps([linha[i] for i in indices_chave], separators=(',', ':'))] = linha
+        presentes = set(blobs.ler_json(final['chaves']))
+        tabelas[nome] = (final['colunas'], [linha for chave, linha in linhas.items() if chave in presentes])
+    return tabelas, blobs
+
+
+_INSERT = re.compile(r'INSERT INTO\s+"?(\w+)"?\s*\(([^)]*)\)\s*VALUES\s*\((.*)\);\s*$', re.S)
+# Texto entre aspas (com '' escapado) ou um literal sem aspas (NULL, número, TRUE...)
+_VALOR = re.compile(r"'([^']*(?:''[^']*)*)'|([^,\s]+)")
+
+
+def _texto_sql(texto):
+    texto = texto.replace("''", "'")
+    # Binários do admin_export_database saem como repr Python (b'...'), sem barras dobradas
+    if texto.startswith(("b'", 'b"')):
+        return texto
+    return texto.replace('\\\\', '\\')
+
+
+def linhas_do_sql(caminho):
+    """{tabela: (colunas, linhas)} dos ``INSERT`` de um export .sql
+
+    Os valores ficam como texto (None para NULL) e são convertidos pelo tipo
+    da coluna na carga. Os exportadores dobram as barras invertidas dos textos;
+    aqui elas voltam a ser simples.
+    """
+    tabelas = {}
+    pendente, aspas = [], 0
+    with open(caminho, encoding='utf-8') as f:
+        for linha in f:
+            if not pendente and not linha.startswith('INSERT INTO'):
+                continue
+            pendente.append(linha)
+            aspas += linha.count("'")
+            # O comando termina numa linha com ");" fora de um texto (aspas balanceadas)
+            if aspas % 2 or not linha.rstrip().endswith(');'):
+                continue
+            comando = ''.join(pendente)
+            pendente, aspas = [], 0
+
+            m = _INSERT.match(comando)
+            if not m:
+                raise ErroRestauracao(f'Comando não reconhecido em {caminho}: {comando[:80]}')
+            nome, colunas = m.group(1), [c.strip().strip('"') for c in m.group(2).split(',')]
+            valores = [
+                _texto_sql(v.group(1)) if v.group(2) is None else (None if v.group(2).upper() == 'NULL' else v.group(2))
+                for v in _VALOR.finditer(m.group(3))
+            ]
+            if len(valores) != len(colunas):
+                raise ErroRestauracao(f'{nome}: {len(valores)} valor(es) para {len(colunas)} coluna(s)')
+            tabela = tabelas.setdefault(nome, (colunas, []))
+            if tabela[0] != colunas:
+                raise ErroRestauracao(f'{nome}: colunas diferentes entre os INSERT')
+            tabela[1].append(valores)
+    if pendente:
+        raise ErroRestauracao(f'{caminho} termina no meio de um comando INSERT')
+    return tabelas
+
+
+# ============================================
+# CONVERSÃO
+# ============================================
+
+def _bytes_do_texto(valor):
+    if valor.startswith('\\x'):
+        return bytes.fromhex(valor[2:])
+    if valor.startswith(("b'", 'b"')):
+        return ast.literal_eval(valor)
+    return valor.encode('utf-8')
+
+
+def _de_texto(tipo):
+    """Converte o valor lido (texto do export ou JSON do backup) para o tipo Python da coluna"""
+    if tipo is bool:
+        return lambda v: str(v).strip().lower() in ('t', 'true', '1', 'y', 'yes', 'on')
+    if tipo is datetime:
+        return lambda v: datetime.fromisoformat(v)
+    if tipo is date:
+        return lambda v: date.fromisoformat(v[:10])
+    if tipo is dtime:
+        return lambda v: dtime.fromisoformat(v)
+    if tipo is bytes:
+        return _bytes_do_texto
+    if tipo in (int, float, Decimal):
+        return tipo
+    return lambda v: v
+
+
+def _conversor(tabela, colunas, blobs):
+    funcoes = []
+    for nome in colunas:
+        try:
+            tipo = tabela.c[nome].type.python_type
+        except NotImplementedError:
+            tipo = object
+        funcoes.append((tipo, _de_texto(tipo)))
+
+    def valor(tipo, converter, v):
+        if isinstance(v, dict):
+            if '$blob' in v:
+                dados = blobs.ler(v['$blob'])
+                v = dados.decode('utf-8') if v.get('tipo') == 'str' else dados
+            elif '$bytes' in v:
+                v = base64.b64decode(v['$bytes'])
+        if v is None or type(v) is tipo:
+            return v
+        return converter(v)
+
+    return lambda linha: tuple(valor(tipo, converter, v) for (tipo, converter), v in zip(funcoes, linha))
+
+
+# ============================================
+# CARGA
+# ============================================
+
+def _indices_removiveis(conn, tabela):
+    """[(nome, DDL)] dos índices da tabela que não sustentam restrições"""
+    if conn.dialect.name == 'postgresql':
+        return conn.execute(text(
+            "SELECT i.relname, pg_get_indexdef(x.indexrelid) FROM pg_index x "
+            "JOIN pg_class i ON i.oid = x.indexrelid "
+            "WHERE x.indrelid = to_regclass(quote_ident(:tabela)) "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)"
+        ), {'tabela': tabela}).all()
+    if conn.dialect.name == 'sqlite':
+        # Os índices automáticos (PRIMARY KEY/UNIQUE) não têm SQL
+        return conn.execute(text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :tabela AND sql IS NOT NULL"
+        ), {'tabela': tabela}).all()
+    return []
+
+
+def _copiar(conn, tabela, colunas, linhas):
+    """COPY FROM STDIN pelo psycopg 3; retorna False se o driver não suportar"""
+    preparador = conn.dialect.identifier_preparer
+    comando = (f"COPY {preparador.format_table(tabela)} "
+               f"({', '.join(preparador.quote(c) for c in colunas)}) FROM STDIN")
+    with conn.connection.driver_connection.cursor() as cursor:
+        if not hasattr(cursor, 'copy'):
+            return False
+        with cursor.copy(comando) as copia:
+            for linha in linhas:
+                copia.write_row(linha)
+    return True
+
+
+def _carregar_tabela(engine, tabela, colunas, linhas, converter, lote):
+    """Carrega as linhas numa transação própria; retorna (tabela, linhas, segundos)"""
+    inicio = time.perf_counter()
+    preparador = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        indices = _indices_removiveis(conn, tabela.name)
+        for nome, _ in indices:
+            conn.execute(text(f'DROP INDEX {preparador.quote(nome)}'))
+
+        convertidas = map(converter, linhas)
+        if not (conn.dialect.name == 'postgresql' and _copiar(conn, tabela, colunas, convertidas)):
+            chaves = [tabela.c[c].key for c in colunas]
+            while True:
+                parte = [dict(zip(chaves, linha)) for _, linha in zip(range(lote), convertidas)]
+                if not parte:
+                    break
+                conn.execute(insert(tabela), parte)
+
+        for _, ddl in indices:
+            conn.execute(text(ddl))
+    return tabela.name, len(linhas), time.perf_counter() - inicio
+
+
+def _niveis(tabelas):
+    """Tabelas agrupadas por profundidade na ordem das chaves estrangeiras"""
+    nomes = {t.name for t in tabelas}
+    nivel = {}
+    for tabela in tabelas:
+        dependencias = {fk.column.table.name for fk in tabela.foreign_keys} & nomes - {tabela.name}
+        nivel[tabela.name] = 1 + max((nivel.get(d, -1) for d in dependencias), default=-1)
+    grupos = {}
+    for tabela in tabelas:
+        grupos.setdefault(nivel[tabela.name], []).append(tabela)
+    return [grupos[n] for n in sorted(grupos)]
+
+
+def _ajustar_sequencias(conn, tabelas):
+    preparador = conn.dialect.identifier_preparer
+    for tabela in tabelas:
+        chave = list(tabela.primary_key.columns)
+        if len(chave) != 1 or chave[0].type.python_type is not int:
+            continue
+        sequencia = conn.execute(
+            text('SELECT pg_get_serial_sequence(:tabela, :coluna)'), {'tabela': tabela.name, 'coluna': chave[0].name}
+        ).scalar()
+        if sequencia:
+            conn.execute(text(
+                f'SELECT setval(:sequencia, COALESCE((SELECT MAX({preparador.quote(chave[0].name)}) '
+                f'FROM {preparador.format_table(tabela)}), 0) + 1, false)'
+            ), {'sequencia': sequencia})
+
+
+def _dependentes(tabelas, existentes):
+    """Tabelas existentes fora de ``tabelas`` que as referenciam, direta ou indiretamente"""
+    nomes = {tabela.name for tabela in tabelas}
+    dependentes = []
+    for tabela in db.metadata.sorted_tables:
+        if tabela.name in nomes or tabela.name not in existentes:
+            continue
+        if any(fk.column.table.name in nomes for fk in tabela.foreign_keys):
+            dependentes.append(tabela)
+            nomes.add(tabela.name)
+    return dependentes
+
+
+def _carregar(engine, plano, blobs, paralelo, lote, progresso):
+    """Carrega as tabelas do plano, em paralelo por nível de chaves estrangeiras"""
+    por_nome = {tabela.name: (tabela, colunas, linhas) for tabela, colunas, linhas in plano}
+    with ThreadPoolExecutor(max_workers=paralelo) as executor:
+        for nivel in _niveis([tabela for tabela, _, _ in plano]):
+            tarefas = []
+            for tabela in nivel:
+                _, colunas, linhas = por_nome[tabela.name]
+                if linhas:
+                    tarefas.append(executor.submit(
+                        _carregar_tabela, engine, tabela, colunas, linhas, _conversor(tabela, colunas, blobs), lote,
+                    ))
+            falhas = []
+            for tarefa in as_completed(tarefas):
+                try:
+                    nome, linhas, segundos = tarefa.result()
+                except Exception as e:
+                    falhas.append(str(e).split('\n')[0] or repr(e))
+                    continue
+                if progresso:
+                    progresso(nome, linhas, segundos)
+            if falhas:
+                raise ErroRestauracao(f"Falha na carga: {'; '.join(falhas)}")
+
+
+def restaurar(origem, blobs=None, substituir=False, paralelo=4, lote=1000, simular=False, progresso=None):
+    """Carrega ``origem`` ({tabela: (colunas, linhas)}) no banco; retorna o resumo
+
+    Sem ``substituir``, as tabelas de destino precisam estar vazias; com ele,
+    o banco atual é copiado para um backup e as tabelas são esvaziadas antes da
+    carga, junto com as tabelas fora da origem que as
+    referenciam. Estas precisam estar vazias (a restauração é recusada, em vez
+    de apagá-las em cascata), exceto as ``DERIVADAS``. Como a carga em massa
+    não passa pelos listeners do ORM, ``saldo_associado`` é recalculado quando
+    não vem na origem. ``progresso(tabela, linhas, segundos)`` é chamado a cada
+    tabela carregada.
+    """
+    inicio = time.perf_counter()
+    engine = db.engine
+    if not simular:
+        db.create_all()
+
+    with engine.connect() as conn:
+        existentes = {tabela.name: colunas for tabela, colunas in tabelas_do_banco(conn)}
+        plano = []
+        for tabela in db.metadata.sorted_tables:
+            if tabela.name not in origem:
+                continue
+            # Na simulação, as tabelas que ainda não existem seriam criadas com todas as colunas
+            colunas_destino = existentes.get(tabela.name, [c.name for c in tabela.columns])
+            colunas, linhas = origem[tabela.name]
+            usadas = [c for c in colunas if c in colunas_destino]
+            indices = [colunas.index(c) for c in usadas]
+            plano.append((tabela, usadas, [[linha[i] for i in indices] for linha in linhas]))
+        ocupadas = [
+            tabela.name for tabela, _, _ in plano
+            if tabela.name in existentes and conn.execute(select(func.count()).select_from(tabela)).scalar()
+        ]
+        dependentes = _dependentes([tabela for tabela, _, _ in plano], existentes)
+        bloqueantes = [
+            tabela.name for tabela in dependentes
+            if tabela.name not in DERIVADAS and conn.execute(select(func.count()).select_from(tabela)).scalar()
+        ]
+
+    resumo = {
+        'tabelas': len(plano),
+        'linhas': sum(len(linhas) for _, _, linhas in plano),
+        'ignoradas': sorted(set(origem) - {tabela.name for tabela, _, _ in plano}),
+        'ocupadas': ocupadas,
+        'bloqueantes': bloqueantes,
+        'saldos': None,
+        'backup': None,
+        'por_tabela': {tabela.name: len(linhas) for tabela, _, linhas in plano},
+        'segundos': 0.0,
+    }
+    if simular:
+        return resumo
+    if ocupadas and not substituir:
+        raise ErroRestauracao(f"Tabelas de destino com dados: {', '.join(ocupadas)} (use --substituir para esvaziá-las)")
+    if ocupadas and bloqueantes:
+        raise ErroRestauracao(
+            f"Tabelas fora da origem referenciam as restauradas e seriam esvaziadas: {', '.join(bloqueantes)} "
+            "(esvazie-as antes ou use uma origem que as inclua)"
+        )
+
+    tabelas = [tabela for tabela, _, _ in plano]
+    if ocupadas:
+        # Cópia do estado atual antes de apagar qualquer coisa: se a carga falhar
+        # no meio, é dela que o destino volta
+        resumo['backup'] = fazer_backup()['numero']
+    with engine.begin() as conn:
+        if ocupadas:
+            # Lista explícita, sem CASCADE: nada além do planejado (e das derivadas) é apagado
+            esvaziar = tabelas + dependentes
+            if conn.dialect.name == 'postgresql':
+                preparador = engine.dialect.identifier_preparer
+                conn.execute(text(f"TRUNCATE {', '.join(preparador.format_table(t) for t in esvaziar)} RESTART IDENTITY"))
+            else:
+                for tabela in reversed(esvaziar):
+                    conn.execute(tabela.delete())
+
+    # SQLite aceita um único escritor por vez: carga sequencial
+    paralelo = paralelo if engine.dialect.name == 'postgresql' else 1
+    try:
+        _carregar(engine, plano, blobs, paralelo, lote, progresso)
+        with engine.begin() as conn:
+            if conn.dialect.name == 'postgresql':
+                _ajustar_sequencias(conn, tabelas)
+                for tabela in tabelas:
+                    conn.execute(text(f'ANALYZE {engine.dialect.identifier_preparer.format_table(tabela)}'))
+            elif conn.dialect.name == 'sqlite':
+                conn.execute(text('ANALYZE'))
+    except Exception as e:
+        causa = str(e).split('\n')[0] or repr(e)
+        if resumo['backup'] is not None:
+            volta = (f"o estado anterior está no backup nº {resumo['backup']} "
+                     f"(flask --app app manutencao restaurar --backup {resumo['backup']} --substituir)")
+        else:
+            volta = "as tabelas estavam vazias; corrija a origem e rode de novo com --substituir"
+        raise ErroRestauracao(
+            f"Restauração interrompida, destino PARCIALMENTE restaurado: {causa}. "
+            f"Não use o banco assim; {volta}."
+        ) from e
+
+    if 'saldo_associado' not in origem:
+        # COPY/executemany não disparam o after_flush que mantém os saldos
+        from saldos import recalcular_todos
+
+        resumo['saldos'], _ = recalcular_todos()
+
+    resumo['segundos'] = time.perf_counter() - inicio
+    return resumo
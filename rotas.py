@@ -0,0 +1,36 @@
+"""Registro adiado das páginas definidas em app.py
+
+As rotas, filtros de template e context processors de app.py são declarados no
+módulo com ``@rotas.route``, ``@rotas.template_filter`` e
+``@rotas.context_processor`` (mesma assinatura dos decoradores do Flask) e só
+são aplicados a uma aplicação quando ``app.create_app`` chama
+``rotas.registrar(app)``. Diferente de um blueprint, os endpoints mantêm o
+nome da função (``url_for('index')``), sem prefixo.
+"""
+
+
+class Rotas:
+    def __init__(self):
+        self._registros = []
+
+    def route(self, rule, **options):
+        def decorador(f):
+            endpoint = options.pop('endpoint', None) or f.__name__
+            self._registros.append(lambda app: app.add_url_rule(rule, endpoint, f, **options))
+            return f
+        return decorador
+
+    def template_filter(self, name=None):
+        def decorador(f):
+            self._registros.append(lambda app: app.add_template_filter(f, name))
+            return f
+        return decorador
+
+    def context_processor(self, f):
+        self._registros.append(lambda app: app.context_processor(f))
+        return f
+
+    def registrar(self, app):
+        """Aplica à ``app`` tudo o que foi declarado, na ordem de declaração"""
+        for registro in self._registros:
+            registro(app)
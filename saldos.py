@@ -0,0 +1,214 @@
+"""Saldo financeiro materializado por associado (tabela ``saldo_associado``)
+
+O saldo de um associado é recalculado na mesma transação em que suas
+mensalidades mudam: o listener ``after_flush`` recolhe os associados afetados
+por inserções, alterações e exclusões de ``Mensalidade`` feitas pelo ORM e
+recalcula apenas esses. Alterações feitas com SQL direto (UPDATE/DELETE em
+massa) devem chamar ``recalcular_saldos`` antes do commit.
+
+Os campos de atraso dependem do dia: ``atualizar_atrasos`` recalcula só os
+saldos cujo ``proximo_vencimento`` já passou desde o último cálculo.
+"""
+from datetime import date, datetime
+
+from sqlalchemy import and_, case, delete, event, func, inspect, select
+
+from database import RoutingSession
+from extensions import db
+from models import Associado, Mensalidade, SaldoAssociado
+
+# Tamanho dos lotes de ids em cláusulas IN
+LOTE_IDS = 500
+
+# Colunas de Mensalidade que afetam o saldo
+_CAMPOS_SALDO = ('associado_id', 'status', 'valor_final', 'data_vencimento', 'data_pagamento')
+
+
+def _lotes(ids, tamanho=LOTE_IDS):
+    ids = sorted(ids)
+    for i in range(0, len(ids), tamanho):
+        yield ids[i:i + tamanho]
+
+
+def _consulta_agregados(ids, hoje):
+    pendente = Mensalidade.status == 'pendente'
+    paga = Mensalidade.status == 'paga'
+    atrasada = and_(pendente, Mensalidade.data_vencimento < hoje)
+    return (
+        select(
+            Mensalidade.associado_id,
+            func.sum(case((pendente, 1), else_=0)).label('mensalidades_pendentes'),
+            func.sum(case((atrasada, 1), else_=0)).label('mensalidades_atrasadas'),
+            func.sum(case((paga, 1), else_=0)).label('mensalidades_pagas'),
+            func.sum(case((pendente, Mensalidade.valor_final), else_=0)).label('total_pendente'),
+            func.sum(case((atrasada, Mensalidade.valor_final), else_=0)).label('total_atrasado'),
+            func.sum(case((paga, Mensalidade.valor_final), else_=0)).label('total_pago'),
+            func.max(case((paga, Mensalidade.data_pagamento))).label('ultimo_pagamento'),
+            func.min(case((and_(pendente, Mensalidade.data_vencimento >= hoje),
+                           Mensalidade.data_vencimento))).label('proximo_vencimento'),
+        )
+        .where(Mensalidade.associado_id.in_(ids))
+        .group_by(Mensalidade.associado_id)
+    )
+
+
+def _insert_upsert(conn):
+    if conn.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(SaldoAssociado.__table__)
+
+
+def recalcular_saldos(conn, associado_ids, hoje=None):
+    """Recalcula o saldo dos associados informados usando a conexão dada
+
+    Associados inexistentes têm o saldo removido. Retorna quantos saldos foram gravados.
+    """
+    hoje = hoje or date.today()
+    agora = datetime.now()
+    gravados = 0
+    for lote in _lotes({int(i) for i in associado_ids if i is not None}):
+        existentes = set(conn.execute(select(Associado.id).where(Associado.id.in_(lote))).scalars())
+        removidos = [i for i in lote if i not in existentes]
+        if removidos:
+            conn.execute(delete(SaldoAssociado.__table__).where(SaldoAssociado.associado_id.in_(removidos)))
+        if not existentes:
+            continue
+
+        agregados = {row.associado_id: row for row in conn.execute(_consulta_agregados(list(existentes), hoje))}
+        linhas = []
+        for associado_id in existentes:
+            row = agregados.get(associado_id)
+            linhas.append({
+                'associado_id': associado_id,
+                'mensalidades_pendentes': int(row.mensalidades_pendentes or 0) if row else 0,
+                'mensalidades_atrasadas': int(row.mensalidades_atrasadas or 0) if row else 0,
+                'mensalidades_pagas': int(row.mensalidades_pagas or 0) if row else 0,
+                'total_pendente': (row.total_pendente or 0) if row else 0,
+                'total_atrasado': (row.total_atrasado or 0) if row else 0,
+                'total_pago': (row.total_pago or 0) if row else 0,
+                'ultimo_pagamento': row.ultimo_pagamento if row else None,
+                'proximo_vencimento': row.proximo_vencimento if row else None,
+                'atrasos_em': hoje,
+                'updated_at': agora,
+            })
+
+        stmt = _insert_upsert(conn)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['associado_id'],
+            set_={c: stmt.excluded[c] for c in linhas[0] if c != 'associado_id'},
+        )
+        conn.execute(stmt, linhas)
+        gravados += len(linhas)
+    return gravados
+
+
+def recalcular_todos(hoje=None, commit=True):
+    """Recalcula o saldo de todos os associados e remove saldos órfãos"""
+    ids = list(db.session.execute(select(Associado.id)).scalars())
+    conn = db.session.connection()
+    total = recalcular_saldos(conn, ids, hoje)
+    orfaos = conn.execute(
+        delete(SaldoAssociado.__table__).where(~SaldoAssociado.associado_id.in_(select(Associado.id)))
+    ).rowcount
+    if commit:
+        db.session.commit()
+    return total, orfaos
+
+
+def atualizar_atrasos(hoje=None):
+    """Recalcula os saldos em que alguma mensalidade passou a estar atrasada desde o último cálculo"""
+    hoje = hoje or date.today()
+    vencidos = list(db.session.execute(
+        select(SaldoAssociado.associado_id).where(
+            SaldoAssociado.atrasos_em < hoje,
+            SaldoAssociado.proximo_vencimento < hoje,
+        )
+    ).scalars())
+    if vencidos:
+        recalcular_saldos(db.session.connection(), vencidos, hoje)
+        db.session.commit()
+    return len(vencidos)
+
+
+def resumo_geral():
+    """Totais de todos os saldos em uma única consulta"""
+    row = db.session.execute(select(
+        func.coalesce(func.sum(SaldoAssociado.mensalidades_pendentes), 0),
+        func.coalesce(func.sum(SaldoAssociado.mensalidades_pagas), 0),
+        func.coalesce(func.sum(SaldoAssociado.total_pendente), 0),
+        func.coalesce(func.sum(SaldoAssociado.total_pago), 0),
+        func.coalesce(func.sum(SaldoAssociado.mensalidades_atrasadas), 0),
+        func.coalesce(func.sum(SaldoAssociado.total_atrasado), 0),
+    )).one()
+    return {
+        'mensalidades_pendentes': int(row[0]),
+        'mensalidades_pagas': int(row[1]),
+        'total_pendente': float(row[2]),
+        'total_pago': float(row[3]),
+        'mensalidades_atrasadas': int(row[4]),
+        'total_atrasadas': float(row[5]),
+    }
+
+
+def resumo_associado(associado_id):
+    """Saldo de um associado no mesmo formato de ``resumo_geral``"""
+    saldo = db.session.get(SaldoAssociado, associado_id, populate_existing=True)
+    if saldo is None:
+        return {
+            'mensalidades_pendentes': 0, 'mensalidades_pagas': 0,
+            'total_pendente': 0.0, 'total_pago': 0.0,
+            'mensalidades_atrasadas': 0, 'total_atrasadas': 0.0,
+        }
+    return {
+        'mensalidades_pendentes': saldo.mensalidades_pendentes,
+        'mensalidades_pagas': saldo.mensalidades_pagas,
+        'total_pendente': float(saldo.total_pendente),
+        'total_pago': float(saldo.total_pago),
+        'mensalidades_atrasadas': saldo.mensalidades_atrasadas,
+        'total_atrasadas': float(saldo.total_atrasado),
+    }
+
+
+def associados_atrasados():
+    """Associados com ao menos uma mensalidade atrasada (índice em mensalidades_atrasadas)"""
+    return (
+        Associado.query.join(SaldoAssociado, SaldoAssociado.associado_id == Associado.id)
+        .filter(SaldoAssociado.mensalidades_atrasadas > 0)
+        .order_by(Associado.nome_completo.asc())
+        .all()
+    )
+
+
+# ============================================
+# MANUTENÇÃO AUTOMÁTICA (ORM)
+# ============================================
+
+def _associados_afetados(session):
+    ids = set()
+    for obj in session.new:
+        if isinstance(obj, Mensalidade):
+            ids.add(obj.associado_id)
+    for obj in session.deleted:
+        if isinstance(obj, Mensalidade):
+            ids.add(obj.associado_id)
+            ids.update(inspect(obj).attrs.associado_id.history.deleted)
+        elif isinstance(obj, Associado):
+            ids.add(obj.id)
+    for obj in session.dirty:
+        if not isinstance(obj, Mensalidade):
+            continue
+        estado = inspect(obj)
+        if any(estado.attrs[campo].history.has_changes() for campo in _CAMPOS_SALDO):
+            ids.add(obj.associado_id)
+            ids.update(estado.attrs.associado_id.history.deleted)
+    ids.discard(None)
+    return ids
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _atualizar_saldos_apos_flush(session, flush_context):
+    ids = _associados_afetados(session)
+    if ids:
+        recalcular_saldos(session.connection(), ids)
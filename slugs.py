@@ -0,0 +1,154 @@
+"""Slugs para URLs amigáveis
+
+- ``gerar_slug_unico``: aloca o próximo slug livre com uma única consulta
+- ``buscar_por_slug``: resolve slug -> id por um mapa em memória (por processo),
+  invalidado quando o slug de um item muda ou o item é excluído
+- ``redirecionar_para_slug``: 301 das URLs numéricas antigas para a URL canônica
+"""
+import re
+import threading
+import unicodedata
+
+from flask import abort, redirect, request, url_for
+from sqlalchemy import event, inspect, or_, select
+
+from extensions import db
+from models import Acao, Evento, Informativo, Projeto, ReunionPresencial, ReunionVirtual
+
+# Modelos com coluna slug única
+MODELOS_COM_SLUG = (Projeto, Acao, Evento, Informativo, ReunionPresencial, ReunionVirtual)
+
+
+def gerar_slug(titulo):
+    """Gera um slug amigável a partir do título"""
+    # Converter para minúsculas
+    slug = titulo.lower()
+    # Remover acentos
+    slug = unicodedata.normalize('NFKD', slug).encode('ascii', 'ignore').decode('ascii')
+    # Substituir espaços e caracteres especiais por hífen
+    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = re.sub(r'[-\s]+', '-', slug)
+    # Remover hífens no início e fim
+    slug = slug.strip('-')
+    # Limitar tamanho
+    if len(slug) > 200:
+        slug = slug[:200].rstrip('-')
+    return slug
+
+def gerar_slug_unico(titulo, model_class, item_id=None):
+    """Gera um slug único para qualquer modelo, adicionando número se necessário
+
+    Busca de uma vez o slug base e todos os ``base-N`` existentes e escolhe o
+    menor sufixo livre. O índice único da coluna garante a unicidade se duas
+    requisições escolherem o mesmo slug ao mesmo tempo.
+    """
+    base_slug = gerar_slug(titulo) or 'item'
+
+    # Escapar curingas do LIKE ('_' é válido em slugs)
+    prefixo = base_slug.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    query = select(model_class.slug).where(or_(
+        model_class.slug == base_slug,
+        model_class.slug.like(prefixo + '-%', escape='\\'),
+    ))
+    if item_id:
+        query = query.where(model_class.id != item_id)
+    existentes = set(db.session.execute(query).scalars())
+
+    # Slug só com dígitos colidiria com as rotas /<int:id>
+    if base_slug not in existentes and not base_slug.isdigit():
+        return base_slug
+
+    sufixos = set()
+    for existente in existentes:
+        sufixo = existente[len(base_slug) + 1:]
+        if existente != base_slug and sufixo.isdigit():
+            sufixos.add(int(sufixo))
+    contador = 1
+    while contador in sufixos:
+        contador += 1
+    return f"{base_slug}-{contador}"
+
+
+# ============================================
+# MAPA SLUG -> ID (POR PROCESSO)
+# ============================================
+
+# Limite de entradas por modelo; ao ultrapassar, o mapa do modelo é esvaziado
+MAX_SLUGS_POR_MODELO = 5000
+
+_slug_ids = {}
+_slug_ids_lock = threading.Lock()
+
+
+def _mapa(model_class):
+    return _slug_ids.setdefault(model_class.__tablename__, {})
+
+
+def invalidar_slug(model_class, *slugs):
+    with _slug_ids_lock:
+        mapa = _mapa(model_class)
+        for slug in slugs:
+            mapa.pop(slug, None)
+
+
+def _lembrar_slug(model_class, slug, item_id):
+    with _slug_ids_lock:
+        mapa = _mapa(model_class)
+        if len(mapa) >= MAX_SLUGS_POR_MODELO:
+            mapa.clear()
+        mapa[slug] = item_id
+
+
+def buscar_por_slug(model_class, slug):
+    """Retorna o item com o slug (ou None), resolvendo o id pelo mapa em memória"""
+    with _slug_ids_lock:
+        item_id = _mapa(model_class).get(slug)
+
+    if item_id is not None:
+        item = db.session.get(model_class, item_id)
+        if item is not None and item.slug == slug:
+            return item
+        # Entrada desatualizada (item renomeado/excluído por outro worker)
+        invalidar_slug(model_class, slug)
+
+    item = model_class.query.filter_by(slug=slug).first()
+    if item is not None:
+        _lembrar_slug(model_class, slug, item.id)
+    return item
+
+
+def buscar_por_slug_ou_404(model_class, slug):
+    item = buscar_por_slug(model_class, slug)
+    if item is None:
+        abort(404)
+    return item
+
+
+def redirecionar_para_slug(item):
+    """Resposta 301 da URL numérica para a URL com slug do item (ou None se não houver slug)
+
+    Usa o endpoint da requisição atual, que deve aceitar o parâmetro ``slug``.
+    """
+    slug = getattr(item, 'slug', None)
+    if not slug or slug.isdigit():
+        return None
+    # Um "slug" na query string colidiria com o parâmetro da rota
+    args = request.args.to_dict()
+    args.pop('slug', None)
+    return redirect(url_for(request.endpoint, slug=slug, **args), code=301)
+
+
+def _slug_alterado(mapper, connection, target):
+    historico = inspect(target).attrs.slug.history
+    if historico.deleted:
+        invalidar_slug(type(target), *[s for s in historico.deleted if s])
+
+
+def _item_excluido(mapper, connection, target):
+    if target.slug:
+        invalidar_slug(type(target), target.slug)
+
+
+for _model in MODELOS_COM_SLUG:
+    event.listen(_model, 'after_update', _slug_alterado)
+    event.listen(_model, 'after_delete', _item_excluido)
@@ -0,0 +1,431 @@
+"""Snapshot estático do site público, servido quando o banco está fora do ar
+
+``gerar_snapshot`` renderiza as páginas públicas com o test client do Flask, em
+todos os idiomas, e guarda cada resposta em ``<SNAPSHOT_DIR>/conteudo/<sha256>``
+(conteúdo idêntico é gravado uma vez só). O ``manifest.json`` liga cada URL ao
+arquivo, ao mimetype e à assinatura dos dados usados para gerá-la; imagens
+servidas pelo banco (``/projeto/<id>/imagem``, blobs etc.) são extraídas do HTML
+e guardadas da mesma forma.
+
+A regeneração é incremental: uma página só é renderizada de novo quando a sua
+assinatura muda. A assinatura de uma página de detalhe vem do próprio registro
+(``updated_at``/``created_at``) e das tabelas de fotos; as páginas de listagem
+usam as contagens e datas de todas as tabelas de conteúdo e a data do dia. Uma
+alteração nos templates ou nas traduções regenera tudo.
+
+Com o snapshot gerado, ``init_snapshot`` registra um ``before_request`` que, para
+URLs presentes no manifesto, consulta o estado do banco (``SELECT 1`` no máximo a
+cada ``SNAPSHOT_HEALTH_INTERVALO`` segundos) e, se ele estiver indisponível,
+responde com o arquivo do snapshot em vez de executar a rota.
+
+Variáveis de ambiente:
+
+    SNAPSHOT_DIR                diretório do snapshot (padrão: instance/snapshot)
+    SNAPSHOT_HEALTH_INTERVALO   segundos entre verificações do banco (padrão: 15)
+    SNAPSHOT_AUTOMATICO         0 desativa a geração em segundo plano no boot (padrão: 1)
+    SNAPSHOT_INTERVALO          segundos entre regenerações em segundo plano (padrão: 0 = só no boot)
+"""
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+from flask import Response, request, send_file, session, url_for
+from sqlalchemy import exc, func, select
+
+from extensions import db
+from models import (
+    Acao, AcaoFoto, Album, AlbumFoto, Apoiador, Banner, BannerConteudo, Configuracao, DadosAssociacao,
+    EstatutoDocumento, Evento, EventoFoto, Imagem, InformacaoDoacao, Informativo, InstagramPost,
+    MembroConselhoFiscal, MembroCoordenacaoSocial, MembroDiretoria, OQueFazemosServico, PrestacaoConta,
+    Projeto, RadioConfig, RadioPrograma, RelatorioAtividade, RelatorioFinanceiro, ReunionPresencial,
+    ReunionVirtual, SliderImage, SobreConteudo, Video,
+)
+
+# Muda quando o formato do manifesto muda (força a regeneração completa)
+VERSAO_FORMATO = 1
+
+MANIFESTO = 'manifest.json'
+
+# Marca as requisições feitas pelo gerador (nunca são atendidas pelo snapshot)
+ENVIRON_GERANDO = 'aadvita.snapshot.gerando'
+
+# Páginas institucionais e de listagem
+PAGINAS = (
+    '/',
+    '/sobre',
+    '/projetos',
+    '/acoes',
+    '/eventos',
+    '/informativo',
+    '/radio',
+    '/videos',
+    '/galeria',
+    '/apoiadores',
+    '/agenda-presencial',
+    '/agenda-virtual',
+    '/transparencia',
+    '/transparencia/relatorios-financeiros',
+    '/transparencia/estatuto-documentos',
+    '/transparencia/relatorios-atividades',
+    '/transparencia/prestacao-contas',
+    '/transparencia/doacoes-recursos',
+)
+
+# Páginas de detalhe: (modelo, endpoint, tabelas relacionadas exibidas na página)
+DETALHES = (
+    (Projeto, 'projeto', ()),
+    (Acao, 'acao_detalhe', (AcaoFoto,)),
+    (Evento, 'evento_detalhe', (EventoFoto, Album, AlbumFoto)),
+    (Informativo, 'informativo_detalhe', ()),
+)
+
+# Tabelas lidas pelo layout (rodapé, dados da associação): mudou, regenera tudo
+TABELAS_LAYOUT = (Configuracao, DadosAssociacao)
+
+# Tabelas exibidas nas páginas de listagem
+TABELAS_CONTEUDO = (
+    ReunionPresencial, ReunionVirtual, Projeto, Acao, AcaoFoto, Apoiador, Imagem, SliderImage, Album,
+    AlbumFoto, Evento, EventoFoto, Video, SobreConteudo, MembroDiretoria, MembroConselhoFiscal,
+    MembroCoordenacaoSocial, OQueFazemosServico, InstagramPost, RelatorioFinanceiro, EstatutoDocumento,
+    PrestacaoConta, RelatorioAtividade, InformacaoDoacao, Informativo, RadioPrograma, RadioConfig, Banner,
+    BannerConteudo,
+)
+
+# src="..." de imagens servidas pela aplicação (não inclui /static, que é servido do disco)
+_RE_SRC = re.compile(r'''\bsrc=["'](/(?!/|static/)[^"'#?]*)''')
+
+
+def diretorio_snapshot(app):
+    return app.config.get('SNAPSHOT_DIR') or os.path.join(app.instance_path, 'snapshot')
+
+
+# ============================================
+# GERAÇÃO
+# ============================================
+
+def _hash(*partes):
+    return hashlib.sha256(json.dumps(partes, default=str, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _assinatura_tabelas(models):
+    """Contagem, maior id e datas de alteração de cada tabela (uma linha por tabela)"""
+    partes = []
+    for model in models:
+        colunas = [func.count(), func.max(model.id)]
+        for nome in ('updated_at', 'created_at'):
+            if hasattr(model, nome):
+                colunas.append(func.max(getattr(model, nome)))
+        partes.append([model.__tablename__, *db.session.execute(select(*colunas)).one()])
+    return partes
+
+
+def assinatura_arquivos(app, *diretorios):
+    """Templates e traduções: nome, tamanho e mtime de cada arquivo"""
+    partes = []
+    for diretorio in diretorios:
+        raiz = os.path.join(app.root_path, diretorio)
+        if os.path.isfile(raiz):
+            st = os.stat(raiz)
+            partes.append([diretorio, st.st_size, st.st_mtime_ns])
+            continue
+        for pasta, _, arquivos in os.walk(raiz):
+            for nome in sorted(arquivos):
+                st = os.stat(os.path.join(pasta, nome))
+                partes.append([os.path.relpath(os.path.join(pasta, nome), raiz), st.st_size, st.st_mtime_ns])
+    return partes
+
+
+def _url_detalhe(endpoint, id, slug):
+    if slug and not slug.isdigit():
+        return url_for(endpoint, slug=slug)
+    return url_for(endpoint, id=id)
+
+
+def listar_paginas(app):
+    """[(url, assinatura dos dados)] de todas as páginas do snapshot"""
+    assinatura_global = _hash(
+        VERSAO_FORMATO,
+        assinatura_arquivos(app, 'templates', 'translations.py'),
+        _assinatura_tabelas(TABELAS_LAYOUT),
+    )
+    # Listagens dependem de todo o conteúdo e da data (ex.: próximos eventos)
+    assinatura_listas = _hash(assinatura_global, _assinatura_tabelas(TABELAS_CONTEUDO), date.today())
+    paginas = [(url, assinatura_listas) for url in PAGINAS]
+
+    with app.test_request_context():
+        for model, endpoint, relacionadas in DETALHES:
+            assinatura_modelo = _hash(assinatura_global, _assinatura_tabelas(relacionadas))
+            # Só as colunas da assinatura (os registros têm imagens em base64)
+            colunas = [getattr(model, nome) for nome in ('id', 'slug', 'updated_at', 'created_at') if hasattr(model, nome)]
+            consulta = select(*colunas)
+            if hasattr(model, 'ativo'):
+                consulta = consulta.where(model.ativo.is_(True))
+            for linha in db.session.execute(consulta).mappings():
+                paginas.append((
+                    _url_detalhe(endpoint, linha['id'], linha.get('slug')),
+                    _hash(assinatura_modelo, dict(linha)),
+                ))
+    return paginas
+
+
+def _ler_manifesto(diretorio):
+    try:
+        with open(os.path.join(diretorio, MANIFESTO), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _gravar_conteudo(diretorio, dados):
+    sha256 = hashlib.sha256(dados).hexdigest()
+    caminho = os.path.join(diretorio, 'conteudo', sha256)
+    if not os.path.exists(caminho):
+        temporario = f'{caminho}.{os.getpid()}.tmp'
+        with open(temporario, 'wb') as f:
+            f.write(dados)
+        os.replace(temporario, caminho)
+    return sha256
+
+
+def _existe(diretorio, entrada):
+    return entrada is not None and os.path.exists(os.path.join(diretorio, 'conteudo', entrada['sha256']))
+
+
+def _manifesto_anterior(diretorio, completo):
+    anterior = _ler_manifesto(diretorio) or {}
+    if completo or anterior.get('versao') != VERSAO_FORMATO:
+        return {}
+    return anterior
+
+
+def _atualizada(diretorio, entrada, assinatura):
+    return bool(entrada) and entrada['assinatura'] == assinatura and _existe(diretorio, entrada)
+
+
+def paginas_pendentes(app, completo=False):
+    """[(idioma, url)] que ``gerar_snapshot`` renderizaria de novo (não grava nada)"""
+    diretorio = diretorio_snapshot(app)
+    paginas_anteriores = _manifesto_anterior(diretorio, completo).get('paginas', {})
+    with app.app_context():
+        paginas = listar_paginas(app)
+    return [
+        (idioma, url)
+        for idioma in app.config['LANGUAGES']
+        for url, assinatura in paginas
+        if not _atualizada(diretorio, paginas_anteriores.get(f'{idioma}:{url}'), assinatura)
+    ]
+
+
+def gerar_snapshot(app, completo=False, progresso=None):
+    """Gera/atualiza o snapshot; retorna as contagens de páginas e arquivos processados
+
+    Páginas cuja assinatura não mudou são mantidas sem renderizar. Se uma página
+    falhar (ex.: banco caiu durante a geração), a versão anterior é mantida.
+    ``progresso(feitas, total)`` é chamado a cada página.
+    """
+    diretorio = diretorio_snapshot(app)
+    os.makedirs(os.path.join(diretorio, 'conteudo'), exist_ok=True)
+
+    anterior = _manifesto_anterior(diretorio, completo)
+    paginas_anteriores = anterior.get('paginas', {})
+    arquivos_anteriores = anterior.get('arquivos', {})
+
+    with app.app_context():
+        paginas = listar_paginas(app)
+        db.session.remove()
+
+    cliente = app.test_client()
+    cliente.environ_base[ENVIRON_GERANDO] = True
+    resultado = {'renderizadas': 0, 'mantidas': 0, 'falhas': 0, 'arquivos': 0}
+    novas_paginas = {}
+    imagens_renderizadas = set()
+
+    total = len(paginas) * len(app.config['LANGUAGES'])
+    feitas = 0
+    for idioma in app.config['LANGUAGES']:
+        cliente.get(f'/set-language/{idioma}')
+        for url, assinatura in paginas:
+            feitas += 1
+            if progresso:
+                progresso(feitas, total)
+            chave = f'{idioma}:{url}'
+            entrada = paginas_anteriores.get(chave)
+            if _atualizada(diretorio, entrada, assinatura):
+                novas_paginas[chave] = entrada
+                resultado['mantidas'] += 1
+                continue
+
+            resposta = cliente.get(url)
+            if resposta.status_code != 200:
+                resultado['falhas'] += 1
+                print(f"⚠️ Snapshot: {url} ({idioma}) retornou {resposta.status_code}")
+                # Erro do servidor: mantém a versão anterior; 404 e afins: a página saiu do site
+                if resposta.status_code >= 500 and _existe(diretorio, entrada):
+                    novas_paginas[chave] = entrada
+                continue
+
+            html = resposta.get_data(as_text=True)
+            imagens = sorted(set(_RE_SRC.findall(html)))
+            imagens_renderizadas.update(imagens)
+            novas_paginas[chave] = {
+                'sha256': _gravar_conteudo(diretorio, resposta.data),
+                'mimetype': resposta.mimetype,
+                'assinatura': assinatura,
+                'imagens': imagens,
+            }
+            resultado['renderizadas'] += 1
+
+    # Imagens: baixadas de novo só quando alguma página que as usa foi renderizada
+    novos_arquivos = {}
+    for url in sorted({img for entrada in novas_paginas.values() for img in entrada.get('imagens', ())}):
+        entrada = arquivos_anteriores.get(url)
+        if url not in imagens_renderizadas and _existe(diretorio, entrada):
+            novos_arquivos[url] = entrada
+            continue
+        resposta = cliente.get(url)
+        if resposta.status_code == 200:
+            novos_arquivos[url] = {
+                'sha256': _gravar_conteudo(diretorio, resposta.data),
+                'mimetype': resposta.mimetype,
+            }
+            resultado['arquivos'] += 1
+        elif resposta.status_code >= 500 and _existe(diretorio, entrada):
+            novos_arquivos[url] = entrada
+        resposta.close()
+
+    manifesto = {
+        'versao': VERSAO_FORMATO,
+        'gerado_em': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'paginas': novas_paginas,
+        'arquivos': novos_arquivos,
+    }
+    temporario = os.path.join(diretorio, f'{MANIFESTO}.{os.getpid()}.tmp')
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False, sort_keys=True)
+    os.replace(temporario, os.path.join(diretorio, MANIFESTO))
+
+    # Conteúdo que nenhuma URL referencia mais
+    em_uso = {e['sha256'] for e in novas_paginas.values()} | {e['sha256'] for e in novos_arquivos.values()}
+    for nome in os.listdir(os.path.join(diretorio, 'conteudo')):
+        if nome not in em_uso and not nome.endswith('.tmp'):
+            os.remove(os.path.join(diretorio, 'conteudo', nome))
+    return resultado
+
+
+def iniciar_gerador_em_segundo_plano():
+    """Dispara ``gerar_snapshot.py`` em um processo separado (não atrasa o boot)"""
+    if os.environ.get('SNAPSHOT_AUTOMATICO', '1') == '0':
+        return None
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gerar_snapshot.py')
+    comando = [sys.executable, script, '--intervalo', os.environ.get('SNAPSHOT_INTERVALO', '0')]
+    try:
+        return subprocess.Popen(comando, cwd=os.path.dirname(script))
+    except OSError as e:
+        print(f"⚠️ Não foi possível iniciar o gerador de snapshot: {e}")
+        return None
+
+
+# ============================================
+# FALLBACK QUANDO O BANCO ESTÁ FORA DO AR
+# ============================================
+
+_estado_banco = {'ok': True, 'verificado_em': 0.0}
+_lock_banco = threading.Lock()
+_manifesto_cache = {'dados': None, 'mtime': None, 'verificado_em': 0.0}
+
+
+def banco_disponivel(intervalo):
+    """Resultado do último ``SELECT 1``, repetido no máximo a cada ``intervalo`` segundos"""
+    if time.monotonic() - _estado_banco['verificado_em'] < intervalo:
+        return _estado_banco['ok']
+    # Só uma thread verifica; as demais usam o último resultado conhecido
+    if not _lock_banco.acquire(blocking=False):
+        return _estado_banco['ok']
+    try:
+        try:
+            with db.engine.connect() as conn:
+                conn.exec_driver_sql('SELECT 1')
+            ok = True
+        except exc.SQLAlchemyError as e:
+            ok = False
+            if _estado_banco['ok']:
+                print(f"⚠️ Banco indisponível, servindo o snapshot estático: {e}")
+        if ok and not _estado_banco['ok']:
+            print("✅ Banco disponível novamente")
+        _estado_banco.update(ok=ok, verificado_em=time.monotonic())
+    finally:
+        _lock_banco.release()
+    return _estado_banco['ok']
+
+
+def _manifesto(app, intervalo):
+    """Manifesto em memória, relido quando o arquivo muda (stat no máximo a cada ``intervalo``)"""
+    agora = time.monotonic()
+    if agora - _manifesto_cache['verificado_em'] >= intervalo:
+        caminho = os.path.join(diretorio_snapshot(app), MANIFESTO)
+        try:
+            mtime = os.stat(caminho).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != _manifesto_cache['mtime']:
+            _manifesto_cache['dados'] = _ler_manifesto(diretorio_snapshot(app)) if mtime else None
+            _manifesto_cache['mtime'] = mtime
+        _manifesto_cache['verificado_em'] = agora
+    return _manifesto_cache['dados']
+
+
+def _entrada(manifesto, caminho):
+    paginas = manifesto.get('paginas', {})
+    idioma = session.get('language', 'pt')
+    return (
+        paginas.get(f'{idioma}:{caminho}')
+        or paginas.get(f'pt:{caminho}')
+        or manifesto.get('arquivos', {}).get(caminho)
+    )
+
+
+def resposta_snapshot(app, manifesto, entrada):
+    caminho = os.path.join(diretorio_snapshot(app), 'conteudo', entrada['sha256'])
+    resposta = send_file(caminho, mimetype=entrada['mimetype'], etag=entrada['sha256'], max_age=0)
+    resposta.headers['Cache-Control'] = 'no-cache'
+    resposta.headers['X-Snapshot'] = manifesto.get('gerado_em', '')
+    return resposta
+
+
+def init_snapshot(app):
+    """Registra o fallback para o snapshot quando o banco não responde"""
+    intervalo = float(os.environ.get('SNAPSHOT_HEALTH_INTERVALO', 15))
+
+    @app.before_request
+    def _servir_snapshot_se_banco_indisponivel():
+        if request.method not in ('GET', 'HEAD') or request.environ.get(ENVIRON_GERANDO):
+            return None
+        manifesto = _manifesto(app, intervalo)
+        if not manifesto:
+            return None
+        entrada = _entrada(manifesto, request.path)
+        if entrada is None or banco_disponivel(intervalo):
+            return None
+        return resposta_snapshot(app, manifesto, entrada)
+
+    @app.errorhandler(exc.OperationalError)
+    def _banco_indisponivel(e):
+        # Falha no meio da rota: verifica o banco agora em vez de esperar o intervalo
+        # (um statement timeout também é OperationalError, e aí o erro segue normalmente)
+        _estado_banco['verificado_em'] = 0.0
+        if request.environ.get(ENVIRON_GERANDO) or banco_disponivel(intervalo):
+            raise e
+        manifesto = _manifesto(app, intervalo)
+        entrada = _entrada(manifesto, request.path) if manifesto and request.method in ('GET', 'HEAD') else None
+        if entrada is not None:
+            return resposta_snapshot(app, manifesto, entrada)
+        resposta = Response('Site temporariamente indisponível. Tente novamente em alguns minutos.',
+                            status=503, mimetype='text/plain')
+        resposta.headers['Retry-After'] = '60'
+        return resposta
@@ -0,0 +1,1454 @@
+"""Tarefas de banco executadas uma única vez antes dos workers subirem
+
+Inclui as migrações ``migrate_postgres_*``, a criação de tabelas, as colunas
+adicionadas depois do deploy inicial (base64, slug, descricao_imagem, updated_at, HTML
+renderizado) e os
+dados iniciais. ``run_startup_tasks`` é chamado por ``start.py`` e pelo hook
+``on_starting`` de ``gunicorn.conf.py`` (processo master, antes do fork), de
+modo que importar ``app`` não toca no banco.
+"""
+import os
+from datetime import datetime
+
+from flask import current_app
+
+from billing import gerar_mensalidades_automaticas
+from extensions import db
+from models import (
+    Acao, Apoiador, Associado, Configuracao, DadosAssociacao, Evento, Imagem, Informativo,
+    Permissao, Projeto, ReunionPresencial, ReunionVirtual, SaldoAssociado, Usuario, Video,
+)
+from slugs import gerar_slug_unico
+
+# Variável de ambiente que marca que o startup já rodou neste deploy
+# (start.py executa as tarefas e depois faz exec do gunicorn)
+STARTUP_DONE_ENV = 'AADVITA_STARTUP_DONE'
+
+# Migrações executadas em ordem; cada módulo expõe migrate() -> int
+MIGRATION_MODULES = [
+    'migrate_postgres_voluntario_full',
+    'migrate_postgres_voluntario',
+    'migrate_postgres_associado',
+    'migrate_postgres_mensalidade',
+    'migrate_postgres_problema_acessibilidade',
+    'migrate_postgres_certificado',
+    'migrate_postgres_reciclagem',
+    'migrate_postgres_radio',
+    'migrate_postgres_informativo',
+    'migrate_postgres_galeria',
+    'migrate_postgres_reuniones',
+    'migrate_postgres_projetos',
+    'migrate_postgres_acoes',
+    'migrate_postgres_eventos',
+    'migrate_postgres_usuario',
+    'migrate_postgres_extras',
+    'migrate_postgres_identidade',
+    'migrate_postgres_indices',
+]
+
+
+def run_migrations():
+    """Executa os scripts migrate_postgres_* (cada um abre sua própria conexão)"""
+    import importlib
+
+    for module_name in MIGRATION_MODULES:
+        nome = module_name.replace('migrate_postgres_', '')
+        try:
+            mig = importlib.import_module(module_name)
+        except Exception as e:
+            print(f'Não foi possível importar {module_name}:', e)
+            continue
+        try:
+            print(f'Executando migração {nome} (se aplicável)...')
+            code = mig.migrate()
+            if code != 0:
+                print(f'Migração {nome} retornou código {code} (continuando startup).')
+            else:
+                print(f'Migração {nome} finalizada com sucesso.')
+        except Exception as e:
+            # Continuar startup mesmo se a migração falhar — admin pode executar manualmente
+            print(f'Erro ao executar migração {nome}:', e)
+
+
+def run_startup_tasks(app, migrations=True):
+    """Prepara o banco para os workers: migrações, tabelas, colunas e dados iniciais"""
+    if migrations:
+        run_migrations()
+
+    with app.app_context():
+        _ensure_associado_foto_base64()
+        _ensure_associado_tipo_associado()
+        _ensure_descricao_imagem_columns()
+        ensure_db_initialized()
+        # Garantir que as colunas base64 existem logo após a inicialização
+        ensure_base64_columns(force=True)
+        _ensure_slug_columns()
+        _ensure_informativo_slug_column()
+        _ensure_slug_unique_indexes()
+        _ensure_updated_at_columns()
+        _ensure_conteudo_html()
+        _ensure_identidade()
+        _ensure_saldos_associados()
+        _ensure_indices()
+        # Criar o registro padrão aqui: com réplica de leitura, o get-or-create
+        # durante uma requisição poderia duplicar a linha no primário
+        DadosAssociacao.get_dados()
+        db.session.remove()
+        # Fechar as conexões abertas no master para que os workers (fork)
+        # não herdem sockets do pool
+        db.engine.dispose()
+
+    os.environ[STARTUP_DONE_ENV] = '1'
+
+
+# Safety-net de colunas em Postgres: garante colunas adicionadas ao modelo depois
+# do deploy inicial mesmo quando as migrações de start.py não rodaram.
+def _ensure_associado_foto_base64():
+    try:
+        # Only attempt for Postgres-like DBs
+        uri = current_app.config.get('SQLALCHEMY_DATABASE_URI', '') or ''
+        if uri.startswith('sqlite') or uri == '':
+            return
+
+        # First, try to reuse the existing migration script if available
+        try:
+            import migrate_postgres_associado as _mig_ass
+            try:
+                print('Startup: running migrate_postgres_associado.migrate()')
+                _mig_ass.migrate()
+            except Exception as e:
+                print('Startup: migrate_postgres_associado.migrate() failed:', e)
+        except Exception:
+            # migration module not present or import failed — fall back
+            pass
+
+        # Reflect columns and add the column if it is missing
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+        if 'associado' in tables:
+            cols = [c['name'] for c in inspector.get_columns('associado')]
+            if 'foto_base64' not in cols:
+                print('Startup: foto_base64 column missing — issuing ALTER TABLE')
+                with db.engine.connect() as conn:
+                    conn.execute(text('ALTER TABLE associado ADD COLUMN IF NOT EXISTS foto_base64 TEXT'))
+                    # commit if using transactional DDL
+                    try:
+                        conn.commit()
+                    except Exception:
+                        pass
+                print('Startup: foto_base64 column ensured')
+    except Exception as e:
+        print('Startup: error while ensuring associado.foto_base64:', e)
+
+
+def _ensure_associado_tipo_associado():
+    try:
+        # Only attempt for Postgres-like DBs
+        uri = current_app.config.get('SQLALCHEMY_DATABASE_URI', '') or ''
+        if uri.startswith('sqlite') or uri == '':
+            return
+
+        # Reflect columns and add the column if it is missing
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+        if 'associado' in tables:
+            cols = [c['name'] for c in inspector.get_columns('associado')]
+            if 'tipo_associado' not in cols:
+                print('Startup: tipo_associado column missing — issuing ALTER TABLE')
+                with db.engine.connect() as conn:
+                    conn.execute(text("ALTER TABLE associado ADD COLUMN IF NOT EXISTS tipo_associado VARCHAR(20) DEFAULT 'contribuinte'"))
+                    # commit if using transactional DDL
+                    try:
+                        conn.commit()
+                    except Exception:
+                        pass
+                print('Startup: tipo_associado column ensured')
+    except Exception as e:
+        print('Startup: error while ensuring associado.tipo_associado:', e)
+
+
+def _ensure_descricao_imagem_columns():
+    """Garante que a coluna descricao_imagem existe em todas as tabelas que têm imagens"""
+    try:
+        # Only attempt for Postgres-like DBs
+        uri = current_app.config.get('SQLALCHEMY_DATABASE_URI', '') or ''
+        if uri.startswith('sqlite') or uri == '':
+            return
+
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+        
+        # Tabelas que precisam da coluna descricao_imagem
+        tables_with_images = [
+            'slider_image',
+            'acao',
+            'evento',
+            'projeto',
+            'informativo',
+            'radio_programa',
+            'banner',
+            'banner_conteudo',
+            'apoiador',
+            'acao_foto',
+            'evento_foto',
+            'album_foto'
+        ]
+        
+        for table_name in tables_with_images:
+            if table_name in tables:
+                cols = [c['name'] for c in inspector.get_columns(table_name)]
+                if 'descricao_imagem' not in cols:
+                    print(f'Startup: descricao_imagem column missing in {table_name} — issuing ALTER TABLE')
+                    with db.engine.connect() as conn:
+                        conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS descricao_imagem TEXT'))
+                        try:
+                            conn.commit()
+                        except Exception:
+                            pass
+                    print(f'Startup: descricao_imagem column ensured in {table_name}')
+    except Exception as e:
+        print('Startup: error while ensuring descricao_imagem columns:', e)
+
+
+def init_permissoes():
+    """Inicializa as permissões do sistema"""
+    permissoes_data = [
+        # Dashboard
+        {'codigo': 'dashboard', 'nome': 'Dashboard', 'descricao': 'Acessar o painel principal', 'categoria': 'Geral'},
+        
+        # Reuniões
+        {'codigo': 'reuniones_presenciales', 'nome': 'Reuniões Presenciais', 'descricao': 'Gerenciar reuniões presenciais', 'categoria': 'Reuniões'},
+        {'codigo': 'reuniones_virtuales', 'nome': 'Reuniões Virtuais', 'descricao': 'Gerenciar reuniões virtuais', 'categoria': 'Reuniões'},
+        
+        # Conteúdo
+        {'codigo': 'projetos', 'nome': 'Projetos', 'descricao': 'Gerenciar projetos', 'categoria': 'Conteúdo'},
+        {'codigo': 'eventos', 'nome': 'Eventos', 'descricao': 'Gerenciar eventos', 'categoria': 'Conteúdo'},
+        {'codigo': 'acoes', 'nome': 'Ações', 'descricao': 'Gerenciar ações', 'categoria': 'Conteúdo'},
+        {'codigo': 'albuns', 'nome': 'Álbuns', 'descricao': 'Gerenciar álbuns da galeria', 'categoria': 'Conteúdo'},
+        {'codigo': 'imagens', 'nome': 'Imagens', 'descricao': 'Gerenciar imagens', 'categoria': 'Conteúdo'},
+        {'codigo': 'videos', 'nome': 'Vídeos', 'descricao': 'Gerenciar vídeos', 'categoria': 'Conteúdo'},
+        {'codigo': 'apoiadores', 'nome': 'Apoiadores', 'descricao': 'Gerenciar apoiadores', 'categoria': 'Conteúdo'},
+        
+        # Associados
+        {'codigo': 'associados', 'nome': 'Associados', 'descricao': 'Gerenciar associados', 'categoria': 'Associados'},
+        
+        # Financeiro
+        {'codigo': 'financeiro', 'nome': 'Sistema Financeiro', 'descricao': 'Acessar sistema financeiro', 'categoria': 'Financeiro'},
+        {'codigo': 'contas', 'nome': 'Contas - Doações e Gastos', 'descricao': 'Gerenciar doações e gastos', 'categoria': 'Financeiro'},
+        
+        # Transparência
+        {'codigo': 'transparencia', 'nome': 'Transparência', 'descricao': 'Gerenciar página de transparência', 'categoria': 'Transparência'},
+        
+        # Configurações
+        {'codigo': 'sobre', 'nome': 'Página Sobre', 'descricao': 'Gerenciar página sobre', 'categoria': 'Configurações'},
+        {'codigo': 'usuarios', 'nome': 'Usuários Administrativos', 'descricao': 'Gerenciar usuários do admin', 'categoria': 'Configurações'},
+        {'codigo': 'configuracao', 'nome': 'Configurações Gerais', 'descricao': 'Acessar configurações gerais', 'categoria': 'Configurações'},
+    ]
+    
+    for perm_data in permissoes_data:
+        permissao = Permissao.query.filter_by(codigo=perm_data['codigo']).first()
+        if not permissao:
+            permissao = Permissao(**perm_data)
+            db.session.add(permissao)
+    
+    db.session.commit()
+
+def init_db():
+    """Inicializa a base de dados com dados de exemplo"""
+    db.create_all()
+        
+    # Inicializar permissões
+    init_permissoes()
+        
+    # Tentar verificar usuários (pode falhar se a coluna não existir ainda)
+    try:
+        usuario_count = Usuario.query.count()
+    except Exception:
+        # Se falhar, provavelmente a coluna is_super_admin não existe
+        # Tentar adicionar via SQL direto
+        from sqlalchemy import text, inspect
+        try:
+            # Verificar se é SQLite ou PostgreSQL
+            is_sqlite = db.engine.url.drivername == 'sqlite'
+                
+            with db.engine.connect() as conn:
+                # Verificar se a coluna existe
+                if is_sqlite:
+                    result = conn.execute(text("PRAGMA table_info(usuario)"))
+                    columns = [row[1] for row in result]
+                else:
+                    # PostgreSQL
+                    result = conn.execute(text("""
+                        SELECT column_name 
+                        FROM information_schema.columns 
+                        WHERE table_name = 'usuario' AND column_name = 'is_super_admin'
+                    """))
+                    columns = [row[0] for row in result]
+                    
+                if (is_sqlite and 'is_super_admin' not in columns) or (not is_sqlite and len(columns) == 0):
+                    # PostgreSQL usa BOOLEAN, SQLite também suporta
+                    conn.execute(text("ALTER TABLE usuario ADD COLUMN is_super_admin BOOLEAN DEFAULT FALSE"))
+                    conn.commit()
+                    print("Coluna is_super_admin adicionada ao banco de dados.")
+        except Exception as e:
+            print(f"Aviso: Não foi possível adicionar coluna automaticamente: {e}")
+            print("Execute o script migrate_permissoes.py manualmente.")
+        usuario_count = 0
+        
+    # Se não houver usuários, criar um super admin padrão
+    if usuario_count == 0:
+        admin = Usuario(
+            username='admin',
+            nome='Administrador',
+            is_super_admin=True
+        )
+        admin.set_password('admin123')
+        db.session.add(admin)
+        db.session.commit()
+        print('Usuário admin criado (username: admin, senha: admin123) - ALTERE A SENHA!')
+        
+    # Marcar o primeiro usuário como super admin se não houver nenhum super admin
+    try:
+        super_admin_count = Usuario.query.filter_by(is_super_admin=True).count()
+        if super_admin_count == 0:
+            primeiro_usuario = Usuario.query.first()
+            if primeiro_usuario:
+                primeiro_usuario.is_super_admin = True
+                db.session.commit()
+                print(f'Usuário {primeiro_usuario.username} marcado como super admin automaticamente.')
+    except Exception as e:
+        print(f"Aviso: Não foi possível verificar/atualizar super admins: {e}")
+        
+    # Migração da coluna imagem_base64 já foi feita no início da função
+        
+    # Verificar se já existem dados no banco (primeira inicialização)
+    # Se já houver qualquer dado, não criar dados de exemplo
+    has_any_data = (
+        ReunionPresencial.query.count() > 0 or
+        ReunionVirtual.query.count() > 0 or
+        Projeto.query.count() > 0 or
+        Acao.query.count() > 0 or
+        Evento.query.count() > 0
+    )
+        
+    # Criar dados de exemplo APENAS se não houver NENHUM dado no banco
+    if not has_any_data:
+        # Reuniones presenciales de ejemplo
+        r1 = ReunionPresencial(
+            titulo="Assembleia Geral Mensal",
+            descripcion="Reunião mensal para discutir atividades e projetos da associação",
+            fecha=datetime(2025, 2, 15, 14, 0),
+            hora="14:00",
+            lugar="Sede da AADVITA",
+            direccion="Rua das Flores, 123, Centro"
+        )
+        db.session.add(r1)
+            
+        r2 = ReunionPresencial(
+            titulo="Workshop de Acessibilidade",
+            descripcion="Workshop sobre tecnologias assistivas e acessibilidade para deficientes visuais",
+            fecha=datetime(2025, 2, 20, 15, 0),
+            hora="15:00",
+            lugar="Centro Comunitário",
+            direccion="Avenida Principal, 456, Bairro Novo"
+        )
+        db.session.add(r2)
+            
+        r3 = ReunionPresencial(
+            titulo="Reunião de Planejamento",
+            descripcion="Reunião para planejar as próximas atividades e eventos da associação",
+            fecha=datetime(2025, 3, 5, 10, 0),
+            hora="10:00",
+            lugar="Sede da AADVITA",
+            direccion="Rua das Flores, 123, Centro"
+        )
+        db.session.add(r3)
+            
+        r4 = ReunionPresencial(
+            titulo="Palestra sobre Inclusão Digital",
+            descripcion="Palestra sobre como a tecnologia pode promover inclusão para pessoas com deficiência visual",
+            fecha=datetime(2025, 3, 15, 16, 0),
+            hora="16:00",
+            lugar="Auditório Municipal",
+            direccion="Praça Central, s/n, Centro"
+        )
+        db.session.add(r4)
+            
+        # Reuniones virtuales de ejemplo
+        rv1 = ReunionVirtual(
+            titulo="Workshop de Tecnologia Assistiva",
+            descripcion="Workshop sobre ferramentas tecnológicas para deficientes visuais",
+            fecha=datetime(2025, 2, 18, 19, 0),
+            hora="19:00",
+            plataforma="Google Meet",
+            link="https://meet.google.com/abc-defg-hij"
+        )
+        db.session.add(rv1)
+            
+        rv2 = ReunionVirtual(
+            titulo="Oficina de Leitura Digital",
+            descripcion="Aprenda a usar leitores de tela e ferramentas de leitura digital",
+            fecha=datetime(2025, 2, 25, 20, 0),
+            hora="20:00",
+            plataforma="Google Meet",
+            link="https://meet.google.com/xyz-uvw-rst"
+        )
+        db.session.add(rv2)
+            
+        rv3 = ReunionVirtual(
+            titulo="Reunião de Acolhimento",
+            descripcion="Reunião para acolher novos membros e apresentar a associação",
+            fecha=datetime(2025, 3, 8, 18, 30),
+            hora="18:30",
+            plataforma="Google Meet",
+            link="https://meet.google.com/mno-pqr-stu"
+        )
+        db.session.add(rv3)
+            
+        rv4 = ReunionVirtual(
+            titulo="Palestra sobre Direitos das Pessoas com Deficiência",
+            descripcion="Palestra sobre direitos e legislação para pessoas com deficiência visual",
+            fecha=datetime(2025, 3, 20, 19, 0),
+            hora="19:00",
+            plataforma="Google Meet",
+            link="https://meet.google.com/ghi-jkl-mno"
+        )
+        db.session.add(rv4)
+            
+        # Projetos de exemplo
+        p1 = Projeto(
+            titulo="Inclusão Digital",
+            descripcion="Projeto para capacitar pessoas com deficiência visual no uso de tecnologias assistivas",
+            estado="Ativo",
+            data_inicio=datetime(2024, 1, 1).date()
+        )
+        db.session.add(p1)
+            
+        p2 = Projeto(
+            titulo="Acessibilidade em Espaços Públicos",
+            descripcion="Projeto voltado para promover melhorias na acessibilidade de espaços públicos para pessoas com deficiência visual",
+            estado="Ativo",
+            data_inicio=datetime(2024, 3, 1).date()
+        )
+        db.session.add(p2)
+            
+        p3 = Projeto(
+            titulo="Formação Profissional",
+            descripcion="Iniciativa para oferecer cursos e treinamentos profissionais para pessoas com deficiência visual",
+            estado="Em Andamento",
+            data_inicio=datetime(2024, 5, 1).date()
+        )
+        db.session.add(p3)
+            
+        p4 = Projeto(
+            titulo="Apoio Educacional",
+            descripcion="Projeto de apoio educacional e inclusão escolar para crianças e jovens com deficiência visual",
+            estado="Ativo",
+            data_inicio=datetime(2024, 2, 1).date()
+        )
+        db.session.add(p4)
+            
+        # Ações de ejemplo
+        a1 = Acao(
+            titulo="Campanha de Conscientização",
+            descricao="Campanha para aumentar a conscientização sobre acessibilidade",
+            data=datetime(2024, 3, 15).date(),
+            categoria="Conscientização"
+        )
+        db.session.add(a1)
+            
+        a2 = Acao(
+            titulo="Doação de Materiais Educativos",
+            descricao="Ação de doação de materiais educativos em braille para escolas da região",
+            data=datetime(2024, 4, 10).date(),
+            categoria="Educação"
+        )
+        db.session.add(a2)
+            
+        a3 = Acao(
+            titulo="Parceria com Empresas Locais",
+            descricao="Iniciativa para estabelecer parcerias com empresas locais para inclusão de pessoas com deficiência visual",
+            data=datetime(2024, 5, 20).date(),
+            categoria="Parcerias"
+        )
+        db.session.add(a3)
+            
+        a4 = Acao(
+            titulo="Workshop de Mobilidade Urbana",
+            descricao="Workshop prático sobre técnicas de mobilidade urbana para pessoas com deficiência visual",
+            data=datetime(2024, 6, 5).date(),
+            categoria="Capacitação"
+        )
+        db.session.add(a4)
+            
+        # Apoiadores de ejemplo
+        ap1 = Apoiador(
+            nome="Empresa Solidária",
+            tipo="Empresa",
+            website="https://exemplo.com",
+            descricao="Empresa parceira que apoia nossos projetos"
+        )
+        db.session.add(ap1)
+            
+        # Vídeos de exemplo
+        v1 = Video(
+            titulo="Apresentação da AADVITA",
+            descricao="Conheça mais sobre a Associação de Deficientes Visuais AADVITA e nossos projetos",
+            url_youtube="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            categoria="Institucional",
+            ordem=1
+        )
+        db.session.add(v1)
+            
+        v2 = Video(
+            titulo="Tecnologias Assistivas para Deficientes Visuais",
+            descricao="Vídeo educativo sobre tecnologias assistivas que facilitam o dia a dia de pessoas com deficiência visual",
+            url_youtube="https://www.youtube.com/watch?v=jNQXAC9IVRw",
+            categoria="Educacional",
+            ordem=2
+        )
+        db.session.add(v2)
+            
+        v3 = Video(
+            titulo="Inclusão e Acessibilidade",
+            descricao="Palestra sobre inclusão e acessibilidade para pessoas com deficiência visual na sociedade",
+            url_youtube="https://www.youtube.com/watch?v=9bZkp7q19f0",
+            categoria="Conscientização",
+            ordem=3
+        )
+        db.session.add(v3)
+            
+        # Imagens de exemplo - usando logo existente como placeholder
+        img1 = Imagem(
+            titulo="Atividade com Membros",
+            descricao="Membros da AADVITA participando de uma atividade comunitária",
+            filename="logo.png",
+            caminho="images/logo.png"
+        )
+        db.session.add(img1)
+            
+        img2 = Imagem(
+            titulo="Workshop de Tecnologia",
+            descricao="Workshop sobre tecnologias assistivas realizado pela associação",
+            filename="logo.png",
+            caminho="images/logo.png"
+        )
+        db.session.add(img2)
+            
+        img3 = Imagem(
+            titulo="Evento de Conscientização",
+            descricao="Evento público para conscientização sobre deficiência visual",
+            filename="logo.png",
+            caminho="images/logo.png"
+        )
+        db.session.add(img3)
+            
+        img4 = Imagem(
+            titulo="Reunião de Planejamento",
+            descricao="Equipe da AADVITA em reunião de planejamento de atividades",
+            filename="logo.png",
+            caminho="images/logo.png"
+        )
+        db.session.add(img4)
+            
+        # Eventos de exemplo
+        e1 = Evento(
+            titulo="Dia da Conscientização sobre Deficiência Visual",
+            descricao="Evento especial para promover a conscientização sobre deficiência visual e inclusão",
+            data=datetime(2025, 4, 15, 14, 0),
+            hora="14:00",
+            local="Praça Central",
+            endereco="Centro da cidade",
+            tipo="Presencial"
+        )
+        db.session.add(e1)
+            
+        e2 = Evento(
+            titulo="Feira de Inclusão e Acessibilidade",
+            descricao="Feira com exposição de tecnologias assistivas e produtos para pessoas com deficiência visual",
+            data=datetime(2025, 5, 10, 9, 0),
+            hora="09:00",
+            local="Centro de Convenções",
+            endereco="Avenida das Flores, 500, Centro",
+            tipo="Presencial"
+        )
+        db.session.add(e2)
+            
+        e3 = Evento(
+            titulo="Seminário sobre Tecnologias Assistivas",
+            descricao="Seminário online sobre as mais recentes tecnologias assistivas para deficiência visual",
+            data=datetime(2025, 6, 20, 19, 0),
+            hora="19:00",
+            local="Online",
+            endereco="Plataforma Google Meet",
+            tipo="Virtual",
+            link="https://meet.google.com/event-tech"
+        )
+        db.session.add(e3)
+            
+        e4 = Evento(
+            titulo="Caminhada pela Inclusão",
+            descricao="Caminhada comunitária para promover a inclusão e acessibilidade no município",
+            data=datetime(2025, 7, 12, 8, 0),
+            hora="08:00",
+            local="Parque Municipal",
+            endereco="Rua da Natureza, s/n",
+            tipo="Presencial"
+        )
+        db.session.add(e4)
+            
+        db.session.commit()
+        
+    # NOTA: Código que recriava automaticamente reuniões, projetos, ações, eventos, imagens e vídeos
+    # foi removido para garantir que exclusões sejam permanentes.
+    # Dados de exemplo são criados apenas na primeira inicialização do banco (quando não há nenhum registro).
+        
+    # Criar usuário admin padrão se não existir
+    if Usuario.query.count() == 0:
+        admin = Usuario(
+            username='admin',
+            nome='Administrador',
+        )
+        admin.set_password('admin123')  # Senha padrão - altere depois!
+        db.session.add(admin)
+        db.session.commit()
+        
+    # Criar configurações padrão do rodapé se não existirem
+    configs_default = {
+        'footer_email': 'contato@aadvita.org.br',
+        'footer_telefone': '(00) 0000-0000',
+        'footer_whatsapp': '(00) 00000-0000',
+        'footer_whatsapp_link': 'https://wa.me/5500000000000',
+        'footer_instagram': 'https://www.instagram.com/aadvita',
+        'footer_facebook': 'https://www.facebook.com/aadvita',
+        'footer_youtube': '',
+        'footer_qrcode': 'images/qrcode.png',
+        'footer_copyright_year': '2025'
+    }
+        
+    for chave, valor in configs_default.items():
+        if not Configuracao.query.filter_by(chave=chave).first():
+            config = Configuracao(chave=chave, valor=valor, tipo='texto')
+            db.session.add(config)
+        
+    db.session.commit()
+        
+    # Gerar mensalidades automaticamente ao iniciar (se não existirem)
+    try:
+        gerar_mensalidades_automaticas()
+    except Exception as e:
+        print(f"Aviso: Erro ao gerar mensalidades automaticamente: {str(e)}")
+
+def _add_column(inspector, conn, table_name, column_name, is_sqlite, column_type='TEXT'):
+    """Função auxiliar para adicionar coluna a uma tabela"""
+    from sqlalchemy import text
+    try:
+        column_exists = False
+        
+        if is_sqlite:
+            result = conn.execute(text("PRAGMA table_info({})".format(table_name)))
+            columns = [row[1] for row in result]
+            column_exists = column_name in columns
+        else:
+            # PostgreSQL
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 
+                    FROM information_schema.columns 
+                    WHERE table_name = :table_name 
+                    AND column_name = :column_name
+                )
+            """), {'table_name': table_name, 'column_name': column_name})
+            column_exists = result.scalar()
+        
+        if not column_exists:
+            print(f"📝 Adicionando coluna {column_name} à tabela {table_name}...")
+            try:
+                if is_sqlite:
+                    conn.execute(text("ALTER TABLE {} ADD COLUMN {} {}".format(table_name, column_name, column_type)))
+                else:
+                    # PostgreSQL - usar IF NOT EXISTS via DO block com format dinâmico
+                    sql = f"""
+                        DO $$ 
+                        BEGIN
+                            IF NOT EXISTS (
+                                SELECT 1 FROM information_schema.columns 
+                                WHERE table_name = '{table_name}' 
+                                AND column_name = '{column_name}'
+                            ) THEN
+                                EXECUTE format('ALTER TABLE %I ADD COLUMN %I {column_type}', '{table_name}', '{column_name}');
+                            END IF;
+                        END $$;
+                    """
+                    conn.execute(text(sql))
+                conn.commit()
+                print(f"✅ Coluna {column_name} adicionada à tabela {table_name}.")
+            except Exception as e:
+                # Se a coluna já existe (erro de duplicação), ignorar
+                error_str = str(e).lower()
+                if 'duplicate' in error_str or 'already exists' in error_str or ('column' in error_str and 'already' in error_str):
+                    print(f"ℹ️ Coluna {table_name}.{column_name} já existe.")
+                else:
+                    raise
+        return True
+    except Exception as e:
+        print(f"⚠️ Erro ao adicionar coluna {table_name}.{column_name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+# Função para inicializar o banco de dados quando necessário
+def ensure_db_initialized():
+    """Garante que o banco de dados está inicializado"""
+    try:
+        # Verificar qual banco está sendo usado
+        db_type = db.engine.url.drivername
+        print(f"📊 Tipo de banco de dados: {db_type}")
+            
+        # PRIMEIRO: Adicionar colunas base64 se necessário ANTES de qualquer query
+        try:
+            from sqlalchemy import text, inspect
+            inspector = inspect(db.engine)
+                
+            # Adicionar coluna imagem_base64 à tabela slider_image
+            table_exists = 'slider_image' in inspector.get_table_names()
+            if table_exists:
+                is_sqlite = db_type == 'sqlite'
+                with db.engine.connect() as conn:
+                    if is_sqlite:
+                        result = conn.execute(text("PRAGMA table_info(slider_image)"))
+                        columns = [row[1] for row in result]
+                    else:
+                        result = conn.execute(text("""
+                            SELECT column_name 
+                            FROM information_schema.columns 
+                            WHERE table_name = 'slider_image' AND column_name = 'imagem_base64'
+                        """))
+                        columns = [row[0] for row in result]
+                        
+                    if (is_sqlite and 'imagem_base64' not in columns) or (not is_sqlite and len(columns) == 0):
+                        print("📝 Adicionando coluna imagem_base64 à tabela slider_image...")
+                        if is_sqlite:
+                            conn.execute(text("ALTER TABLE slider_image ADD COLUMN imagem_base64 TEXT"))
+                        else:
+                            conn.execute(text("ALTER TABLE slider_image ADD COLUMN imagem_base64 TEXT"))
+                        conn.commit()
+                        print("✅ Coluna imagem_base64 adicionada.")
+                
+            # Adicionar coluna logo_base64 à tabela apoiador
+            table_exists = 'apoiador' in inspector.get_table_names()
+            if table_exists:
+                is_sqlite = db_type == 'sqlite'
+                with db.engine.connect() as conn:
+                    if is_sqlite:
+                        result = conn.execute(text("PRAGMA table_info(apoiador)"))
+                        columns = [row[1] for row in result]
+                    else:
+                        result = conn.execute(text("""
+                            SELECT column_name 
+                            FROM information_schema.columns 
+                            WHERE table_name = 'apoiador' AND column_name = 'logo_base64'
+                        """))
+                        columns = [row[0] for row in result]
+                        
+                    if (is_sqlite and 'logo_base64' not in columns) or (not is_sqlite and len(columns) == 0):
+                        print("📝 Adicionando coluna logo_base64 à tabela apoiador...")
+                        if is_sqlite:
+                            conn.execute(text("ALTER TABLE apoiador ADD COLUMN logo_base64 TEXT"))
+                        else:
+                            conn.execute(text("ALTER TABLE apoiador ADD COLUMN logo_base64 TEXT"))
+                        conn.commit()
+                        print("✅ Coluna logo_base64 adicionada.")
+                
+            # Adicionar coluna imagem_base64 à tabela banner_conteudo
+            table_exists = 'banner_conteudo' in inspector.get_table_names()
+            if table_exists:
+                is_sqlite = db_type == 'sqlite'
+                with db.engine.connect() as conn:
+                    column_exists = False
+                        
+                    if is_sqlite:
+                        result = conn.execute(text("PRAGMA table_info(banner_conteudo)"))
+                        columns = [row[1] for row in result]
+                        column_exists = 'imagem_base64' in columns
+                    else:
+                        # PostgreSQL - usar EXISTS para verificação mais robusta
+                        result = conn.execute(text("""
+                            SELECT EXISTS (
+                                SELECT 1 
+                                FROM information_schema.columns 
+                                WHERE table_name = 'banner_conteudo' 
+                                AND column_name = 'imagem_base64'
+                            )
+                        """))
+                        column_exists = result.scalar()
+                        
+                    if not column_exists:
+                        print("📝 Adicionando coluna imagem_base64 à tabela banner_conteudo...")
+                        try:
+                            if is_sqlite:
+                                conn.execute(text("ALTER TABLE banner_conteudo ADD COLUMN imagem_base64 TEXT"))
+                            else:
+                                # PostgreSQL - usar IF NOT EXISTS via DO block
+                                conn.execute(text("""
+                                    DO $$ 
+                                    BEGIN
+                                        IF NOT EXISTS (
+                                            SELECT 1 FROM information_schema.columns 
+                                            WHERE table_name = 'banner_conteudo' 
+                                            AND column_name = 'imagem_base64'
+                                        ) THEN
+                                            ALTER TABLE banner_conteudo ADD COLUMN imagem_base64 TEXT;
+                                        END IF;
+                                    END $$;
+                                """))
+                            conn.commit()
+                            print("✅ Coluna imagem_base64 adicionada à tabela banner_conteudo.")
+                        except Exception as e:
+                            if 'duplicate' in str(e).lower() or 'already exists' in str(e).lower():
+                                print("ℹ️ Coluna banner_conteudo.imagem_base64 já existe.")
+                            else:
+                                raise
+                
+            # Adicionar coluna imagem_base64 à tabela banner
+            table_exists = 'banner' in inspector.get_table_names()
+            if table_exists:
+                is_sqlite = db_type == 'sqlite'
+                with db.engine.connect() as conn:
+                    column_exists = False
+                        
+                    if is_sqlite:
+                        result = conn.execute(text("PRAGMA table_info(banner)"))
+                        columns = [row[1] for row in result]
+                        column_exists = 'imagem_base64' in columns
+                    else:
+                        # PostgreSQL - usar EXISTS para verificação mais robusta
+                        result = conn.execute(text("""
+                            SELECT EXISTS (
+                                SELECT 1 
+                                FROM information_schema.columns 
+                                WHERE table_name = 'banner' 
+                                AND column_name = 'imagem_base64'
+                            )
+                        """))
+                        column_exists = result.scalar()
+                        
+                    if not column_exists:
+                        print("📝 Adicionando coluna imagem_base64 à tabela banner...")
+                        try:
+                            if is_sqlite:
+                                conn.execute(text("ALTER TABLE banner ADD COLUMN imagem_base64 TEXT"))
+                            else:
+                                # PostgreSQL - usar IF NOT EXISTS via DO block
+                                conn.execute(text("""
+                                    DO $$ 
+                                    BEGIN
+                                        IF NOT EXISTS (
+                                            SELECT 1 FROM information_schema.columns 
+                                            WHERE table_name = 'banner' 
+                                            AND column_name = 'imagem_base64'
+                                        ) THEN
+                                            ALTER TABLE banner ADD COLUMN imagem_base64 TEXT;
+                                        END IF;
+                                    END $$;
+                                """))
+                            conn.commit()
+                            print("✅ Coluna imagem_base64 adicionada à tabela banner.")
+                        except Exception as e:
+                            if 'duplicate' in str(e).lower() or 'already exists' in str(e).lower():
+                                print("ℹ️ Coluna banner.imagem_base64 já existe.")
+                            else:
+                                raise
+                
+            # Adicionar colunas base64 para os outros modelos
+            # IMPORTANTE: Adicionar também colunas que não são base64 mas foram adicionadas ao modelo
+            tables_to_migrate = [
+                ('projeto', 'imagen_base64'),  # Projeto usa "imagen" em vez de "imagem"
+                ('projeto', 'arquivo_pdf'),  # Campo arquivo_pdf (pode ser caminho ou 'base64:...')
+                ('projeto', 'arquivo_pdf_base64'),  # PDF do projeto em base64
+                ('acao', 'imagem_base64'),
+                ('evento', 'imagem_base64'),
+                ('informativo', 'imagem_base64'),
+                ('radio_programa', 'imagem_base64'),
+                ('membro_diretoria', 'foto_base64'),
+                ('membro_conselho_fiscal', 'foto_base64'),
+                ('relatorio_atividade', 'arquivo_base64'),
+                ('associado', 'carteira_pdf_base64'),
+            ]
+                
+            for table_name, column_name in tables_to_migrate:
+                table_exists = table_name in inspector.get_table_names()
+                if table_exists:
+                    is_sqlite = db_type == 'sqlite'
+                    with db.engine.connect() as conn:
+                        _add_column(inspector, conn, table_name, column_name, is_sqlite, 'TEXT')
+        except Exception as e:
+            print(f"⚠️ Aviso ao verificar colunas base64: {e}")
+            
+        # Criar todas as tabelas (idempotente - não recria se já existirem)
+        db.create_all()
+        print("✅ Tabelas do banco de dados verificadas/criadas")
+            
+        # Executar migração problema_acessibilidade para garantir que a tabela exista
+        try:
+            import migrate_postgres_problema_acessibilidade as mig_problema
+            print('Executando migração problema_acessibilidade (startup)...')
+            mig_problema.migrate()
+            print('Migração problema_acessibilidade executada com sucesso (startup)')
+        except Exception as e:
+            print(f'⚠️ Aviso: Não foi possível executar migração problema_acessibilidade no startup: {e}')
+            # Tentar criar a tabela manualmente se a migração falhar
+            try:
+                from sqlalchemy import inspect, text
+                inspector = inspect(db.engine)
+                if 'problema_acessibilidade' not in inspector.get_table_names():
+                    print('Criando tabela problema_acessibilidade manualmente...')
+                    is_sqlite = db_type == 'sqlite'
+                    with db.engine.connect() as conn:
+                        if is_sqlite:
+                            conn.execute(text('''
+                                CREATE TABLE IF NOT EXISTS problema_acessibilidade (
+                                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                    tipo_problema VARCHAR(100) NOT NULL,
+                                    descricao TEXT NOT NULL,
+                                    localizacao VARCHAR(500) NOT NULL,
+                                    nome_denunciante VARCHAR(200) NOT NULL,
+                                    telefone VARCHAR(100) NOT NULL,
+                                    email VARCHAR(200),
+                                    anexos TEXT,
+                                    status VARCHAR(50) DEFAULT 'novo',
+                                    observacoes_admin TEXT,
+                                    created_at TIMESTAMP,
+                                    updated_at TIMESTAMP
+                                )
+                            '''))
+                        else:
+                            conn.execute(text('''
+                                CREATE TABLE IF NOT EXISTS problema_acessibilidade (
+                                    id SERIAL PRIMARY KEY,
+                                    tipo_problema VARCHAR(100) NOT NULL,
+                                    descricao TEXT NOT NULL,
+                                    localizacao VARCHAR(500) NOT NULL,
+                                    nome_denunciante VARCHAR(200) NOT NULL,
+                                    telefone VARCHAR(100) NOT NULL,
+                                    email VARCHAR(200),
+                                    anexos TEXT,
+                                    status VARCHAR(50) DEFAULT 'novo',
+                                    observacoes_admin TEXT,
+                                    created_at TIMESTAMP,
+                                    updated_at TIMESTAMP
+                                )
+                            '''))
+                        conn.commit()
+                    print('✅ Tabela problema_acessibilidade criada manualmente')
+            except Exception as manual_error:
+                print(f'⚠️ Erro ao criar tabela manualmente: {manual_error}')
+
+        # Executar migração certificado para garantir que a tabela exista
+        try:
+            import migrate_postgres_certificado as mig_cert
+            print('Executando migração certificado (startup)...')
+            mig_cert.migrate()
+            print('Migração certificado executada com sucesso (startup)')
+        except Exception as e:
+            print(f'⚠️ Aviso: Não foi possível executar migração certificado no startup: {e}')
+            try:
+                from sqlalchemy import inspect, text
+                inspector = inspect(db.engine)
+                if 'certificado' not in inspector.get_table_names():
+                    print('Criando tabela certificado manualmente...')
+                    is_sqlite = db_type == 'sqlite'
+                    with db.engine.connect() as conn:
+                        if is_sqlite:
+                            conn.execute(text('''
+                                CREATE TABLE IF NOT EXISTS certificado (
+                                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                    numero_validacao VARCHAR(50) UNIQUE NOT NULL,
+                                    nome_pessoa VARCHAR(200) NOT NULL,
+                                    documento VARCHAR(100),
+                                    descricao TEXT,
+                                    curso VARCHAR(200),
+                                    data_emissao TIMESTAMP,
+                                    data_validade TIMESTAMP,
+                                    status VARCHAR(50) DEFAULT 'valido',
+                                    qr_code_path VARCHAR(300),
+                                    created_at TIMESTAMP,
+                                    updated_at TIMESTAMP
+                                )
+                            '''))
+                        else:
+                            conn.execute(text('''
+                                CREATE TABLE IF NOT EXISTS certificado (
+                                    id SERIAL PRIMARY KEY,
+                                    numero_validacao VARCHAR(50) UNIQUE NOT NULL,
+                                    nome_pessoa VARCHAR(200) NOT NULL,
+                                    documento VARCHAR(100),
+                                    descricao TEXT,
+                                    curso VARCHAR(200),
+                                    data_emissao TIMESTAMP,
+                                    data_validade TIMESTAMP,
+                                    status VARCHAR(50) DEFAULT 'valido',
+                                    qr_code_path VARCHAR(300),
+                                    created_at TIMESTAMP,
+                                    updated_at TIMESTAMP
+                                )
+                            '''))
+                        conn.commit()
+                    print('✅ Tabela certificado criada manualmente')
+            except Exception as cert_manual_error:
+                print(f'⚠️ Erro ao criar tabela certificado manualmente: {cert_manual_error}')
+            
+        # Executar migração reciclagem para garantir que a tabela exista
+        try:
+            import migrate_postgres_reciclagem as mig_reciclagem
+            print('Executando migração reciclagem (startup)...')
+            mig_reciclagem.migrate()
+            print('Migração reciclagem executada com sucesso (startup)')
+        except Exception as e:
+            print(f'⚠️ Aviso: Não foi possível executar migração reciclagem no startup: {e}')
+            try:
+                from sqlalchemy import inspect, text
+                inspector = inspect(db.engine)
+                if 'reciclagem' not in inspector.get_table_names():
+                    print('Criando tabela reciclagem manualmente...')
+                    is_sqlite = db_type == 'sqlite'
+                    with db.engine.connect() as conn:
+                        if is_sqlite:
+                            conn.execute(text('''
+                                CREATE TABLE IF NOT EXISTS reciclagem (
+                                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                    tipo_material VARCHAR(50) NOT NULL,
+                                    nome_completo VARCHAR(200) NOT NULL,
+                                    telefone VARCHAR(20) NOT NULL,
+                                    endereco_retirada TEXT NOT NULL,
+                                    observacoes TEXT,
+                                    status VARCHAR(20) DEFAULT 'pendente',
+                                    observacoes_admin TEXT,
+                                    created_at TIMESTAMP,
+                                    updated_at TIMESTAMP
+                                )
+                            '''))
+                        else:
+                            conn.execute(text('''
+                                CREATE TABLE IF NOT EXISTS reciclagem (
+                                    id SERIAL PRIMARY KEY,
+                                    tipo_material VARCHAR(50) NOT NULL,
+                                    nome_completo VARCHAR(200) NOT NULL,
+                                    telefone VARCHAR(20) NOT NULL,
+                                    endereco_retirada TEXT NOT NULL,
+                                    observacoes TEXT,
+                                    status VARCHAR(20) DEFAULT 'pendente',
+                                    observacoes_admin TEXT,
+                                    created_at TIMESTAMP,
+                                    updated_at TIMESTAMP
+                                )
+                            '''))
+                        conn.commit()
+                    print('✅ Tabela reciclagem criada manualmente')
+            except Exception as rec_manual_error:
+                print(f'⚠️ Erro ao criar tabela reciclagem manualmente: {rec_manual_error}')
+            
+        # Verificar se há usuários, se não houver, inicializar dados
+        try:
+            from sqlalchemy import inspect
+            inspector = inspect(db.engine)
+            tables = inspector.get_table_names()
+            print(f"📋 Tabelas encontradas: {len(tables)}")
+                
+            if tables and 'usuario' in tables:
+                try:
+                    usuario_count = Usuario.query.count()
+                    print(f"👥 Usuários no banco: {usuario_count}")
+                    if usuario_count == 0:
+                        # Se não houver usuários, inicializar o banco completamente
+                        print("🔄 Nenhum usuário encontrado. Inicializando banco de dados...")
+                        init_db()
+                    else:
+                        print("✅ Banco de dados já possui dados - não será reinicializado")
+                except Exception as e:
+                    print(f"⚠️ Nota: Erro ao verificar usuários: {e}")
+                    # Se não conseguir verificar, tentar inicializar
+                    try:
+                        init_db()
+                    except:
+                        pass
+            else:
+                print("⚠️ Tabela 'usuario' não encontrada - inicializando banco...")
+                init_db()
+        except Exception as e:
+            print(f"⚠️ Nota: Erro ao verificar tabelas: {e}")
+            # Tentar inicializar de qualquer forma
+            try:
+                init_db()
+            except:
+                pass
+    except Exception as e:
+        print(f"❌ Aviso: Erro ao inicializar banco de dados: {e}")
+        # Não interromper o startup se houver erro no banco
+
+# Cache para evitar verificar migrações em todas as requisições
+# Incluir TODOS os modelos que têm colunas base64
+# Usar tupla (table, column) como chave para permitir múltiplas colunas por tabela
+_migration_cache = {}
+_migration_lock = False
+_migration_initialized = False
+
+def _add_base64_column(inspector, conn, table_name, column_name, is_sqlite):
+    """Função auxiliar para adicionar coluna base64 a uma tabela (alias para _add_column)"""
+    return _add_column(inspector, conn, table_name, column_name, is_sqlite, 'TEXT')
+
+def ensure_base64_columns(force=False):
+    """
+    Garante que as colunas base64 existem antes de fazer queries.
+    Esta função é CRÍTICA e deve ser executada antes de qualquer query que use modelos com imagens.
+    """
+    global _migration_cache, _migration_lock, _migration_initialized
+    
+    # Evitar execuções simultâneas
+    if _migration_lock:
+        # Aguardar um pouco e tentar novamente
+        import time
+        time.sleep(0.1)
+        if _migration_lock:
+            return False
+    
+    _migration_lock = True
+    
+    try:
+        from sqlalchemy import text, inspect
+        from sqlalchemy.exc import ProgrammingError, OperationalError
+        
+        inspector = inspect(db.engine)
+        db_type = db.engine.url.drivername
+        is_sqlite = db_type == 'sqlite'
+        
+        success = True
+        
+        # Lista de tabelas e suas colunas base64
+        # IMPORTANTE: Adicionar também colunas que não são base64 mas foram adicionadas ao modelo
+        tables_to_migrate = [
+            ('banner', 'imagem_base64'),
+            ('banner_conteudo', 'imagem_base64'),
+            ('projeto', 'imagen_base64'),  # Projeto usa "imagen" em vez de "imagem"
+            ('projeto', 'arquivo_pdf'),  # Campo arquivo_pdf (pode ser caminho ou 'base64:...')
+            ('projeto', 'arquivo_pdf_base64'),  # PDF do projeto em base64
+            ('acao', 'imagem_base64'),
+            ('evento', 'imagem_base64'),
+            ('informativo', 'imagem_base64'),
+            ('radio_programa', 'imagem_base64'),
+            ('membro_diretoria', 'foto_base64'),
+            ('membro_conselho_fiscal', 'foto_base64'),
+            ('relatorio_atividade', 'arquivo_base64'),
+            ('associado', 'carteira_pdf_base64'),
+        ]
+        
+        for table_name, column_name in tables_to_migrate:
+            cache_key = (table_name, column_name)  # Usar tupla como chave
+            
+            # SEMPRE verificar se a coluna realmente existe, não confiar apenas no cache
+            # Isso é crítico porque o cache pode estar incorreto após um deploy
+            try:
+                if table_name in inspector.get_table_names():
+                    # Verificar se a coluna realmente existe
+                    column_exists = False
+                    with db.engine.connect() as conn:
+                        if is_sqlite:
+                            result = conn.execute(text("PRAGMA table_info({})".format(table_name)))
+                            columns = [row[1] for row in result]
+                            column_exists = column_name in columns
+                        else:
+                            # PostgreSQL
+                            result = conn.execute(text("""
+                                SELECT EXISTS (
+                                    SELECT 1 
+                                    FROM information_schema.columns 
+                                    WHERE table_name = :table_name 
+                                    AND column_name = :column_name
+                                )
+                            """), {'table_name': table_name, 'column_name': column_name})
+                            column_exists = result.scalar()
+                    
+                    # Se a coluna não existe, criar agora
+                    if not column_exists:
+                        print(f"🔧 Coluna {table_name}.{column_name} não existe. Criando agora...")
+                        with db.engine.connect() as conn:
+                            result = _add_column(inspector, conn, table_name, column_name, is_sqlite, 'TEXT')
+                            if not result:
+                                success = False
+                                print(f"❌ Falha ao criar coluna {table_name}.{column_name}")
+                            else:
+                                print(f"✅ Coluna {table_name}.{column_name} criada com sucesso")
+                                _migration_cache[cache_key] = True
+                    else:
+                        # Coluna existe, marcar no cache
+                        _migration_cache[cache_key] = True
+                else:
+                    # Tabela não existe ainda, marcar no cache para não tentar novamente
+                    _migration_cache[cache_key] = True
+            except Exception as e:
+                print(f"⚠️ Erro ao verificar/adicionar coluna {table_name}.{column_name}: {e}")
+                import traceback
+                traceback.print_exc()
+                success = False
+                # NÃO marcar como verificado se houve erro - tentar novamente na próxima vez
+        
+        if success:
+            _migration_initialized = True
+        
+        return success
+        
+    except Exception as e:
+        print(f"⚠️ Erro geral em ensure_base64_columns: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        _migration_lock = False
+
+def _ensure_informativo_slug_column():
+    """Garante que a coluna slug existe na tabela informativo"""
+    try:
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        
+        # Verificar se a tabela existe
+        if 'informativo' not in inspector.get_table_names():
+            return
+        
+        # Verificar se a coluna slug existe
+        columns = [col['name'] for col in inspector.get_columns('informativo')]
+        if 'slug' not in columns:
+            print("Adicionando coluna 'slug' à tabela 'informativo'...")
+            db_type = db.engine.url.drivername
+            if db_type == 'postgresql':
+                db.session.execute(text("ALTER TABLE informativo ADD COLUMN IF NOT EXISTS slug VARCHAR(250)"))
+            else:
+                # SQLite
+                db.session.execute(text("ALTER TABLE informativo ADD COLUMN slug VARCHAR(250)"))
+            db.session.commit()
+            print("✅ Coluna 'slug' adicionada com sucesso!")
+            
+            # Gerar slugs para informativos existentes que não têm (usar query raw para evitar problemas)
+            result = db.session.execute(text("SELECT id, titulo FROM informativo WHERE slug IS NULL OR slug = ''"))
+            informativos_raw = result.fetchall()
+            
+            if informativos_raw:
+                print(f"Gerando slugs para {len(informativos_raw)} informativo(s) existente(s)...")
+                for row in informativos_raw:
+                    informativo_id = row[0]
+                    titulo = row[1]
+                    slug = gerar_slug_unico(titulo, Informativo, informativo_id)
+                    db.session.execute(
+                        text("UPDATE informativo SET slug = :slug WHERE id = :id"),
+                        {"slug": slug, "id": informativo_id}
+                    )
+                db.session.commit()
+                print(f"✅ {len(informativos_raw)} slug(s) gerado(s) com sucesso!")
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Erro ao verificar/adicionar coluna slug: {e}")
+
+def _ensure_slug_columns():
+    """Garante que as colunas slug existem nas tabelas necessárias"""
+    try:
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        
+        # Tabelas que precisam de slug - mapeamento table_name -> model_class
+        tables_with_slug = [
+            ('projeto', Projeto),
+            ('acao', Acao),
+            ('evento', Evento),
+            ('reunion_presencial', ReunionPresencial),
+            ('reunion_virtual', ReunionVirtual)
+        ]
+        
+        for table_name, model_class in tables_with_slug:
+            # Verificar se a tabela existe
+            if table_name not in inspector.get_table_names():
+                continue
+            
+            # Verificar se a coluna slug existe
+            columns = [col['name'] for col in inspector.get_columns(table_name)]
+            if 'slug' not in columns:
+                print(f"Adicionando coluna 'slug' à tabela '{table_name}'...")
+                db_type = db.engine.url.drivername
+                if db_type == 'postgresql':
+                    db.session.execute(text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS slug VARCHAR(250)"))
+                else:
+                    # SQLite
+                    db.session.execute(text(f"ALTER TABLE {table_name} ADD COLUMN slug VARCHAR(250)"))
+                db.session.commit()
+                print(f"✅ Coluna 'slug' adicionada à tabela '{table_name}'!")
+            
+            # Gerar slugs para registros existentes que não têm (usar query raw)
+            result = db.session.execute(text(f"SELECT id, titulo FROM {table_name} WHERE slug IS NULL OR slug = ''"))
+            records_raw = result.fetchall()
+            
+            if records_raw:
+                print(f"Gerando slugs para {len(records_raw)} registro(s) existente(s) em '{table_name}'...")
+                for row in records_raw:
+                    record_id = row[0]
+                    titulo = row[1]
+                    slug = gerar_slug_unico(titulo, model_class, record_id)
+                    db.session.execute(
+                        text(f"UPDATE {table_name} SET slug = :slug WHERE id = :id"),
+                        {"slug": slug, "id": record_id}
+                    )
+                db.session.commit()
+                print(f"✅ {len(records_raw)} slug(s) gerado(s) para '{table_name}'!")
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Erro ao verificar/adicionar colunas slug: {e}")
+
+
+def _ensure_updated_at_columns():
+    """Garante a coluna updated_at nas tabelas de conteúdo publicadas pela API
+
+    Registros antigos ficam com NULL; a API usa created_at como fallback.
+    """
+    try:
+        from sqlalchemy import inspect
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+        is_sqlite = db.engine.url.drivername.startswith('sqlite')
+
+        tables_with_updated_at = [
+            'reunion_presencial',
+            'reunion_virtual',
+            'projeto',
+            'acao',
+            'evento',
+            'album',
+        ]
+
+        with db.engine.connect() as conn:
+            for table_name in tables_with_updated_at:
+                if table_name in tables:
+                    _add_column(inspector, conn, table_name, 'updated_at', is_sqlite, 'TIMESTAMP')
+    except Exception as e:
+        print(f"⚠️ Erro ao verificar/adicionar colunas updated_at: {e}")
+
+
+def _ensure_conteudo_html():
+    """Garante as colunas <campo>_html_<idioma> e renderiza os registros que ainda não as têm"""
+    try:
+        from sqlalchemy import inspect
+        from conteudo import CAMPOS_RENDERIZADOS, IDIOMAS, renderizar_pendentes
+
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+        is_sqlite = db.engine.url.drivername.startswith('sqlite')
+
+        with db.engine.connect() as conn:
+            for model, campos in CAMPOS_RENDERIZADOS.items():
+                if model.__tablename__ not in tables:
+                    continue
+                for campo in campos:
+                    for idioma in IDIOMAS:
+                        _add_column(inspector, conn, model.__tablename__, f'{campo}_html_{idioma}', is_sqlite)
+
+        total = renderizar_pendentes()
+        if total:
+            print(f"✅ HTML renderizado para {total} registro(s) de transparência.")
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Erro ao renderizar HTML dos textos de transparência: {e}")
+
+
+def _ensure_identidade():
+    """Garante as colunas normalizadas de CPF/telefone/e-mail e preenche os registros antigos"""
+    try:
+        from sqlalchemy import inspect
+        from identidade import preencher_pendentes
+
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+        is_sqlite = db.engine.url.drivername.startswith('sqlite')
+
+        colunas = {
+            'associado': [('cpf_normalizado', 'VARCHAR(14)'), ('telefone_normalizado', 'VARCHAR(20)')],
+            'voluntario': [('cpf_normalizado', 'VARCHAR(20)'), ('telefone_normalizado', 'VARCHAR(20)'),
+                           ('email_normalizado', 'VARCHAR(200)')],
+        }
+        with db.engine.connect() as conn:
+            for table_name, campos in colunas.items():
+                if table_name in tables:
+                    for column_name, column_type in campos:
+                        _add_column(inspector, conn, table_name, column_name, is_sqlite, column_type)
+
+        total = preencher_pendentes()
+        if total:
+            print(f"✅ CPF/telefone/e-mail normalizados em {total} registro(s).")
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Erro ao normalizar CPF/telefone/e-mail: {e}")
+
+
+def _ensure_saldos_associados():
+    """Preenche saldo_associado na primeira subida depois da criação da tabela"""
+    try:
+        from sqlalchemy import func, select
+        from saldos import recalcular_todos
+
+        if db.session.execute(select(func.count()).select_from(SaldoAssociado)).scalar():
+            return
+        if not db.session.execute(select(func.count()).select_from(Associado)).scalar():
+            return
+        print("📝 Calculando saldos financeiros dos associados...")
+        total, _ = recalcular_todos()
+        print(f"✅ {total} saldo(s) calculado(s).")
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Erro ao calcular saldos dos associados: {e}")
+
+
+def _ensure_indices():
+    """Cria os índices declarados nos modelos que ainda não existem
+
+    Em Postgres a migração migrate_postgres_indices já os cria com CONCURRENTLY;
+    aqui é a rede de segurança (e o caminho para bancos SQLite existentes).
+    """
+    try:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(db.engine, checkfirst=True)
+                except Exception as e:
+                    print(f"⚠️ Não foi possível criar o índice {index.name}: {e}")
+    except Exception as e:
+        print(f"⚠️ Erro ao verificar índices: {e}")
+
+
+def _ensure_slug_unique_indexes():
+    """Garante índice único em slug (colunas adicionadas por ALTER TABLE ficaram sem ele)
+
+    gerar_slug_unico escolhe o slug com uma consulta; o índice impede que duas
+    gravações simultâneas fiquem com o mesmo valor.
+    """
+    try:
+        from sqlalchemy import inspect, text
+        inspector = inspect(db.engine)
+        tables = inspector.get_table_names()
+
+        for table_name in ('projeto', 'acao', 'evento', 'informativo', 'reunion_presencial', 'reunion_virtual'):
+            if table_name not in tables:
+                continue
+            unicos = [c['column_names'] for c in inspector.get_unique_constraints(table_name)]
+            unicos += [i['column_names'] for i in inspector.get_indexes(table_name) if i.get('unique')]
+            if ['slug'] in unicos:
+                continue
+            print(f"📝 Criando índice único em {table_name}.slug...")
+            try:
+                with db.engine.connect() as conn:
+                    conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{table_name}_slug ON {table_name} (slug)"))
+                    conn.commit()
+                print(f"✅ Índice ux_{table_name}_slug criado.")
+            except Exception as e:
+                # Slugs duplicados já gravados impedem o índice; corrigir e reiniciar
+                print(f"⚠️ Não foi possível criar índice único em {table_name}.slug: {e}")
+    except Exception as e:
+        print(f"⚠️ Erro ao verificar índices de slug: {e}")
@@ -0,0 +1,1091 @@
+"""Dicionário de traduções da interface (pt, es, en)"""
+
+# Dicionário de traduções
+TRANSLATIONS = {
+    'pt': {
+        'Início': 'Início',
+        'Agendas': 'Agendas',
+        'Agenda Presencial': 'Agenda Presencial',
+        'Agenda Virtual': 'Agenda Virtual',
+        'Projetos': 'Projetos',
+        'Ações': 'Ações',
+        'Apoiadores': 'Apoiadores',
+        'Selecionar idioma': 'Selecionar idioma',
+        'Idioma atual': 'Idioma atual',
+        'Bem-vindo à AADVITA': 'Bem-vindo à AADVITA',
+        'Associação de Deficientes Visuais promovendo inclusão e acessibilidade': 'Associação de Deficientes Visuais promovendo inclusão e acessibilidade',
+        'Conheça nossos projetos': 'Conheça nossos projetos',
+        'Destaques': 'Destaques',
+        'Próximas Reuniões Presenciais': 'Próximas Reuniões Presenciais',
+        'Próximas Reuniões Virtuais': 'Próximas Reuniões Virtuais',
+        'Projetos em Destaque': 'Projetos em Destaque',
+        'Ações Recentes': 'Ações Recentes',
+        'Ver todas as reuniões presenciais': 'Ver todas as reuniões presenciais',
+        'Ver todas as reuniões virtuais': 'Ver todas as reuniões virtuais',
+        'Ver todos os projetos': 'Ver todos os projetos',
+        'Ver todas as ações': 'Ver todas as ações',
+        'Agenda de Reuniões Presenciais': 'Agenda de Reuniões Presenciais',
+        'Confira nossas próximas reuniões presenciais e eventos': 'Confira nossas próximas reuniões presenciais e eventos',
+        'Agenda de Reuniões Virtuais': 'Agenda de Reuniões Virtuais',
+        'Participe das nossas reuniões e eventos online': 'Participe das nossas reuniões e eventos online',
+        'Nossos Projetos': 'Nossos Projetos',
+        'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade': 'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade',
+        'Nossas Ações': 'Nossas Ações',
+        'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA': 'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA',
+        'Nossos Apoiadores': 'Nossos Apoiadores',
+        'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis': 'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis',
+        'Informativo': 'Informativo',
+        'Fique por dentro das notícias e podcasts da AADVITA': 'Fique por dentro das notícias e podcasts da AADVITA',
+        'Todos': 'Todos',
+        'Notícias': 'Notícias',
+        'Podcast': 'Podcast',
+        'Notícia': 'Notícia',
+        'Publicado em': 'Publicado em',
+        'Não há notícias cadastradas no momento.': 'Não há notícias cadastradas no momento.',
+        'Não há podcasts cadastrados no momento.': 'Não há podcasts cadastrados no momento.',
+        'Não há informativos cadastrados no momento.': 'Não há informativos cadastrados no momento.',
+        'Ler Notícia': 'Ler Notícia',
+        'Escutar Podcast': 'Escutar Podcast',
+        'Voltar para Informativo': 'Voltar para Informativo',
+        'Abrir no SoundCloud': 'Abrir no SoundCloud',
+        'Clique no botão abaixo para escutar o podcast completo': 'Clique no botão abaixo para escutar o podcast completo',
+        'Compartilhar': 'Compartilhar',
+        'Compartilhar no Facebook': 'Compartilhar no Facebook',
+        'Compartilhar no Twitter': 'Compartilhar no Twitter',
+        'Compartilhar no WhatsApp': 'Compartilhar no WhatsApp',
+        'Compartilhar no LinkedIn': 'Compartilhar no LinkedIn',
+        'Copiar Link': 'Copiar Link',
+        'Link Copiado!': 'Link Copiado!',
+        'Copiar link': 'Copiar link',
+        'Não foi possível copiar o link. Por favor, copie manualmente:': 'Não foi possível copiar o link. Por favor, copie manualmente:',
+        'Rádio AADVITA': 'Rádio AADVITA',
+        'Ouça nossos programas de rádio e acompanhe nossa programação': 'Ouça nossos programas de rádio e acompanhe nossa programação',
+        'Apresentador': 'Apresentador',
+        'Horário': 'Horário',
+        'Ao Vivo': 'Ao Vivo',
+        'Clique em play para ouvir ao vivo': 'Clique em play para ouvir ao vivo',
+        'Episódio': 'Episódio',
+        'Ouça o episódio completo': 'Ouça o episódio completo',
+        'Seu navegador não suporta o elemento de áudio.': 'Seu navegador não suporta o elemento de áudio.',
+        'Não há programas de rádio cadastrados no momento.': 'Não há programas de rádio cadastrados no momento.',
+        'Rádio AADVITA - Ao Vivo': 'Rádio AADVITA - Ao Vivo',
+        'Transmitindo ao vivo': 'Transmitindo ao vivo',
+        'Nossos Programas': 'Nossos Programas',
+        'Campanhas': 'Campanhas',
+        'Conheça nossas campanhas e participe': 'Conheça nossas campanhas e participe',
+        'Apoie-nos': 'Apoie-nos',
+        'Apoie nossa causa e faça a diferença': 'Apoie nossa causa e faça a diferença',
+        'Editais': 'Editais',
+        'Confira nossos editais e oportunidades': 'Confira nossos editais e oportunidades',
+        'Acesso Rápido': 'Acesso Rápido',
+        'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.': 'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.',
+        'Como Apoiar': 'Como Apoiar',
+        'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.': 'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.',
+        'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.': 'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.',
+        'Em breve, informações sobre nossos editais estarão disponíveis aqui.': 'Em breve, informações sobre nossos editais estarão disponíveis aqui.',
+        'Sobre': 'Sobre',
+        'Sobre a AADVITA': 'Sobre a AADVITA',
+        'Transparência': 'Transparência',
+        'Acompanhe nossa gestão, relatórios e informações financeiras': 'Acompanhe nossa gestão, relatórios e informações financeiras',
+        'Nossa Compromisso com a Transparência': 'Nossa Compromisso com a Transparência',
+        'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.': 'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.',
+        'Relatórios Financeiros': 'Relatórios Financeiros',
+        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.': 'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.',
+        'Estatuto e Documentos': 'Estatuto e Documentos',
+        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.': 'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.',
+        'Prestação de Contas': 'Prestação de Contas',
+        'Confira como utilizamos os recursos recebidos e os resultados alcançados.': 'Confira como utilizamos os recursos recebidos e os resultados alcançados.',
+        'Relatório de Atividades': 'Relatório de Atividades',
+        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Acompanhe as atividades realizadas pela associação e os resultados alcançados.',
+        'Nenhum relatório de atividades cadastrado no momento.': 'Nenhum relatório de atividades cadastrado no momento.',
+        'Atividades Realizadas:': 'Atividades Realizadas:',
+        'Projetos e Ações': 'Projetos e Ações',
+        'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.': 'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.',
+        'Doações e Recursos': 'Doações e Recursos',
+        'Informações sobre doações recebidas e como contribuir com nossa causa.': 'Informações sobre doações recebidas e como contribuir com nossa causa.',
+        'Diretoria e Conselho': 'Diretoria e Conselho',
+        'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.': 'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.',
+        'Em breve': 'Em breve',
+        'Ver Projetos': 'Ver Projetos',
+        'Ver Detalhes': 'Ver Detalhes',
+        'Voltar para Projetos': 'Voltar para Projetos',
+        'Término:': 'Término:',
+        'Identificação do Projeto': 'Identificação do Projeto',
+        'Contexto e Justificativa': 'Contexto e Justificativa',
+        'Objetivos': 'Objetivos',
+        'Público-Alvo': 'Público-Alvo',
+        'Metodologia': 'Metodologia',
+        'Recursos Necessários': 'Recursos Necessários',
+        'Parcerias': 'Parcerias',
+        'Resultados Esperados': 'Resultados Esperados',
+        'Monitoramento e Avaliação': 'Monitoramento e Avaliação',
+        'Cronograma de Execução': 'Cronograma de Execução',
+        'Orçamento': 'Orçamento',
+        'Exemplo Resumido': 'Exemplo Resumido',
+        'Considerações Finais': 'Considerações Finais',
+        'Descrição': 'Descrição',
+        'Ver Diretoria': 'Ver Diretoria',
+        'Ver Relatórios': 'Ver Relatórios',
+        'Acompanhe nossas doações e gastos de forma transparente': 'Acompanhe nossas doações e gastos de forma transparente',
+        'Doações Recebidas': 'Doações Recebidas',
+        'Gastos Realizados': 'Gastos Realizados',
+        'Tipo': 'Tipo',
+        'Descrição': 'Descrição',
+        'Doador': 'Doador',
+        'País': 'País',
+        'Valor/Quantidade': 'Valor/Quantidade',
+        'Data': 'Data',
+        'Observações': 'Observações',
+        'Categoria': 'Categoria',
+        'Fornecedor': 'Fornecedor',
+        'Valor': 'Valor',
+        'Financeira': 'Financeira',
+        'Material': 'Material',
+        'Serviço': 'Serviço',
+        'itens': 'itens',
+        'unidades': 'unidades',
+        'Total de Doações Financeiras': 'Total de Doações Financeiras',
+        'Total de Doações em Material': 'Total de Doações em Material',
+        'Total de Doações em Serviços': 'Total de Doações em Serviços',
+        'Total de Gastos': 'Total de Gastos',
+        'Nenhuma doação cadastrada no momento.': 'Nenhuma doação cadastrada no momento.',
+        'Nenhum gasto cadastrado no momento.': 'Nenhum gasto cadastrado no momento.',
+        'Voltar para Transparência': 'Voltar para Transparência',
+        'Baixar Documento': 'Baixar Documento',
+        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente': 'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente',
+        'Nenhum relatório financeiro cadastrado no momento.': 'Nenhum relatório financeiro cadastrado no momento.',
+        'Relatório': 'Relatório',
+        'Demonstrativo': 'Demonstrativo',
+        'Balanço': 'Balanço',
+        'Ver Relatórios': 'Ver Relatórios',
+        'Ver Documentos': 'Ver Documentos',
+        'Ver Prestação de Contas': 'Ver Prestação de Contas',
+        'Ver Informações': 'Ver Informações',
+        'Estatuto': 'Estatuto',
+        'Ata': 'Ata',
+        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais': 'Acesse nosso estatuto social, atas de reuniões e documentos oficiais',
+        'Confira como utilizamos os recursos recebidos e os resultados alcançados': 'Confira como utilizamos os recursos recebidos e os resultados alcançados',
+        'Informações sobre doações recebidas e como contribuir com nossa causa': 'Informações sobre doações recebidas e como contribuir com nossa causa',
+        'Nenhum documento cadastrado no momento.': 'Nenhum documento cadastrado no momento.',
+        'Nenhuma prestação de contas cadastrada no momento.': 'Nenhuma prestação de contas cadastrada no momento.',
+        'Nenhuma informação de doação cadastrada no momento.': 'Nenhuma informação de doação cadastrada no momento.',
+        'Nenhum relatório de atividades cadastrado no momento.': 'Nenhum relatório de atividades cadastrado no momento.',
+        'Período:': 'Período:',
+        'A partir de': 'A partir de',
+        'Recursos Recebidos:': 'Recursos Recebidos:',
+        'Resultados Alcançados:': 'Resultados Alcançados:',
+        'Como Contribuir:': 'Como Contribuir:',
+        'Informações de Contato': 'Informações de Contato',
+        'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.': 'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.',
+        'E-mail:': 'E-mail:',
+        'Telefone:': 'Telefone:',
+        'Entre em contato através do formulário': 'Entre em contato através do formulário',
+        'Conheça nossa história, missão e valores': 'Conheça nossa história, missão e valores',
+        'Quem Somos': 'Quem Somos',
+        'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.': 'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.',
+        'Nossa Missão': 'Nossa Missão',
+        'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.': 'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.',
+        'Nossos Valores': 'Nossos Valores',
+        'Inclusão:': 'Inclusão:',
+        'Acreditamos que todos têm o direito de participar plenamente da sociedade': 'Acreditamos que todos têm o direito de participar plenamente da sociedade',
+        'Respeito:': 'Respeito:',
+        'Valorizamos a diversidade e a dignidade de cada pessoa': 'Valorizamos a diversidade e a dignidade de cada pessoa',
+        'Compromisso:': 'Compromisso:',
+        'Trabalhamos com dedicação para alcançar nossos objetivos': 'Trabalhamos com dedicação para alcançar nossos objetivos',
+        'Solidariedade:': 'Solidariedade:',
+        'Apoiamos uns aos outros em nossa jornada coletiva': 'Apoiamos uns aos outros em nossa jornada coletiva',
+        'Transparência:': 'Transparência:',
+        'Mantemos práticas éticas e transparentes em todas as nossas ações': 'Mantemos práticas éticas e transparentes em todas as nossas ações',
+        'Diretoria': 'Diretoria',
+        'Diretor de Comunicação': 'Diretor de Comunicação',
+        'Presidente': 'Presidente',
+        'Vice Presidente': 'Vice Presidente',
+        'Primeiro(a) Secretário(a)': 'Primeiro(a) Secretário(a)',
+        'Segundo(a) Secretário(a)': 'Segundo(a) Secretário(a)',
+        'Tesoureiro(a)': 'Tesoureiro(a)',
+        'Nome do Presidente': 'Nome do Presidente',
+        'Nome do Vice Presidente': 'Nome do Vice-Presidente',
+        'Vice-Presidente': 'Vice-Presidente',
+        'Vice Presidente': 'Vice-Presidente',
+        'Nome do Primeiro Secretário': 'Nome do Primeiro Secretário',
+        'Nome do Segundo Secretário': 'Nome do Segundo Secretário',
+        'Nome do Tesoureiro': 'Nome do Tesoureiro',
+        'Primeiro Secretário(a)': 'Primeiro Secretário(a)',
+        'Segundo Secretário(a)': 'Segundo Secretário(a)',
+        'Primeiro Tesoureiro(a)': 'Primeiro Tesoureiro(a)',
+        'Conselho Fiscal': 'Conselho Fiscal',
+        'Conselheiro': 'Conselheiro(a)',
+        'Conselheiro(a)': 'Conselheiro(a)',
+        'Coordenação Social': 'Coordenação Social',
+        'Coordenador(a)': 'Coordenador(a)',
+        'Membro da Coordenação Social': 'Coordenador(a)',
+        'Nenhum coordenador(a) cadastrado(a).': 'Nenhum coordenador(a) cadastrado(a).',
+        'Nome do Conselheiro 1': 'Nome do Conselheiro 1',
+        'Nome do Conselheiro 2': 'Nome do Conselheiro 2',
+        'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.': 'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.',
+        'Contato': 'Contato',
+        'Links Rápidos': 'Links Rápidos',
+        'Não há reuniões presenciais programadas no momento.': 'Não há reuniões presenciais programadas no momento.',
+        'Não há reuniões virtuais programadas no momento.': 'Não há reuniões virtuais programadas no momento.',
+        'Não há projetos cadastrados no momento.': 'Não há projetos cadastrados no momento.',
+        'Não há ações cadastradas no momento.': 'Não há ações cadastradas no momento.',
+        'Não há reuniões presenciais cadastradas no momento.': 'Não há reuniões presenciais cadastradas no momento.',
+        'Não há reuniões virtuais cadastradas no momento.': 'Não há reuniões virtuais cadastradas no momento.',
+        'Volte em breve para conferir nossa agenda atualizada.': 'Volte em breve para conferir nossa agenda atualizada.',
+        'Acessar reunião': 'Acessar reunião',
+        'Acessar evento': 'Acessar evento',
+        'Local:': 'Local:',
+        'Endereço:': 'Endereço:',
+        'Plataforma:': 'Plataforma:',
+        'Data:': 'Data:',
+        'Hora:': 'Hora:',
+        'Visitar site': 'Visitar site',
+        'Não há apoiadores cadastrados no momento.': 'Não há apoiadores cadastrados no momento.',
+        'Galeria': 'Galeria',
+        'Galeria de Imagens': 'Galeria de Imagens',
+        'Fotos de Eventos': 'Fotos de Eventos',
+        'Fotos de Ações': 'Fotos de Ações',
+        'Galeria Geral': 'Galeria Geral',
+        'Confira nossa galeria completa de álbuns': 'Confira nossa galeria completa de álbuns',
+        'Ver Álbum': 'Ver Álbum',
+        'Voltar para Galeria': 'Voltar para Galeria',
+        'foto(s)': 'foto(s)',
+        'Este álbum ainda não possui fotos.': 'Este álbum ainda não possui fotos.',
+        'Nenhum álbum cadastrado no momento.': 'Nenhum álbum cadastrado no momento.',
+        'Álbuns:': 'Álbuns:',
+        'Enviar Imagem': 'Enviar Imagem',
+        'Título (opcional)': 'Título (opcional)',
+        'Descrição (opcional)': 'Descrição (opcional)',
+        'Selecionar arquivo': 'Selecionar arquivo',
+        'Nenhuma imagem cadastrada no momento.': 'Nenhuma imagem cadastrada no momento.',
+        'Imagem ampliada': 'Imagem ampliada',
+        'Fechar': 'Fechar',
+        'Anterior': 'Anterior',
+        'Próxima': 'Próxima',
+        'Vídeos': 'Vídeos',
+        'Nossos Vídeos': 'Nossos Vídeos',
+        'Confira nossos vídeos e conteúdos em vídeo': 'Confira nossos vídeos e conteúdos em vídeo',
+        'Vídeos em Destaque': 'Vídeos em Destaque',
+        'Ver todos os vídeos': 'Ver todos os vídeos',
+        'Nenhum vídeo cadastrado no momento.': 'Nenhum vídeo cadastrado no momento.',
+        'Assistir vídeo': 'Assistir vídeo',
+        'Associe-se': 'Associe-se',
+        'Eventos': 'Eventos',
+        'Próximos Eventos': 'Próximos Eventos',
+        'Ver todos os eventos': 'Ver todos os eventos',
+        'Não há eventos cadastrados no momento.': 'Não há eventos cadastrados no momento.',
+        'Tipo:': 'Tipo:',
+        'Ir para conteúdo principal': 'Ir para conteúdo principal',
+        'Abrir menu': 'Abrir menu',
+        'Menu': 'Menu',
+        'Navegação principal': 'Navegação principal',
+        'AADVITA - Página inicial': 'AADVITA - Página inicial',
+        'Português': 'Português',
+        'Español': 'Español',
+        'English': 'English',
+        'Fechar mensagem': 'Fechar mensagem',
+        'Email:': 'Email:',
+        'Telefone:': 'Telefone:',
+        'WhatsApp:': 'WhatsApp:',
+        'Doações': 'Doações',
+        'QR Code para doação': 'QR Code para doação',
+        'Todos os direitos reservados.': 'Todos os direitos reservados.',
+        'Desenvolvido por:': 'Desenvolvido por:',
+        'AADVITA - Associação de Deficientes Visuais': 'AADVITA - Associação de Deficientes Visuais',
+        '(abre em nova aba)': '(abre em nova aba)',
+        'Entrar': 'Entrar',
+        'Acesse sua conta ou área administrativa': 'Acesse sua conta ou área administrativa',
+        'Associado': 'Associado',
+        'Administrador': 'Administrador',
+        'Digite seu CPF cadastrado': 'Digite seu CPF cadastrado',
+        'Senha': 'Senha',
+        'Digite sua senha': 'Digite sua senha',
+        'Opções de idioma': 'Opções de idioma',
+        'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade': 'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade',
+        'AADVITA - Associação dos Deficientes Visuais Tapuienses': 'AADVITA - Associação dos Deficientes Visuais Tapuienses',
+    },
+    'es': {
+        'Início': 'Inicio',
+        'Agendas': 'Agendas',
+        'Agenda Presencial': 'Agenda Presencial',
+        'Agenda Virtual': 'Agenda Virtual',
+        'Projetos': 'Proyectos',
+        'Ações': 'Acciones',
+        'Apoiadores': 'Apoiadores',
+        'Selecionar idioma': 'Seleccionar idioma',
+        'Idioma atual': 'Idioma actual',
+        'Bem-vindo à AADVITA': 'Bienvenido a AADVITA',
+        'Associação de Deficientes Visuais promovendo inclusão e acessibilidade': 'Asociación de Deficientes Visuales promoviendo inclusión y accesibilidad',
+        'Conheça nossos projetos': 'Conoce nuestros proyectos',
+        'Destaques': 'Destacados',
+        'Próximas Reuniões Presenciais': 'Próximas Reuniones Presenciales',
+        'Próximas Reuniões Virtuais': 'Próximas Reuniones Virtuales',
+        'Projetos em Destaque': 'Proyectos Destacados',
+        'Ações Recentes': 'Acciones Recientes',
+        'Ver todas as reuniões presenciais': 'Ver todas las reuniones presenciales',
+        'Ver todas as reuniões virtuais': 'Ver todas las reuniones virtuales',
+        'Ver todos os projetos': 'Ver todos los proyectos',
+        'Ver todas as ações': 'Ver todas las acciones',
+        'Agenda de Reuniões Presenciais': 'Agenda de Reuniones Presenciales',
+        'Confira nossas próximas reuniões presenciais e eventos': 'Consulta nuestras próximas reuniones presenciales y eventos',
+        'Agenda de Reuniões Virtuais': 'Agenda de Reuniones Virtuales',
+        'Participe das nossas reuniões e eventos online': 'Participa en nuestras reuniones y eventos en línea',
+        'Nossos Projetos': 'Nuestros Proyectos',
+        'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade': 'Conoce los proyectos que desarrollamos para promover inclusión y accesibilidad',
+        'Nossas Ações': 'Nuestras Acciones',
+        'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA': 'Acompaña las acciones e iniciativas desarrolladas por AADVITA',
+        'Nossos Apoiadores': 'Nuestros Apoiadores',
+        'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis': 'Agradecemos a todos los que apoyan nuestra causa y hacen posibles nuestros proyectos',
+        'Informativo': 'Informativo',
+        'Fique por dentro das notícias e podcasts da AADVITA': 'Mantente al tanto de las noticias y podcasts de AADVITA',
+        'Todos': 'Todos',
+        'Notícias': 'Noticias',
+        'Podcast': 'Podcast',
+        'Notícia': 'Noticia',
+        'Publicado em': 'Publicado el',
+        'Não há notícias cadastradas no momento.': 'No hay noticias registradas en este momento.',
+        'Não há podcasts cadastrados no momento.': 'No hay podcasts registrados en este momento.',
+        'Não há informativos cadastrados no momento.': 'No hay informativos registrados en este momento.',
+        'Ler Notícia': 'Leer Noticia',
+        'Escutar Podcast': 'Escuchar Podcast',
+        'Voltar para Informativo': 'Volver a Informativo',
+        'Abrir no SoundCloud': 'Abrir en SoundCloud',
+        'Clique no botão abaixo para escutar o podcast completo': 'Haga clic en el botón a continuación para escuchar el podcast completo',
+        'Compartilhar': 'Compartir',
+        'Compartilhar no Facebook': 'Compartir en Facebook',
+        'Compartilhar no Twitter': 'Compartir en Twitter',
+        'Compartilhar no WhatsApp': 'Compartir en WhatsApp',
+        'Compartilhar no LinkedIn': 'Compartir en LinkedIn',
+        'Copiar Link': 'Copiar Enlace',
+        'Link Copiado!': '¡Enlace Copiado!',
+        'Copiar link': 'Copiar enlace',
+        'Não foi possível copiar o link. Por favor, copie manualmente:': 'No se pudo copiar el enlace. Por favor, copie manualmente:',
+        'Rádio AADVITA': 'Radio AADVITA',
+        'Ouça nossos programas de rádio e acompanhe nossa programação': 'Escucha nuestros programas de radio y sigue nuestra programación',
+        'Apresentador': 'Presentador',
+        'Horário': 'Horario',
+        'Ao Vivo': 'En Vivo',
+        'Clique em play para ouvir ao vivo': 'Haz clic en play para escuchar en vivo',
+        'Episódio': 'Episodio',
+        'Ouça o episódio completo': 'Escucha el episodio completo',
+        'Seu navegador não suporta o elemento de áudio.': 'Su navegador no soporta el elemento de audio.',
+        'Não há programas de rádio cadastrados no momento.': 'No hay programas de radio registrados en este momento.',
+        'Rádio AADVITA - Ao Vivo': 'Radio AADVITA - En Vivo',
+        'Transmitindo ao vivo': 'Transmitiendo en vivo',
+        'Nossos Programas': 'Nuestros Programas',
+        'Campanhas': 'Campañas',
+        'Conheça nossas campanhas e participe': 'Conoce nuestras campañas y participa',
+        'Apoie-nos': 'Apóyanos',
+        'Apoie nossa causa e faça a diferença': 'Apoya nuestra causa y marca la diferencia',
+        'Editais': 'Editales',
+        'Confira nossos editais e oportunidades': 'Consulta nuestros editales y oportunidades',
+        'Acesso Rápido': 'Acceso Rápido',
+        'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.': 'Pronto, la información sobre nuestras campañas estará disponible aquí.',
+        'Como Apoiar': 'Cómo Apoyar',
+        'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.': 'Su contribución es fundamental para continuar promoviendo la inclusión y accesibilidad.',
+        'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.': 'Pronto, más información sobre cómo apoyar estará disponible aquí.',
+        'Em breve, informações sobre nossos editais estarão disponíveis aqui.': 'Pronto, la información sobre nuestros editales estará disponible aquí.',
+        'Sobre': 'Sobre',
+        'Sobre a AADVITA': 'Sobre AADVITA',
+        'Conheça nossa história, missão e valores': 'Conoce nuestra historia, misión y valores',
+        'Transparência': 'Transparencia',
+        'Acompanhe nossa gestão, relatórios e informações financeiras': 'Consulta nuestra gestión, informes e información financiera',
+        'Nossa Compromisso com a Transparência': 'Nuestro Compromiso con la Transparencia',
+        'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.': 'AADVITA cree que la transparencia es fundamental para construir confianza y fortalecer nuestra relación con la comunidad. Por eso, proporcionamos información sobre nuestra gestión, actividades y recursos financieros.',
+        'Relatórios Financeiros': 'Informes Financieros',
+        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.': 'Consulta nuestros informes financieros, estados financieros y balances.',
+        'Estatuto e Documentos': 'Estatuto y Documentos',
+        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.': 'Accede a nuestro estatuto social, actas de reuniones y documentos oficiales.',
+        'Prestação de Contas': 'Rendición de Cuentas',
+        'Confira como utilizamos os recursos recebidos e os resultados alcançados.': 'Consulta cómo utilizamos los recursos recibidos y los resultados alcanzados.',
+        'Relatório de Atividades': 'Informe de Actividades',
+        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Consulta las actividades realizadas por la asociación y los resultados alcanzados.',
+        'Nenhum relatório de atividades cadastrado no momento.': 'No hay informes de actividades registrados en este momento.',
+        'Atividades Realizadas:': 'Actividades Realizadas:',
+        'Projetos e Ações': 'Proyectos y Acciones',
+        'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.': 'Consulta los proyectos desarrollados y acciones realizadas en beneficio de la comunidad.',
+        'Doações e Recursos': 'Donaciones y Recursos',
+        'Informações sobre doações recebidas e como contribuir com nossa causa.': 'Información sobre donaciones recibidas y cómo contribuir con nuestra causa.',
+        'Diretoria e Conselho': 'Directiva y Consejo',
+        'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.': 'Conoce los miembros de la directiva y consejo fiscal responsables de la gestión.',
+        'Em breve': 'Próximamente',
+        'Ver Projetos': 'Ver Proyectos',
+        'Ver Detalhes': 'Ver Detalles',
+        'Voltar para Projetos': 'Volver a Proyectos',
+        'Término:': 'Término:',
+        'Identificação do Projeto': 'Identificación del Proyecto',
+        'Contexto e Justificativa': 'Contexto y Justificación',
+        'Objetivos': 'Objetivos',
+        'Público-Alvo': 'Público Objetivo',
+        'Metodologia': 'Metodología',
+        'Recursos Necessários': 'Recursos Necesarios',
+        'Parcerias': 'Alianzas',
+        'Resultados Esperados': 'Resultados Esperados',
+        'Monitoramento e Avaliação': 'Monitoreo y Evaluación',
+        'Cronograma de Execução': 'Cronograma de Ejecución',
+        'Orçamento': 'Presupuesto',
+        'Exemplo Resumido': 'Ejemplo Resumido',
+        'Considerações Finais': 'Consideraciones Finales',
+        'Descrição': 'Descripción',
+        'Ver Diretoria': 'Ver Directiva',
+        'Ver Relatórios': 'Ver Informes',
+        'Acompanhe nossas doações e gastos de forma transparente': 'Consulta nuestras donaciones y gastos de forma transparente',
+        'Doações Recebidas': 'Donaciones Recibidas',
+        'Gastos Realizados': 'Gastos Realizados',
+        'Tipo': 'Tipo',
+        'Descrição': 'Descripción',
+        'Doador': 'Donante',
+        'País': 'País',
+        'Valor/Quantidade': 'Valor/Cantidad',
+        'Data': 'Fecha',
+        'Observações': 'Observaciones',
+        'Categoria': 'Categoría',
+        'Fornecedor': 'Proveedor',
+        'Valor': 'Valor',
+        'Financeira': 'Financiera',
+        'Material': 'Material',
+        'Serviço': 'Servicio',
+        'itens': 'artículos',
+        'unidades': 'unidades',
+        'Total de Doações Financeiras': 'Total de Donaciones Financieras',
+        'Total de Doações em Material': 'Total de Donaciones en Material',
+        'Total de Doações em Serviços': 'Total de Donaciones en Servicios',
+        'Total de Gastos': 'Total de Gastos',
+        'Nenhuma doação cadastrada no momento.': 'No hay donaciones registradas en este momento.',
+        'Nenhum gasto cadastrado no momento.': 'No hay gastos registrados en este momento.',
+        'Voltar para Transparência': 'Volver a Transparencia',
+        'Baixar Documento': 'Descargar Documento',
+        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente': 'Consulta nuestros informes financieros, estados financieros y balances de forma transparente',
+        'Nenhum relatório financeiro cadastrado no momento.': 'No hay informes financieros registrados en este momento.',
+        'Relatório': 'Informe',
+        'Demonstrativo': 'Estado Financiero',
+        'Balanço': 'Balance',
+        'Ver Relatórios': 'Ver Informes',
+        'Ver Documentos': 'Ver Documentos',
+        'Ver Prestação de Contas': 'Ver Rendición de Cuentas',
+        'Ver Informações': 'Ver Información',
+        'Estatuto': 'Estatuto',
+        'Ata': 'Acta',
+        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais': 'Accede a nuestro estatuto social, actas de reuniones y documentos oficiales',
+        'Confira como utilizamos os recursos recebidos e os resultados alcançados': 'Consulta cómo utilizamos los recursos recibidos y los resultados alcanzados',
+        'Informações sobre doações recebidas e como contribuir com nossa causa': 'Información sobre donaciones recibidas y cómo contribuir con nuestra causa',
+        'Nenhum documento cadastrado no momento.': 'No hay documentos registrados en este momento.',
+        'Nenhuma prestação de contas cadastrada no momento.': 'No hay rendiciones de cuentas registradas en este momento.',
+        'Nenhuma informação de doação cadastrada no momento.': 'No hay información de donaciones registrada en este momento.',
+        'Nenhum relatório de atividades cadastrado no momento.': 'No hay informes de actividades registrados en este momento.',
+        'Período:': 'Período:',
+        'A partir de': 'A partir de',
+        'Recursos Recebidos:': 'Recursos Recibidos:',
+        'Resultados Alcançados:': 'Resultados Alcanzados:',
+        'Atividades Realizadas:': 'Actividades Realizadas:',
+        'Relatório de Atividades': 'Informe de Actividades',
+        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Consulta las actividades realizadas por la asociación y los resultados alcanzados.',
+        'Como Contribuir:': 'Cómo Contribuir:',
+        'Informações de Contato': 'Información de Contacto',
+        'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.': 'Para más información sobre transparencia, contáctanos a través de los canales oficiales.',
+        'E-mail:': 'Correo:',
+        'Telefone:': 'Teléfono:',
+        'Entre em contato através do formulário': 'Contáctanos a través del formulario',
+        'Quem Somos': 'Quiénes Somos',
+        'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.': 'AADVITA - Asociación de Deficientes Visuales Tapuienses es una organización sin fines de lucro dedicada a promover la inclusión, accesibilidad y calidad de vida para personas con discapacidad visual en nuestra comunidad.',
+        'Nossa Missão': 'Nuestra Misión',
+        'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.': 'Promover la inclusión social, educativa y profesional de personas con discapacidad visual, ofreciendo apoyo, capacitación y recursos necesarios para que puedan desarrollar todo su potencial y participar plenamente en la sociedad.',
+        'Nossos Valores': 'Nuestros Valores',
+        'Inclusão:': 'Inclusión:',
+        'Acreditamos que todos têm o direito de participar plenamente da sociedade': 'Creemos que todos tienen derecho a participar plenamente en la sociedad',
+        'Respeito:': 'Respeto:',
+        'Valorizamos a diversidade e a dignidade de cada pessoa': 'Valoramos la diversidad y la dignidad de cada persona',
+        'Compromisso:': 'Compromiso:',
+        'Trabalhamos com dedicação para alcançar nossos objetivos': 'Trabajamos con dedicación para alcanzar nuestros objetivos',
+        'Solidariedade:': 'Solidaridad:',
+        'Apoiamos uns aos outros em nossa jornada coletiva': 'Nos apoyamos mutuamente en nuestro viaje colectivo',
+        'Transparência:': 'Transparencia:',
+        'Mantemos práticas éticas e transparentes em todas as nossas ações': 'Mantenemos prácticas éticas y transparentes en todas nuestras acciones',
+        'Diretoria': 'Directiva',
+        'Diretor de Comunicação': 'Director de Comunicación',
+        'Presidente': 'Presidente',
+        'Vice Presidente': 'Vicepresidente',
+        'Primeiro(a) Secretário(a)': 'Primer(a) Secretario(a)',
+        'Segundo(a) Secretário(a)': 'Segundo(a) Secretario(a)',
+        'Tesoureiro(a)': 'Tesorero(a)',
+        'Nome do Presidente': 'Nombre del Presidente',
+        'Nome do Vice Presidente': 'Nombre del Vicepresidente',
+        'Vice-Presidente': 'Vicepresidente',
+        'Vice Presidente': 'Vicepresidente',
+        'Nome do Primeiro Secretário': 'Nombre del Primer Secretario',
+        'Nome do Segundo Secretário': 'Nombre del Segundo Secretario',
+        'Nome do Tesoureiro': 'Nombre del Tesorero',
+        'Primeiro Secretário(a)': 'Primer Secretario(a)',
+        'Segundo Secretário(a)': 'Segundo Secretario(a)',
+        'Primeiro Tesoureiro(a)': 'Primer Tesorero(a)',
+        'Conselho Fiscal': 'Consejo Fiscal',
+        'Conselheiro': 'Consejero(a)',
+        'Conselheiro(a)': 'Consejero(a)',
+        'Coordenação Social': 'Coordinación Social',
+        'Coordenador(a)': 'Coordinador(a)',
+        'Membro da Coordenação Social': 'Coordinador(a)',
+        'Nenhum coordenador(a) cadastrado(a).': 'Ningún coordinador(a) registrado(a).',
+        'Nome do Conselheiro 1': 'Nombre del Consejero 1',
+        'Nome do Conselheiro 2': 'Nombre del Consejero 2',
+        'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.': 'Asociación dedicada a promover la inclusión y accesibilidad para personas con discapacidad visual.',
+        'Contato': 'Contacto',
+        'Links Rápidos': 'Enlaces Rápidos',
+        'Não há reuniões presenciais programadas no momento.': 'No hay reuniones presenciales programadas en este momento.',
+        'Não há reuniões virtuais programadas no momento.': 'No hay reuniones virtuales programadas en este momento.',
+        'Não há projetos cadastrados no momento.': 'No hay proyectos registrados en este momento.',
+        'Não há ações cadastradas no momento.': 'No hay acciones registradas en este momento.',
+        'Não há reuniões presenciais cadastradas no momento.': 'No hay reuniones presenciales registradas en este momento.',
+        'Não há reuniões virtuais cadastradas no momento.': 'No hay reuniones virtuales registradas en este momento.',
+        'Volte em breve para conferir nossa agenda atualizada.': 'Vuelve pronto para consultar nuestra agenda actualizada.',
+        'Acessar reunião': 'Acceder a reunión',
+        'Acessar evento': 'Acceder a evento',
+        'Local:': 'Local:',
+        'Endereço:': 'Dirección:',
+        'Plataforma:': 'Plataforma:',
+        'Data:': 'Fecha:',
+        'Hora:': 'Hora:',
+        'Visitar site': 'Visitar sitio',
+        'Não há apoiadores cadastrados no momento.': 'No hay apoyadores registrados en este momento.',
+        'Galeria': 'Galería',
+        'Galeria de Imagens': 'Galería de Imágenes',
+        'Fotos de Eventos': 'Fotos de Eventos',
+        'Fotos de Ações': 'Fotos de Acciones',
+        'Galeria Geral': 'Galería General',
+        'Confira nossa galeria completa de álbuns': 'Consulte nuestra galería completa de álbumes',
+        'Ver Álbum': 'Ver Álbum',
+        'Voltar para Galeria': 'Volver a Galería',
+        'foto(s)': 'foto(s)',
+        'Este álbum ainda não possui fotos.': 'Este álbum aún no tiene fotos.',
+        'Nenhum álbum cadastrado no momento.': 'No hay álbumes registrados en este momento.',
+        'Álbuns:': 'Álbumes:',
+        'Enviar Imagem': 'Enviar Imagen',
+        'Título (opcional)': 'Título (opcional)',
+        'Descrição (opcional)': 'Descripción (opcional)',
+        'Selecionar arquivo': 'Seleccionar archivo',
+        'Nenhuma imagem cadastrada no momento.': 'No hay imágenes registradas en este momento.',
+        'Imagem ampliada': 'Imagen ampliada',
+        'Fechar': 'Cerrar',
+        'Anterior': 'Anterior',
+        'Próxima': 'Siguiente',
+        'Vídeos': 'Videos',
+        'Nossos Vídeos': 'Nuestros Videos',
+        'Confira nossos vídeos e conteúdos em vídeo': 'Consulta nuestros videos y contenidos en video',
+        'Vídeos em Destaque': 'Videos Destacados',
+        'Ver todos os vídeos': 'Ver todos los videos',
+        'Nenhum vídeo cadastrado no momento.': 'No hay videos registrados en este momento.',
+        'Assistir vídeo': 'Ver video',
+        'Associe-se': 'Asóciate',
+        'Eventos': 'Eventos',
+        'Próximos Eventos': 'Próximos Eventos',
+        'Ver todos os eventos': 'Ver todos los eventos',
+        'Não há eventos cadastrados no momento.': 'No hay eventos registrados en este momento.',
+        'Tipo:': 'Tipo:',
+        'Ir para conteúdo principal': 'Ir al contenido principal',
+        'Abrir menu': 'Abrir menú',
+        'Menu': 'Menú',
+        'Navegação principal': 'Navegación principal',
+        'AADVITA - Página inicial': 'AADVITA - Página de inicio',
+        'Português': 'Portugués',
+        'Español': 'Español',
+        'English': 'Inglés',
+        'Fechar mensagem': 'Cerrar mensaje',
+        'Email:': 'Correo:',
+        'Telefone:': 'Teléfono:',
+        'WhatsApp:': 'WhatsApp:',
+        'Doações': 'Donaciones',
+        'QR Code para doação': 'Código QR para donación',
+        'Todos os direitos reservados.': 'Todos los derechos reservados.',
+        'Desenvolvido por:': 'Desarrollado por:',
+        'AADVITA - Associação de Deficientes Visuais': 'AADVITA - Asociación de Deficientes Visuales',
+        '(abre em nova aba)': '(se abre en nueva pestaña)',
+        'Entrar': 'Iniciar sesión',
+        'Acesse sua conta ou área administrativa': 'Accede a tu cuenta o área administrativa',
+        'Associado': 'Asociado',
+        'Administrador': 'Administrador',
+        'Digite seu CPF cadastrado': 'Ingresa tu CPF registrado',
+        'Senha': 'Contraseña',
+        'Digite sua senha': 'Ingresa tu contraseña',
+        'Opções de idioma': 'Opciones de idioma',
+        'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade': 'Asociación de Deficientes Visuales Tapuienses AADVITA - Promoviendo inclusión y accesibilidad',
+        'AADVITA - Associação dos Deficientes Visuais Tapuienses': 'AADVITA - Asociación de Deficientes Visuales Tapuienses',
+        'Radar de Acessibilidade': 'Radar de Accesibilidad',
+        'Validar Certificados': 'Validar Certificados',
+        'Reciclagem': 'Reciclaje',
+        'O que fazemos': 'Lo que hacemos',
+        'Associação dos Deficientes Visuais Tapuienses': 'Asociación de Deficientes Visuales Tapuienses',
+        'Conheça nossas campanhas e participe.': 'Conoce nuestras campañas y participa.',
+        'Sua contribuição transforma vidas!': '¡Tu contribución transforma vidas!',
+        'Confira nossos editais e oportunidades.': 'Consulta nuestros editales y oportunidades.',
+        'Seja Voluntário': 'Sé Voluntario',
+        'Ações principais': 'Acciones principales',
+        'Imagem anterior': 'Imagen anterior',
+        'Próxima imagem': 'Siguiente imagen',
+        'Ir para imagem': 'Ir a imagen',
+        'Solicitar Coleta de Reciclagem': 'Solicitar Recolección de Reciclaje',
+        'Preencha o formulário abaixo para solicitar a coleta de materiais recicláveis. Nossa equipe entrará em contato em breve.': 'Complete el formulario a continuación para solicitar la recolección de materiales reciclables. Nuestro equipo se pondrá en contacto pronto.',
+        'Tipo de Material': 'Tipo de Material',
+        'Selecione o tipo de material': 'Seleccione el tipo de material',
+        'Ferro': 'Hierro',
+        'Alumínio': 'Aluminio',
+        'Cobre': 'Cobre',
+        'Plástico': 'Plástico',
+        'Papel': 'Papel',
+        'Papelão': 'Cartón',
+        'Nome Completo': 'Nombre Completo',
+        'Digite seu nome completo': 'Ingrese su nombre completo',
+        'Telefone/WhatsApp': 'Teléfono/WhatsApp',
+        'Endereço de Retirada do Material': 'Dirección de Recolección del Material',
+        'Digite o endereço completo onde o material deve ser coletado': 'Ingrese la dirección completa donde se debe recolectar el material',
+        'Observações': 'Observaciones',
+        'Informações adicionais sobre o material ou horários preferenciais para coleta': 'Información adicional sobre el material u horarios preferenciales para la recolección',
+        'Enviar Solicitação': 'Enviar Solicitud',
+        'Validar Certificado': 'Validar Certificado',
+        'Informe o número do certificado (ex: <strong>CERT-7B062C2604</strong>) para verificar a autenticidade.': 'Ingrese el número del certificado (ej: <strong>CERT-7B062C2604</strong>) para verificar la autenticidad.',
+        'Número do Certificado': 'Número del Certificado',
+        'Validar': 'Validar',
+        'Voltar': 'Volver',
+        'Certificado válido': 'Certificado válido',
+        'O certificado': 'El certificado',
+        'é autêntico': 'es auténtico',
+        'Beneficiário:': 'Beneficiario:',
+        'Curso/Atividade:': 'Curso/Actividad:',
+        'Descrição:': 'Descripción:',
+        'Data de emissão:': 'Fecha de emisión:',
+        'Validade:': 'Validez:',
+        'Vitalício': 'Vitalicio',
+        'Certificado inválido': 'Certificado inválido',
+        'Não encontramos um certificado válido para o código informado.': 'No encontramos un certificado válido para el código proporcionado.',
+        'Validar outro certificado': 'Validar otro certificado',
+        'Registrar Problema de Acessibilidade': 'Registrar Problema de Accesibilidad',
+        'Ajude-nos a mapear os problemas de acessibilidade na cidade. Sua denúncia é importante para cobrarmos melhorias dos órgãos públicos.': 'Ayúdanos a mapear los problemas de accesibilidad en la ciudad. Tu denuncia es importante para exigir mejoras a los órganos públicos.',
+        'Tipo de Problema': 'Tipo de Problema',
+        'Selecione o tipo de problema': 'Seleccione el tipo de problema',
+        'Acessibilidade Urbana': 'Accesibilidad Urbana',
+        'Calçada': 'Acera',
+        'Faixa de Pedestre': 'Cruce de Peatones',
+        'Sinal Sonoro': 'Señal Sonora',
+        'Rampa de Acesso': 'Rampa de Acceso',
+        'Piso Tátil': 'Piso Táctil',
+        'Transporte Público': 'Transporte Público',
+        'Estabelecimento Comercial': 'Establecimiento Comercial',
+        'Outro': 'Otro',
+        'Localização (Endereço)': 'Ubicación (Dirección)',
+        'Descrição do Problema': 'Descripción del Problema',
+        'Descreva detalhadamente o problema encontrado...': 'Describe detalladamente el problema encontrado...',
+        'Seu Nome Completo': 'Tu Nombre Completo',
+        'Nome completo': 'Nombre completo',
+        'Email (opcional)': 'Correo (opcional)',
+        'Anexos (Fotos, documentos) - opcional': 'Anexos (Fotos, documentos) - opcional',
+        'Envie fotos ou documentos que ajudem a ilustrar o problema. Tamanho máximo por arquivo: 16MB.': 'Envía fotos o documentos que ayuden a ilustrar el problema. Tamaño máximo por archivo: 16MB.',
+        'Enviar Denúncia': 'Enviar Denuncia',
+        'Cancelar': 'Cancelar',
+        'Fique por dentro das novidades da AADVITA.': 'Mantente al tanto de las novedades de AADVITA.',
+        'Ouça nossos podcasts e conteúdos em áudio.': 'Escucha nuestros podcasts y contenidos en audio.',
+        'Nenhum serviço cadastrado no momento.': 'Ningún servicio registrado en este momento.',
+        'Acessibilidade': 'Accesibilidad',
+        'Opções de acessibilidade': 'Opciones de accesibilidad',
+        'Tamanho da Fonte': 'Tamaño de la Fuente',
+        'Diminuir fonte': 'Disminuir fuente',
+        'Aumentar fonte': 'Aumentar fuente',
+        'Diminuir': 'Disminuir',
+        'Aumentar': 'Aumentar',
+        'Contraste': 'Contraste',
+        'Alternar contraste': 'Alternar contraste',
+        'Alto Contraste': 'Alto Contraste',
+        'Alto Contraste Ativo': 'Alto Contraste Activo',
+        'Áudio Descrição': 'Descripción de Audio',
+        'Áudio Descrição Ativa': 'Descripción de Audio Activa',
+        'Alternar áudio descrição': 'Alternar descripción de audio',
+        'Redefinir': 'Restablecer',
+    },
+    'en': {
+        'Início': 'Home',
+        'Agendas': 'Schedules',
+        'Agenda Presencial': 'In-Person Schedule',
+        'Agenda Virtual': 'Virtual Schedule',
+        'Projetos': 'Projects',
+        'Ações': 'Actions',
+        'Apoiadores': 'Supporters',
+        'Selecionar idioma': 'Select language',
+        'Idioma atual': 'Current language',
+        'Bem-vindo à AADVITA': 'Welcome to AADVITA',
+        'Associação de Deficientes Visuais promovendo inclusão e acessibilidade': 'Association of Visually Impaired promoting inclusion and accessibility',
+        'Conheça nossos projetos': 'Learn about our projects',
+        'Destaques': 'Highlights',
+        'Próximas Reuniões Presenciais': 'Upcoming In-Person Meetings',
+        'Próximas Reuniões Virtuais': 'Upcoming Virtual Meetings',
+        'Projetos em Destaque': 'Featured Projects',
+        'Ações Recentes': 'Recent Actions',
+        'Ver todas as reuniões presenciais': 'View all in-person meetings',
+        'Ver todas as reuniões virtuais': 'View all virtual meetings',
+        'Ver todos os projetos': 'View all projects',
+        'Ver todas as ações': 'View all actions',
+        'Agenda de Reuniões Presenciais': 'In-Person Meeting Schedule',
+        'Confira nossas próximas reuniões presenciais e eventos': 'Check out our upcoming in-person meetings and events',
+        'Agenda de Reuniões Virtuais': 'Virtual Meeting Schedule',
+        'Participe das nossas reuniões e eventos online': 'Join our online meetings and events',
+        'Nossos Projetos': 'Our Projects',
+        'Conheça os projetos que desenvolvemos para promover inclusão e acessibilidade': 'Learn about the projects we develop to promote inclusion and accessibility',
+        'Nossas Ações': 'Our Actions',
+        'Acompanhe as ações e iniciativas desenvolvidas pela AADVITA': 'Follow the actions and initiatives developed by AADVITA',
+        'Nossos Apoiadores': 'Our Supporters',
+        'Agradecemos a todos que apoiam nossa causa e tornam nossos projetos possíveis': 'We thank everyone who supports our cause and makes our projects possible',
+        'Informativo': 'News & Podcasts',
+        'Fique por dentro das notícias e podcasts da AADVITA': 'Stay up to date with AADVITA news and podcasts',
+        'Todos': 'All',
+        'Notícias': 'News',
+        'Podcast': 'Podcast',
+        'Notícia': 'News',
+        'Publicado em': 'Published on',
+        'Não há notícias cadastradas no momento.': 'No news registered at this time.',
+        'Não há podcasts cadastrados no momento.': 'No podcasts registered at this time.',
+        'Não há informativos cadastrados no momento.': 'No news or podcasts registered at this time.',
+        'Ler Notícia': 'Read News',
+        'Escutar Podcast': 'Listen to Podcast',
+        'Voltar para Informativo': 'Back to News & Podcasts',
+        'Abrir no SoundCloud': 'Open in SoundCloud',
+        'Clique no botão abaixo para escutar o podcast completo': 'Click the button below to listen to the full podcast',
+        'Compartilhar': 'Share',
+        'Compartilhar no Facebook': 'Share on Facebook',
+        'Compartilhar no Twitter': 'Share on Twitter',
+        'Compartilhar no WhatsApp': 'Share on WhatsApp',
+        'Compartilhar no LinkedIn': 'Share on LinkedIn',
+        'Copiar Link': 'Copy Link',
+        'Link Copiado!': 'Link Copied!',
+        'Copiar link': 'Copy link',
+        'Não foi possível copiar o link. Por favor, copie manualmente:': 'Could not copy link. Please copy manually:',
+        'Rádio AADVITA': 'AADVITA Radio',
+        'Ouça nossos programas de rádio e acompanhe nossa programação': 'Listen to our radio programs and follow our schedule',
+        'Apresentador': 'Host',
+        'Horário': 'Schedule',
+        'Ao Vivo': 'Live',
+        'Clique em play para ouvir ao vivo': 'Click play to listen live',
+        'Episódio': 'Episode',
+        'Ouça o episódio completo': 'Listen to the full episode',
+        'Seu navegador não suporta o elemento de áudio.': 'Your browser does not support the audio element.',
+        'Não há programas de rádio cadastrados no momento.': 'No radio programs registered at this time.',
+        'Rádio AADVITA - Ao Vivo': 'AADVITA Radio - Live',
+        'Transmitindo ao vivo': 'Live Broadcasting',
+        'Nossos Programas': 'Our Programs',
+        'Campanhas': 'Campaigns',
+        'Conheça nossas campanhas e participe': 'Learn about our campaigns and participate',
+        'Apoie-nos': 'Support Us',
+        'Apoie nossa causa e faça a diferença': 'Support our cause and make a difference',
+        'Editais': 'Public Notices',
+        'Confira nossos editais e oportunidades': 'Check our public notices and opportunities',
+        'Acesso Rápido': 'Quick Access',
+        'Em breve, informações sobre nossas campanhas estarão disponíveis aqui.': 'Soon, information about our campaigns will be available here.',
+        'Como Apoiar': 'How to Support',
+        'Sua contribuição é fundamental para continuarmos promovendo inclusão e acessibilidade.': 'Your contribution is essential for us to continue promoting inclusion and accessibility.',
+        'Em breve, mais informações sobre como apoiar estarão disponíveis aqui.': 'Soon, more information on how to support will be available here.',
+        'Em breve, informações sobre nossos editais estarão disponíveis aqui.': 'Soon, information about our public notices will be available here.',
+        'Sobre': 'About',
+        'Sobre a AADVITA': 'About AADVITA',
+        'Conheça nossa história, missão e valores': 'Learn about our history, mission and values',
+        'Transparência': 'Transparency',
+        'Acompanhe nossa gestão, relatórios e informações financeiras': 'Follow our management, reports and financial information',
+        'Nossa Compromisso com a Transparência': 'Our Commitment to Transparency',
+        'A AADVITA acredita que a transparência é fundamental para construir confiança e fortalecer nossa relação com a comunidade. Por isso, disponibilizamos informações sobre nossa gestão, atividades e recursos financeiros.': 'AADVITA believes that transparency is fundamental to building trust and strengthening our relationship with the community. Therefore, we provide information about our management, activities and financial resources.',
+        'Relatórios Financeiros': 'Financial Reports',
+        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços.': 'Follow our financial reports, statements and balances.',
+        'Estatuto e Documentos': 'Statute and Documents',
+        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais.': 'Access our bylaws, meeting minutes and official documents.',
+        'Prestação de Contas': 'Accountability',
+        'Confira como utilizamos os recursos recebidos e os resultados alcançados.': 'See how we use the resources received and the results achieved.',
+        'Projetos e Ações': 'Projects and Actions',
+        'Veja os projetos desenvolvidos e ações realizadas em benefício da comunidade.': 'See the projects developed and actions carried out for the benefit of the community.',
+        'Doações e Recursos': 'Donations and Resources',
+        'Informações sobre doações recebidas e como contribuir com nossa causa.': 'Information about donations received and how to contribute to our cause.',
+        'Diretoria e Conselho': 'Board and Council',
+        'Conheça os membros da diretoria e conselho fiscal responsáveis pela gestão.': 'Meet the members of the board and fiscal council responsible for management.',
+        'Em breve': 'Coming soon',
+        'Ver Projetos': 'View Projects',
+        'Ver Detalhes': 'View Details',
+        'Voltar para Projetos': 'Back to Projects',
+        'Término:': 'End:',
+        'Identificação do Projeto': 'Project Identification',
+        'Contexto e Justificativa': 'Context and Justification',
+        'Objetivos': 'Objectives',
+        'Público-Alvo': 'Target Audience',
+        'Metodologia': 'Methodology',
+        'Recursos Necessários': 'Necessary Resources',
+        'Parcerias': 'Partnerships',
+        'Resultados Esperados': 'Expected Results',
+        'Monitoramento e Avaliação': 'Monitoring and Evaluation',
+        'Cronograma de Execução': 'Execution Schedule',
+        'Orçamento': 'Budget',
+        'Exemplo Resumido': 'Summary Example',
+        'Considerações Finais': 'Final Considerations',
+        'Descrição': 'Description',
+        'Ver Diretoria': 'View Board',
+        'Ver Relatórios': 'View Reports',
+        'Acompanhe nossas doações e gastos de forma transparente': 'Follow our donations and expenses transparently',
+        'Doações Recebidas': 'Donations Received',
+        'Gastos Realizados': 'Expenses Made',
+        'Tipo': 'Type',
+        'Descrição': 'Description',
+        'Doador': 'Donor',
+        'País': 'Country',
+        'Valor/Quantidade': 'Value/Quantity',
+        'Data': 'Date',
+        'Observações': 'Observations',
+        'Categoria': 'Category',
+        'Fornecedor': 'Supplier',
+        'Valor': 'Value',
+        'Financeira': 'Financial',
+        'Material': 'Material',
+        'Serviço': 'Service',
+        'itens': 'items',
+        'unidades': 'units',
+        'Total de Doações Financeiras': 'Total Financial Donations',
+        'Total de Doações em Material': 'Total Material Donations',
+        'Total de Doações em Serviços': 'Total Service Donations',
+        'Total de Gastos': 'Total Expenses',
+        'Nenhuma doação cadastrada no momento.': 'No donations registered at this time.',
+        'Nenhum gasto cadastrado no momento.': 'No expenses registered at this time.',
+        'Voltar para Transparência': 'Back to Transparency',
+        'Baixar Documento': 'Download Document',
+        'Acompanhe nossos relatórios financeiros, demonstrativos e balanços de forma transparente': 'Follow our financial reports, statements and balances transparently',
+        'Nenhum relatório financeiro cadastrado no momento.': 'No financial reports registered at this time.',
+        'Relatório': 'Report',
+        'Demonstrativo': 'Statement',
+        'Balanço': 'Balance',
+        'Ver Relatórios': 'View Reports',
+        'Ver Documentos': 'View Documents',
+        'Ver Prestação de Contas': 'View Accountability',
+        'Ver Informações': 'View Information',
+        'Estatuto': 'Statute',
+        'Ata': 'Minutes',
+        'Acesse nosso estatuto social, atas de reuniões e documentos oficiais': 'Access our bylaws, meeting minutes and official documents',
+        'Confira como utilizamos os recursos recebidos e os resultados alcançados': 'See how we use the resources received and the results achieved',
+        'Informações sobre doações recebidas e como contribuir com nossa causa': 'Information about donations received and how to contribute to our cause',
+        'Nenhum documento cadastrado no momento.': 'No documents registered at this time.',
+        'Nenhuma prestação de contas cadastrada no momento.': 'No accountability reports registered at this time.',
+        'Nenhuma informação de doação cadastrada no momento.': 'No donation information registered at this time.',
+        'Nenhum relatório de atividades cadastrado no momento.': 'No activity reports registered at this time.',
+        'Período:': 'Period:',
+        'A partir de': 'From',
+        'Recursos Recebidos:': 'Resources Received:',
+        'Resultados Alcançados:': 'Results Achieved:',
+        'Atividades Realizadas:': 'Activities Carried Out:',
+        'Relatório de Atividades': 'Activity Report',
+        'Acompanhe as atividades realizadas pela associação e os resultados alcançados.': 'Follow the activities carried out by the association and the results achieved.',
+        'Como Contribuir:': 'How to Contribute:',
+        'Informações de Contato': 'Contact Information',
+        'Para mais informações sobre transparência, entre em contato conosco através dos canais oficiais.': 'For more information about transparency, contact us through official channels.',
+        'E-mail:': 'Email:',
+        'Telefone:': 'Phone:',
+        'Entre em contato através do formulário': 'Contact us through the form',
+        'Quem Somos': 'Who We Are',
+        'A AADVITA - Associação dos Deficientes Visuais Tapuienses é uma organização sem fins lucrativos dedicada a promover a inclusão, acessibilidade e qualidade de vida para pessoas com deficiência visual em nossa comunidade.': 'AADVITA - Association of Visually Impaired Tapuienses is a non-profit organization dedicated to promoting inclusion, accessibility and quality of life for visually impaired people in our community.',
+        'Nossa Missão': 'Our Mission',
+        'Promover a inclusão social, educacional e profissional de pessoas com deficiência visual, oferecendo apoio, capacitação e recursos necessários para que possam desenvolver todo o seu potencial e participar plenamente da sociedade.': 'Promote social, educational and professional inclusion of visually impaired people, offering support, training and necessary resources so they can develop their full potential and fully participate in society.',
+        'Nossos Valores': 'Our Values',
+        'Inclusão:': 'Inclusion:',
+        'Acreditamos que todos têm o direito de participar plenamente da sociedade': 'We believe everyone has the right to fully participate in society',
+        'Respeito:': 'Respect:',
+        'Valorizamos a diversidade e a dignidade de cada pessoa': 'We value diversity and the dignity of each person',
+        'Compromisso:': 'Commitment:',
+        'Trabalhamos com dedicação para alcançar nossos objetivos': 'We work with dedication to achieve our goals',
+        'Solidariedade:': 'Solidarity:',
+        'Apoiamos uns aos outros em nossa jornada coletiva': 'We support each other on our collective journey',
+        'Transparência:': 'Transparency:',
+        'Mantemos práticas éticas e transparentes em todas as nossas ações': 'We maintain ethical and transparent practices in all our actions',
+        'Diretoria': 'Board of Directors',
+        'Diretor de Comunicação': 'Director of Communications',
+        'Presidente': 'President',
+        'Vice Presidente': 'Vice-President',
+        'Vice-Presidente': 'Vice-President',
+        'Primeiro(a) Secretário(a)': 'First Secretary',
+        'Segundo(a) Secretário(a)': 'Second Secretary',
+        'Tesoureiro(a)': 'Treasurer',
+        'Nome do Presidente': 'President Name',
+        'Nome do Vice Presidente': 'Vice President Name',
+        'Nome do Primeiro Secretário': 'First Secretary Name',
+        'Nome do Segundo Secretário': 'Second Secretary Name',
+        'Nome do Tesoureiro': 'Treasurer Name',
+        'Primeiro Secretário(a)': 'First Secretary',
+        'Segundo Secretário(a)': 'Second Secretary',
+        'Primeiro Tesoureiro(a)': 'First Treasurer',
+        'Conselho Fiscal': 'Fiscal Council',
+        'Conselheiro': 'Councilor',
+        'Conselheiro(a)': 'Councilor',
+        'Coordenação Social': 'Social Coordination',
+        'Coordenador(a)': 'Coordinator',
+        'Membro da Coordenação Social': 'Coordinator',
+        'Nenhum coordenador(a) cadastrado(a).': 'No coordinator(s) registered.',
+        'Conselheiro': 'Councilor',
+        'Nome do Conselheiro 1': 'Councilor 1 Name',
+        'Nome do Conselheiro 2': 'Councilor 2 Name',
+        'Associação dedicada a promover a inclusão e acessibilidade para pessoas com deficiência visual.': 'Association dedicated to promoting inclusion and accessibility for visually impaired people.',
+        'Contato': 'Contact',
+        'Links Rápidos': 'Quick Links',
+        'Não há reuniões presenciais programadas no momento.': 'No in-person meetings scheduled at this time.',
+        'Não há reuniões virtuais programadas no momento.': 'No virtual meetings scheduled at this time.',
+        'Não há projetos cadastrados no momento.': 'No projects registered at this time.',
+        'Não há ações cadastradas no momento.': 'No actions registered at this time.',
+        'Não há reuniões presenciais cadastradas no momento.': 'No in-person meetings registered at this time.',
+        'Não há reuniões virtuais cadastradas no momento.': 'No virtual meetings registered at this time.',
+        'Volte em breve para conferir nossa agenda atualizada.': 'Come back soon to check our updated schedule.',
+        'Acessar reunião': 'Join meeting',
+        'Acessar evento': 'Join event',
+        'Local:': 'Location:',
+        'Endereço:': 'Address:',
+        'Plataforma:': 'Platform:',
+        'Data:': 'Date:',
+        'Hora:': 'Time:',
+        'Visitar site': 'Visit website',
+        'Não há apoiadores cadastrados no momento.': 'No supporters registered at this time.',
+        'Galeria': 'Gallery',
+        'Galeria de Imagens': 'Image Gallery',
+        'Fotos de Eventos': 'Event Photos',
+        'Fotos de Ações': 'Action Photos',
+        'Galeria Geral': 'General Gallery',
+        'Confira nossa galeria completa de álbuns': 'Check out our complete album gallery',
+        'Ver Álbum': 'View Album',
+        'Voltar para Galeria': 'Back to Gallery',
+        'foto(s)': 'photo(s)',
+        'Este álbum ainda não possui fotos.': 'This album does not have photos yet.',
+        'Nenhum álbum cadastrado no momento.': 'No albums registered at this time.',
+        'Álbuns:': 'Albums:',
+        'Enviar Imagem': 'Upload Image',
+        'Título (opcional)': 'Title (optional)',
+        'Descrição (opcional)': 'Description (optional)',
+        'Selecionar arquivo': 'Select file',
+        'Nenhuma imagem cadastrada no momento.': 'No images registered at this time.',
+        'Imagem ampliada': 'Enlarged image',
+        'Fechar': 'Close',
+        'Anterior': 'Previous',
+        'Próxima': 'Next',
+        'Vídeos': 'Videos',
+        'Nossos Vídeos': 'Our Videos',
+        'Confira nossos vídeos e conteúdos em vídeo': 'Check out our videos and video content',
+        'Vídeos em Destaque': 'Featured Videos',
+        'Ver todos os vídeos': 'View all videos',
+        'Nenhum vídeo cadastrado no momento.': 'No videos registered at this time.',
+        'Assistir vídeo': 'Watch video',
+        'Associe-se': 'Join Us',
+        'Eventos': 'Events',
+        'Próximos Eventos': 'Upcoming Events',
+        'Ver todos os eventos': 'View all events',
+        'Não há eventos cadastrados no momento.': 'No events registered at this time.',
+        'Tipo:': 'Type:',
+        'Ir para conteúdo principal': 'Skip to main content',
+        'Abrir menu': 'Open menu',
+        'Menu': 'Menu',
+        'Navegação principal': 'Main navigation',
+        'AADVITA - Página inicial': 'AADVITA - Home page',
+        'Português': 'Portuguese',
+        'Español': 'Spanish',
+        'English': 'English',
+        'Fechar mensagem': 'Close message',
+        'Email:': 'Email:',
+        'Telefone:': 'Phone:',
+        'WhatsApp:': 'WhatsApp:',
+        'Doações': 'Donations',
+        'QR Code para doação': 'QR Code for donation',
+        'Todos os direitos reservados.': 'All rights reserved.',
+        'Desenvolvido por:': 'Developed by:',
+        'AADVITA - Associação de Deficientes Visuais': 'AADVITA - Association of Visually Impaired',
+        '(abre em nova aba)': '(opens in new tab)',
+        'Entrar': 'Login',
+        'Acesse sua conta ou área administrativa': 'Access your account or administrative area',
+        'Associado': 'Member',
+        'Administrador': 'Administrator',
+        'Digite seu CPF cadastrado': 'Enter your registered CPF',
+        'Senha': 'Password',
+        'Digite sua senha': 'Enter your password',
+        'Opções de idioma': 'Language options',
+        'Associação dos Deficientes Visuais Tapuienses AADVITA - Promovendo inclusão e acessibilidade': 'Association of Visually Impaired Tapuienses AADVITA - Promoting inclusion and accessibility',
+        'AADVITA - Associação dos Deficientes Visuais Tapuienses': 'AADVITA - Association of Visually Impaired Tapuienses',
+        'Radar de Acessibilidade': 'Accessibility Radar',
+        'Validar Certificados': 'Validate Certificates',
+        'Reciclagem': 'Recycling',
+        'O que fazemos': 'What We Do',
+        'Associação dos Deficientes Visuais Tapuienses': 'Association of Visually Impaired Tapuienses',
+        'Conheça nossas campanhas e participe.': 'Learn about our campaigns and participate.',
+        'Sua contribuição transforma vidas!': 'Your contribution transforms lives!',
+        'Confira nossos editais e oportunidades.': 'Check our public notices and opportunities.',
+        'Seja Voluntário': 'Be a Volunteer',
+        'Ações principais': 'Main actions',
+        'Imagem anterior': 'Previous image',
+        'Próxima imagem': 'Next image',
+        'Ir para imagem': 'Go to image',
+        'Solicitar Coleta de Reciclagem': 'Request Recycling Collection',
+        'Preencha o formulário abaixo para solicitar a coleta de materiais recicláveis. Nossa equipe entrará em contato em breve.': 'Fill out the form below to request collection of recyclable materials. Our team will contact you soon.',
+        'Tipo de Material': 'Material Type',
+        'Selecione o tipo de material': 'Select the material type',
+        'Ferro': 'Iron',
+        'Alumínio': 'Aluminum',
+        'Cobre': 'Copper',
+        'Plástico': 'Plastic',
+        'Papel': 'Paper',
+        'Papelão': 'Cardboard',
+        'Nome Completo': 'Full Name',
+        'Digite seu nome completo': 'Enter your full name',
+        'Telefone/WhatsApp': 'Phone/WhatsApp',
+        'Endereço de Retirada do Material': 'Material Pickup Address',
+        'Digite o endereço completo onde o material deve ser coletado': 'Enter the complete address where the material should be collected',
+        'Observações': 'Observations',
+        'Informações adicionais sobre o material ou horários preferenciais para coleta': 'Additional information about the material or preferred collection times',
+        'Enviar Solicitação': 'Submit Request',
+        'Validar Certificado': 'Validate Certificate',
+        'Informe o número do certificado (ex: <strong>CERT-7B062C2604</strong>) para verificar a autenticidade.': 'Enter the certificate number (e.g., <strong>CERT-7B062C2604</strong>) to verify authenticity.',
+        'Número do Certificado': 'Certificate Number',
+        'Validar': 'Validate',
+        'Voltar': 'Back',
+        'Certificado válido': 'Valid certificate',
+        'O certificado': 'The certificate',
+        'é autêntico': 'is authentic',
+        'Beneficiário:': 'Beneficiary:',
+        'Curso/Atividade:': 'Course/Activity:',
+        'Descrição:': 'Description:',
+        'Data de emissão:': 'Issue date:',
+        'Validade:': 'Validity:',
+        'Vitalício': 'Lifetime',
+        'Certificado inválido': 'Invalid certificate',
+        'Não encontramos um certificado válido para o código informado.': 'We did not find a valid certificate for the code provided.',
+        'Validar outro certificado': 'Validate another certificate',
+        'Registrar Problema de Acessibilidade': 'Register Accessibility Problem',
+        'Ajude-nos a mapear os problemas de acessibilidade na cidade. Sua denúncia é importante para cobrarmos melhorias dos órgãos públicos.': 'Help us map accessibility problems in the city. Your report is important to demand improvements from public agencies.',
+        'Tipo de Problema': 'Problem Type',
+        'Selecione o tipo de problema': 'Select the problem type',
+        'Acessibilidade Urbana': 'Urban Accessibility',
+        'Calçada': 'Sidewalk',
+        'Faixa de Pedestre': 'Crosswalk',
+        'Sinal Sonoro': 'Audio Signal',
+        'Rampa de Acesso': 'Access Ramp',
+        'Piso Tátil': 'Tactile Floor',
+        'Transporte Público': 'Public Transportation',
+        'Estabelecimento Comercial': 'Commercial Establishment',
+        'Outro': 'Other',
+        'Localização (Endereço)': 'Location (Address)',
+        'Descrição do Problema': 'Problem Description',
+        'Descreva detalhadamente o problema encontrado...': 'Describe in detail the problem found...',
+        'Seu Nome Completo': 'Your Full Name',
+        'Nome completo': 'Full name',
+        'Email (opcional)': 'Email (optional)',
+        'Anexos (Fotos, documentos) - opcional': 'Attachments (Photos, documents) - optional',
+        'Envie fotos ou documentos que ajudem a ilustrar o problema. Tamanho máximo por arquivo: 16MB.': 'Send photos or documents that help illustrate the problem. Maximum file size: 16MB.',
+        'Enviar Denúncia': 'Submit Report',
+        'Cancelar': 'Cancel',
+        'Fique por dentro das novidades da AADVITA.': 'Stay up to date with AADVITA news.',
+        'Ouça nossos podcasts e conteúdos em áudio.': 'Listen to our podcasts and audio content.',
+        'Nenhum serviço cadastrado no momento.': 'No services registered at this time.',
+        'Acessibilidade': 'Accessibility',
+        'Opções de acessibilidade': 'Accessibility options',
+        'Tamanho da Fonte': 'Font Size',
+        'Diminuir fonte': 'Decrease font',
+        'Aumentar fonte': 'Increase font',
+        'Diminuir': 'Decrease',
+        'Aumentar': 'Increase',
+        'Contraste': 'Contrast',
+        'Alternar contraste': 'Toggle contrast',
+        'Alto Contraste': 'High Contrast',
+        'Alto Contraste Ativo': 'High Contrast Active',
+        'Áudio Descrição': 'Audio Description',
+        'Áudio Descrição Ativa': 'Audio Description Active',
+        'Alternar áudio descrição': 'Toggle audio description',
+        'Redefinir': 'Reset',
+    }
+}